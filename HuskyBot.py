@@ -27,9 +27,16 @@ except ImportError:
 # aiohttp/web api support
 from aiohttp import web
 
+from libhusky import HuskyActions
 from libhusky import HuskyConfig
 from libhusky import HuskyHTTP
+from libhusky import HuskyInvites
+from libhusky import HuskyLogSink
+from libhusky import HuskyPipeline
+from libhusky import HuskyRegex
+from libhusky import HuskyScheduler
 from libhusky import HuskyUtils
+from libhusky import HuskyWebhooks
 from libhusky.HuskyStatics import *
 from libhusky.discord.HuskyHelpFormatter import HuskyHelpFormatter
 
@@ -44,6 +51,59 @@ class HuskyBot(commands.Bot, metaclass=HuskyUtils.Singleton):
         self.config = HuskyConfig.get_config()
         self.session_store = HuskyConfig.get_session_store()
 
+        # Shared message processing pipeline. Plugins register their message filters/handlers here.
+        self.pipeline = HuskyPipeline.MessagePipeline(self)
+        self.pipeline.register("Commands", self.__process_command_message, HuskyPipeline.Priority.COMMANDS)
+
+        # Staff-supplied regexes run out of process, so a single runaway pattern can't freeze the event loop.
+        sandbox_config = self.config.get('regexSandbox', {})
+        self.regex_sandbox = HuskyRegex.RegexSandbox(
+            workers=sandbox_config.get('workers', HuskyRegex.defaults['workers']),
+            timeout=sandbox_config.get('timeout', HuskyRegex.defaults['timeout']),
+            on_quarantine=self.__report_quarantined_regex
+        )
+
+        # Invite lookups are cached and coalesced, so invite raids don't burn through the rate limit.
+        resolver_config = {**HuskyInvites.defaults, **self.config.get('inviteResolver', {})}
+        self.invite_resolver = HuskyInvites.InviteResolver(
+            self.__fetch_invite,
+            ttl=resolver_config['ttl'],
+            negative_ttl=resolver_config['negativeTtl'],
+            max_entries=resolver_config['maxEntries'],
+            persist_path=resolver_config['persistPath']
+        )
+        self.invite_resolver.load()
+
+        # Deletes, kicks and bans are deduplicated, batched and rate-limited here, rather than sent by every filter.
+        action_config = {**HuskyActions.defaults, **self.config.get('actionQueue', {})}
+        self.action_queue = HuskyActions.ActionQueue(
+            deletes_per_second=action_config['deletesPerSecond'],
+            bulk_deletes_per_second=action_config['bulkDeletesPerSecond'],
+            member_actions_per_second=action_config['memberActionsPerSecond'],
+            dedupe_seconds=action_config['dedupeSeconds'],
+            on_unban_failed=self.__report_failed_unban
+        )
+
+        # Timed events (mute expiries, giveaway ends, ...) all run off one scheduler.
+        self.scheduler = HuskyScheduler.Scheduler()
+
+        # Staff log and alert embeds are batched per channel here, rather than sent one message at a time.
+        sink_config = {**HuskyLogSink.defaults, **self.config.get('logSink', {})}
+        # Busy log channels can be moved to webhooks, so that their traffic never holds up moderation.
+        webhook_config = {**HuskyWebhooks.defaults, **self.config.get('logWebhooks', {})}
+        self.log_sink = HuskyLogSink.LogSink(
+            self.__post_embeds,
+            flush_interval=sink_config['flushInterval'],
+            max_buffered=sink_config['maxBuffered'],
+            multi_embed=sink_config['multiEmbed'],
+            webhooks=HuskyWebhooks.WebhookDelivery(
+                self.__webhook_channels,
+                name=webhook_config['name'],
+                api_base=webhook_config['apiBase'],
+                retry_seconds=webhook_config['retrySeconds']
+            )
+        )
+
         self.developer_mode = self.__check_developer_mode()
         self.superusers = []
 
@@ -108,8 +168,11 @@ class HuskyBot(commands.Bot, metaclass=HuskyUtils.Singleton):
 
         LOG.info("Shutting down HuskyBot...")
 
-        self.config.save()
-        LOG.debug("Config file saved/written to disk.")
+        HuskyConfig.flush_all()
+        LOG.debug("Config files flushed/written to disk.")
+
+        self.regex_sandbox.shutdown()
+        self.invite_resolver.save()
 
         if self.db:
             self.db.dispose()
@@ -122,6 +185,8 @@ class HuskyBot(commands.Bot, metaclass=HuskyUtils.Singleton):
     async def logout(self):
         LOG.info("Shutting down HuskyBot...")
 
+        await self.log_sink.close()
+        self.scheduler.close()
         await super().logout()
 
     def __check_developer_mode(self):
@@ -369,21 +434,36 @@ class HuskyBot(commands.Bot, metaclass=HuskyUtils.Singleton):
                             f"The bot is leaving the guild...")
                 await guild.leave()
 
+    async def on_member_join(self, member: discord.Member):
+        # A kicked user who came back may need to be acted on again.
+        self.action_queue.forget(member.guild, member)
+
+    async def on_member_unban(self, guild: discord.Guild, user: discord.User):
+        self.action_queue.forget(guild, user)
+
     async def on_message(self, message: discord.Message):
-        author = message.author
-        if not HuskyUtils.should_process_message(message):
-            return
+        await self.pipeline.process(message)
+
+    async def on_message_edit(self, before: discord.Message, after: discord.Message):
+        await self.pipeline.process(after, HuskyPipeline.EDITED_MESSAGE, {"before": before, "after": after})
+
+    async def __process_command_message(self, features: HuskyPipeline.MessageFeatures):
+        message = features.message
+        author = features.author
 
-        if message.content.startswith(self.command_prefix):
-            if (author.id in self.config.get('userBlacklist', [])) and (author.id not in self.superusers):
+        if features.is_command:
+            config = features.config
+            command_name = features.content_lower.split(' ')[0]
+
+            if (author.id in config.get('userBlacklist')) and (author.id not in self.superusers):
                 LOG.info("Blacklisted user %s attempted to run command %s", message.author, message.content)
                 return
 
-            if message.content.lower().split(' ')[0][1:] in self.config.get('ignoredCommands', []):
+            if command_name[1:] in config.get('ignoredCommands'):
                 LOG.info("User %s ran an ignored command %s", message.author, message.content)
                 return
 
-            if message.content.lower().split(' ')[0].startswith('/r/'):
+            if command_name.startswith('/r/'):
                 LOG.info("User %s linked to subreddit %s, ignoring command", message.author, message.content)
                 return
 
@@ -391,8 +471,8 @@ class HuskyBot(commands.Bot, metaclass=HuskyUtils.Singleton):
                 LOG.info("Lockdown mode is enabled for the bot. Command blocked.")
                 return
 
-            if message.channel.id in self.config.get("disabledChannels", []) and isinstance(author, discord.Member) \
-                    and not author.permissions_in(message.channel).manage_messages:
+            if message.channel.id in config.get("disabledChannels") and features.is_member \
+                    and not features.can_manage_messages:
                 LOG.info(f"Got a command from a disabled channel {message.channel}. Command blocked.")
                 return
 
@@ -400,6 +480,55 @@ class HuskyBot(commands.Bot, metaclass=HuskyUtils.Singleton):
 
             await self.process_commands(message)
 
+    async def __fetch_invite(self, fragment: str) -> dict:
+        # discord py doesn't let us do this natively, so let's do it ourselves!
+        return await self.http.request(
+            discord.http.Route('GET', '/invite/{invite_id}?with_counts=true', invite_id=fragment))
+
+    async def __post_embeds(self, channel_id: int, embeds: list) -> dict:
+        # discord.py 1.3 can only send one embed per message, so send the list ourselves.
+        return await self.http.request(
+            discord.http.Route('POST', '/channels/{channel_id}/messages', channel_id=channel_id),
+            json={'embeds': embeds})
+
+    def __webhook_channels(self) -> set:
+        special_channels = self.config.get('specialChannels', {})
+        keys = self.config.get('logWebhooks', {}).get('channels', HuskyWebhooks.defaults['channels'])
+
+        return {special_channels[key] for key in keys if special_channels.get(key) is not None}
+
+    async def __report_quarantined_regex(self, pattern: str, source: str):
+        channel = self.config.get('specialChannels', {}).get(ChannelKeys.STAFF_LOG.value, None)
+
+        if channel is None:
+            return
+
+        channel = self.get_channel(channel)
+
+        if channel is None:
+            return
+
+        self.log_sink.post(channel, discord.Embed(
+            title=Emojis.STOP + " Regex Quarantined",
+            description=f"The pattern `{pattern}` (from {source}) took longer than {self.regex_sandbox.timeout} "
+                        f"seconds to evaluate, and has been quarantined. It will be ignored until it is changed or "
+                        f"the bot restarts.",
+            color=Colors.DANGER
+        ))
+
+    async def __report_failed_unban(self, guild: discord.Guild, user: discord.User, error: Exception):
+        channel = self.config.snapshot.get('specialChannels').get(ChannelKeys.STAFF_ALERTS.value, None)
+
+        if channel is None:
+            return
+
+        self.log_sink.post(self.get_channel(channel), discord.Embed(
+            title=Emojis.STOP + " Softban Not Lifted",
+            description=f"The user {user} (`{user.id}`) was softbanned from {guild.name}, but the ban could not be "
+                        f"lifted afterwards ({error}). **They are still banned**, and need to be unbanned by hand.",
+            color=Colors.DANGER
+        ), urgent=True)
+
     async def on_error(self, event_method, *args, **kwargs):
         exception = sys.exc_info()
 
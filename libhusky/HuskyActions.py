@@ -0,0 +1,521 @@
+import asyncio
+import collections
+import datetime
+import logging
+import math
+import time
+from enum import IntEnum
+from typing import Optional
+
+import discord
+
+LOG = logging.getLogger("HuskyBot.ActionQueue")
+
+defaults = {
+    'deletesPerSecond': 5,  # Single message deletes per channel per second
+    'bulkDeletesPerSecond': 1,  # Bulk deletes per channel per second
+    'memberActionsPerSecond': 5,  # Bans and kicks per guild per second
+    'dedupeSeconds': 60  # Time (in seconds) a banned/kicked user stays marked as such, so repeat requests are skipped
+}
+
+# Discord limits on bulk deletes: 2 to 100 messages, none of them older than 14 days. A little margin is kept on the
+# age, as the request may wait on the rate limit for a while.
+BULK_DELETE_LIMIT = 100
+BULK_DELETE_MAX_AGE = datetime.timedelta(days=14) - datetime.timedelta(minutes=5)
+
+# Number of recently deleted messages and recently actioned users remembered for deduplication.
+RECENT_LIMIT = 10000
+
+# Delays (in seconds) between further attempts to lift a softban whose unban failed.
+UNBAN_RETRY_DELAYS = (5, 30, 120, 600)
+
+
+class ActionKind(IntEnum):
+    """
+    Moderation actions, weakest first. When several are requested for the same user at once, only the strongest runs.
+
+    A softban is a ban that's lifted right away, to purge a user's messages and remove them from the guild. It's
+    stronger than a kick, but a real ban requested alongside it takes over (and is then never lifted).
+    """
+
+    DELETE = 1
+    KICK = 2
+    SOFTBAN = 3
+    BAN = 4
+
+
+class RateLimiter:
+    """
+    A token bucket allowing bursts of up to `rate` calls, refilled at `rate` calls every `per` seconds.
+
+    Discord enforces its rate limits per route "bucket" (e.g. message deletes per channel). Every bucket the queue
+    calls has exactly one worker consuming it, so staying under the limit here means requests are never rejected with
+    a 429, rather than being retried after one.
+    """
+
+    __slots__ = ['rate', 'per', '_tokens', '_updated']
+
+    def __init__(self, rate: float, per: float = 1.0):
+        self.rate = max(float(rate), 0.001)
+        self.per = per
+        self._tokens = self.rate
+        self._updated = time.monotonic()
+
+    async def acquire(self):
+        while True:
+            now = time.monotonic()
+            self._tokens = min(self.rate, self._tokens + (now - self._updated) * self.rate / self.per)
+            self._updated = now
+
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+
+            await asyncio.sleep((1 - self._tokens) * self.per / self.rate)
+
+
+class PendingDelete:
+    __slots__ = ['message', 'future', 'enqueued', 'started']
+
+    def __init__(self, message: discord.Message, future: asyncio.Future):
+        self.message = message
+        self.future = future
+        self.enqueued = time.monotonic()
+        self.started = False
+
+
+class PendingMemberAction:
+    __slots__ = ['guild', 'user', 'kind', 'reason', 'delete_message_days', 'future', 'enqueued', 'started']
+
+    def __init__(self, guild: discord.Guild, user, kind: ActionKind, reason: str, delete_message_days: int,
+                 future: asyncio.Future):
+        self.guild = guild
+        self.user = user
+        self.kind = kind
+        self.reason = reason
+        self.delete_message_days = delete_message_days
+        self.future = future
+        self.enqueued = time.monotonic()
+        self.started = False
+
+
+class ActionQueueStats:
+    """
+    Counters for the moderation action queue. Latency (from request to completion) is calculated over the most recent
+    actions only.
+    """
+
+    def __init__(self, window: int = 1000):
+        self.requested = 0
+        self.executed = collections.Counter()  # ActionKind name -> count
+        self.deduplicated = 0
+        self.escalated = 0
+        self.absorbed = 0
+        self.bulk_deletes = 0
+        self.bulk_deleted = 0
+        self.errors = 0
+        self.max_depth = 0
+
+        self._latencies = collections.deque(maxlen=window)
+
+    def record(self, latency: float):
+        self._latencies.append(latency)
+
+    def latency_percentile(self, percentile: float) -> float:
+        """
+        :return: The action latency (in seconds) at the given percentile (0-100) over recent actions.
+        """
+        if not self._latencies:
+            return 0.0
+
+        latencies = sorted(self._latencies)
+        index = min(len(latencies) - 1, int(math.ceil(percentile / 100 * len(latencies))) - 1)
+
+        return latencies[max(index, 0)]
+
+
+class ActionQueue:
+    """
+    The single way moderation actions (deletes, kicks, bans) reach Discord.
+
+    When a spam message trips several filters at once, each of them decides to delete it and possibly to punish its
+    author. Rather than every filter making its own REST calls (and all but the first failing with NotFound), they
+    all ask the queue, which:
+
+    - Deduplicates: a message is deleted once, and everybody asking gets the same result. A user who was just banned
+      isn't banned again, nor kicked.
+    - Escalates: requests for the same user are merged into the strongest of them (ban > softban > kick). A (soft)ban
+      that purges the user's messages also covers any of their deletes still waiting, which are then never sent.
+    - Batches: deletes queued in the same channel are sent as one bulk delete (up to 100 messages under 14 days old).
+    - Rate-limits itself, per channel for deletes and per guild for kicks and bans, staying inside Discord's buckets.
+
+    Nothing is delayed to wait for a batch: an idle queue sends a request right away, and batches form on their own
+    when requests arrive faster than they can be sent (e.g. during a raid).
+
+    Every request is a coroutine returning True if the action was carried out, and False if it wasn't needed (the
+    message was already gone, the user was already banned, ...). Any other API error is raised to every requester.
+    """
+
+    def __init__(self, deletes_per_second: float = defaults['deletesPerSecond'],
+                 bulk_deletes_per_second: float = defaults['bulkDeletesPerSecond'],
+                 member_actions_per_second: float = defaults['memberActionsPerSecond'],
+                 dedupe_seconds: float = defaults['dedupeSeconds'], on_unban_failed=None):
+        """
+        :param deletes_per_second: The number of single message deletes to send per channel per second.
+        :param bulk_deletes_per_second: The number of bulk deletes to send per channel per second.
+        :param member_actions_per_second: The number of kicks and bans to send per guild per second.
+        :param dedupe_seconds: How long (in seconds) a kicked or banned user is remembered, to skip repeat requests.
+        :param on_unban_failed: A coroutine function called as `on_unban_failed(guild, user, exception)` when a softban
+                                couldn't be lifted after all retries, leaving the user banned.
+        """
+        self.deletes_per_second = deletes_per_second
+        self.bulk_deletes_per_second = bulk_deletes_per_second
+        self.member_actions_per_second = member_actions_per_second
+        self.dedupe_seconds = dedupe_seconds
+        self.on_unban_failed = on_unban_failed
+
+        self._deletes = {}  # message ID -> PendingDelete
+        self._channels = {}  # channel ID -> deque of PendingDelete, waiting to be sent
+        self._members = {}  # (guild ID, user ID) -> PendingMemberAction
+        self._guilds = {}  # guild ID -> deque of PendingMemberAction, waiting to be sent
+        self._limiters = {}  # (bucket, channel or guild ID) -> RateLimiter
+
+        self._deleted = collections.OrderedDict()  # message ID -> None
+        self._actioned = collections.OrderedDict()  # (guild ID, user ID) -> (ActionKind, monotonic time)
+
+        self.stats = ActionQueueStats()
+
+    @property
+    def depth(self) -> int:
+        """
+        The number of actions requested but not yet completed.
+        """
+        return len(self._deletes) + len(self._members)
+
+    async def delete(self, message: discord.Message) -> bool:
+        """
+        Delete a message.
+
+        :return: Returns False if the message was already deleted.
+        """
+        self.stats.requested += 1
+        pending = self._deletes.get(message.id)
+
+        if pending is None and message.id in self._deleted:
+            self.stats.deduplicated += 1
+            return False
+
+        if pending is not None:
+            self.stats.deduplicated += 1
+        else:
+            pending = PendingDelete(message, asyncio.get_event_loop().create_future())
+            self._deletes[message.id] = pending
+            self._enqueue(self._channels, message.channel.id, pending, self._run_channel)
+
+        # A cancelled requester mustn't cancel the action for everybody else.
+        return await asyncio.shield(pending.future)
+
+    async def ban(self, guild: discord.Guild, user, reason: str = None, delete_message_days: int = 1) -> bool:
+        """
+        Ban a user (who doesn't have to be a member of the guild).
+
+        :return: Returns False if the user was banned (or the ban was already requested) within the last
+                 `dedupe_seconds`.
+        """
+        return await self._member_action(guild, user, ActionKind.BAN, reason, delete_message_days)
+
+    async def softban(self, guild: discord.Guild, user, reason: str = None, delete_message_days: int = 1) -> bool:
+        """
+        Ban a user to purge their messages, and unban them straight away. If a real ban for the same user is requested
+        before the softban is sent, the user is banned (and stays banned) instead. A failed unban is retried a few
+        times, and then reported through `on_unban_failed`.
+
+        :return: Returns False if the user was softbanned or banned (or that was already requested) within the last
+                 `dedupe_seconds`.
+        """
+        return await self._member_action(guild, user, ActionKind.SOFTBAN, reason, delete_message_days)
+
+    async def kick(self, member: discord.Member, reason: str = None) -> bool:
+        """
+        Kick a member. If a ban for the same member is requested before the kick is sent, the member is banned instead.
+
+        :return: Returns False if the member was already kicked or banned within the last `dedupe_seconds`, or isn't
+                 a member anymore.
+        """
+        return await self._member_action(member.guild, member, ActionKind.KICK, reason, 0)
+
+    def forget(self, guild: discord.Guild, user):
+        """
+        Forget that a user was recently kicked or banned, so that requests to act on them aren't skipped. Call this
+        when they are unbanned, or rejoin.
+        """
+        self._actioned.pop((guild.id, user.id), None)
+
+    async def _member_action(self, guild: discord.Guild, user, kind: ActionKind, reason: str,
+                             delete_message_days: int) -> bool:
+        self.stats.requested += 1
+        key = (guild.id, user.id)
+
+        actioned = self._actioned.get(key)
+        if actioned is not None and actioned[0] >= kind and actioned[1] + self.dedupe_seconds > time.monotonic():
+            self.stats.deduplicated += 1
+            return False
+
+        pending = self._members.get(key)
+
+        # Merge into a pending request, unless that's already being sent and is weaker than this one.
+        if pending is not None and (pending.kind >= kind or not pending.started):
+            if kind > pending.kind:
+                LOG.debug("Escalating %s on %s to %s.", pending.kind.name, user, kind.name)
+                pending.kind = kind
+                pending.user = user
+                pending.reason = reason
+                self.stats.escalated += 1
+            else:
+                self.stats.deduplicated += 1
+
+            if not pending.started:
+                pending.delete_message_days = max(pending.delete_message_days, delete_message_days)
+
+            return await asyncio.shield(pending.future)
+
+        pending = PendingMemberAction(guild, user, kind, reason, delete_message_days,
+                                      asyncio.get_event_loop().create_future())
+        self._members[key] = pending
+        self._enqueue(self._guilds, guild.id, pending, self._run_guild)
+
+        return await asyncio.shield(pending.future)
+
+    def _enqueue(self, queues: dict, queue_id: int, pending, runner):
+        queue = queues.get(queue_id)
+
+        if queue is None:
+            # No worker for this channel/guild yet; start one. It exits (and drops the queue) once it's drained.
+            queue = queues[queue_id] = collections.deque()
+            asyncio.ensure_future(runner(queue_id, queue))
+
+        queue.append(pending)
+        self.stats.max_depth = max(self.stats.max_depth, self.depth)
+
+    def _limiter(self, bucket: str, bucket_id: int, rate: float) -> RateLimiter:
+        limiter = self._limiters.get((bucket, bucket_id))
+
+        if limiter is None:
+            limiter = self._limiters[(bucket, bucket_id)] = RateLimiter(rate)
+
+        return limiter
+
+    async def _run_channel(self, channel_id: int, queue: collections.deque):
+        try:
+            while queue:
+                batch = []
+
+                while queue and len(batch) < BULK_DELETE_LIMIT:
+                    pending = queue.popleft()
+                    pending.started = True
+                    batch.append(pending)
+
+                await self._delete_batch(channel_id, batch)
+        finally:
+            del self._channels[channel_id]
+            self._limiters.pop(("delete", channel_id), None)
+            self._limiters.pop(("bulk", channel_id), None)
+
+    async def _delete_batch(self, channel_id: int, batch: list):
+        cutoff = datetime.datetime.utcnow() - BULK_DELETE_MAX_AGE
+        bulk = [pending for pending in batch if pending.message.created_at > cutoff]
+        single = [pending for pending in batch if pending.message.created_at <= cutoff]
+
+        if len(bulk) >= 2:
+            await self._limiter("bulk", channel_id, self.bulk_deletes_per_second).acquire()
+
+            try:
+                await bulk[0].message.channel.delete_messages([pending.message for pending in bulk])
+            except discord.HTTPException as e:
+                # Most likely one of the messages is gone already. Fall back to deleting them one by one.
+                LOG.debug("Bulk delete of %d messages in channel %s failed (%s), deleting one by one.", len(bulk),
+                          channel_id, e)
+                single = bulk + single
+            else:
+                self.stats.bulk_deletes += 1
+                self.stats.bulk_deleted += len(bulk)
+
+                for pending in bulk:
+                    self._finish_delete(pending, True)
+        else:
+            single = bulk + single
+
+        for pending in single:
+            await self._limiter("delete", channel_id, self.deletes_per_second).acquire()
+
+            # noinspection PyBroadException
+            try:
+                await pending.message.delete()
+            except discord.NotFound:
+                self._finish_delete(pending, False)
+            except Exception as e:
+                self._fail(pending, e)
+                self._deletes.pop(pending.message.id, None)
+            else:
+                self._finish_delete(pending, True)
+
+    def _finish_delete(self, pending: PendingDelete, result: bool):
+        message_id = pending.message.id
+
+        if self._deletes.get(message_id) is pending:
+            del self._deletes[message_id]
+
+        self._deleted[message_id] = None
+        while len(self._deleted) > RECENT_LIMIT:
+            self._deleted.popitem(last=False)
+
+        if result:
+            self.stats.executed[ActionKind.DELETE.name] += 1
+
+        self._resolve(pending, result)
+
+    async def _run_guild(self, guild_id: int, queue: collections.deque):
+        try:
+            while queue:
+                pending = queue.popleft()
+
+                await self._limiter("member", guild_id, self.member_actions_per_second).acquire()
+                pending.started = True
+
+                await self._member_action_now(pending)
+        finally:
+            del self._guilds[guild_id]
+            self._limiters.pop(("member", guild_id), None)
+
+    async def _member_action_now(self, pending: PendingMemberAction):
+        key = (pending.guild.id, pending.user.id)
+        absorbed = []
+
+        if pending.kind >= ActionKind.SOFTBAN and pending.delete_message_days > 0:
+            absorbed = self._absorb_deletes(pending)
+
+        # noinspection PyBroadException
+        try:
+            if pending.kind >= ActionKind.SOFTBAN:
+                await pending.guild.ban(pending.user, reason=pending.reason,
+                                        delete_message_days=pending.delete_message_days)
+            else:
+                await pending.guild.kick(pending.user, reason=pending.reason)
+        except discord.NotFound:
+            result = False
+        except Exception as e:
+            # The messages weren't purged after all; send their deletes after all.
+            for pending_delete in absorbed:
+                pending_delete.started = False
+                self._enqueue(self._channels, pending_delete.message.channel.id, pending_delete, self._run_channel)
+
+            if self._members.get(key) is pending:
+                del self._members[key]
+
+            self._fail(pending, e)
+            return
+        else:
+            result = True
+
+        # The ban (and its purge) happened, whatever becomes of the unban. Only ever lift the ban just issued here. A
+        # real ban requested meanwhile waits behind this action (it was too late to merge), and is sent after the unban.
+        if result and pending.kind == ActionKind.SOFTBAN:
+            error = await self._unban(pending.guild, pending.user)
+
+            if error is not None:
+                asyncio.ensure_future(self._retry_unban(pending.guild, pending.user, error))
+
+        if self._members.get(key) is pending:
+            del self._members[key]
+
+        if result:
+            self.stats.executed[pending.kind.name] += 1
+            self._actioned[key] = (pending.kind, time.monotonic())
+            self._actioned.move_to_end(key)
+
+            while len(self._actioned) > RECENT_LIMIT:
+                self._actioned.popitem(last=False)
+
+        for pending_delete in absorbed:
+            self.stats.absorbed += 1
+            self._finish_delete(pending_delete, result)
+
+        self._resolve(pending, result)
+
+    async def _unban(self, guild: discord.Guild, user) -> Optional[Exception]:
+        """
+        Lift a softban.
+
+        :return: Returns the error if the unban failed, or None.
+        """
+        # noinspection PyBroadException
+        try:
+            await guild.unban(user, reason="Softban reversal")
+        except discord.NotFound:
+            # Somebody unbanned them already.
+            pass
+        except Exception as e:
+            return e
+
+        return None
+
+    async def _retry_unban(self, guild: discord.Guild, user, error: Exception):
+        key = (guild.id, user.id)
+
+        for delay in UNBAN_RETRY_DELAYS:
+            LOG.warning("Could not lift the softban on %s (%s), retrying in %d seconds.", user, error, delay)
+            await asyncio.sleep(delay)
+
+            # A real ban since then must stay in place.
+            actioned = self._actioned.get(key)
+            pending = self._members.get(key)
+
+            if (actioned is not None and actioned[0] == ActionKind.BAN) or \
+                    (pending is not None and pending.kind == ActionKind.BAN):
+                LOG.info("Not lifting the softban on %s, they have been banned since.", user)
+                return
+
+            error = await self._unban(guild, user)
+
+            if error is None:
+                return
+
+        self.stats.errors += 1
+        LOG.error("Could not lift the softban on %s (%s). They remain banned.", user, error)
+
+        if self.on_unban_failed is not None:
+            try:
+                await self.on_unban_failed(guild, user, error)
+            except Exception:
+                LOG.exception("Failed to report the softban left on %s.", user)
+
+    def _absorb_deletes(self, ban: PendingMemberAction) -> list:
+        """
+        Take the not-yet-sent deletes of a user's messages out of their channel queues, if the ban is about to purge
+        those messages anyways.
+        """
+        cutoff = datetime.datetime.utcnow() - datetime.timedelta(days=ban.delete_message_days)
+        absorbed = [pending for pending in self._deletes.values()
+                    if not pending.started and pending.message.author.id == ban.user.id
+                    and pending.message.guild is not None and pending.message.guild.id == ban.guild.id
+                    and pending.message.created_at > cutoff]
+
+        for pending in absorbed:
+            pending.started = True
+            self._channels[pending.message.channel.id].remove(pending)
+
+        return absorbed
+
+    def _resolve(self, pending, result: bool):
+        self.stats.record(time.monotonic() - pending.enqueued)
+
+        if not pending.future.done():
+            pending.future.set_result(result)
+
+    def _fail(self, pending, exception: Exception):
+        self.stats.errors += 1
+        self.stats.record(time.monotonic() - pending.enqueued)
+        LOG.warning("Moderation action failed: %s", exception)
+
+        if not pending.future.done():
+            pending.future.set_exception(exception)
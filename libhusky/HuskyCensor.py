@@ -0,0 +1,336 @@
+import logging
+import re
+
+from libhusky.HuskyFoldTable import FOLD_TABLE
+
+# Optional accelerated Aho-Corasick backend (pip install pyahocorasick)
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+LOG = logging.getLogger("HuskyBot.Censor")
+
+# Characters that give a term any meaning beyond its literal text.
+_REGEX_METACHARACTERS = frozenset(".^$*+?{}[]\\|()")
+
+# Non-ASCII characters that re.IGNORECASE matches to an ASCII letter, but that str.lower() doesn't lower to it.
+_IGNORECASE_FIXES = str.maketrans({'\u0130': 'i', '\u0131': 'i', '\u017f': 's'})
+
+# Backreferences (\1, (?P=name)) point at the wrong group once a term is folded into a combined pattern.
+_BACKREFERENCE = re.compile(r"\\[1-9]|\(\?P=")
+
+# Global inline flags ((?i)...) are only legal at the very start of a pattern.
+_GLOBAL_FLAGS = re.compile(r"\(\?[aiLmsux]+\)")
+
+
+def fold(text: str) -> str:
+    """
+    Fold a string for evasion-resistant matching: confusables (fullwidth letters, mathematical alphanumerics, common
+    Cyrillic/Greek look-alikes, ...) become the plain letters they imitate, zero-width characters and combining marks
+    are dropped, and everything is case-folded. This is a single str.translate() pass over a precomputed table (see
+    HuskyFoldTable).
+    """
+    return text.translate(FOLD_TABLE)
+
+
+def is_literal(term: str) -> bool:
+    """
+    Check if a censor term matches only its own text, and so can skip the regex engine.
+
+    Only ASCII terms count; case-insensitive matching of anything else is best left to the regex engine's own rules.
+    """
+    return bool(term) and term.isascii() and _REGEX_METACHARACTERS.isdisjoint(term)
+
+
+class LiteralMatcher:
+    """
+    Finds any of a set of literal strings in a text, case-insensitively, in a single pass over the text.
+
+    This is an Aho-Corasick automaton: the literals are built into a trie, with each node linked to the node for its
+    longest proper suffix that's also in the trie. Scanning walks the trie one character at a time, following those
+    links on a mismatch, so the cost depends on the length of the text and not on how many literals there are.
+
+    If pyahocorasick is installed, it's used in place of the pure Python automaton.
+    """
+
+    __slots__ = ['_terms', '_automaton', '_goto', '_fail', '_output']
+
+    def __init__(self, terms):
+        """
+        :param terms: The literal terms to find. Terms that only differ in case are all reported together.
+        """
+        self._terms = {}  # lowercased literal -> every original term spelled that way
+
+        for term in terms:
+            self._terms.setdefault(term.lower(), []).append(term)
+
+        self._automaton = None
+
+        if ahocorasick is not None and self._terms:
+            self._automaton = ahocorasick.Automaton()
+
+            for key in self._terms:
+                self._automaton.add_word(key, key)
+
+            self._automaton.make_automaton()
+        else:
+            self._build()
+
+    def __len__(self):
+        return len(self._terms)
+
+    def _build(self):
+        # Node 0 is the root. _goto[n] maps a character to the next node, _output[n] lists the literals ending at n.
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [()]
+
+        for key in self._terms:
+            node = 0
+
+            for char in key:
+                next_node = self._goto[node].get(char)
+
+                if next_node is None:
+                    next_node = len(self._goto)
+                    self._goto[node][char] = next_node
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append(())
+
+                node = next_node
+
+            self._output[node] = (key,)
+
+        # Breadth-first, so a node's failure link is always resolved before its children need it.
+        queue = list(self._goto[0].values())
+
+        for node in queue:
+            for (char, child) in self._goto[node].items():
+                fallback = self._fail[node]
+
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+
+                self._fail[child] = self._goto[fallback].get(char, 0)
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+                queue.append(child)
+
+    def _scan(self, text: str):
+        """
+        Yield every literal key found in the (lowercased) text, in order of where it ends.
+        """
+        if self._automaton is not None:
+            for (_, key) in self._automaton.iter(text):
+                yield key
+
+            return
+
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        node = 0
+
+        for char in text:
+            while node and char not in goto[node]:
+                node = fail[node]
+
+            node = goto[node].get(char, 0)
+
+            if output[node]:
+                yield from output[node]
+
+    def search(self, text: str):
+        """
+        :return: Returns the first literal term found in the text, or None.
+        """
+        if not self._terms:
+            return None
+
+        for key in self._scan(self._fold(text)):
+            return self._terms[key][0]
+
+        return None
+
+    def find_all(self, text: str) -> set:
+        """
+        :return: Returns every literal term found in the text.
+        """
+        if not self._terms:
+            return set()
+
+        return {term for key in set(self._scan(self._fold(text))) for term in self._terms[key]}
+
+    @staticmethod
+    def _fold(text: str) -> str:
+        # Lowercase the text the way re.IGNORECASE would compare it to an ASCII literal.
+        return text.translate(_IGNORECASE_FIXES).lower()
+
+
+class CensorMatcher:
+    """
+    A list of censor terms (plain words or regular expressions), matched case-insensitively.
+
+    Terms are sorted once, when the matcher is built. Plain words - most censors - go into a LiteralMatcher, which
+    finds all of them in a single scan whatever their number. The regex engine is only used for the real patterns.
+
+    Each remaining term becomes one alternative (`(?:term)|(?:term)|...`), so a message is checked against every term
+    in one pass. Only once the combined pattern hits are the terms tried one by one at the match position, to report
+    which term it was. (Wrapping each term in a named group would report it directly, but the regex engine saves and
+    restores every group on every alternative it tries, which makes a combined pattern of a few hundred named groups
+    far slower than no combining at all.)
+
+    Terms that can't be combined safely (named groups, backreferences, global inline flags) are kept as standalone
+    patterns and checked after the combined one. Terms that aren't valid regular expressions are logged and ignored.
+    """
+
+    __slots__ = ['terms', 'literals', 'patterns', '_combined', '_combinable', '_standalone']
+
+    def __init__(self, terms):
+        """
+        :param terms: The censor terms (plain words or regular expressions).
+        """
+        self.terms = tuple(terms)
+        self.literals = LiteralMatcher(t for t in self.terms if is_literal(t))
+        self._combined = None
+        self._combinable = []
+        self._standalone = []
+
+        # Every valid term that needs the regex engine, in order.
+        patterns = []
+
+        for term in self.terms:
+            if is_literal(term):
+                continue
+
+            try:
+                compiled = re.compile(term, re.IGNORECASE)
+            except re.error as e:
+                LOG.warning("Ignoring invalid censor term %r: %s", term, e)
+                continue
+
+            if compiled.groupindex or _BACKREFERENCE.search(term) or _GLOBAL_FLAGS.search(term):
+                self._standalone.append((term, compiled))
+            else:
+                self._combinable.append((term, compiled))
+
+            patterns.append(term)
+
+        self.patterns = tuple(patterns)
+
+        if not self._combinable:
+            return
+
+        try:
+            self._combined = re.compile("|".join(f"(?:{term})" for (term, _) in self._combinable), re.IGNORECASE)
+        except (re.error, RecursionError, OverflowError):
+            # Some term didn't survive being combined. Correct, if slower, to check them all one by one.
+            LOG.warning("Could not combine %d censor terms, checking them individually.", len(self._combinable))
+            self._standalone = self._combinable + self._standalone
+            self._combinable = []
+
+    def __len__(self):
+        return len(self.terms)
+
+    def search(self, text: str, folded: str = None):
+        """
+        Find the first censor term that matches anywhere in a string.
+
+        :param text: The string to check.
+        :param folded: The string's folded form (see fold()), to also check if nothing matches the string as-is.
+        :return: Returns the matching term, or None if nothing matched.
+        """
+        term = self._search(text)
+
+        if term is None and folded is not None and folded != text:
+            term = self._search(folded)
+
+        return term
+
+    def find_all(self, text: str, folded: str = None) -> list:
+        """
+        Find every censor term that matches anywhere in a string.
+
+        :param text: The string to check.
+        :param folded: The string's folded form (see fold()), to also check.
+        :return: Returns the matching terms, in the order they were given.
+        """
+        matched = self._find_all(text)
+
+        if folded is not None and folded != text:
+            matched |= self._find_all(folded)
+
+        return [term for term in self.terms if term in matched]
+
+    def _search(self, text: str):
+        term = self.literals.search(text)
+
+        if term is not None:
+            return term
+
+        if self._combined is not None:
+            match = self._combined.search(text)
+
+            if match is not None:
+                # The combined pattern takes the first alternative that matches at the leftmost position.
+                for (term, compiled) in self._combinable:
+                    if compiled.match(text, match.start()) is not None:
+                        return term
+
+        for (term, compiled) in self._standalone:
+            if compiled.search(text) is not None:
+                return term
+
+        return None
+
+    def _find_all(self, text: str) -> set:
+        matched = self.literals.find_all(text)
+
+        if self._combined is not None and self._combined.search(text) is not None:
+            matched.update(term for (term, compiled) in self._combinable if compiled.search(text) is not None)
+
+        matched.update(term for (term, compiled) in self._standalone if compiled.search(text) is not None)
+
+        return matched
+
+
+class CensorCache:
+    """
+    Holds one CensorMatcher per censor scope ("global", a channel ID, or "user-<id>").
+
+    A scope's matcher is only rebuilt when that scope's term list changes; editing one channel's censors leaves every
+    other scope's compiled pattern in place.
+    """
+
+    def __init__(self):
+        self._matchers = {}
+
+    def __len__(self):
+        return len(self._matchers)
+
+    def get(self, scope: str, terms) -> CensorMatcher:
+        """
+        Get the matcher for a scope, compiling it if the scope's terms have changed.
+
+        :param scope: The scope's key in the censor config.
+        :param terms: The scope's current list of terms.
+        """
+        terms = tuple(terms)
+        matcher = self._matchers.get(scope)
+
+        if matcher is not None:
+            if matcher.terms is terms:
+                return matcher
+
+            # The config was rewritten (by a change to some other scope), but this scope's terms are the same. Adopt
+            # the new tuple so the next lookup takes the identity check above.
+            if matcher.terms == terms:
+                matcher.terms = terms
+                return matcher
+
+        matcher = CensorMatcher(terms)
+        self._matchers[scope] = matcher
+        LOG.debug("Compiled %d censor term(s) for scope %s.", len(matcher), scope)
+
+        return matcher
@@ -1,6 +1,24 @@
 import json
+import logging
 import os
-from threading import Lock
+import sqlite3
+import tempfile
+import threading
+import time
+import zlib
+from threading import RLock
+from types import MappingProxyType
+
+LOG = logging.getLogger("HuskyBot.Config")
+
+# Default number of seconds a persistent store waits (coalescing writes) before flushing to disk.
+DEFAULT_FLUSH_INTERVAL = 2.0
+
+# A journal is compacted into its snapshot once it grows past the larger of this size or the snapshot itself.
+JOURNAL_COMPACT_MIN_BYTES = 64 * 1024
+
+# Top-level keys that can grow large enough to be worth storing one row per child in the SQLite backend.
+SQLITE_COLLECTION_KEYS = frozenset({'censors', 'responses', 'mutes'})
 
 
 def override_dumper(obj):
@@ -10,11 +28,534 @@ def override_dumper(obj):
         return obj.__dict__
 
 
+def atomic_write(path: str, data: str) -> None:
+    """
+    Write a file by way of a temporary file and an atomic rename, so readers (and crashes) never see a partial file.
+
+    :param path: The path of the file to (over)write.
+    :param data: The full contents to write.
+    """
+    directory = os.path.dirname(path) or '.'
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+
+    try:
+        try:
+            os.chmod(tmp_path, os.stat(path).st_mode & 0o777)
+        except FileNotFoundError:
+            os.chmod(tmp_path, 0o644)
+
+        with os.fdopen(fd, 'w') as tmp_file:
+            tmp_file.write(data)
+            tmp_file.flush()
+            os.fsync(tmp_file.fileno())
+
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def freeze(value):
+    """
+    Build a deep, read-only copy of a JSON-like value (dicts become mappingproxies, lists become tuples).
+
+    :param value: The value to freeze.
+    :return: An immutable equivalent of the value. Unknown objects are passed through untouched.
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({k: freeze(v) for k, v in value.items()})
+
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+
+    return value
+
+
+def thaw(value):
+    """
+    Build a mutable copy of a frozen value (the inverse of freeze()).
+
+    :param value: The value to thaw.
+    :return: A mutable equivalent of the value, with mappingproxies as dicts and tuples as lists.
+    """
+    if isinstance(value, MappingProxyType):
+        return {k: thaw(v) for k, v in value.items()}
+
+    if isinstance(value, tuple):
+        return [thaw(v) for v in value]
+
+    return value
+
+
+def _frozenset_view(value) -> frozenset:
+    return frozenset(value or [])
+
+
+class AntiSpamView:
+    """
+    Pre-resolved view of the `antiSpam` config section.
+    """
+
+    __slots__ = ('global_config', 'exempted_roles', 'enabled_modules', '_modules', '_resolved')
+
+    def __init__(self, data: dict = None):
+        data = data or {}
+
+        self.global_config = freeze(data.get('__global__', {}))
+        self.exempted_roles = frozenset(data.get('__global__', {}).get('exemptedRoles', []))
+        self.enabled_modules = frozenset(name for (name, conf) in data.items()
+                                         if not name.startswith("__") and conf.get('enabled', True))
+        self._modules = {name: conf.get('config', {}) for (name, conf) in data.items() if not name.startswith("__")}
+        self._resolved = {}
+
+    def module_config(self, name: str, defaults: dict = None):
+        """
+        Get the (read-only) configuration for an AntiSpam module, with any unset values filled in from its defaults.
+
+        :param name: The name of the module, e.g. `LinkFilter`.
+        :param defaults: The module's default configuration.
+        :return: A read-only mapping of the module's effective configuration.
+        """
+        try:
+            return self._resolved[name]
+        except KeyError:
+            resolved = freeze({**(defaults or {}), **self._modules.get(name, {})})
+            self._resolved[name] = resolved
+            return resolved
+
+
+class LoggersView:
+    """
+    Pre-resolved view of the `loggers` config section.
+    """
+
+    __slots__ = ('enabled', 'ignored_channels')
+
+    def __init__(self, data: dict = None):
+        data = data or {}
+
+        self.enabled = frozenset(k for k in data.keys() if not k.startswith("__"))
+        self.ignored_channels = frozenset(data.get('__global__', {}).get('ignoredChannels', []))
+
+
+# Typed views for hot top-level keys. Anything not listed here is simply frozen.
+__views__ = {
+    'userBlacklist': _frozenset_view,
+    'ignoredGuilds': _frozenset_view,
+    'ignoredCommands': _frozenset_view,
+    'disabledChannels': _frozenset_view,
+    'flaggedUsers': _frozenset_view,
+    'foldedMatching': _frozenset_view,
+    'specialChannels': lambda v: freeze(v or {}),
+    'specialRoles': lambda v: freeze(v or {}),
+    'censors': lambda v: freeze(v or {}),
+    'flaggedRegexes': lambda v: freeze(v or []),
+    'antiSpam': AntiSpamView,
+    'loggers': LoggersView,
+}
+
+__empty_views__ = {k: view(None) for (k, view) in __views__.items()}
+
+
+class ConfigSnapshot:
+    """
+    An immutable, pre-resolved copy of a WolfConfig.
+
+    Snapshots are rebuilt (one key at a time) whenever the store is written, and swapped in atomically. Reading from a
+    snapshot takes no locks, which makes it the preferred way to read config on hot paths (e.g. once per message).
+    Well-known keys are exposed as typed views - membership lists become frozensets, `antiSpam` becomes an
+    AntiSpamView, and so on. Registered keys always resolve to a view, even if they are absent from the store.
+    """
+
+    __slots__ = ('_values',)
+
+    def __init__(self, values: dict):
+        self._values = values
+
+    @staticmethod
+    def build(config: dict):
+        return ConfigSnapshot({k: ConfigSnapshot._resolve(k, v) for (k, v) in config.items()})
+
+    @staticmethod
+    def _resolve(key, value):
+        view = __views__.get(key)
+
+        if view is not None:
+            return view(value)
+
+        return freeze(value)
+
+    def get(self, key: str, default=None):
+        try:
+            return self._values[key]
+        except KeyError:
+            return __empty_views__.get(key, default)
+
+    def __getitem__(self, item):
+        return self._values[item]
+
+    def __contains__(self, item):
+        return item in self._values
+
+    def evolve(self, key: str, value=None, removed: bool = False):
+        """
+        Create a new snapshot with a single key replaced (or removed).
+        """
+        values = dict(self._values)
+
+        if removed:
+            values.pop(key, None)
+        else:
+            values[key] = self._resolve(key, value)
+
+        return ConfigSnapshot(values)
+
+
+class JsonFileBackend:
+    """
+    The classic storage backend - the entire store lives in a single JSON file, rewritten on every flush.
+    """
+
+    def __init__(self, path: str):
+        self._path = path
+        self._lock = RLock()
+
+    def load(self) -> dict:
+        with open(self._path, 'r') as f:
+            return json.loads(f.read())
+
+    def write(self, config: dict, changed_keys: set = None) -> None:
+        """
+        Persist the store.
+
+        :param config: The full live store.
+        :param changed_keys: The top-level keys changed since the last write, or None if a full write is required.
+        """
+        data = json.dumps(config, sort_keys=True, default=override_dumper, indent=2)
+
+        with self._lock:
+            atomic_write(self._path, data)
+
+    def close(self) -> None:
+        pass
+
+
+class JournaledFileBackend(JsonFileBackend):
+    """
+    A JSON snapshot plus an append-only journal of key-level changes.
+
+    Every flush appends one record per changed top-level key to `<path>.journal`, so a small change costs a small
+    write no matter how large the store has grown. Once the journal outgrows the snapshot, the snapshot is rewritten
+    and the journal truncated. Records are CRC-checked and newline-terminated; on load, replay stops at the first
+    torn or corrupt record and the journal is cut back to the last good one.
+    """
+
+    def __init__(self, path: str):
+        super().__init__(path)
+        self._journal_path = f"{path}.journal"
+        self._journal_size = 0
+        self._snapshot_size = 0
+
+    def load(self) -> dict:
+        with self._lock:
+            try:
+                with open(self._path, 'r') as f:
+                    data = f.read()
+                    config = json.loads(data)
+                    self._snapshot_size = len(data)
+            except FileNotFoundError:
+                # A store that was only ever journaled (crashed before first compaction) is still a valid store.
+                if not os.path.exists(self._journal_path):
+                    raise
+
+                config = {}
+
+            self._journal_size = self._replay(config)
+
+        return config
+
+    def write(self, config: dict, changed_keys: set = None) -> None:
+        if changed_keys is None:
+            self.compact(config)
+            return
+
+        records = []
+        for key in changed_keys:
+            if key in config:
+                records.append(self._encode_record({"op": "set", "key": key, "value": config[key]}))
+            else:
+                records.append(self._encode_record({"op": "delete", "key": key}))
+
+        data = b''.join(records)
+
+        with self._lock:
+            with open(self._journal_path, 'ab') as journal:
+                journal.write(data)
+                journal.flush()
+                os.fsync(journal.fileno())
+
+            self._journal_size += len(data)
+
+            if self._journal_size > max(JOURNAL_COMPACT_MIN_BYTES, self._snapshot_size):
+                self.compact(config)
+
+    def compact(self, config: dict) -> None:
+        """
+        Fold the journal into a fresh snapshot and truncate it.
+
+        The snapshot is replaced atomically before the journal is truncated. Replaying a journal over a snapshot that
+        already contains its changes is harmless, so a crash between the two steps loses nothing.
+        """
+        data = json.dumps(config, sort_keys=True, default=override_dumper, indent=2)
+
+        with self._lock:
+            atomic_write(self._path, data)
+            self._snapshot_size = len(data)
+
+            with open(self._journal_path, 'wb') as journal:
+                os.fsync(journal.fileno())
+
+            self._journal_size = 0
+
+        LOG.debug("Compacted config journal into snapshot %s (%d bytes).", self._path, self._snapshot_size)
+
+    @staticmethod
+    def _encode_record(record: dict) -> bytes:
+        payload = json.dumps(record, sort_keys=True, default=override_dumper, separators=(',', ':')).encode('utf-8')
+        return b'%08x %s\n' % (zlib.crc32(payload), payload)
+
+    def _replay(self, config: dict) -> int:
+        good_offset = 0
+        record_count = 0
+
+        try:
+            journal = open(self._journal_path, 'rb')
+        except FileNotFoundError:
+            return 0
+
+        with journal:
+            for line in journal:
+                # A record without its trailing newline was torn mid-write. Anything past a bad record is suspect.
+                if not line.endswith(b'\n'):
+                    break
+
+                try:
+                    crc, payload = line[:-1].split(b' ', 1)
+                    if int(crc, 16) != zlib.crc32(payload):
+                        break
+
+                    record = json.loads(payload.decode('utf-8'))
+                except ValueError:
+                    break
+
+                if record['op'] == 'set':
+                    config[record['key']] = record['value']
+                else:
+                    config.pop(record['key'], None)
+
+                good_offset += len(line)
+                record_count += 1
+
+            journal_size = journal.seek(0, os.SEEK_END)
+
+        if good_offset < journal_size:
+            LOG.warning("Config journal %s has %d bytes of torn or corrupt data after %d good records. Discarding.",
+                        self._journal_path, journal_size - good_offset, record_count)
+            os.truncate(self._journal_path, good_offset)
+
+        if record_count:
+            LOG.info("Replayed %d journaled change(s) into %s.", record_count, self._path)
+
+        return good_offset
+
+
+class SqliteBackend:
+    """
+    An embedded SQLite database (in WAL mode) holding one row per top-level key.
+
+    The database lives next to the JSON path it replaces (`config/config.json` becomes `config/config.sqlite3`).
+    Collections listed in SQLITE_COLLECTION_KEYS are stored one row per child (dict entry or list item), so adding a
+    single censor or mute only touches the rows that actually changed. If the database does not exist yet but the
+    JSON file does, the JSON file is migrated in on first load and left in place as a backup.
+    """
+
+    SCHEMA = [
+        "CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, kind TEXT NOT NULL, value TEXT)",
+        "CREATE TABLE IF NOT EXISTS children (key TEXT NOT NULL, child TEXT NOT NULL, value TEXT NOT NULL, "
+        "PRIMARY KEY (key, child))"
+    ]
+
+    def __init__(self, path: str):
+        self._path = path
+        self._db_path = os.path.splitext(path)[0] + '.sqlite3'
+        self._lock = RLock()
+        self._conn = None
+
+        # What is currently on disk, as {key: (kind, value_json or {child: child_json})}. Used to skip unchanged rows.
+        self._written = {}
+
+    @property
+    def db_path(self) -> str:
+        return self._db_path
+
+    def load(self) -> dict:
+        with self._lock:
+            if not os.path.exists(self._db_path):
+                # Let WolfConfig create the store (or fail) exactly as it would for a missing JSON file.
+                with open(self._path, 'r') as f:
+                    config = json.loads(f.read())
+
+                self._connect()
+                self.write(config, None)
+                LOG.info("Migrated config store %s into %s (%d keys).", self._path, self._db_path, len(config))
+
+                return config
+
+            self._connect()
+
+            config = {}
+            self._written = {}
+            children = {}
+
+            for key, child, value in self._conn.execute("SELECT key, child, value FROM children"):
+                children.setdefault(key, {})[child] = value
+
+            for key, kind, value in self._conn.execute("SELECT key, kind, value FROM entries"):
+                if kind == 'value':
+                    config[key] = json.loads(value)
+                    self._written[key] = (kind, value)
+                    continue
+
+                rows = children.get(key, {})
+                if kind == 'list':
+                    config[key] = [json.loads(rows[c]) for c in sorted(rows, key=int)]
+                else:
+                    config[key] = {c: json.loads(v) for c, v in rows.items()}
+
+                self._written[key] = (kind, rows)
+
+        return config
+
+    def write(self, config: dict, changed_keys: set = None) -> None:
+        if changed_keys is None:
+            changed_keys = set(config.keys()) | set(self._written.keys())
+
+        # Serialize everything up front, so that a store mutated mid-serialization leaves the database untouched.
+        encoded = {}
+        for key in changed_keys:
+            if key in config:
+                encoded[key] = self._encode(key, config[key])
+            else:
+                encoded[key] = None
+
+        with self._lock:
+            if self._conn is None:
+                self._connect()
+
+            with self._conn:
+                for key, entry in encoded.items():
+                    self._write_key(key, entry)
+
+            for key, entry in encoded.items():
+                if entry is None:
+                    self._written.pop(key, None)
+                else:
+                    self._written[key] = entry
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _connect(self):
+        self._conn = sqlite3.connect(self._db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+
+        with self._conn:
+            for statement in self.SCHEMA:
+                self._conn.execute(statement)
+
+    @staticmethod
+    def _dumps(value) -> str:
+        return json.dumps(value, sort_keys=True, default=override_dumper, separators=(',', ':'))
+
+    def _encode(self, key: str, value):
+        if key in SQLITE_COLLECTION_KEYS:
+            if isinstance(value, dict):
+                return 'dict', {str(k): self._dumps(v) for k, v in value.items()}
+            elif isinstance(value, list):
+                return 'list', {str(i): self._dumps(v) for i, v in enumerate(value)}
+
+        return 'value', self._dumps(value)
+
+    def _write_key(self, key: str, entry):
+        old_kind, old_value = self._written.get(key, (None, None))
+
+        if entry is None:
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            self._conn.execute("DELETE FROM children WHERE key = ?", (key,))
+            return
+
+        kind, value = entry
+
+        if kind == 'value':
+            if old_kind == kind and old_value == value:
+                return
+
+            self._conn.execute("INSERT OR REPLACE INTO entries (key, kind, value) VALUES (?, ?, ?)", (key, kind, value))
+
+            if old_kind not in (None, 'value'):
+                self._conn.execute("DELETE FROM children WHERE key = ?", (key,))
+
+            return
+
+        if old_kind != kind:
+            self._conn.execute("INSERT OR REPLACE INTO entries (key, kind, value) VALUES (?, ?, NULL)", (key, kind))
+            self._conn.execute("DELETE FROM children WHERE key = ?", (key,))
+            old_value = {}
+
+        self._conn.executemany("DELETE FROM children WHERE key = ? AND child = ?",
+                               [(key, c) for c in old_value.keys() - value.keys()])
+        self._conn.executemany("INSERT OR REPLACE INTO children (key, child, value) VALUES (?, ?, ?)",
+                               [(key, c, v) for c, v in value.items() if old_value.get(c) != v])
+
+
 class WolfConfig:
-    def __init__(self, path: str = None, create_if_nonexistent: bool = False):
+    def __init__(self, path: str = None, create_if_nonexistent: bool = False, flush_interval: float = None,
+                 backend: JsonFileBackend = None):
+        """
+        Create a new key/value store, optionally backed by a file on disk.
+
+        :param path: The path to persist this store to. If None, the store is ephemeral.
+        :param create_if_nonexistent: Create the store on disk if it does not already exist.
+        :param flush_interval: If set, writes are deferred (write-behind) and coalesced into at most one disk write
+                               every `flush_interval` seconds. If unset, every mutation is written immediately.
+        :param backend: The storage backend to persist through. Defaults to a plain JSON file at `path`.
+        """
         self._config = {}
+        self._snapshot = None
         self._path = path
-        self._lock = Lock()
+        self._lock = RLock()
+
+        # Change tracking for caches built on top of this store
+        self._generations = {}
+        self._subscribers = {}
+        self._derived = {}
+
+        if backend is None and path is not None:
+            backend = JsonFileBackend(path)
+
+        self._backend = backend
+
+        # Write-behind state
+        self._flush_interval = flush_interval or None
+        self._dirty_keys = set()
+        self._flush_event = threading.Event()
+        self._close_event = threading.Event()
+        self._flush_thread = None
+        self._closed = False
 
         if self._path is not None:
             self.load(create_if_nonexistent)
@@ -50,15 +591,100 @@ class WolfConfig:
         with self._lock:
             return not self.get(key) is None
 
+    @property
+    def snapshot(self) -> ConfigSnapshot:
+        """
+        Get a lock-free, immutable view of this store. See ConfigSnapshot.
+
+        The snapshot is built on first access, and from then on kept current on every set()/delete(). Note that
+        in-place changes to objects returned by get() are only reflected once set() is called.
+        """
+        snapshot = self._snapshot
+
+        if snapshot is None:
+            with self._lock:
+                if self._snapshot is None:
+                    self._snapshot = ConfigSnapshot.build(self._config)
+
+                snapshot = self._snapshot
+
+        return snapshot
+
+    def generation(self, key: str) -> int:
+        """
+        Get the generation of a top-level key. The generation increases every time the key is set or deleted, so a
+        cache built from a key is valid for as long as the key's generation is unchanged.
+
+        :param key: The top-level key to check.
+        :return: The current generation of the key (0 if it has never been changed).
+        """
+        return self._generations.get(key, 0)
+
+    def subscribe(self, key: str, callback) -> None:
+        """
+        Register a callback to be run whenever a top-level key is set or deleted.
+
+        Callbacks are called as `callback(key, value)` in the writer's thread, after the change has been applied.
+        `value` is the key's new (read-only) snapshot value. Plugins must unsubscribe when they unload.
+
+        :param key: The top-level key to watch.
+        :param callback: The callable to invoke on change.
+        """
+        with self._lock:
+            self._subscribers.setdefault(key, []).append(callback)
+
+    def unsubscribe(self, key: str, callback) -> None:
+        with self._lock:
+            callbacks = self._subscribers.get(key, [])
+
+            if callback in callbacks:
+                callbacks.remove(callback)
+
+    def derive(self, key: str, builder):
+        """
+        Get a structure derived from a single top-level key (compiled regexes, lookup indexes, embeds, ...), building
+        it only when the key has changed since the last call.
+
+        :param key: The top-level key the structure is built from.
+        :param builder: A callable taking the key's (read-only) snapshot value and returning the derived structure.
+                        The builder also acts as the cache key, so pass the same callable every time.
+        :return: The (possibly cached) derived structure.
+        """
+        # Read the generation *before* the value - if a write lands in between, we'll just rebuild next time.
+        generation = self.generation(key)
+        cached = self._derived.get((key, builder))
+
+        if cached is not None and cached[0] == generation:
+            return cached[1]
+
+        derived = builder(self.snapshot.get(key))
+        self._derived[(key, builder)] = (generation, derived)
+
+        return derived
+
     def set(self, key, value):
         with self._lock:
             self._config[key] = value
-            self.save()
+
+            if self._snapshot is not None:
+                self._snapshot = self._snapshot.evolve(key, value)
+
+            self._generations[key] = self._generations.get(key, 0) + 1
+            self._persist(key)
+
+        self._notify(key)
 
     def delete(self, key: str) -> None:
         with self._lock:
             self._config.pop(key)
-            self.save()
+
+            if self._snapshot is not None:
+                self._snapshot = self._snapshot.evolve(key, removed=True)
+
+            self._generations[key] = self._generations.get(key, 0) + 1
+            self._persist(key)
+
+        self._notify(key)
 
     def load(self, create_if_nonexistent: bool = False) -> None:
         if self._path is None:
@@ -68,8 +694,12 @@ class WolfConfig:
             os.makedirs(os.path.dirname(self._path), exist_ok=True)
 
         try:
-            with open(self._path, 'r') as f:
-                self._config = json.loads(f.read())
+            old_keys = set(self._config.keys())
+            self._config = self._backend.load()
+            self._snapshot = None
+
+            for key in old_keys | set(self._config.keys()):
+                self._generations[key] = self._generations.get(key, 0) + 1
         except IOError:
             if not create_if_nonexistent:
                 raise
@@ -77,15 +707,125 @@ class WolfConfig:
             self.save()
 
     def save(self):
+        """
+        Immediately write the entire store to disk, bypassing any write-behind delay.
+        """
+        if self._path is None:
+            return
+
+        with self._lock:
+            self._dirty_keys = set()
+            self._backend.write(self._config, None)
+
+    def flush(self):
+        """
+        Write any pending (dirty) changes to disk. Safe to call from any thread; a no-op if nothing has changed.
+        """
+        if self._path is None:
+            return
+
+        with self._lock:
+            if not self._dirty_keys:
+                return
+
+            changed_keys, self._dirty_keys = self._dirty_keys, set()
+
+        # Serialization happens outside of the store lock so that readers on the event loop are never blocked behind
+        # a large write. Callers mutate returned objects in place (before calling set()), so a concurrent change may
+        # make json trip over a resized dict. If so, just mark those keys dirty again and retry on the next pass.
+        try:
+            self._backend.write(self._config, changed_keys)
+        except RuntimeError:
+            LOG.debug("Store %s changed during serialization, deferring flush.", self._path)
+            self._mark_dirty(changed_keys)
+
+    def close(self):
+        """
+        Stop the background flusher (if any), wait for it to finish, and write out every pending change.
+        """
+        with self._lock:
+            self._closed = True
+            flush_thread = self._flush_thread
+
+        self._close_event.set()
+        self._flush_event.set()
+
+        if flush_thread is not None and flush_thread is not threading.current_thread():
+            flush_thread.join()
+
+        # The flusher is gone, so this is the last write. Hold the lock so that set() and delete() can't race it. A
+        # flush tripped up by an in-place change from another thread leaves its keys dirty, so go again until none are
+        # left.
+        while self._path is not None and self._dirty_keys:
+            with self._lock:
+                self.flush()
+
+            if self._dirty_keys:
+                time.sleep(0.01)
+
+        if self._backend is not None:
+            self._backend.close()
+
+    def _notify(self, key):
+        callbacks = self._subscribers.get(key)
+
+        if not callbacks:
+            return
+
+        value = self.snapshot.get(key)
+
+        for callback in list(callbacks):
+            # noinspection PyBroadException
+            try:
+                callback(key, value)
+            except Exception:
+                LOG.exception("Config subscriber %s failed to handle a change to key %s.", callback, key)
+
+    def _persist(self, key):
         if self._path is None:
             return
 
-        with open(self._path, 'w') as config_file:
-            json.dump(self._config, config_file, sort_keys=True, default=override_dumper, indent=2)
+        if self._flush_interval is None or self._closed:
+            self._dirty_keys.add(key)
+            self.flush()
+        else:
+            self._mark_dirty({key})
+
+    def _mark_dirty(self, keys: set):
+        with self._lock:
+            self._dirty_keys.update(keys)
+
+            if self._flush_thread is None and not self._closed:
+                self._flush_thread = threading.Thread(target=self._flush_worker,
+                                                      name=f"WolfConfig-Flusher[{self._path}]",
+                                                      daemon=True)
+                self._flush_thread.start()
+
+        self._flush_event.set()
+
+    def _flush_worker(self):
+        while not self._closed:
+            self._flush_event.wait()
+
+            # Give further mutations a chance to coalesce into this write (unless we're closing).
+            self._close_event.wait(self._flush_interval)
+            self._flush_event.clear()
+
+            # noinspection PyBroadException
+            try:
+                self.flush()
+            except Exception:
+                LOG.exception("Failed to flush config store %s to disk.", self._path)
 
 
 __cache__ = {}
 
+__backends__ = {
+    'json': JsonFileBackend,
+    'journal': JournaledFileBackend,
+    'sqlite': SqliteBackend
+}
+
 
 def get_config(name: str = 'config', create_if_nonexistent: bool = True) -> WolfConfig:
     """
@@ -95,24 +835,37 @@ def get_config(name: str = 'config', create_if_nonexistent: bool = True) -> Wolf
     here, and expose it through get_config() to clients. DO NOT access the config manually, as it may be out of date, or
     otherwise rewrite configs without expectation.
 
+    Writes to persistent configurations are coalesced and flushed in the background every
+    HUSKYBOT_CONFIG_FLUSH_INTERVAL seconds (set to 0 to write synchronously on every change). The storage format is
+    selected with HUSKYBOT_CONFIG_BACKEND - either `json` (default), `journal` or `sqlite`. JSON stores are migrated to
+    `sqlite` as they're loaded, or all at once ahead of time with `python misc/migrate_config_to_sqlite.py`.
+
     :param name: Define the name of the persistent configuration to get.
     :param create_if_nonexistent: Create this config file if it doesn't exist.
     :return: Returns the bot's shared persistent configuration.
     """
 
-    config_prefix = os.environ.get('HUSKYBOT_CONFIG_PREFIX', '')
-
-    if config_prefix:
-        config_prefix += "_"  # Add an underscore to the end of prefix
-
     if name != 'config':
         key = 'config_{}'.format(name)
     else:
         key = 'config'
 
-    if name not in __cache__:
+    if key not in __cache__:
         # The requested store does not exist in cache.
-        __cache__[key] = WolfConfig(f'config/{config_prefix}{name}.json', create_if_nonexistent=create_if_nonexistent)
+        config_prefix = os.environ.get('HUSKYBOT_CONFIG_PREFIX', '')
+        flush_interval = float(os.environ.get('HUSKYBOT_CONFIG_FLUSH_INTERVAL', DEFAULT_FLUSH_INTERVAL))
+        backend_name = os.environ.get('HUSKYBOT_CONFIG_BACKEND', 'json').lower()
+
+        if backend_name not in __backends__:
+            raise ValueError(f"Unknown config backend {backend_name}. "
+                             f"Valid backends: {', '.join(__backends__.keys())}")
+
+        if config_prefix:
+            config_prefix += "_"  # Add an underscore to the end of prefix
+
+        path = f'config/{config_prefix}{name}.json'
+        __cache__[key] = WolfConfig(path, create_if_nonexistent=create_if_nonexistent, flush_interval=flush_interval,
+                                    backend=__backends__[backend_name](path))
 
     return __cache__[key]
 
@@ -142,3 +895,52 @@ def get_session_store(name: str = None) -> WolfConfig:
         __cache__[key] = WolfConfig()
 
     return __cache__[key]
+
+
+def flush_all() -> None:
+    """
+    Flush every persistent store to disk and stop their background flusher. Call this on shutdown.
+    """
+
+    for store in list(__cache__.values()):
+        store.close()
+
+
+def migrate_to_sqlite(directory: str = 'config', overwrite: bool = False) -> list:
+    """
+    Migrate every JSON store in a directory into the SQLite backend in one shot. The JSON files are left untouched.
+
+    Stores are otherwise migrated lazily the first time they're loaded with HUSKYBOT_CONFIG_BACKEND=sqlite, so this is
+    only needed to convert a deployment ahead of time (or to re-import JSON files with `overwrite`). It's run by
+    `misc/migrate_config_to_sqlite.py`.
+
+    :param directory: The directory to search for `*.json` stores.
+    :param overwrite: Replace any existing SQLite databases instead of skipping them.
+    :return: Returns a list of the databases written.
+    """
+
+    migrated = []
+
+    for file_name in sorted(os.listdir(directory)):
+        if not file_name.endswith('.json'):
+            continue
+
+        backend = SqliteBackend(os.path.join(directory, file_name))
+
+        if os.path.exists(backend.db_path):
+            if not overwrite:
+                LOG.info("Skipping %s, %s already exists.", file_name, backend.db_path)
+                continue
+
+            for suffix in ('', '-wal', '-shm'):
+                if os.path.exists(backend.db_path + suffix):
+                    os.remove(backend.db_path + suffix)
+
+        try:
+            backend.load()
+        finally:
+            backend.close()
+
+        migrated.append(backend.db_path)
+
+    return migrated
@@ -0,0 +1,503 @@
+# Generated by misc/generate_fold_table.py from Unicode 14.0.0. Do not edit by hand.
+
+FOLD_TABLE = {
+    0x0041: 'a', 0x0042: 'b', 0x0043: 'c', 0x0044: 'd', 0x0045: 'e', 0x0046: 'f',
+    0x0047: 'g', 0x0048: 'h', 0x0049: 'i', 0x004A: 'j', 0x004B: 'k', 0x004C: 'l',
+    0x004D: 'm', 0x004E: 'n', 0x004F: 'o', 0x0050: 'p', 0x0051: 'q', 0x0052: 'r',
+    0x0053: 's', 0x0054: 't', 0x0055: 'u', 0x0056: 'v', 0x0057: 'w', 0x0058: 'x',
+    0x0059: 'y', 0x005A: 'z', 0x00A0: ' ', 0x00A8: ' ', 0x00AA: 'a', 0x00AD: '',
+    0x00AF: ' ', 0x00B2: '2', 0x00B3: '3', 0x00B4: ' ', 0x00B5: 'μ', 0x00B8: ' ',
+    0x00B9: '1', 0x00BA: 'o', 0x00BC: '1⁄4', 0x00BD: '1⁄2', 0x00BE: '3⁄4', 0x00C0: 'a',
+    0x00C1: 'a', 0x00C2: 'a', 0x00C3: 'a', 0x00C4: 'a', 0x00C5: 'a', 0x00C6: 'æ',
+    0x00C7: 'c', 0x00C8: 'e', 0x00C9: 'e', 0x00CA: 'e', 0x00CB: 'e', 0x00CC: 'i',
+    0x00CD: 'i', 0x00CE: 'i', 0x00CF: 'i', 0x00D0: 'ð', 0x00D1: 'n', 0x00D2: 'o',
+    0x00D3: 'o', 0x00D4: 'o', 0x00D5: 'o', 0x00D6: 'o', 0x00D8: 'ø', 0x00D9: 'u',
+    0x00DA: 'u', 0x00DB: 'u', 0x00DC: 'u', 0x00DD: 'y', 0x00DE: 'þ', 0x00DF: 'ss',
+    0x00E0: 'a', 0x00E1: 'a', 0x00E2: 'a', 0x00E3: 'a', 0x00E4: 'a', 0x00E5: 'a',
+    0x00E7: 'c', 0x00E8: 'e', 0x00E9: 'e', 0x00EA: 'e', 0x00EB: 'e', 0x00EC: 'i',
+    0x00ED: 'i', 0x00EE: 'i', 0x00EF: 'i', 0x00F1: 'n', 0x00F2: 'o', 0x00F3: 'o',
+    0x00F4: 'o', 0x00F5: 'o', 0x00F6: 'o', 0x00F9: 'u', 0x00FA: 'u', 0x00FB: 'u',
+    0x00FC: 'u', 0x00FD: 'y', 0x00FF: 'y', 0x0100: 'a', 0x0101: 'a', 0x0102: 'a',
+    0x0103: 'a', 0x0104: 'a', 0x0105: 'a', 0x0106: 'c', 0x0107: 'c', 0x0108: 'c',
+    0x0109: 'c', 0x010A: 'c', 0x010B: 'c', 0x010C: 'c', 0x010D: 'c', 0x010E: 'd',
+    0x010F: 'd', 0x0110: 'đ', 0x0112: 'e', 0x0113: 'e', 0x0114: 'e', 0x0115: 'e',
+    0x0116: 'e', 0x0117: 'e', 0x0118: 'e', 0x0119: 'e', 0x011A: 'e', 0x011B: 'e',
+    0x011C: 'g', 0x011D: 'g', 0x011E: 'g', 0x011F: 'g', 0x0120: 'g', 0x0121: 'g',
+    0x0122: 'g', 0x0123: 'g', 0x0124: 'h', 0x0125: 'h', 0x0126: 'ħ', 0x0128: 'i',
+    0x0129: 'i', 0x012A: 'i', 0x012B: 'i', 0x012C: 'i', 0x012D: 'i', 0x012E: 'i',
+    0x012F: 'i', 0x0130: 'i', 0x0131: 'i', 0x0132: 'ij', 0x0133: 'ij', 0x0134: 'j',
+    0x0135: 'j', 0x0136: 'k', 0x0137: 'k', 0x0139: 'l', 0x013A: 'l', 0x013B: 'l',
+    0x013C: 'l', 0x013D: 'l', 0x013E: 'l', 0x013F: 'l·', 0x0140: 'l·', 0x0141: 'ł',
+    0x0143: 'n', 0x0144: 'n', 0x0145: 'n', 0x0146: 'n', 0x0147: 'n', 0x0148: 'n',
+    0x0149: 'ʼn', 0x014A: 'ŋ', 0x014C: 'o', 0x014D: 'o', 0x014E: 'o', 0x014F: 'o',
+    0x0150: 'o', 0x0151: 'o', 0x0152: 'œ', 0x0154: 'r', 0x0155: 'r', 0x0156: 'r',
+    0x0157: 'r', 0x0158: 'r', 0x0159: 'r', 0x015A: 's', 0x015B: 's', 0x015C: 's',
+    0x015D: 's', 0x015E: 's', 0x015F: 's', 0x0160: 's', 0x0161: 's', 0x0162: 't',
+    0x0163: 't', 0x0164: 't', 0x0165: 't', 0x0166: 'ŧ', 0x0168: 'u', 0x0169: 'u',
+    0x016A: 'u', 0x016B: 'u', 0x016C: 'u', 0x016D: 'u', 0x016E: 'u', 0x016F: 'u',
+    0x0170: 'u', 0x0171: 'u', 0x0172: 'u', 0x0173: 'u', 0x0174: 'w', 0x0175: 'w',
+    0x0176: 'y', 0x0177: 'y', 0x0178: 'y', 0x0179: 'z', 0x017A: 'z', 0x017B: 'z',
+    0x017C: 'z', 0x017D: 'z', 0x017E: 'z', 0x017F: 's', 0x0181: 'ɓ', 0x0182: 'ƃ',
+    0x0184: 'ƅ', 0x0186: 'ɔ', 0x0187: 'ƈ', 0x0189: 'ɖ', 0x018A: 'ɗ', 0x018B: 'ƌ',
+    0x018E: 'ǝ', 0x018F: 'ə', 0x0190: 'ɛ', 0x0191: 'ƒ', 0x0193: 'ɠ', 0x0194: 'ɣ',
+    0x0196: 'i', 0x0197: 'ɨ', 0x0198: 'ƙ', 0x019C: 'ɯ', 0x019D: 'ɲ', 0x019F: 'ɵ',
+    0x01A0: 'o', 0x01A1: 'o', 0x01A2: 'ƣ', 0x01A4: 'ƥ', 0x01A6: 'r', 0x01A7: 'ƨ',
+    0x01A9: 'ʃ', 0x01AC: 'ƭ', 0x01AE: 'ʈ', 0x01AF: 'u', 0x01B0: 'u', 0x01B1: 'ʊ',
+    0x01B2: 'ʋ', 0x01B3: 'ƴ', 0x01B5: 'ƶ', 0x01B7: 'ʒ', 0x01B8: 'ƹ', 0x01BC: 'ƽ',
+    0x01C4: 'dz', 0x01C5: 'dz', 0x01C6: 'dz', 0x01C7: 'lj', 0x01C8: 'lj', 0x01C9: 'lj',
+    0x01CA: 'nj', 0x01CB: 'nj', 0x01CC: 'nj', 0x01CD: 'a', 0x01CE: 'a', 0x01CF: 'i',
+    0x01D0: 'i', 0x01D1: 'o', 0x01D2: 'o', 0x01D3: 'u', 0x01D4: 'u', 0x01D5: 'u',
+    0x01D6: 'u', 0x01D7: 'u', 0x01D8: 'u', 0x01D9: 'u', 0x01DA: 'u', 0x01DB: 'u',
+    0x01DC: 'u', 0x01DE: 'a', 0x01DF: 'a', 0x01E0: 'a', 0x01E1: 'a', 0x01E2: 'æ',
+    0x01E3: 'æ', 0x01E4: 'ǥ', 0x01E6: 'g', 0x01E7: 'g', 0x01E8: 'k', 0x01E9: 'k',
+    0x01EA: 'o', 0x01EB: 'o', 0x01EC: 'o', 0x01ED: 'o', 0x01EE: 'ʒ', 0x01EF: 'ʒ',
+    0x01F0: 'j', 0x01F1: 'dz', 0x01F2: 'dz', 0x01F3: 'dz', 0x01F4: 'g', 0x01F5: 'g',
+    0x01F6: 'ƕ', 0x01F7: 'ƿ', 0x01F8: 'n', 0x01F9: 'n', 0x01FA: 'a', 0x01FB: 'a',
+    0x01FC: 'æ', 0x01FD: 'æ', 0x01FE: 'ø', 0x01FF: 'ø', 0x0200: 'a', 0x0201: 'a',
+    0x0202: 'a', 0x0203: 'a', 0x0204: 'e', 0x0205: 'e', 0x0206: 'e', 0x0207: 'e',
+    0x0208: 'i', 0x0209: 'i', 0x020A: 'i', 0x020B: 'i', 0x020C: 'o', 0x020D: 'o',
+    0x020E: 'o', 0x020F: 'o', 0x0210: 'r', 0x0211: 'r', 0x0212: 'r', 0x0213: 'r',
+    0x0214: 'u', 0x0215: 'u', 0x0216: 'u', 0x0217: 'u', 0x0218: 's', 0x0219: 's',
+    0x021A: 't', 0x021B: 't', 0x021C: 'ȝ', 0x021E: 'h', 0x021F: 'h', 0x0220: 'ƞ',
+    0x0222: 'ȣ', 0x0224: 'ȥ', 0x0226: 'a', 0x0227: 'a', 0x0228: 'e', 0x0229: 'e',
+    0x022A: 'o', 0x022B: 'o', 0x022C: 'o', 0x022D: 'o', 0x022E: 'o', 0x022F: 'o',
+    0x0230: 'o', 0x0231: 'o', 0x0232: 'y', 0x0233: 'y', 0x0237: 'j', 0x023A: 'ⱥ',
+    0x023B: 'ȼ', 0x023D: 'ƚ', 0x023E: 'ⱦ', 0x0241: 'ɂ', 0x0243: 'ƀ', 0x0244: 'ʉ',
+    0x0245: 'ʌ', 0x0246: 'ɇ', 0x0248: 'ɉ', 0x024A: 'ɋ', 0x024C: 'ɍ', 0x024E: 'ɏ',
+    0x0251: 'a', 0x0261: 'g', 0x0269: 'i', 0x0280: 'r', 0x02B0: 'h', 0x02B1: 'ɦ',
+    0x02B2: 'j', 0x02B3: 'r', 0x02B4: 'ɹ', 0x02B5: 'ɻ', 0x02B6: 'ʁ', 0x02B7: 'w',
+    0x02B8: 'y', 0x02D8: ' ', 0x02D9: ' ', 0x02DA: ' ', 0x02DB: ' ', 0x02DC: ' ',
+    0x02DD: ' ', 0x02E0: 'ɣ', 0x02E1: 'l', 0x02E2: 's', 0x02E3: 'x', 0x02E4: 'ʕ',
+    0x0300: '', 0x0301: '', 0x0302: '', 0x0303: '', 0x0304: '', 0x0305: '',
+    0x0306: '', 0x0307: '', 0x0308: '', 0x0309: '', 0x030A: '', 0x030B: '',
+    0x030C: '', 0x030D: '', 0x030E: '', 0x030F: '', 0x0310: '', 0x0311: '',
+    0x0312: '', 0x0313: '', 0x0314: '', 0x0315: '', 0x0316: '', 0x0317: '',
+    0x0318: '', 0x0319: '', 0x031A: '', 0x031B: '', 0x031C: '', 0x031D: '',
+    0x031E: '', 0x031F: '', 0x0320: '', 0x0321: '', 0x0322: '', 0x0323: '',
+    0x0324: '', 0x0325: '', 0x0326: '', 0x0327: '', 0x0328: '', 0x0329: '',
+    0x032A: '', 0x032B: '', 0x032C: '', 0x032D: '', 0x032E: '', 0x032F: '',
+    0x0330: '', 0x0331: '', 0x0332: '', 0x0333: '', 0x0334: '', 0x0335: '',
+    0x0336: '', 0x0337: '', 0x0338: '', 0x0339: '', 0x033A: '', 0x033B: '',
+    0x033C: '', 0x033D: '', 0x033E: '', 0x033F: '', 0x0340: '', 0x0341: '',
+    0x0342: '', 0x0343: '', 0x0344: '', 0x0345: '', 0x0346: '', 0x0347: '',
+    0x0348: '', 0x0349: '', 0x034A: '', 0x034B: '', 0x034C: '', 0x034D: '',
+    0x034E: '', 0x034F: '', 0x0350: '', 0x0351: '', 0x0352: '', 0x0353: '',
+    0x0354: '', 0x0355: '', 0x0356: '', 0x0357: '', 0x0358: '', 0x0359: '',
+    0x035A: '', 0x035B: '', 0x035C: '', 0x035D: '', 0x035E: '', 0x035F: '',
+    0x0360: '', 0x0361: '', 0x0362: '', 0x0363: '', 0x0364: '', 0x0365: '',
+    0x0366: '', 0x0367: '', 0x0368: '', 0x0369: '', 0x036A: '', 0x036B: '',
+    0x036C: '', 0x036D: '', 0x036E: '', 0x036F: '', 0x0370: 'ͱ', 0x0372: 'ͳ',
+    0x0374: 'ʹ', 0x0376: 'ͷ', 0x037A: ' i', 0x037E: ';', 0x037F: 'ϳ', 0x0384: ' ',
+    0x0385: ' ', 0x0386: 'a', 0x0387: '·', 0x0388: 'ε', 0x0389: 'η', 0x038A: 'i',
+    0x038C: 'o', 0x038E: 'u', 0x038F: 'ω', 0x0390: 'i', 0x0391: 'a', 0x0392: 'b',
+    0x0393: 'γ', 0x0394: 'δ', 0x0395: 'e', 0x0396: 'z', 0x0397: 'h', 0x0398: 'θ',
+    0x0399: 'i', 0x039A: 'k', 0x039B: 'λ', 0x039C: 'm', 0x039D: 'n', 0x039E: 'ξ',
+    0x039F: 'o', 0x03A0: 'π', 0x03A1: 'p', 0x03A3: 'σ', 0x03A4: 't', 0x03A5: 'y',
+    0x03A6: 'φ', 0x03A7: 'x', 0x03A8: 'ψ', 0x03A9: 'ω', 0x03AA: 'i', 0x03AB: 'u',
+    0x03AC: 'a', 0x03AD: 'ε', 0x03AE: 'η', 0x03AF: 'i', 0x03B0: 'u', 0x03B1: 'a',
+    0x03B9: 'i', 0x03BA: 'k', 0x03BD: 'v', 0x03BF: 'o', 0x03C1: 'p', 0x03C2: 'σ',
+    0x03C4: 't', 0x03C5: 'u', 0x03C7: 'x', 0x03CA: 'i', 0x03CB: 'u', 0x03CC: 'o',
+    0x03CD: 'u', 0x03CE: 'ω', 0x03CF: 'ϗ', 0x03D0: 'β', 0x03D1: 'θ', 0x03D2: 'u',
+    0x03D3: 'u', 0x03D4: 'u', 0x03D5: 'φ', 0x03D6: 'π', 0x03D8: 'ϙ', 0x03DA: 'ϛ',
+    0x03DC: 'ϝ', 0x03DE: 'ϟ', 0x03E0: 'ϡ', 0x03E2: 'ϣ', 0x03E4: 'ϥ', 0x03E6: 'ϧ',
+    0x03E8: 'ϩ', 0x03EA: 'ϫ', 0x03EC: 'ϭ', 0x03EE: 'ϯ', 0x03F0: 'k', 0x03F1: 'p',
+    0x03F2: 'σ', 0x03F4: 'θ', 0x03F5: 'ε', 0x03F7: 'ϸ', 0x03F9: 'σ', 0x03FA: 'ϻ',
+    0x03FD: 'ͻ', 0x03FE: 'ͼ', 0x03FF: 'ͽ', 0x0400: 'e', 0x0401: 'e', 0x0402: 'ђ',
+    0x0403: 'г', 0x0404: 'є', 0x0405: 's', 0x0406: 'i', 0x0407: 'i', 0x0408: 'j',
+    0x0409: 'љ', 0x040A: 'њ', 0x040B: 'ћ', 0x040C: 'к', 0x040D: 'и', 0x040E: 'y',
+    0x040F: 'џ', 0x0410: 'a', 0x0411: 'б', 0x0412: 'b', 0x0413: 'г', 0x0414: 'д',
+    0x0415: 'e', 0x0416: 'ж', 0x0417: 'з', 0x0418: 'и', 0x0419: 'и', 0x041A: 'k',
+    0x041B: 'л', 0x041C: 'm', 0x041D: 'h', 0x041E: 'o', 0x041F: 'п', 0x0420: 'p',
+    0x0421: 'c', 0x0422: 't', 0x0423: 'y', 0x0424: 'ф', 0x0425: 'x', 0x0426: 'ц',
+    0x0427: 'ч', 0x0428: 'ш', 0x0429: 'щ', 0x042A: 'ъ', 0x042B: 'ы', 0x042C: 'ь',
+    0x042D: 'э', 0x042E: 'ю', 0x042F: 'я', 0x0430: 'a', 0x0435: 'e', 0x0439: 'и',
+    0x043E: 'o', 0x0440: 'p', 0x0441: 'c', 0x0443: 'y', 0x0445: 'x', 0x0450: 'e',
+    0x0451: 'e', 0x0453: 'г', 0x0455: 's', 0x0456: 'i', 0x0457: 'i', 0x0458: 'j',
+    0x045C: 'к', 0x045D: 'и', 0x045E: 'y', 0x0460: 'w', 0x0461: 'w', 0x0462: 'ѣ',
+    0x0464: 'ѥ', 0x0466: 'ѧ', 0x0468: 'ѩ', 0x046A: 'ѫ', 0x046C: 'ѭ', 0x046E: 'ѯ',
+    0x0470: 'ѱ', 0x0472: 'ѳ', 0x0474: 'ѵ', 0x0476: 'ѵ', 0x0477: 'ѵ', 0x0478: 'ѹ',
+    0x047A: 'ѻ', 0x047C: 'ѽ', 0x047E: 'ѿ', 0x0480: 'ҁ', 0x048A: 'ҋ', 0x048C: 'ҍ',
+    0x048E: 'ҏ', 0x0490: 'ґ', 0x0492: 'ғ', 0x0494: 'ҕ', 0x0496: 'җ', 0x0498: 'ҙ',
+    0x049A: 'қ', 0x049C: 'ҝ', 0x049E: 'ҟ', 0x04A0: 'ҡ', 0x04A2: 'ң', 0x04A4: 'ҥ',
+    0x04A6: 'ҧ', 0x04A8: 'ҩ', 0x04AA: 'ҫ', 0x04AC: 'ҭ', 0x04AE: 'y', 0x04AF: 'y',
+    0x04B0: 'ұ', 0x04B2: 'ҳ', 0x04B4: 'ҵ', 0x04B6: 'ҷ', 0x04B8: 'ҹ', 0x04BA: 'h',
+    0x04BB: 'h', 0x04BC: 'ҽ', 0x04BE: 'ҿ', 0x04C0: 'ӏ', 0x04C1: 'ж', 0x04C2: 'ж',
+    0x04C3: 'ӄ', 0x04C5: 'ӆ', 0x04C7: 'ӈ', 0x04C9: 'ӊ', 0x04CB: 'ӌ', 0x04CD: 'ӎ',
+    0x04D0: 'a', 0x04D1: 'a', 0x04D2: 'a', 0x04D3: 'a', 0x04D4: 'ӕ', 0x04D6: 'e',
+    0x04D7: 'e', 0x04D8: 'ә', 0x04DA: 'ә', 0x04DB: 'ә', 0x04DC: 'ж', 0x04DD: 'ж',
+    0x04DE: 'з', 0x04DF: 'з', 0x04E0: 'ӡ', 0x04E2: 'и', 0x04E3: 'и', 0x04E4: 'и',
+    0x04E5: 'и', 0x04E6: 'o', 0x04E7: 'o', 0x04E8: 'ө', 0x04EA: 'ө', 0x04EB: 'ө',
+    0x04EC: 'э', 0x04ED: 'э', 0x04EE: 'y', 0x04EF: 'y', 0x04F0: 'y', 0x04F1: 'y',
+    0x04F2: 'y', 0x04F3: 'y', 0x04F4: 'ч', 0x04F5: 'ч', 0x04F6: 'ӷ', 0x04F8: 'ы',
+    0x04F9: 'ы', 0x04FA: 'ӻ', 0x04FC: 'ӽ', 0x04FE: 'ӿ', 0x0500: 'd', 0x0501: 'd',
+    0x0502: 'ԃ', 0x0504: 'ԅ', 0x0506: 'ԇ', 0x0508: 'ԉ', 0x050A: 'ԋ', 0x050C: 'ԍ',
+    0x050E: 'ԏ', 0x0510: 'ԑ', 0x0512: 'ԓ', 0x0514: 'ԕ', 0x0516: 'ԗ', 0x0518: 'ԙ',
+    0x051A: 'q', 0x051B: 'q', 0x051C: 'w', 0x051D: 'w', 0x051E: 'ԟ', 0x0520: 'ԡ',
+    0x0522: 'ԣ', 0x0524: 'ԥ', 0x0526: 'ԧ', 0x0528: 'ԩ', 0x052A: 'ԫ', 0x052C: 'ԭ',
+    0x052E: 'ԯ', 0x0600: '', 0x0601: '', 0x0602: '', 0x0603: '', 0x0604: '',
+    0x0605: '', 0x061C: '', 0x06DD: '', 0x070F: '', 0x0890: '', 0x0891: '',
+    0x08E2: '', 0x115F: '', 0x1160: '', 0x180E: '', 0x1AB0: '', 0x1AB1: '',
+    0x1AB2: '', 0x1AB3: '', 0x1AB4: '', 0x1AB5: '', 0x1AB6: '', 0x1AB7: '',
+    0x1AB8: '', 0x1AB9: '', 0x1ABA: '', 0x1ABB: '', 0x1ABC: '', 0x1ABD: '',
+    0x1ABE: '', 0x1ABF: '', 0x1AC0: '', 0x1AC1: '', 0x1AC2: '', 0x1AC3: '',
+    0x1AC4: '', 0x1AC5: '', 0x1AC6: '', 0x1AC7: '', 0x1AC8: '', 0x1AC9: '',
+    0x1ACA: '', 0x1ACB: '', 0x1ACC: '', 0x1ACD: '', 0x1ACE: '', 0x1C82: 'o',
+    0x1C83: 'c', 0x1D2C: 'a', 0x1D2E: 'b', 0x1D30: 'd', 0x1D31: 'e', 0x1D33: 'g',
+    0x1D34: 'h', 0x1D35: 'i', 0x1D36: 'j', 0x1D37: 'k', 0x1D38: 'l', 0x1D39: 'm',
+    0x1D3A: 'n', 0x1D3C: 'o', 0x1D3E: 'p', 0x1D3F: 'r', 0x1D40: 't', 0x1D41: 'u',
+    0x1D42: 'w', 0x1D43: 'a', 0x1D45: 'a', 0x1D47: 'b', 0x1D48: 'd', 0x1D49: 'e',
+    0x1D4D: 'g', 0x1D4F: 'k', 0x1D50: 'm', 0x1D52: 'o', 0x1D56: 'p', 0x1D57: 't',
+    0x1D58: 'u', 0x1D5B: 'v', 0x1D61: 'x', 0x1D62: 'i', 0x1D63: 'r', 0x1D64: 'u',
+    0x1D65: 'v', 0x1D68: 'p', 0x1D6A: 'x', 0x1D9C: 'c', 0x1DA0: 'f', 0x1DA2: 'g',
+    0x1DA5: 'i', 0x1DBB: 'z', 0x1DC0: '', 0x1DC1: '', 0x1DC2: '', 0x1DC3: '',
+    0x1DC4: '', 0x1DC5: '', 0x1DC6: '', 0x1DC7: '', 0x1DC8: '', 0x1DC9: '',
+    0x1DCA: '', 0x1DCB: '', 0x1DCC: '', 0x1DCD: '', 0x1DCE: '', 0x1DCF: '',
+    0x1DD0: '', 0x1DD1: '', 0x1DD2: '', 0x1DD3: '', 0x1DD4: '', 0x1DD5: '',
+    0x1DD6: '', 0x1DD7: '', 0x1DD8: '', 0x1DD9: '', 0x1DDA: '', 0x1DDB: '',
+    0x1DDC: '', 0x1DDD: '', 0x1DDE: '', 0x1DDF: '', 0x1DE0: '', 0x1DE1: '',
+    0x1DE2: '', 0x1DE3: '', 0x1DE4: '', 0x1DE5: '', 0x1DE6: '', 0x1DE7: '',
+    0x1DE8: '', 0x1DE9: '', 0x1DEA: '', 0x1DEB: '', 0x1DEC: '', 0x1DED: '',
+    0x1DEE: '', 0x1DEF: '', 0x1DF0: '', 0x1DF1: '', 0x1DF2: '', 0x1DF3: '',
+    0x1DF4: '', 0x1DF5: '', 0x1DF6: '', 0x1DF7: '', 0x1DF8: '', 0x1DF9: '',
+    0x1DFA: '', 0x1DFB: '', 0x1DFC: '', 0x1DFD: '', 0x1DFE: '', 0x1DFF: '',
+    0x1E00: 'a', 0x1E01: 'a', 0x1E02: 'b', 0x1E03: 'b', 0x1E04: 'b', 0x1E05: 'b',
+    0x1E06: 'b', 0x1E07: 'b', 0x1E08: 'c', 0x1E09: 'c', 0x1E0A: 'd', 0x1E0B: 'd',
+    0x1E0C: 'd', 0x1E0D: 'd', 0x1E0E: 'd', 0x1E0F: 'd', 0x1E10: 'd', 0x1E11: 'd',
+    0x1E12: 'd', 0x1E13: 'd', 0x1E14: 'e', 0x1E15: 'e', 0x1E16: 'e', 0x1E17: 'e',
+    0x1E18: 'e', 0x1E19: 'e', 0x1E1A: 'e', 0x1E1B: 'e', 0x1E1C: 'e', 0x1E1D: 'e',
+    0x1E1E: 'f', 0x1E1F: 'f', 0x1E20: 'g', 0x1E21: 'g', 0x1E22: 'h', 0x1E23: 'h',
+    0x1E24: 'h', 0x1E25: 'h', 0x1E26: 'h', 0x1E27: 'h', 0x1E28: 'h', 0x1E29: 'h',
+    0x1E2A: 'h', 0x1E2B: 'h', 0x1E2C: 'i', 0x1E2D: 'i', 0x1E2E: 'i', 0x1E2F: 'i',
+    0x1E30: 'k', 0x1E31: 'k', 0x1E32: 'k', 0x1E33: 'k', 0x1E34: 'k', 0x1E35: 'k',
+    0x1E36: 'l', 0x1E37: 'l', 0x1E38: 'l', 0x1E39: 'l', 0x1E3A: 'l', 0x1E3B: 'l',
+    0x1E3C: 'l', 0x1E3D: 'l', 0x1E3E: 'm', 0x1E3F: 'm', 0x1E40: 'm', 0x1E41: 'm',
+    0x1E42: 'm', 0x1E43: 'm', 0x1E44: 'n', 0x1E45: 'n', 0x1E46: 'n', 0x1E47: 'n',
+    0x1E48: 'n', 0x1E49: 'n', 0x1E4A: 'n', 0x1E4B: 'n', 0x1E4C: 'o', 0x1E4D: 'o',
+    0x1E4E: 'o', 0x1E4F: 'o', 0x1E50: 'o', 0x1E51: 'o', 0x1E52: 'o', 0x1E53: 'o',
+    0x1E54: 'p', 0x1E55: 'p', 0x1E56: 'p', 0x1E57: 'p', 0x1E58: 'r', 0x1E59: 'r',
+    0x1E5A: 'r', 0x1E5B: 'r', 0x1E5C: 'r', 0x1E5D: 'r', 0x1E5E: 'r', 0x1E5F: 'r',
+    0x1E60: 's', 0x1E61: 's', 0x1E62: 's', 0x1E63: 's', 0x1E64: 's', 0x1E65: 's',
+    0x1E66: 's', 0x1E67: 's', 0x1E68: 's', 0x1E69: 's', 0x1E6A: 't', 0x1E6B: 't',
+    0x1E6C: 't', 0x1E6D: 't', 0x1E6E: 't', 0x1E6F: 't', 0x1E70: 't', 0x1E71: 't',
+    0x1E72: 'u', 0x1E73: 'u', 0x1E74: 'u', 0x1E75: 'u', 0x1E76: 'u', 0x1E77: 'u',
+    0x1E78: 'u', 0x1E79: 'u', 0x1E7A: 'u', 0x1E7B: 'u', 0x1E7C: 'v', 0x1E7D: 'v',
+    0x1E7E: 'v', 0x1E7F: 'v', 0x1E80: 'w', 0x1E81: 'w', 0x1E82: 'w', 0x1E83: 'w',
+    0x1E84: 'w', 0x1E85: 'w', 0x1E86: 'w', 0x1E87: 'w', 0x1E88: 'w', 0x1E89: 'w',
+    0x1E8A: 'x', 0x1E8B: 'x', 0x1E8C: 'x', 0x1E8D: 'x', 0x1E8E: 'y', 0x1E8F: 'y',
+    0x1E90: 'z', 0x1E91: 'z', 0x1E92: 'z', 0x1E93: 'z', 0x1E94: 'z', 0x1E95: 'z',
+    0x1E96: 'h', 0x1E97: 't', 0x1E98: 'w', 0x1E99: 'y', 0x1E9B: 's', 0x1E9E: 'ss',
+    0x1EA0: 'a', 0x1EA1: 'a', 0x1EA2: 'a', 0x1EA3: 'a', 0x1EA4: 'a', 0x1EA5: 'a',
+    0x1EA6: 'a', 0x1EA7: 'a', 0x1EA8: 'a', 0x1EA9: 'a', 0x1EAA: 'a', 0x1EAB: 'a',
+    0x1EAC: 'a', 0x1EAD: 'a', 0x1EAE: 'a', 0x1EAF: 'a', 0x1EB0: 'a', 0x1EB1: 'a',
+    0x1EB2: 'a', 0x1EB3: 'a', 0x1EB4: 'a', 0x1EB5: 'a', 0x1EB6: 'a', 0x1EB7: 'a',
+    0x1EB8: 'e', 0x1EB9: 'e', 0x1EBA: 'e', 0x1EBB: 'e', 0x1EBC: 'e', 0x1EBD: 'e',
+    0x1EBE: 'e', 0x1EBF: 'e', 0x1EC0: 'e', 0x1EC1: 'e', 0x1EC2: 'e', 0x1EC3: 'e',
+    0x1EC4: 'e', 0x1EC5: 'e', 0x1EC6: 'e', 0x1EC7: 'e', 0x1EC8: 'i', 0x1EC9: 'i',
+    0x1ECA: 'i', 0x1ECB: 'i', 0x1ECC: 'o', 0x1ECD: 'o', 0x1ECE: 'o', 0x1ECF: 'o',
+    0x1ED0: 'o', 0x1ED1: 'o', 0x1ED2: 'o', 0x1ED3: 'o', 0x1ED4: 'o', 0x1ED5: 'o',
+    0x1ED6: 'o', 0x1ED7: 'o', 0x1ED8: 'o', 0x1ED9: 'o', 0x1EDA: 'o', 0x1EDB: 'o',
+    0x1EDC: 'o', 0x1EDD: 'o', 0x1EDE: 'o', 0x1EDF: 'o', 0x1EE0: 'o', 0x1EE1: 'o',
+    0x1EE2: 'o', 0x1EE3: 'o', 0x1EE4: 'u', 0x1EE5: 'u', 0x1EE6: 'u', 0x1EE7: 'u',
+    0x1EE8: 'u', 0x1EE9: 'u', 0x1EEA: 'u', 0x1EEB: 'u', 0x1EEC: 'u', 0x1EED: 'u',
+    0x1EEE: 'u', 0x1EEF: 'u', 0x1EF0: 'u', 0x1EF1: 'u', 0x1EF2: 'y', 0x1EF3: 'y',
+    0x1EF4: 'y', 0x1EF5: 'y', 0x1EF6: 'y', 0x1EF7: 'y', 0x1EF8: 'y', 0x1EF9: 'y',
+    0x1F00: 'a', 0x1F01: 'a', 0x1F02: 'a', 0x1F03: 'a', 0x1F04: 'a', 0x1F05: 'a',
+    0x1F06: 'a', 0x1F07: 'a', 0x1F08: 'a', 0x1F09: 'a', 0x1F0A: 'a', 0x1F0B: 'a',
+    0x1F0C: 'a', 0x1F0D: 'a', 0x1F0E: 'a', 0x1F0F: 'a', 0x1F30: 'i', 0x1F31: 'i',
+    0x1F32: 'i', 0x1F33: 'i', 0x1F34: 'i', 0x1F35: 'i', 0x1F36: 'i', 0x1F37: 'i',
+    0x1F38: 'i', 0x1F39: 'i', 0x1F3A: 'i', 0x1F3B: 'i', 0x1F3C: 'i', 0x1F3D: 'i',
+    0x1F3E: 'i', 0x1F3F: 'i', 0x1F40: 'o', 0x1F41: 'o', 0x1F42: 'o', 0x1F43: 'o',
+    0x1F44: 'o', 0x1F45: 'o', 0x1F48: 'o', 0x1F49: 'o', 0x1F4A: 'o', 0x1F4B: 'o',
+    0x1F4C: 'o', 0x1F4D: 'o', 0x1F50: 'u', 0x1F51: 'u', 0x1F52: 'u', 0x1F53: 'u',
+    0x1F54: 'u', 0x1F55: 'u', 0x1F56: 'u', 0x1F57: 'u', 0x1F59: 'u', 0x1F5B: 'u',
+    0x1F5D: 'u', 0x1F5F: 'u', 0x1F70: 'a', 0x1F71: 'a', 0x1F76: 'i', 0x1F77: 'i',
+    0x1F78: 'o', 0x1F79: 'o', 0x1F7A: 'u', 0x1F7B: 'u', 0x1F80: 'ai', 0x1F81: 'ai',
+    0x1F82: 'ai', 0x1F83: 'ai', 0x1F84: 'ai', 0x1F85: 'ai', 0x1F86: 'ai', 0x1F87: 'ai',
+    0x1F88: 'ai', 0x1F89: 'ai', 0x1F8A: 'ai', 0x1F8B: 'ai', 0x1F8C: 'ai', 0x1F8D: 'ai',
+    0x1F8E: 'ai', 0x1F8F: 'ai', 0x1FB0: 'a', 0x1FB1: 'a', 0x1FB2: 'ai', 0x1FB3: 'ai',
+    0x1FB4: 'ai', 0x1FB6: 'a', 0x1FB7: 'ai', 0x1FB8: 'a', 0x1FB9: 'a', 0x1FBA: 'a',
+    0x1FBB: 'a', 0x1FBC: 'ai', 0x1FBD: ' ', 0x1FBE: 'i', 0x1FBF: ' ', 0x1FC0: ' ',
+    0x1FC1: ' ', 0x1FCD: ' ', 0x1FCE: ' ', 0x1FCF: ' ', 0x1FD0: 'i', 0x1FD1: 'i',
+    0x1FD2: 'i', 0x1FD3: 'i', 0x1FD6: 'i', 0x1FD7: 'i', 0x1FD8: 'i', 0x1FD9: 'i',
+    0x1FDA: 'i', 0x1FDB: 'i', 0x1FDD: ' ', 0x1FDE: ' ', 0x1FDF: ' ', 0x1FE0: 'u',
+    0x1FE1: 'u', 0x1FE2: 'u', 0x1FE3: 'u', 0x1FE4: 'p', 0x1FE5: 'p', 0x1FE6: 'u',
+    0x1FE7: 'u', 0x1FE8: 'u', 0x1FE9: 'u', 0x1FEA: 'u', 0x1FEB: 'u', 0x1FEC: 'p',
+    0x1FED: ' ', 0x1FEE: ' ', 0x1FEF: '`', 0x1FF8: 'o', 0x1FF9: 'o', 0x1FFD: ' ',
+    0x1FFE: ' ', 0x2000: ' ', 0x2001: ' ', 0x2002: ' ', 0x2003: ' ', 0x2004: ' ',
+    0x2005: ' ', 0x2006: ' ', 0x2007: ' ', 0x2008: ' ', 0x2009: ' ', 0x200A: ' ',
+    0x200B: '', 0x200C: '', 0x200D: '', 0x200E: '', 0x200F: '', 0x2017: ' ',
+    0x2024: '.', 0x2025: '..', 0x2026: '...', 0x202A: '', 0x202B: '', 0x202C: '',
+    0x202D: '', 0x202E: '', 0x202F: ' ', 0x203C: '!!', 0x203E: ' ', 0x2047: '??',
+    0x2048: '?!', 0x2049: '!?', 0x205F: ' ', 0x2060: '', 0x2061: '', 0x2062: '',
+    0x2063: '', 0x2064: '', 0x2066: '', 0x2067: '', 0x2068: '', 0x2069: '',
+    0x206A: '', 0x206B: '', 0x206C: '', 0x206D: '', 0x206E: '', 0x206F: '',
+    0x2070: '0', 0x2071: 'i', 0x2074: '4', 0x2075: '5', 0x2076: '6', 0x2077: '7',
+    0x2078: '8', 0x2079: '9', 0x207A: '+', 0x207C: '=', 0x207D: '(', 0x207E: ')',
+    0x207F: 'n', 0x2080: '0', 0x2081: '1', 0x2082: '2', 0x2083: '3', 0x2084: '4',
+    0x2085: '5', 0x2086: '6', 0x2087: '7', 0x2088: '8', 0x2089: '9', 0x208A: '+',
+    0x208C: '=', 0x208D: '(', 0x208E: ')', 0x2090: 'a', 0x2091: 'e', 0x2092: 'o',
+    0x2093: 'x', 0x2095: 'h', 0x2096: 'k', 0x2097: 'l', 0x2098: 'm', 0x2099: 'n',
+    0x209A: 'p', 0x209B: 's', 0x209C: 't', 0x20A8: 'rs', 0x20D0: '', 0x20D1: '',
+    0x20D2: '', 0x20D3: '', 0x20D4: '', 0x20D5: '', 0x20D6: '', 0x20D7: '',
+    0x20D8: '', 0x20D9: '', 0x20DA: '', 0x20DB: '', 0x20DC: '', 0x20DD: '',
+    0x20DE: '', 0x20DF: '', 0x20E0: '', 0x20E1: '', 0x20E2: '', 0x20E3: '',
+    0x20E4: '', 0x20E5: '', 0x20E6: '', 0x20E7: '', 0x20E8: '', 0x20E9: '',
+    0x20EA: '', 0x20EB: '', 0x20EC: '', 0x20ED: '', 0x20EE: '', 0x20EF: '',
+    0x20F0: '', 0x2100: 'a/c', 0x2101: 'a/s', 0x2102: 'c', 0x2105: 'c/o', 0x2106: 'c/u',
+    0x210A: 'g', 0x210B: 'h', 0x210C: 'h', 0x210D: 'h', 0x210E: 'h', 0x2110: 'i',
+    0x2111: 'i', 0x2112: 'l', 0x2113: 'l', 0x2115: 'n', 0x2116: 'no', 0x2119: 'p',
+    0x211A: 'q', 0x211B: 'r', 0x211C: 'r', 0x211D: 'r', 0x2120: 'sm', 0x2121: 'tel',
+    0x2122: 'tm', 0x2124: 'z', 0x2128: 'z', 0x212A: 'k', 0x212B: 'a', 0x212C: 'b',
+    0x212D: 'c', 0x212F: 'e', 0x2130: 'e', 0x2131: 'f', 0x2133: 'm', 0x2134: 'o',
+    0x2139: 'i', 0x213B: 'fax', 0x2145: 'd', 0x2146: 'd', 0x2147: 'e', 0x2148: 'i',
+    0x2149: 'j', 0x2160: 'i', 0x2161: 'ii', 0x2162: 'iii', 0x2163: 'iv', 0x2164: 'v',
+    0x2165: 'vi', 0x2166: 'vii', 0x2167: 'viii', 0x2168: 'ix', 0x2169: 'x', 0x216A: 'xi',
+    0x216B: 'xii', 0x216C: 'l', 0x216D: 'c', 0x216E: 'd', 0x216F: 'm', 0x2170: 'i',
+    0x2171: 'ii', 0x2172: 'iii', 0x2173: 'iv', 0x2174: 'v', 0x2175: 'vi', 0x2176: 'vii',
+    0x2177: 'viii', 0x2178: 'ix', 0x2179: 'x', 0x217A: 'xi', 0x217B: 'xii', 0x217C: 'l',
+    0x217D: 'c', 0x217E: 'd', 0x217F: 'm', 0x2260: '=', 0x226E: '<', 0x226F: '>',
+    0x2460: '1', 0x2461: '2', 0x2462: '3', 0x2463: '4', 0x2464: '5', 0x2465: '6',
+    0x2466: '7', 0x2467: '8', 0x2468: '9', 0x2469: '10', 0x246A: '11', 0x246B: '12',
+    0x246C: '13', 0x246D: '14', 0x246E: '15', 0x246F: '16', 0x2470: '17', 0x2471: '18',
+    0x2472: '19', 0x2473: '20', 0x2474: '(1)', 0x2475: '(2)', 0x2476: '(3)', 0x2477: '(4)',
+    0x2478: '(5)', 0x2479: '(6)', 0x247A: '(7)', 0x247B: '(8)', 0x247C: '(9)', 0x247D: '(10)',
+    0x247E: '(11)', 0x247F: '(12)', 0x2480: '(13)', 0x2481: '(14)', 0x2482: '(15)', 0x2483: '(16)',
+    0x2484: '(17)', 0x2485: '(18)', 0x2486: '(19)', 0x2487: '(20)', 0x2488: '1.', 0x2489: '2.',
+    0x248A: '3.', 0x248B: '4.', 0x248C: '5.', 0x248D: '6.', 0x248E: '7.', 0x248F: '8.',
+    0x2490: '9.', 0x2491: '10.', 0x2492: '11.', 0x2493: '12.', 0x2494: '13.', 0x2495: '14.',
+    0x2496: '15.', 0x2497: '16.', 0x2498: '17.', 0x2499: '18.', 0x249A: '19.', 0x249B: '20.',
+    0x249C: '(a)', 0x249D: '(b)', 0x249E: '(c)', 0x249F: '(d)', 0x24A0: '(e)', 0x24A1: '(f)',
+    0x24A2: '(g)', 0x24A3: '(h)', 0x24A4: '(i)', 0x24A5: '(j)', 0x24A6: '(k)', 0x24A7: '(l)',
+    0x24A8: '(m)', 0x24A9: '(n)', 0x24AA: '(o)', 0x24AB: '(p)', 0x24AC: '(q)', 0x24AD: '(r)',
+    0x24AE: '(s)', 0x24AF: '(t)', 0x24B0: '(u)', 0x24B1: '(v)', 0x24B2: '(w)', 0x24B3: '(x)',
+    0x24B4: '(y)', 0x24B5: '(z)', 0x24B6: 'a', 0x24B7: 'b', 0x24B8: 'c', 0x24B9: 'd',
+    0x24BA: 'e', 0x24BB: 'f', 0x24BC: 'g', 0x24BD: 'h', 0x24BE: 'i', 0x24BF: 'j',
+    0x24C0: 'k', 0x24C1: 'l', 0x24C2: 'm', 0x24C3: 'n', 0x24C4: 'o', 0x24C5: 'p',
+    0x24C6: 'q', 0x24C7: 'r', 0x24C8: 's', 0x24C9: 't', 0x24CA: 'u', 0x24CB: 'v',
+    0x24CC: 'w', 0x24CD: 'x', 0x24CE: 'y', 0x24CF: 'z', 0x24D0: 'a', 0x24D1: 'b',
+    0x24D2: 'c', 0x24D3: 'd', 0x24D4: 'e', 0x24D5: 'f', 0x24D6: 'g', 0x24D7: 'h',
+    0x24D8: 'i', 0x24D9: 'j', 0x24DA: 'k', 0x24DB: 'l', 0x24DC: 'm', 0x24DD: 'n',
+    0x24DE: 'o', 0x24DF: 'p', 0x24E0: 'q', 0x24E1: 'r', 0x24E2: 's', 0x24E3: 't',
+    0x24E4: 'u', 0x24E5: 'v', 0x24E6: 'w', 0x24E7: 'x', 0x24E8: 'y', 0x24E9: 'z',
+    0x24EA: '0', 0x2800: '', 0x2A74: '::=', 0x2A75: '==', 0x2A76: '===', 0x2C6D: 'a',
+    0x2C7C: 'j', 0x2C7D: 'v', 0x3000: ' ', 0x3164: '', 0x3250: 'pte', 0x3251: '21',
+    0x3252: '22', 0x3253: '23', 0x3254: '24', 0x3255: '25', 0x3256: '26', 0x3257: '27',
+    0x3258: '28', 0x3259: '29', 0x325A: '30', 0x325B: '31', 0x325C: '32', 0x325D: '33',
+    0x325E: '34', 0x325F: '35', 0x32B1: '36', 0x32B2: '37', 0x32B3: '38', 0x32B4: '39',
+    0x32B5: '40', 0x32B6: '41', 0x32B7: '42', 0x32B8: '43', 0x32B9: '44', 0x32BA: '45',
+    0x32BB: '46', 0x32BC: '47', 0x32BD: '48', 0x32BE: '49', 0x32BF: '50', 0x32CC: 'hg',
+    0x32CD: 'erg', 0x32CE: 'ev', 0x32CF: 'ltd', 0x3371: 'hpa', 0x3372: 'da', 0x3373: 'au',
+    0x3374: 'bar', 0x3375: 'ov', 0x3376: 'pc', 0x3377: 'dm', 0x3378: 'dm2', 0x3379: 'dm3',
+    0x337A: 'iu', 0x3380: 'pa', 0x3381: 'na', 0x3383: 'ma', 0x3384: 'ka', 0x3385: 'kb',
+    0x3386: 'mb', 0x3387: 'gb', 0x3388: 'cal', 0x3389: 'kcal', 0x338A: 'pf', 0x338B: 'nf',
+    0x338E: 'mg', 0x338F: 'kg', 0x3390: 'hz', 0x3391: 'khz', 0x3392: 'mhz', 0x3393: 'ghz',
+    0x3394: 'thz', 0x3396: 'ml', 0x3397: 'dl', 0x3398: 'kl', 0x3399: 'fm', 0x339A: 'nm',
+    0x339C: 'mm', 0x339D: 'cm', 0x339E: 'km', 0x339F: 'mm2', 0x33A0: 'cm2', 0x33A1: 'm2',
+    0x33A2: 'km2', 0x33A3: 'mm3', 0x33A4: 'cm3', 0x33A5: 'm3', 0x33A6: 'km3', 0x33A9: 'pa',
+    0x33AA: 'kpa', 0x33AB: 'mpa', 0x33AC: 'gpa', 0x33AD: 'rad', 0x33B0: 'ps', 0x33B1: 'ns',
+    0x33B3: 'ms', 0x33B4: 'pv', 0x33B5: 'nv', 0x33B7: 'mv', 0x33B8: 'kv', 0x33B9: 'mv',
+    0x33BA: 'pw', 0x33BB: 'nw', 0x33BD: 'mw', 0x33BE: 'kw', 0x33BF: 'mw', 0x33C2: 'a.m.',
+    0x33C3: 'bq', 0x33C4: 'cc', 0x33C5: 'cd', 0x33C7: 'co.', 0x33C8: 'db', 0x33C9: 'gy',
+    0x33CA: 'ha', 0x33CB: 'hp', 0x33CC: 'in', 0x33CD: 'kk', 0x33CE: 'km', 0x33CF: 'kt',
+    0x33D0: 'lm', 0x33D1: 'ln', 0x33D2: 'log', 0x33D3: 'lx', 0x33D4: 'mb', 0x33D5: 'mil',
+    0x33D6: 'mol', 0x33D7: 'ph', 0x33D8: 'p.m.', 0x33D9: 'ppm', 0x33DA: 'pr', 0x33DB: 'sr',
+    0x33DC: 'sv', 0x33DD: 'wb', 0x33FF: 'gal', 0xA731: 's', 0xA7AC: 'g', 0xA7F2: 'c',
+    0xA7F3: 'f', 0xA7F4: 'q', 0xFB00: 'ff', 0xFB01: 'fi', 0xFB02: 'fl', 0xFB03: 'ffi',
+    0xFB04: 'ffl', 0xFB05: 'st', 0xFB06: 'st', 0xFB29: '+', 0xFE10: ',', 0xFE13: ':',
+    0xFE14: ';', 0xFE15: '!', 0xFE16: '?', 0xFE19: '...', 0xFE20: '', 0xFE21: '',
+    0xFE22: '', 0xFE23: '', 0xFE24: '', 0xFE25: '', 0xFE26: '', 0xFE27: '',
+    0xFE28: '', 0xFE29: '', 0xFE2A: '', 0xFE2B: '', 0xFE2C: '', 0xFE2D: '',
+    0xFE2E: '', 0xFE2F: '', 0xFE30: '..', 0xFE33: '_', 0xFE34: '_', 0xFE35: '(',
+    0xFE36: ')', 0xFE37: '{', 0xFE38: '}', 0xFE47: '[', 0xFE48: ']', 0xFE49: ' ',
+    0xFE4A: ' ', 0xFE4B: ' ', 0xFE4C: ' ', 0xFE4D: '_', 0xFE4E: '_', 0xFE4F: '_',
+    0xFE50: ',', 0xFE52: '.', 0xFE54: ';', 0xFE55: ':', 0xFE56: '?', 0xFE57: '!',
+    0xFE59: '(', 0xFE5A: ')', 0xFE5B: '{', 0xFE5C: '}', 0xFE5F: '#', 0xFE60: '&',
+    0xFE61: '*', 0xFE62: '+', 0xFE63: '-', 0xFE64: '<', 0xFE65: '>', 0xFE66: '=',
+    0xFE68: '\\', 0xFE69: '$', 0xFE6A: '%', 0xFE6B: '@', 0xFEFF: '', 0xFF01: '!',
+    0xFF02: '"', 0xFF03: '#', 0xFF04: '$', 0xFF05: '%', 0xFF06: '&', 0xFF07: "'",
+    0xFF08: '(', 0xFF09: ')', 0xFF0A: '*', 0xFF0B: '+', 0xFF0C: ',', 0xFF0D: '-',
+    0xFF0E: '.', 0xFF0F: '/', 0xFF10: '0', 0xFF11: '1', 0xFF12: '2', 0xFF13: '3',
+    0xFF14: '4', 0xFF15: '5', 0xFF16: '6', 0xFF17: '7', 0xFF18: '8', 0xFF19: '9',
+    0xFF1A: ':', 0xFF1B: ';', 0xFF1C: '<', 0xFF1D: '=', 0xFF1E: '>', 0xFF1F: '?',
+    0xFF20: '@', 0xFF21: 'a', 0xFF22: 'b', 0xFF23: 'c', 0xFF24: 'd', 0xFF25: 'e',
+    0xFF26: 'f', 0xFF27: 'g', 0xFF28: 'h', 0xFF29: 'i', 0xFF2A: 'j', 0xFF2B: 'k',
+    0xFF2C: 'l', 0xFF2D: 'm', 0xFF2E: 'n', 0xFF2F: 'o', 0xFF30: 'p', 0xFF31: 'q',
+    0xFF32: 'r', 0xFF33: 's', 0xFF34: 't', 0xFF35: 'u', 0xFF36: 'v', 0xFF37: 'w',
+    0xFF38: 'x', 0xFF39: 'y', 0xFF3A: 'z', 0xFF3B: '[', 0xFF3C: '\\', 0xFF3D: ']',
+    0xFF3E: '^', 0xFF3F: '_', 0xFF40: '`', 0xFF41: 'a', 0xFF42: 'b', 0xFF43: 'c',
+    0xFF44: 'd', 0xFF45: 'e', 0xFF46: 'f', 0xFF47: 'g', 0xFF48: 'h', 0xFF49: 'i',
+    0xFF4A: 'j', 0xFF4B: 'k', 0xFF4C: 'l', 0xFF4D: 'm', 0xFF4E: 'n', 0xFF4F: 'o',
+    0xFF50: 'p', 0xFF51: 'q', 0xFF52: 'r', 0xFF53: 's', 0xFF54: 't', 0xFF55: 'u',
+    0xFF56: 'v', 0xFF57: 'w', 0xFF58: 'x', 0xFF59: 'y', 0xFF5A: 'z', 0xFF5B: '{',
+    0xFF5C: '|', 0xFF5D: '}', 0xFF5E: '~', 0xFFA0: '', 0xFFE3: ' ', 0xFFF9: '',
+    0xFFFA: '', 0xFFFB: '', 0x107A5: 'q', 0x107AA: 'r', 0x110BD: '', 0x110CD: '',
+    0x13430: '', 0x13431: '', 0x13432: '', 0x13433: '', 0x13434: '', 0x13435: '',
+    0x13436: '', 0x13437: '', 0x13438: '', 0x1BCA0: '', 0x1BCA1: '', 0x1BCA2: '',
+    0x1BCA3: '', 0x1D173: '', 0x1D174: '', 0x1D175: '', 0x1D176: '', 0x1D177: '',
+    0x1D178: '', 0x1D179: '', 0x1D17A: '', 0x1D400: 'a', 0x1D401: 'b', 0x1D402: 'c',
+    0x1D403: 'd', 0x1D404: 'e', 0x1D405: 'f', 0x1D406: 'g', 0x1D407: 'h', 0x1D408: 'i',
+    0x1D409: 'j', 0x1D40A: 'k', 0x1D40B: 'l', 0x1D40C: 'm', 0x1D40D: 'n', 0x1D40E: 'o',
+    0x1D40F: 'p', 0x1D410: 'q', 0x1D411: 'r', 0x1D412: 's', 0x1D413: 't', 0x1D414: 'u',
+    0x1D415: 'v', 0x1D416: 'w', 0x1D417: 'x', 0x1D418: 'y', 0x1D419: 'z', 0x1D41A: 'a',
+    0x1D41B: 'b', 0x1D41C: 'c', 0x1D41D: 'd', 0x1D41E: 'e', 0x1D41F: 'f', 0x1D420: 'g',
+    0x1D421: 'h', 0x1D422: 'i', 0x1D423: 'j', 0x1D424: 'k', 0x1D425: 'l', 0x1D426: 'm',
+    0x1D427: 'n', 0x1D428: 'o', 0x1D429: 'p', 0x1D42A: 'q', 0x1D42B: 'r', 0x1D42C: 's',
+    0x1D42D: 't', 0x1D42E: 'u', 0x1D42F: 'v', 0x1D430: 'w', 0x1D431: 'x', 0x1D432: 'y',
+    0x1D433: 'z', 0x1D434: 'a', 0x1D435: 'b', 0x1D436: 'c', 0x1D437: 'd', 0x1D438: 'e',
+    0x1D439: 'f', 0x1D43A: 'g', 0x1D43B: 'h', 0x1D43C: 'i', 0x1D43D: 'j', 0x1D43E: 'k',
+    0x1D43F: 'l', 0x1D440: 'm', 0x1D441: 'n', 0x1D442: 'o', 0x1D443: 'p', 0x1D444: 'q',
+    0x1D445: 'r', 0x1D446: 's', 0x1D447: 't', 0x1D448: 'u', 0x1D449: 'v', 0x1D44A: 'w',
+    0x1D44B: 'x', 0x1D44C: 'y', 0x1D44D: 'z', 0x1D44E: 'a', 0x1D44F: 'b', 0x1D450: 'c',
+    0x1D451: 'd', 0x1D452: 'e', 0x1D453: 'f', 0x1D454: 'g', 0x1D456: 'i', 0x1D457: 'j',
+    0x1D458: 'k', 0x1D459: 'l', 0x1D45A: 'm', 0x1D45B: 'n', 0x1D45C: 'o', 0x1D45D: 'p',
+    0x1D45E: 'q', 0x1D45F: 'r', 0x1D460: 's', 0x1D461: 't', 0x1D462: 'u', 0x1D463: 'v',
+    0x1D464: 'w', 0x1D465: 'x', 0x1D466: 'y', 0x1D467: 'z', 0x1D468: 'a', 0x1D469: 'b',
+    0x1D46A: 'c', 0x1D46B: 'd', 0x1D46C: 'e', 0x1D46D: 'f', 0x1D46E: 'g', 0x1D46F: 'h',
+    0x1D470: 'i', 0x1D471: 'j', 0x1D472: 'k', 0x1D473: 'l', 0x1D474: 'm', 0x1D475: 'n',
+    0x1D476: 'o', 0x1D477: 'p', 0x1D478: 'q', 0x1D479: 'r', 0x1D47A: 's', 0x1D47B: 't',
+    0x1D47C: 'u', 0x1D47D: 'v', 0x1D47E: 'w', 0x1D47F: 'x', 0x1D480: 'y', 0x1D481: 'z',
+    0x1D482: 'a', 0x1D483: 'b', 0x1D484: 'c', 0x1D485: 'd', 0x1D486: 'e', 0x1D487: 'f',
+    0x1D488: 'g', 0x1D489: 'h', 0x1D48A: 'i', 0x1D48B: 'j', 0x1D48C: 'k', 0x1D48D: 'l',
+    0x1D48E: 'm', 0x1D48F: 'n', 0x1D490: 'o', 0x1D491: 'p', 0x1D492: 'q', 0x1D493: 'r',
+    0x1D494: 's', 0x1D495: 't', 0x1D496: 'u', 0x1D497: 'v', 0x1D498: 'w', 0x1D499: 'x',
+    0x1D49A: 'y', 0x1D49B: 'z', 0x1D49C: 'a', 0x1D49E: 'c', 0x1D49F: 'd', 0x1D4A2: 'g',
+    0x1D4A5: 'j', 0x1D4A6: 'k', 0x1D4A9: 'n', 0x1D4AA: 'o', 0x1D4AB: 'p', 0x1D4AC: 'q',
+    0x1D4AE: 's', 0x1D4AF: 't', 0x1D4B0: 'u', 0x1D4B1: 'v', 0x1D4B2: 'w', 0x1D4B3: 'x',
+    0x1D4B4: 'y', 0x1D4B5: 'z', 0x1D4B6: 'a', 0x1D4B7: 'b', 0x1D4B8: 'c', 0x1D4B9: 'd',
+    0x1D4BB: 'f', 0x1D4BD: 'h', 0x1D4BE: 'i', 0x1D4BF: 'j', 0x1D4C0: 'k', 0x1D4C1: 'l',
+    0x1D4C2: 'm', 0x1D4C3: 'n', 0x1D4C5: 'p', 0x1D4C6: 'q', 0x1D4C7: 'r', 0x1D4C8: 's',
+    0x1D4C9: 't', 0x1D4CA: 'u', 0x1D4CB: 'v', 0x1D4CC: 'w', 0x1D4CD: 'x', 0x1D4CE: 'y',
+    0x1D4CF: 'z', 0x1D4D0: 'a', 0x1D4D1: 'b', 0x1D4D2: 'c', 0x1D4D3: 'd', 0x1D4D4: 'e',
+    0x1D4D5: 'f', 0x1D4D6: 'g', 0x1D4D7: 'h', 0x1D4D8: 'i', 0x1D4D9: 'j', 0x1D4DA: 'k',
+    0x1D4DB: 'l', 0x1D4DC: 'm', 0x1D4DD: 'n', 0x1D4DE: 'o', 0x1D4DF: 'p', 0x1D4E0: 'q',
+    0x1D4E1: 'r', 0x1D4E2: 's', 0x1D4E3: 't', 0x1D4E4: 'u', 0x1D4E5: 'v', 0x1D4E6: 'w',
+    0x1D4E7: 'x', 0x1D4E8: 'y', 0x1D4E9: 'z', 0x1D4EA: 'a', 0x1D4EB: 'b', 0x1D4EC: 'c',
+    0x1D4ED: 'd', 0x1D4EE: 'e', 0x1D4EF: 'f', 0x1D4F0: 'g', 0x1D4F1: 'h', 0x1D4F2: 'i',
+    0x1D4F3: 'j', 0x1D4F4: 'k', 0x1D4F5: 'l', 0x1D4F6: 'm', 0x1D4F7: 'n', 0x1D4F8: 'o',
+    0x1D4F9: 'p', 0x1D4FA: 'q', 0x1D4FB: 'r', 0x1D4FC: 's', 0x1D4FD: 't', 0x1D4FE: 'u',
+    0x1D4FF: 'v', 0x1D500: 'w', 0x1D501: 'x', 0x1D502: 'y', 0x1D503: 'z', 0x1D504: 'a',
+    0x1D505: 'b', 0x1D507: 'd', 0x1D508: 'e', 0x1D509: 'f', 0x1D50A: 'g', 0x1D50D: 'j',
+    0x1D50E: 'k', 0x1D50F: 'l', 0x1D510: 'm', 0x1D511: 'n', 0x1D512: 'o', 0x1D513: 'p',
+    0x1D514: 'q', 0x1D516: 's', 0x1D517: 't', 0x1D518: 'u', 0x1D519: 'v', 0x1D51A: 'w',
+    0x1D51B: 'x', 0x1D51C: 'y', 0x1D51E: 'a', 0x1D51F: 'b', 0x1D520: 'c', 0x1D521: 'd',
+    0x1D522: 'e', 0x1D523: 'f', 0x1D524: 'g', 0x1D525: 'h', 0x1D526: 'i', 0x1D527: 'j',
+    0x1D528: 'k', 0x1D529: 'l', 0x1D52A: 'm', 0x1D52B: 'n', 0x1D52C: 'o', 0x1D52D: 'p',
+    0x1D52E: 'q', 0x1D52F: 'r', 0x1D530: 's', 0x1D531: 't', 0x1D532: 'u', 0x1D533: 'v',
+    0x1D534: 'w', 0x1D535: 'x', 0x1D536: 'y', 0x1D537: 'z', 0x1D538: 'a', 0x1D539: 'b',
+    0x1D53B: 'd', 0x1D53C: 'e', 0x1D53D: 'f', 0x1D53E: 'g', 0x1D540: 'i', 0x1D541: 'j',
+    0x1D542: 'k', 0x1D543: 'l', 0x1D544: 'm', 0x1D546: 'o', 0x1D54A: 's', 0x1D54B: 't',
+    0x1D54C: 'u', 0x1D54D: 'v', 0x1D54E: 'w', 0x1D54F: 'x', 0x1D550: 'y', 0x1D552: 'a',
+    0x1D553: 'b', 0x1D554: 'c', 0x1D555: 'd', 0x1D556: 'e', 0x1D557: 'f', 0x1D558: 'g',
+    0x1D559: 'h', 0x1D55A: 'i', 0x1D55B: 'j', 0x1D55C: 'k', 0x1D55D: 'l', 0x1D55E: 'm',
+    0x1D55F: 'n', 0x1D560: 'o', 0x1D561: 'p', 0x1D562: 'q', 0x1D563: 'r', 0x1D564: 's',
+    0x1D565: 't', 0x1D566: 'u', 0x1D567: 'v', 0x1D568: 'w', 0x1D569: 'x', 0x1D56A: 'y',
+    0x1D56B: 'z', 0x1D56C: 'a', 0x1D56D: 'b', 0x1D56E: 'c', 0x1D56F: 'd', 0x1D570: 'e',
+    0x1D571: 'f', 0x1D572: 'g', 0x1D573: 'h', 0x1D574: 'i', 0x1D575: 'j', 0x1D576: 'k',
+    0x1D577: 'l', 0x1D578: 'm', 0x1D579: 'n', 0x1D57A: 'o', 0x1D57B: 'p', 0x1D57C: 'q',
+    0x1D57D: 'r', 0x1D57E: 's', 0x1D57F: 't', 0x1D580: 'u', 0x1D581: 'v', 0x1D582: 'w',
+    0x1D583: 'x', 0x1D584: 'y', 0x1D585: 'z', 0x1D586: 'a', 0x1D587: 'b', 0x1D588: 'c',
+    0x1D589: 'd', 0x1D58A: 'e', 0x1D58B: 'f', 0x1D58C: 'g', 0x1D58D: 'h', 0x1D58E: 'i',
+    0x1D58F: 'j', 0x1D590: 'k', 0x1D591: 'l', 0x1D592: 'm', 0x1D593: 'n', 0x1D594: 'o',
+    0x1D595: 'p', 0x1D596: 'q', 0x1D597: 'r', 0x1D598: 's', 0x1D599: 't', 0x1D59A: 'u',
+    0x1D59B: 'v', 0x1D59C: 'w', 0x1D59D: 'x', 0x1D59E: 'y', 0x1D59F: 'z', 0x1D5A0: 'a',
+    0x1D5A1: 'b', 0x1D5A2: 'c', 0x1D5A3: 'd', 0x1D5A4: 'e', 0x1D5A5: 'f', 0x1D5A6: 'g',
+    0x1D5A7: 'h', 0x1D5A8: 'i', 0x1D5A9: 'j', 0x1D5AA: 'k', 0x1D5AB: 'l', 0x1D5AC: 'm',
+    0x1D5AD: 'n', 0x1D5AE: 'o', 0x1D5AF: 'p', 0x1D5B0: 'q', 0x1D5B1: 'r', 0x1D5B2: 's',
+    0x1D5B3: 't', 0x1D5B4: 'u', 0x1D5B5: 'v', 0x1D5B6: 'w', 0x1D5B7: 'x', 0x1D5B8: 'y',
+    0x1D5B9: 'z', 0x1D5BA: 'a', 0x1D5BB: 'b', 0x1D5BC: 'c', 0x1D5BD: 'd', 0x1D5BE: 'e',
+    0x1D5BF: 'f', 0x1D5C0: 'g', 0x1D5C1: 'h', 0x1D5C2: 'i', 0x1D5C3: 'j', 0x1D5C4: 'k',
+    0x1D5C5: 'l', 0x1D5C6: 'm', 0x1D5C7: 'n', 0x1D5C8: 'o', 0x1D5C9: 'p', 0x1D5CA: 'q',
+    0x1D5CB: 'r', 0x1D5CC: 's', 0x1D5CD: 't', 0x1D5CE: 'u', 0x1D5CF: 'v', 0x1D5D0: 'w',
+    0x1D5D1: 'x', 0x1D5D2: 'y', 0x1D5D3: 'z', 0x1D5D4: 'a', 0x1D5D5: 'b', 0x1D5D6: 'c',
+    0x1D5D7: 'd', 0x1D5D8: 'e', 0x1D5D9: 'f', 0x1D5DA: 'g', 0x1D5DB: 'h', 0x1D5DC: 'i',
+    0x1D5DD: 'j', 0x1D5DE: 'k', 0x1D5DF: 'l', 0x1D5E0: 'm', 0x1D5E1: 'n', 0x1D5E2: 'o',
+    0x1D5E3: 'p', 0x1D5E4: 'q', 0x1D5E5: 'r', 0x1D5E6: 's', 0x1D5E7: 't', 0x1D5E8: 'u',
+    0x1D5E9: 'v', 0x1D5EA: 'w', 0x1D5EB: 'x', 0x1D5EC: 'y', 0x1D5ED: 'z', 0x1D5EE: 'a',
+    0x1D5EF: 'b', 0x1D5F0: 'c', 0x1D5F1: 'd', 0x1D5F2: 'e', 0x1D5F3: 'f', 0x1D5F4: 'g',
+    0x1D5F5: 'h', 0x1D5F6: 'i', 0x1D5F7: 'j', 0x1D5F8: 'k', 0x1D5F9: 'l', 0x1D5FA: 'm',
+    0x1D5FB: 'n', 0x1D5FC: 'o', 0x1D5FD: 'p', 0x1D5FE: 'q', 0x1D5FF: 'r', 0x1D600: 's',
+    0x1D601: 't', 0x1D602: 'u', 0x1D603: 'v', 0x1D604: 'w', 0x1D605: 'x', 0x1D606: 'y',
+    0x1D607: 'z', 0x1D608: 'a', 0x1D609: 'b', 0x1D60A: 'c', 0x1D60B: 'd', 0x1D60C: 'e',
+    0x1D60D: 'f', 0x1D60E: 'g', 0x1D60F: 'h', 0x1D610: 'i', 0x1D611: 'j', 0x1D612: 'k',
+    0x1D613: 'l', 0x1D614: 'm', 0x1D615: 'n', 0x1D616: 'o', 0x1D617: 'p', 0x1D618: 'q',
+    0x1D619: 'r', 0x1D61A: 's', 0x1D61B: 't', 0x1D61C: 'u', 0x1D61D: 'v', 0x1D61E: 'w',
+    0x1D61F: 'x', 0x1D620: 'y', 0x1D621: 'z', 0x1D622: 'a', 0x1D623: 'b', 0x1D624: 'c',
+    0x1D625: 'd', 0x1D626: 'e', 0x1D627: 'f', 0x1D628: 'g', 0x1D629: 'h', 0x1D62A: 'i',
+    0x1D62B: 'j', 0x1D62C: 'k', 0x1D62D: 'l', 0x1D62E: 'm', 0x1D62F: 'n', 0x1D630: 'o',
+    0x1D631: 'p', 0x1D632: 'q', 0x1D633: 'r', 0x1D634: 's', 0x1D635: 't', 0x1D636: 'u',
+    0x1D637: 'v', 0x1D638: 'w', 0x1D639: 'x', 0x1D63A: 'y', 0x1D63B: 'z', 0x1D63C: 'a',
+    0x1D63D: 'b', 0x1D63E: 'c', 0x1D63F: 'd', 0x1D640: 'e', 0x1D641: 'f', 0x1D642: 'g',
+    0x1D643: 'h', 0x1D644: 'i', 0x1D645: 'j', 0x1D646: 'k', 0x1D647: 'l', 0x1D648: 'm',
+    0x1D649: 'n', 0x1D64A: 'o', 0x1D64B: 'p', 0x1D64C: 'q', 0x1D64D: 'r', 0x1D64E: 's',
+    0x1D64F: 't', 0x1D650: 'u', 0x1D651: 'v', 0x1D652: 'w', 0x1D653: 'x', 0x1D654: 'y',
+    0x1D655: 'z', 0x1D656: 'a', 0x1D657: 'b', 0x1D658: 'c', 0x1D659: 'd', 0x1D65A: 'e',
+    0x1D65B: 'f', 0x1D65C: 'g', 0x1D65D: 'h', 0x1D65E: 'i', 0x1D65F: 'j', 0x1D660: 'k',
+    0x1D661: 'l', 0x1D662: 'm', 0x1D663: 'n', 0x1D664: 'o', 0x1D665: 'p', 0x1D666: 'q',
+    0x1D667: 'r', 0x1D668: 's', 0x1D669: 't', 0x1D66A: 'u', 0x1D66B: 'v', 0x1D66C: 'w',
+    0x1D66D: 'x', 0x1D66E: 'y', 0x1D66F: 'z', 0x1D670: 'a', 0x1D671: 'b', 0x1D672: 'c',
+    0x1D673: 'd', 0x1D674: 'e', 0x1D675: 'f', 0x1D676: 'g', 0x1D677: 'h', 0x1D678: 'i',
+    0x1D679: 'j', 0x1D67A: 'k', 0x1D67B: 'l', 0x1D67C: 'm', 0x1D67D: 'n', 0x1D67E: 'o',
+    0x1D67F: 'p', 0x1D680: 'q', 0x1D681: 'r', 0x1D682: 's', 0x1D683: 't', 0x1D684: 'u',
+    0x1D685: 'v', 0x1D686: 'w', 0x1D687: 'x', 0x1D688: 'y', 0x1D689: 'z', 0x1D68A: 'a',
+    0x1D68B: 'b', 0x1D68C: 'c', 0x1D68D: 'd', 0x1D68E: 'e', 0x1D68F: 'f', 0x1D690: 'g',
+    0x1D691: 'h', 0x1D692: 'i', 0x1D693: 'j', 0x1D694: 'k', 0x1D695: 'l', 0x1D696: 'm',
+    0x1D697: 'n', 0x1D698: 'o', 0x1D699: 'p', 0x1D69A: 'q', 0x1D69B: 'r', 0x1D69C: 's',
+    0x1D69D: 't', 0x1D69E: 'u', 0x1D69F: 'v', 0x1D6A0: 'w', 0x1D6A1: 'x', 0x1D6A2: 'y',
+    0x1D6A3: 'z', 0x1D6A4: 'i', 0x1D6A5: 'j', 0x1D6A8: 'a', 0x1D6B0: 'i', 0x1D6B1: 'k',
+    0x1D6B4: 'v', 0x1D6B6: 'o', 0x1D6B8: 'p', 0x1D6BB: 't', 0x1D6BC: 'u', 0x1D6BE: 'x',
+    0x1D6C2: 'a', 0x1D6CA: 'i', 0x1D6CB: 'k', 0x1D6CE: 'v', 0x1D6D0: 'o', 0x1D6D2: 'p',
+    0x1D6D5: 't', 0x1D6D6: 'u', 0x1D6D8: 'x', 0x1D6DE: 'k', 0x1D6E0: 'p', 0x1D6E2: 'a',
+    0x1D6EA: 'i', 0x1D6EB: 'k', 0x1D6EE: 'v', 0x1D6F0: 'o', 0x1D6F2: 'p', 0x1D6F5: 't',
+    0x1D6F6: 'u', 0x1D6F8: 'x', 0x1D6FC: 'a', 0x1D704: 'i', 0x1D705: 'k', 0x1D708: 'v',
+    0x1D70A: 'o', 0x1D70C: 'p', 0x1D70F: 't', 0x1D710: 'u', 0x1D712: 'x', 0x1D718: 'k',
+    0x1D71A: 'p', 0x1D71C: 'a', 0x1D724: 'i', 0x1D725: 'k', 0x1D728: 'v', 0x1D72A: 'o',
+    0x1D72C: 'p', 0x1D72F: 't', 0x1D730: 'u', 0x1D732: 'x', 0x1D736: 'a', 0x1D73E: 'i',
+    0x1D73F: 'k', 0x1D742: 'v', 0x1D744: 'o', 0x1D746: 'p', 0x1D749: 't', 0x1D74A: 'u',
+    0x1D74C: 'x', 0x1D752: 'k', 0x1D754: 'p', 0x1D756: 'a', 0x1D75E: 'i', 0x1D75F: 'k',
+    0x1D762: 'v', 0x1D764: 'o', 0x1D766: 'p', 0x1D769: 't', 0x1D76A: 'u', 0x1D76C: 'x',
+    0x1D770: 'a', 0x1D778: 'i', 0x1D779: 'k', 0x1D77C: 'v', 0x1D77E: 'o', 0x1D780: 'p',
+    0x1D783: 't', 0x1D784: 'u', 0x1D786: 'x', 0x1D78C: 'k', 0x1D78E: 'p', 0x1D790: 'a',
+    0x1D798: 'i', 0x1D799: 'k', 0x1D79C: 'v', 0x1D79E: 'o', 0x1D7A0: 'p', 0x1D7A3: 't',
+    0x1D7A4: 'u', 0x1D7A6: 'x', 0x1D7AA: 'a', 0x1D7B2: 'i', 0x1D7B3: 'k', 0x1D7B6: 'v',
+    0x1D7B8: 'o', 0x1D7BA: 'p', 0x1D7BD: 't', 0x1D7BE: 'u', 0x1D7C0: 'x', 0x1D7C6: 'k',
+    0x1D7C8: 'p', 0x1D7CE: '0', 0x1D7CF: '1', 0x1D7D0: '2', 0x1D7D1: '3', 0x1D7D2: '4',
+    0x1D7D3: '5', 0x1D7D4: '6', 0x1D7D5: '7', 0x1D7D6: '8', 0x1D7D7: '9', 0x1D7D8: '0',
+    0x1D7D9: '1', 0x1D7DA: '2', 0x1D7DB: '3', 0x1D7DC: '4', 0x1D7DD: '5', 0x1D7DE: '6',
+    0x1D7DF: '7', 0x1D7E0: '8', 0x1D7E1: '9', 0x1D7E2: '0', 0x1D7E3: '1', 0x1D7E4: '2',
+    0x1D7E5: '3', 0x1D7E6: '4', 0x1D7E7: '5', 0x1D7E8: '6', 0x1D7E9: '7', 0x1D7EA: '8',
+    0x1D7EB: '9', 0x1D7EC: '0', 0x1D7ED: '1', 0x1D7EE: '2', 0x1D7EF: '3', 0x1D7F0: '4',
+    0x1D7F1: '5', 0x1D7F2: '6', 0x1D7F3: '7', 0x1D7F4: '8', 0x1D7F5: '9', 0x1D7F6: '0',
+    0x1D7F7: '1', 0x1D7F8: '2', 0x1D7F9: '3', 0x1D7FA: '4', 0x1D7FB: '5', 0x1D7FC: '6',
+    0x1D7FD: '7', 0x1D7FE: '8', 0x1D7FF: '9', 0x1F100: '0.', 0x1F101: '0,', 0x1F102: '1,',
+    0x1F103: '2,', 0x1F104: '3,', 0x1F105: '4,', 0x1F106: '5,', 0x1F107: '6,', 0x1F108: '7,',
+    0x1F109: '8,', 0x1F10A: '9,', 0x1F110: '(a)', 0x1F111: '(b)', 0x1F112: '(c)', 0x1F113: '(d)',
+    0x1F114: '(e)', 0x1F115: '(f)', 0x1F116: '(g)', 0x1F117: '(h)', 0x1F118: '(i)', 0x1F119: '(j)',
+    0x1F11A: '(k)', 0x1F11B: '(l)', 0x1F11C: '(m)', 0x1F11D: '(n)', 0x1F11E: '(o)', 0x1F11F: '(p)',
+    0x1F120: '(q)', 0x1F121: '(r)', 0x1F122: '(s)', 0x1F123: '(t)', 0x1F124: '(u)', 0x1F125: '(v)',
+    0x1F126: '(w)', 0x1F127: '(x)', 0x1F128: '(y)', 0x1F129: '(z)', 0x1F12B: 'c', 0x1F12C: 'r',
+    0x1F12D: 'cd', 0x1F12E: 'wz', 0x1F130: 'a', 0x1F131: 'b', 0x1F132: 'c', 0x1F133: 'd',
+    0x1F134: 'e', 0x1F135: 'f', 0x1F136: 'g', 0x1F137: 'h', 0x1F138: 'i', 0x1F139: 'j',
+    0x1F13A: 'k', 0x1F13B: 'l', 0x1F13C: 'm', 0x1F13D: 'n', 0x1F13E: 'o', 0x1F13F: 'p',
+    0x1F140: 'q', 0x1F141: 'r', 0x1F142: 's', 0x1F143: 't', 0x1F144: 'u', 0x1F145: 'v',
+    0x1F146: 'w', 0x1F147: 'x', 0x1F148: 'y', 0x1F149: 'z', 0x1F14A: 'hv', 0x1F14B: 'mv',
+    0x1F14C: 'sd', 0x1F14D: 'ss', 0x1F14E: 'ppv', 0x1F14F: 'wc', 0x1F16A: 'mc', 0x1F16B: 'md',
+    0x1F16C: 'mr', 0x1F190: 'dj', 0x1FBF0: '0', 0x1FBF1: '1', 0x1FBF2: '2', 0x1FBF3: '3',
+    0x1FBF4: '4', 0x1FBF5: '5', 0x1FBF6: '6', 0x1FBF7: '7', 0x1FBF8: '8', 0x1FBF9: '9',
+    0xE0001: '', 0xE0020: '', 0xE0021: '', 0xE0022: '', 0xE0023: '', 0xE0024: '',
+    0xE0025: '', 0xE0026: '', 0xE0027: '', 0xE0028: '', 0xE0029: '', 0xE002A: '',
+    0xE002B: '', 0xE002C: '', 0xE002D: '', 0xE002E: '', 0xE002F: '', 0xE0030: '',
+    0xE0031: '', 0xE0032: '', 0xE0033: '', 0xE0034: '', 0xE0035: '', 0xE0036: '',
+    0xE0037: '', 0xE0038: '', 0xE0039: '', 0xE003A: '', 0xE003B: '', 0xE003C: '',
+    0xE003D: '', 0xE003E: '', 0xE003F: '', 0xE0040: '', 0xE0041: '', 0xE0042: '',
+    0xE0043: '', 0xE0044: '', 0xE0045: '', 0xE0046: '', 0xE0047: '', 0xE0048: '',
+    0xE0049: '', 0xE004A: '', 0xE004B: '', 0xE004C: '', 0xE004D: '', 0xE004E: '',
+    0xE004F: '', 0xE0050: '', 0xE0051: '', 0xE0052: '', 0xE0053: '', 0xE0054: '',
+    0xE0055: '', 0xE0056: '', 0xE0057: '', 0xE0058: '', 0xE0059: '', 0xE005A: '',
+    0xE005B: '', 0xE005C: '', 0xE005D: '', 0xE005E: '', 0xE005F: '', 0xE0060: '',
+    0xE0061: '', 0xE0062: '', 0xE0063: '', 0xE0064: '', 0xE0065: '', 0xE0066: '',
+    0xE0067: '', 0xE0068: '', 0xE0069: '', 0xE006A: '', 0xE006B: '', 0xE006C: '',
+    0xE006D: '', 0xE006E: '', 0xE006F: '', 0xE0070: '', 0xE0071: '', 0xE0072: '',
+    0xE0073: '', 0xE0074: '', 0xE0075: '', 0xE0076: '', 0xE0077: '', 0xE0078: '',
+    0xE0079: '', 0xE007A: '', 0xE007B: '', 0xE007C: '', 0xE007D: '', 0xE007E: '',
+    0xE007F: '',
+}
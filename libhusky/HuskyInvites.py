@@ -0,0 +1,190 @@
+import asyncio
+import collections
+import json
+import logging
+import os
+import time
+from typing import Optional
+
+import discord
+
+from libhusky import HuskyConfig
+
+LOG = logging.getLogger("HuskyBot.InviteResolver")
+
+defaults = {
+    'ttl': 4 * 60 * 60,  # Time (in seconds) to cache a valid invite for
+    'negativeTtl': 10 * 60,  # Time (in seconds) to cache an invalid invite for
+    'maxEntries': 5000,  # Maximum number of invites to keep cached
+    'persistPath': None  # File to keep the cache in across restarts (None to keep it in memory only)
+}
+
+# Returned by the cache lookup when a fragment isn't cached, as None is a valid (negative) cached result.
+_MISS = object()
+
+
+class InviteResolver:
+    """
+    Looks up Discord invites (`GET /invite/{fragment}`), with a cache in front of the API.
+
+    During an invite raid, the same few invites are posted dozens of times within seconds. Without help, every one of
+    those messages would ask the API about the same invite before the first answer came back. The resolver:
+
+    - Keeps an LRU cache of results, each with a TTL, and never more than `max_entries` of them.
+    - Caches invalid invites too (for a shorter TTL), so that junk fragments don't cost a request every time.
+    - Coalesces concurrent lookups of the same fragment into a single request ("single-flight"); everybody waiting on
+      it gets the same answer.
+    - Optionally saves its cache to disk on shutdown, and loads it back on startup.
+
+    Results are the raw invite payloads from the API, shared between every caller. Don't modify them.
+    """
+
+    def __init__(self, fetch, ttl: float = defaults['ttl'], negative_ttl: float = defaults['negativeTtl'],
+                 max_entries: int = defaults['maxEntries'], persist_path: str = None):
+        """
+        :param fetch: A coroutine function fetching an invite's payload from the API, given its fragment. It should
+                      raise discord.NotFound for invites that don't exist.
+        :param ttl: The time (in seconds) to cache a valid invite for.
+        :param negative_ttl: The time (in seconds) to cache an invalid invite for.
+        :param max_entries: The maximum number of invites to cache. Past this, the least recently used are evicted.
+        :param persist_path: The file to save the cache to (and load it from), if any.
+        """
+        self._fetch = fetch
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+        self.persist_path = persist_path
+
+        self._cache = collections.OrderedDict()  # fragment -> (expiry time, payload or None)
+        self._in_flight = {}  # fragment -> asyncio.Task
+
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    def __len__(self):
+        return len(self._cache)
+
+    async def resolve(self, fragment: str) -> Optional[dict]:
+        """
+        Look up an invite.
+
+        :param fragment: The invite's code.
+        :return: Returns the invite's payload, or None if the invite doesn't exist (or the bot is banned from its
+                 guild).
+        :raises discord.HTTPException: If the API failed for any other reason. Failures are not cached.
+        """
+        cached = self._get(fragment)
+
+        if cached is not _MISS:
+            self.hits += 1
+            return cached
+
+        task = self._in_flight.get(fragment)
+
+        if task is None:
+            self.misses += 1
+            task = asyncio.ensure_future(self._lookup(fragment))
+            self._in_flight[fragment] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(fragment, None))
+        else:
+            self.coalesced += 1
+
+        # A cancelled waiter mustn't cancel the lookup everybody else is waiting on.
+        return await asyncio.shield(task)
+
+    def invalidate(self, fragment: str):
+        self._cache.pop(fragment, None)
+
+    def clear(self):
+        self._cache.clear()
+
+    def purge_expired(self) -> int:
+        """
+        Drop every expired entry.
+
+        :return: Returns the number of entries dropped.
+        """
+        now = time.time()
+        expired = [fragment for (fragment, (expiry, _)) in self._cache.items() if expiry <= now]
+
+        for fragment in expired:
+            del self._cache[fragment]
+
+        return len(expired)
+
+    def load(self):
+        """
+        Load the cache saved by save(), if there's one. Entries that expired in the meantime are skipped.
+        """
+        if not self.persist_path or not os.path.exists(self.persist_path):
+            return
+
+        try:
+            with open(self.persist_path, 'r') as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            LOG.exception("Could not load the invite cache from %s, starting empty.", self.persist_path)
+            return
+
+        now = time.time()
+
+        for (fragment, expiry, payload) in entries:
+            if expiry > now:
+                self._put(fragment, payload, expiry)
+
+        LOG.info("Loaded %d cached invite(s) from %s.", len(self._cache), self.persist_path)
+
+    def save(self):
+        """
+        Save the cache (least recently used first), so that it survives a restart.
+        """
+        if not self.persist_path:
+            return
+
+        self.purge_expired()
+        entries = [[fragment, expiry, payload] for (fragment, (expiry, payload)) in self._cache.items()]
+
+        try:
+            HuskyConfig.atomic_write(self.persist_path, json.dumps(entries))
+        except OSError:
+            LOG.exception("Could not save the invite cache to %s.", self.persist_path)
+            return
+
+        LOG.debug("Saved %d cached invite(s) to %s.", len(entries), self.persist_path)
+
+    def _get(self, fragment: str):
+        entry = self._cache.get(fragment)
+
+        if entry is None:
+            return _MISS
+
+        (expiry, payload) = entry
+
+        if expiry <= time.time():
+            del self._cache[fragment]
+            return _MISS
+
+        self._cache.move_to_end(fragment)
+
+        return payload
+
+    def _put(self, fragment: str, payload: Optional[dict], expiry: float):
+        self._cache[fragment] = (expiry, payload)
+        self._cache.move_to_end(fragment)
+
+        while len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+
+    async def _lookup(self, fragment: str) -> Optional[dict]:
+        try:
+            payload = await self._fetch(fragment)
+        except discord.NotFound:
+            LOG.debug("Invite %s does not exist, caching that for %s seconds.", fragment, self.negative_ttl)
+            self._put(fragment, None, time.time() + self.negative_ttl)
+            return None
+
+        LOG.debug("Invite %s was not cached. Downloaded and added.", fragment)
+        self._put(fragment, payload, time.time() + self.ttl)
+
+        return payload
@@ -0,0 +1,121 @@
+import re
+from typing import Optional
+
+from libhusky.HuskyStatics import Regex
+
+URL_PATTERN = re.compile(Regex.URL_REGEX, re.IGNORECASE)
+
+_SCHEME = re.compile(r'[a-z][\w-]+:(/*)', re.IGNORECASE)
+_HOST = re.compile(r'(?:[^@/?#\s]*@)?(\[[^\]/]*\]|[^:/?#\s]+)')
+
+# Second-level labels that are handed out by registries, rather than being domains of their own (as in `example.co.uk`).
+_REGISTRY_LABELS = frozenset(['ac', 'co', 'com', 'edu', 'gov', 'ltd', 'mil', 'net', 'nom', 'org', 'plc', 'sch'])
+
+
+def find_urls(text: str) -> tuple:
+    """
+    Find every link-like string in a piece of text.
+
+    :return: Returns the links, in order of appearance.
+    """
+    # Every URL_PATTERN match starts with a scheme (`http://`, `mailto:x`), a `www.`, or a `domain.tld/`. The pattern
+    # tries those alternatives at every word boundary, which is expensive; these substring checks are not, and rule out
+    # most messages (which have no links at all) before the pattern ever runs.
+    if ':' not in text and ('.' not in text or ('/' not in text and 'www' not in text.lower())):
+        return ()
+
+    return tuple(m.group(0) for m in URL_PATTERN.finditer(text))
+
+
+def normalize_host(host: str) -> str:
+    """
+    Normalize a host name for comparison: lowercased, without a trailing dot or a leading `www.`.
+    """
+    host = host.lower().rstrip('.')
+
+    if host.startswith('www') and '.' in host:
+        (prefix, rest) = host.split('.', 1)
+
+        if prefix[3:].isdigit() or prefix == 'www':
+            host = rest
+
+    return host
+
+
+def parse_host(url: str) -> Optional[str]:
+    """
+    Get the (normalized) host a link points to.
+
+    :param url: A link, as found by find_urls(). Scheme-less links (`www.example.com`, `example.com/page`) work too.
+    :return: Returns the host, or None if the link has no host (e.g. `mailto:` links).
+    """
+    scheme = _SCHEME.match(url)
+
+    if scheme is not None:
+        if not scheme.group(1):
+            return None
+
+        url = url[scheme.end():]
+
+    host = _HOST.match(url)
+
+    if host is None:
+        return None
+
+    return normalize_host(host.group(1)) or None
+
+
+def registered_domain(host: str) -> str:
+    """
+    Approximate the domain a host was registered under, so that `a.spam.example` and `b.spam.example` count as the
+    same site: the last two labels of the host, or the last three when the second-to-last is a registry label (as in
+    `example.co.uk`). IP addresses are returned as they are.
+    """
+    labels = host.split('.')
+
+    if len(labels) <= 2 or labels[-1].isdigit() or host.startswith('['):
+        return host
+
+    if labels[-2] in _REGISTRY_LABELS and len(labels[-1]) == 2:
+        return '.'.join(labels[-3:])
+
+    return '.'.join(labels[-2:])
+
+
+class DomainSet:
+    """
+    A set of domains, each also matching all of its subdomains: a set holding `example.com` contains
+    `cdn.example.com`, but not `badexample.com`. Lookups cost one set probe per label of the host.
+    """
+
+    __slots__ = ['_domains']
+
+    def __init__(self, domains=()):
+        self._domains = frozenset(normalize_host(d) for d in domains if d)
+
+    def __len__(self):
+        return len(self._domains)
+
+    def __iter__(self):
+        return iter(sorted(self._domains))
+
+    def __contains__(self, host: str) -> bool:
+        return self.match(host) is not None
+
+    def match(self, host: str) -> Optional[str]:
+        """
+        :return: Returns the entry in this set that the host falls under, or None.
+        """
+        if not self._domains:
+            return None
+
+        while True:
+            if host in self._domains:
+                return host
+
+            dot = host.find('.')
+
+            if dot < 0:
+                return None
+
+            host = host[dot + 1:]
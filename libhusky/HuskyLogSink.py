@@ -0,0 +1,286 @@
+import asyncio
+import collections
+import json
+import logging
+from typing import Optional
+
+import discord
+
+LOG = logging.getLogger("HuskyBot.LogSink")
+
+defaults = {
+    'flushInterval': 2.0,  # Time (in seconds) a log embed may wait for others to share a message with
+    'maxBuffered': 250,  # Embeds buffered per channel before the oldest are dropped
+    'multiEmbed': True  # Send up to 10 embeds per message. If False (or rejected by Discord), one embed per message.
+}
+
+# Discord's limits on a single message: at most 10 embeds, and 6000 characters across all of them.
+MAX_EMBEDS = 10
+MAX_EMBED_CHARACTERS = 6000
+
+
+class LogEntry:
+    __slots__ = ['payload', 'size', 'repeats']
+
+    def __init__(self, payload: dict, size: int):
+        self.payload = payload
+        self.size = size
+        self.repeats = 1
+
+    def render(self) -> dict:
+        if self.repeats == 1:
+            return self.payload
+
+        footer = self.payload.get('footer', {}).get('text')
+        repeats = f"Repeated {self.repeats} times"
+
+        return {**self.payload, 'footer': {**self.payload.get('footer', {}),
+                                           'text': f"{footer} | {repeats}" if footer else repeats}}
+
+
+class LogBuffer:
+    __slots__ = ['channel', 'entries', 'ready', 'urgent', 'task']
+
+    def __init__(self, channel: discord.TextChannel):
+        self.channel = channel
+        self.entries = collections.OrderedDict()  # fingerprint -> LogEntry, oldest first
+        self.ready = asyncio.Event()
+        self.urgent = False
+        self.task = None
+
+
+class LogSinkStats:
+    """
+    Counters for the log sink. `merged` counts embeds folded into an identical one already waiting, and `dropped`
+    counts embeds that were never delivered (buffer overflow or API errors).
+    """
+
+    def __init__(self):
+        self.posted = 0
+        self.merged = 0
+        self.dropped = 0
+        self.urgent = 0
+        self.messages = 0
+        self.embeds = 0
+        self.errors = 0
+
+    @property
+    def embeds_per_message(self) -> float:
+        return self.embeds / self.messages if self.messages else 0.0
+
+
+class LogSink:
+    """
+    Delivers staff log and alert embeds, batched per channel.
+
+    Every log embed used to be its own message, and so its own request against the channel's rate limit. During a raid
+    that's hundreds of requests, and the log channels fall minutes behind. The sink instead buffers embeds per channel
+    and sends them up to 10 to a message: as soon as a channel has 10 embeds waiting, or once the oldest has waited
+    `flush_interval` seconds. Identical embeds waiting in the same channel are merged (and marked as repeated), and if
+    a channel's buffer overflows, its oldest embeds are dropped rather than delaying everything behind them.
+
+    Urgent embeds (e.g. raid alerts) flush their channel immediately. Embeds that delete themselves after a while are
+    sent on their own, right away.
+
+    Channels handled by a WebhookDelivery are sent through their webhooks, on rate limits of their own.
+
+    Posting never blocks; delivery happens in the background, and failures are logged rather than raised.
+    """
+
+    def __init__(self, post_embeds=None, flush_interval: float = defaults['flushInterval'],
+                 max_buffered: int = defaults['maxBuffered'], multi_embed: bool = defaults['multiEmbed'],
+                 webhooks=None):
+        """
+        :param post_embeds: A coroutine function posting a message with several embeds, as `post_embeds(channel_id,
+                            [embed dicts])`. If None, embeds are sent one per message.
+        :param flush_interval: How long (in seconds) an embed may wait for others to share a message with.
+        :param max_buffered: The maximum number of embeds waiting per channel.
+        :param multi_embed: Whether to send several embeds per message.
+        :param webhooks: A HuskyWebhooks.WebhookDelivery for the channels to send to through webhooks, if any.
+        """
+        self._post_embeds = post_embeds
+        self._webhooks = webhooks
+        self.flush_interval = flush_interval
+        self.max_buffered = max_buffered
+        self.multi_embed = multi_embed and post_embeds is not None
+
+        self._buffers = {}  # channel ID -> LogBuffer
+
+        self.stats = LogSinkStats()
+
+    @property
+    def depth(self) -> int:
+        """
+        The number of embeds waiting to be sent.
+        """
+        return sum(len(buffer.entries) for buffer in self._buffers.values())
+
+    def post(self, channel: Optional[discord.TextChannel], embed: discord.Embed, urgent: bool = False,
+             delete_after: float = None):
+        """
+        Queue an embed for a log channel.
+
+        :param channel: The channel to send the embed to. If None, the embed is discarded.
+        :param embed: The embed to send.
+        :param urgent: Send the embed (and anything waiting with it) right away.
+        :param delete_after: Delete the message after this many seconds. Such embeds are sent on their own, right away.
+        """
+        if channel is None:
+            return
+
+        self.stats.posted += 1
+
+        if delete_after is not None:
+            self.stats.urgent += 1
+            asyncio.ensure_future(self._send_one(channel, embed, delete_after))
+            return
+
+        buffer = self._buffers.get(channel.id)
+
+        if buffer is None:
+            buffer = self._buffers[channel.id] = LogBuffer(channel)
+            buffer.task = asyncio.ensure_future(self._run(buffer))
+
+        payload = embed.to_dict()
+        fingerprint = json.dumps(payload, sort_keys=True, default=str)
+        entry = buffer.entries.get(fingerprint)
+
+        if entry is not None:
+            entry.repeats += 1
+            self.stats.merged += 1
+        else:
+            buffer.entries[fingerprint] = LogEntry(payload, len(embed))
+
+            while len(buffer.entries) > self.max_buffered:
+                buffer.entries.popitem(last=False)
+                self.stats.dropped += 1
+
+        if urgent:
+            buffer.urgent = True
+            self.stats.urgent += 1
+
+        if urgent or len(buffer.entries) >= MAX_EMBEDS:
+            buffer.ready.set()
+
+    async def flush(self):
+        """
+        Send everything waiting right away, and wait until it's sent.
+        """
+        buffers = list(self._buffers.values())
+
+        for buffer in buffers:
+            buffer.urgent = True
+            buffer.ready.set()
+
+        await asyncio.gather(*(buffer.task for buffer in buffers), return_exceptions=True)
+
+    async def close(self):
+        """
+        Send everything waiting, and release the webhook backend (if any).
+        """
+        await self.flush()
+
+        if self._webhooks is not None:
+            await self._webhooks.close()
+
+    async def _run(self, buffer: LogBuffer):
+        try:
+            while buffer.entries:
+                if not buffer.urgent and len(buffer.entries) < MAX_EMBEDS:
+                    try:
+                        await asyncio.wait_for(buffer.ready.wait(), self.flush_interval)
+                    except asyncio.TimeoutError:
+                        pass
+
+                buffer.ready.clear()
+                buffer.urgent = buffer.urgent and len(buffer.entries) > MAX_EMBEDS
+
+                await self._deliver(buffer.channel, self._take_batch(buffer))
+        finally:
+            del self._buffers[buffer.channel.id]
+
+    @staticmethod
+    def _take_batch(buffer: LogBuffer) -> list:
+        batch = []
+        size = 0
+
+        while buffer.entries and len(batch) < MAX_EMBEDS:
+            entry = next(iter(buffer.entries.values()))
+
+            if batch and size + entry.size > MAX_EMBED_CHARACTERS:
+                break
+
+            buffer.entries.popitem(last=False)
+            batch.append(entry)
+            size += entry.size
+
+        return batch
+
+    async def _deliver(self, channel: discord.TextChannel, batch: list):
+        payloads = [entry.render() for entry in batch]
+        rejected = None
+
+        # noinspection PyBroadException
+        try:
+            if self._webhooks is not None and await self._webhooks.deliver(channel, payloads):
+                self.stats.messages += 1
+                self.stats.embeds += len(payloads)
+                return
+
+            if self.multi_embed and len(payloads) > 1:
+                try:
+                    await self._post_embeds(channel.id, payloads)
+                except discord.HTTPException as e:
+                    if e.status != 400:
+                        raise
+
+                    rejected = e
+                else:
+                    self.stats.messages += 1
+                    self.stats.embeds += len(payloads)
+                    return
+        except Exception:
+            self.stats.errors += 1
+            self.stats.dropped += len(payloads)
+            LOG.exception("Could not deliver %d log embed(s) to #%s.", len(payloads), channel)
+            return
+
+        sent = 0
+
+        for payload in payloads:
+            # One bad embed mustn't take the rest of the batch down with it.
+            # noinspection PyBroadException
+            try:
+                await channel.send(embed=discord.Embed.from_dict(payload))
+            except Exception:
+                self.stats.errors += 1
+                self.stats.dropped += 1
+                LOG.exception("Could not deliver a log embed to #%s.", channel)
+            else:
+                sent += 1
+                self.stats.messages += 1
+                self.stats.embeds += 1
+
+        if rejected is None:
+            return
+
+        if sent == len(payloads):
+            # Every embed was fine on its own, so it's the multi-embed message itself that Discord won't take.
+            LOG.warning("Discord rejected a message with %d embeds (%s), but accepted them one by one. Sending log "
+                        "embeds one per message from now on.", len(payloads), rejected)
+            self.multi_embed = False
+        else:
+            LOG.warning("Discord rejected a message with %d embeds (%s), and %d of them on their own as well.",
+                        len(payloads), rejected, len(payloads) - sent)
+
+    async def _send_one(self, channel: discord.TextChannel, embed: discord.Embed, delete_after: float):
+        # noinspection PyBroadException
+        try:
+            await channel.send(embed=embed, delete_after=delete_after)
+        except Exception:
+            self.stats.errors += 1
+            self.stats.dropped += 1
+            LOG.exception("Could not deliver a log embed to #%s.", channel)
+        else:
+            self.stats.messages += 1
+            self.stats.embeds += 1
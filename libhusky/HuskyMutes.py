@@ -0,0 +1,222 @@
+import heapq
+import itertools
+import logging
+from typing import Optional
+
+from libhusky import HuskyConfig, HuskyData, HuskyScheduler
+
+LOG = logging.getLogger("HuskyBot.MuteStore")
+
+# Mutes used to be kept as a single list under this key, rewritten whole on every change.
+LEGACY_KEY = "mutes"
+
+# Stale expiry entries are left in the heap until they come up, unless they make up most of it.
+_COMPACT_MIN = 64
+
+
+def get_record_key(mute: HuskyData.Mute) -> tuple:
+    return mute.guild, mute.user_id, mute.channel
+
+
+def get_store_key(key: tuple) -> str:
+    (guild, user_id, channel) = key
+
+    return f"{guild}:{user_id}:{channel if channel is not None else 'guild'}"
+
+
+class MuteStore:
+    """
+    Every active mute, indexed for the lookups MuteManager makes.
+
+    - Mutes are looked up by (guild, user, channel) in a dict. A user has at most one mute per channel (and one for
+      the guild), so that's also the identity of a record.
+    - A per-user index finds all of a user's mutes when they rejoin.
+    - Expiries are kept in a min-heap. Changing or removing a mute leaves its old entry behind, which is skipped (and
+      eventually compacted away) rather than searched for.
+    - Each mute is its own top-level key in the mutes store, so a change marks just that record dirty. The `journal`
+      and `sqlite` config backends then write only the changed records. The `json` backend still rewrites the whole
+      file, but at most once per flush interval.
+
+    Stores holding the old single `mutes` list are migrated on load.
+    """
+
+    def __init__(self, config: HuskyConfig.WolfConfig):
+        """
+        :param config: The store to persist mutes to.
+        """
+        self._config = config
+
+        self._mutes = {}  # (guild, user ID, channel ID) -> Mute
+        self._by_user = {}  # (guild, user ID) -> {channel ID: Mute}
+        self._expiries = []  # Heap of (expiry, version, record key)
+        self._versions = {}  # record key -> version of its live heap entry
+        self._version = itertools.count()
+        self._stale = 0
+
+    def __len__(self):
+        return len(self._mutes)
+
+    def __iter__(self):
+        return iter(list(self._mutes.values()))
+
+    def __contains__(self, mute: HuskyData.Mute):
+        return self._mutes.get(get_record_key(mute)) is mute
+
+    def load(self):
+        """
+        Load every mute from the store, migrating a legacy mute list if there is one.
+        """
+        for (store_key, raw) in list(self._config.dump().items()):
+            if store_key != LEGACY_KEY:
+                self._index(HuskyData.Mute(raw))
+
+        legacy = self._config.get(LEGACY_KEY)
+
+        if legacy is not None:
+            for raw in legacy:
+                self.add(HuskyData.Mute(raw))
+
+            self._config.delete(LEGACY_KEY)
+            LOG.info("Migrated %d mute(s) from the legacy mute list to one record each.", len(legacy))
+
+    def get(self, guild: int, user_id: int, channel: Optional[int]) -> Optional[HuskyData.Mute]:
+        """
+        :param channel: The channel ID of a channel mute, or None for a guild mute.
+        :return: Returns the user's mute in that channel (or the guild), or None.
+        """
+        return self._mutes.get((guild, user_id, channel))
+
+    def for_user(self, guild: int, user_id: int) -> list:
+        """
+        :return: Returns all of a user's mutes in a guild.
+        """
+        return list(self._by_user.get((guild, user_id), {}).values())
+
+    def add(self, mute: HuskyData.Mute):
+        """
+        Store a mute, replacing any mute the user already has in the same channel (or guild).
+        """
+        self._index(mute)
+        self._save(mute)
+
+    def update(self, mute: HuskyData.Mute):
+        """
+        Save changes to a stored mute (reason, expiry, ...). Its user, guild and channel must not have changed.
+
+        :raises KeyError: If the mute isn't stored.
+        """
+        if mute not in self:
+            raise KeyError("This record doesn't exist in the store!")
+
+        self._push(get_record_key(mute), mute)
+        self._save(mute)
+
+    def retry_at(self, mute: HuskyData.Mute, when: float):
+        """
+        Have an expired mute come due again (e.g. because lifting it failed), without changing its stored expiry.
+
+        :param when: The time to return it from pop_due() at (see HuskyScheduler.now()).
+        :raises KeyError: If the mute isn't stored.
+        """
+        if mute not in self:
+            raise KeyError("This record doesn't exist in the store!")
+
+        self._push(get_record_key(mute), mute, when)
+
+    def remove(self, mute: HuskyData.Mute) -> bool:
+        """
+        :return: Returns True if the mute was stored (and is now removed).
+        """
+        if mute not in self:
+            return False
+
+        key = get_record_key(mute)
+
+        del self._mutes[key]
+
+        user_mutes = self._by_user[key[:2]]
+        del user_mutes[key[2]]
+
+        if not user_mutes:
+            del self._by_user[key[:2]]
+
+        if self._versions.pop(key, None) is not None:
+            self._retire()
+
+        self._config.delete(get_store_key(key))
+
+        return True
+
+    def next_expiry(self) -> Optional[float]:
+        """
+        :return: Returns the earliest expiry of a stored mute (see HuskyScheduler.now()), or None if no mute expires.
+        """
+        self._drop_stale()
+
+        return self._expiries[0][0] if self._expiries else None
+
+    def pop_due(self, when: float = None) -> list:
+        """
+        Take every mute that has expired. The mutes stay stored (until removed), but won't be returned again unless
+        they're updated or retried (see retry_at()).
+
+        :param when: The time to check against (see HuskyScheduler.now()). Defaults to now.
+        :return: Returns the expired mutes, earliest first.
+        """
+        if when is None:
+            when = HuskyScheduler.now()
+
+        due = []
+
+        while self._expiries and self._expiries[0][0] <= when:
+            (_, version, key) = heapq.heappop(self._expiries)
+
+            if self._versions.get(key) != version:
+                self._stale -= 1
+                continue
+
+            del self._versions[key]
+            due.append(self._mutes[key])
+
+        return due
+
+    def _index(self, mute: HuskyData.Mute):
+        key = get_record_key(mute)
+        old = self._mutes.get(key)
+
+        if old is not None and old is not mute:
+            LOG.debug("Replacing the mute of user %s in %s.", mute.user_id, mute.channel or "the guild")
+
+        self._mutes[key] = mute
+        self._by_user.setdefault(key[:2], {})[key[2]] = mute
+        self._push(key, mute)
+
+    def _push(self, key: tuple, mute: HuskyData.Mute, when: float = None):
+        if self._versions.pop(key, None) is not None:
+            self._retire()
+
+        if when is None:
+            when = mute.expiry
+
+        if when is None:
+            return
+
+        version = next(self._version)
+        self._versions[key] = version
+        heapq.heappush(self._expiries, (when, version, key))
+
+    def _retire(self):
+        self._stale += 1
+
+        if self._stale > _COMPACT_MIN and self._stale > len(self._expiries) // 2:
+            self._expiries = [e for e in self._expiries if self._versions.get(e[2]) == e[1]]
+            heapq.heapify(self._expiries)
+            self._stale = 0
+
+    def _drop_stale(self):
+        while self._expiries and self._versions.get(self._expiries[0][2]) != self._expiries[0][1]:
+            heapq.heappop(self._expiries)
+            self._stale -= 1
+
+    def _save(self, mute: HuskyData.Mute):
+        self._config.set(get_store_key(get_record_key(mute)), mute.to_data())
@@ -0,0 +1,362 @@
+import asyncio
+import logging
+import re
+from enum import IntEnum
+from typing import Optional
+
+import discord
+
+from libhusky import HuskyCensor
+from libhusky import HuskyLinks
+from libhusky import HuskyUtils
+from libhusky.HuskyStatics import Regex
+
+LOG = logging.getLogger("HuskyBot.Pipeline")
+
+NEW_MESSAGE = "new_message"
+EDITED_MESSAGE = "edited_message"
+
+INVITE_PATTERN = re.compile(Regex.INVITE_REGEX, re.IGNORECASE)
+
+_UNSET = object()
+
+
+class Priority(IntEnum):
+    """
+    Well-known stage priorities. Stages run lowest priority first, so anything that may delete a message should run
+    before anything that would respond to it.
+    """
+
+    CENSOR = 100
+    UBL = 200
+    AUTOFLAG = 300
+    ANTISPAM = 400
+    DIRTY_HACKS = 500
+    AUTORESPONDER = 600
+    PING_ME = 700
+    COMMANDS = 1000
+
+
+class MessageFeatures:
+    """
+    Everything the message stages want to know about a message, computed at most once per message.
+
+    Cheap fields are filled in up front. Anything that costs a regex pass or a permission calculation is computed on
+    first access and cached, so a message that no stage cares about never pays for it.
+    """
+
+    __slots__ = ['message', 'context', 'meta', 'config', 'actions', 'author', 'channel', 'guild', 'content',
+                 'is_member', 'deleted', '_content_lower', '_folded_content', '_urls', '_link_hosts',
+                 '_invite_fragments', '_permissions', '_role_ids']
+
+    def __init__(self, message: discord.Message, context: str = NEW_MESSAGE, meta: dict = None, config=None,
+                 actions=None):
+        """
+        :param message: The message being processed.
+        :param context: Either NEW_MESSAGE or EDITED_MESSAGE.
+        :param meta: Extra context for the stages (for edits, the `before` and `after` messages).
+        :param config: The config snapshot to evaluate this message against.
+        :param actions: The HuskyActions.ActionQueue to send deletes, kicks and bans through. If None, they're sent
+                        directly.
+        """
+        self.message = message
+        self.context = context
+        self.meta = meta or {}
+        self.config = config
+        self.actions = actions
+        self.author = message.author
+        self.channel = message.channel
+        self.guild = message.guild
+        self.content = message.content
+        self.is_member = isinstance(message.author, discord.Member)
+        self.deleted = False
+
+        self._content_lower = None
+        self._folded_content = None
+        self._urls = None
+        self._link_hosts = None
+        self._invite_fragments = None
+        self._permissions = None
+        self._role_ids = None
+
+    @property
+    def content_lower(self) -> str:
+        if self._content_lower is None:
+            self._content_lower = self.content.lower()
+
+        return self._content_lower
+
+    @property
+    def folded_content(self) -> str:
+        """
+        The message's content folded for evasion-resistant matching (see HuskyCensor.fold).
+        """
+        if self._folded_content is None:
+            self._folded_content = HuskyCensor.fold(self.content)
+
+        return self._folded_content
+
+    def folded_for(self, name: str) -> Optional[str]:
+        """
+        Get the folded content for a matcher, if it has opted into folded matching (through `foldedMatching`).
+
+        :param name: The matcher's name, e.g. "Censor".
+        :return: Returns the folded content, or None if the matcher only matches the content as-is.
+        """
+        if name not in self.config.get('foldedMatching'):
+            return None
+
+        return self.folded_content
+
+    @property
+    def urls(self) -> tuple:
+        """
+        Every link-like string in the message, in order of appearance.
+        """
+        if self._urls is None:
+            self._urls = HuskyLinks.find_urls(self.content)
+
+        return self._urls
+
+    @property
+    def link_hosts(self) -> tuple:
+        """
+        The (normalized) host of every link in the message, matching `urls` one for one. Links without a host (e.g.
+        `mailto:` links) have None.
+        """
+        if self._link_hosts is None:
+            self._link_hosts = tuple(HuskyLinks.parse_host(url) for url in self.urls)
+
+        return self._link_hosts
+
+    @property
+    def invite_fragments(self) -> tuple:
+        """
+        The invite codes of every Discord invite in the message, in order of appearance.
+        """
+        if self._invite_fragments is None:
+            self._invite_fragments = tuple(m.group('fragment') for m in INVITE_PATTERN.finditer(self.content))
+
+        return self._invite_fragments
+
+    @property
+    def mention_count(self) -> int:
+        return len(self.message.mentions)
+
+    @property
+    def role_mention_count(self) -> int:
+        return len(self.message.role_mentions)
+
+    @property
+    def permissions(self) -> discord.Permissions:
+        """
+        The author's permissions in the message's channel. Users who are no longer guild members have none.
+        """
+        if self._permissions is None:
+            if self.is_member:
+                self._permissions = self.author.permissions_in(self.channel)
+            else:
+                self._permissions = discord.Permissions.none()
+
+        return self._permissions
+
+    @property
+    def can_manage_messages(self) -> bool:
+        return self.permissions.manage_messages
+
+    @property
+    def role_ids(self) -> frozenset:
+        if self._role_ids is None:
+            if self.is_member:
+                self._role_ids = frozenset(r.id for r in self.author.roles)
+            else:
+                self._role_ids = frozenset()
+
+        return self._role_ids
+
+    @property
+    def is_command(self) -> bool:
+        return self.content.startswith(self.config.get('prefix', '/'))
+
+    @property
+    def is_antispam_exempt(self) -> bool:
+        return not self.role_ids.isdisjoint(self.config.get('antiSpam').exempted_roles)
+
+    def has_any_role(self, roles) -> bool:
+        """
+        Check if the author has any of the given roles. Mirrors HuskyUtils.member_has_any_role, so `None` matches
+        everyone.
+        """
+        if roles is None:
+            return True
+
+        return not self.role_ids.isdisjoint(roles)
+
+    def mark_deleted(self) -> None:
+        """
+        Record that this message is gone (e.g. purged by a ban), so that no further stages run for it.
+        """
+        self.deleted = True
+
+    async def delete(self) -> bool:
+        """
+        Delete the message and stop any further stages from running for it.
+
+        :return: Returns False if the message was already deleted (by an earlier stage or by someone else).
+        """
+        if self.deleted:
+            return False
+
+        self.deleted = True
+
+        if self.actions is not None:
+            return await self.actions.delete(self.message)
+
+        try:
+            await self.message.delete()
+        except discord.NotFound:
+            return False
+
+        return True
+
+    async def ban(self, reason: str = None, delete_message_days: int = 1) -> bool:
+        """
+        Ban the message's author. If the ban purges the author's recent messages, no further stages run for this one.
+
+        :return: Returns False if the author was already banned (by an earlier stage or module).
+        """
+        if delete_message_days > 0:
+            self.deleted = True
+
+        if self.actions is not None:
+            return await self.actions.ban(self.guild, self.author, reason=reason,
+                                          delete_message_days=delete_message_days)
+
+        await self.guild.ban(self.author, reason=reason, delete_message_days=delete_message_days)
+        return True
+
+    async def softban(self, reason: str = None, delete_message_days: int = 1) -> bool:
+        """
+        Ban the message's author to purge their recent messages, then unban them. Like ban(), no further stages run for
+        this message if its author's messages are purged.
+
+        :return: Returns False if the author was already softbanned or banned (by an earlier stage or module).
+        """
+        if delete_message_days > 0:
+            self.deleted = True
+
+        if self.actions is not None:
+            return await self.actions.softban(self.guild, self.author, reason=reason,
+                                              delete_message_days=delete_message_days)
+
+        await self.guild.ban(self.author, reason=reason, delete_message_days=delete_message_days)
+        await self.guild.unban(self.author, reason="Softban reversal")
+        return True
+
+    async def kick(self, reason: str = None) -> bool:
+        """
+        Kick the message's author.
+
+        :return: Returns False if the author was already kicked or banned (by an earlier stage or module).
+        """
+        if self.actions is not None:
+            return await self.actions.kick(self.author, reason=reason)
+
+        await self.author.kick(reason=reason)
+        return True
+
+
+class PipelineStage:
+    __slots__ = ['name', 'callback', 'priority', 'on_edit', 'background']
+
+    def __init__(self, name: str, callback, priority: int, on_edit: bool, background: bool):
+        self.name = name
+        self.callback = callback
+        self.priority = priority
+        self.on_edit = on_edit
+        self.background = background
+
+
+class MessagePipeline:
+    """
+    The single entry point for message processing.
+
+    Rather than every plugin listening to on_message on its own (and each re-checking whether to process the message,
+    re-running the URL regex, re-calculating permissions...), plugins register a stage here. The bot builds a
+    MessageFeatures object once per message and hands it to every stage in priority order. As soon as a stage deletes
+    the message, the remaining stages are skipped.
+
+    Stages are coroutines taking a single MessageFeatures argument. Background stages are only scheduled, not awaited,
+    and so can never stop the pipeline - use them for stages that only ever report on a message.
+    """
+
+    def __init__(self, bot):
+        self._bot = bot
+        self._stages = []
+
+    @property
+    def stages(self) -> list:
+        return list(self._stages)
+
+    def register(self, name: str, callback, priority: int, on_edit: bool = False, background: bool = False) -> None:
+        """
+        Register (or replace) a message processing stage.
+
+        :param name: A unique name for this stage.
+        :param callback: A coroutine function taking a MessageFeatures object.
+        :param priority: Where in the pipeline this stage runs, lowest first. See Priority.
+        :param on_edit: Also run this stage for edited messages.
+        :param background: Schedule this stage without waiting for it to complete.
+        """
+        stages = [s for s in self._stages if s.name != name]
+        stages.append(PipelineStage(name, callback, priority, on_edit, background))
+        stages.sort(key=lambda s: s.priority)
+
+        # Swap the list rather than editing it, so a message mid-pipeline keeps a consistent view.
+        self._stages = stages
+        LOG.debug("Registered message pipeline stage %s (priority %d)", name, priority)
+
+    def unregister(self, name: str) -> None:
+        self._stages = [s for s in self._stages if s.name != name]
+
+    async def process(self, message: discord.Message, context: str = NEW_MESSAGE,
+                      meta: dict = None) -> Optional[MessageFeatures]:
+        """
+        Run a message through every registered stage.
+
+        :param message: The message to process.
+        :param context: Either NEW_MESSAGE or EDITED_MESSAGE.
+        :param meta: Extra context for the stages.
+        :return: Returns the message's features, or None if the message was not processed at all.
+        """
+        if not HuskyUtils.should_process_message(message):
+            return None
+
+        features = MessageFeatures(message, context, meta, self._bot.config.snapshot, self._bot.action_queue)
+
+        for stage in self._stages:
+            if context == EDITED_MESSAGE and not stage.on_edit:
+                continue
+
+            if stage.background:
+                asyncio.ensure_future(self._run_stage(stage, features))
+                continue
+
+            await self._run_stage(stage, features)
+
+            if features.deleted:
+                LOG.debug("Message %s was deleted by stage %s, skipping remaining stages.", message.id, stage.name)
+                break
+
+        return features
+
+    async def _run_stage(self, stage: PipelineStage, features: MessageFeatures):
+        # One broken stage must not take the rest of the pipeline (or the bot's commands) down with it.
+        # noinspection PyBroadException
+        try:
+            await stage.callback(features)
+        except Exception:
+            try:
+                await self._bot.on_error(f"pipeline:{stage.name}", features.message)
+            except Exception:
+                LOG.exception("Message pipeline stage %s raised an exception.", stage.name)
@@ -0,0 +1,319 @@
+import asyncio
+import functools
+import logging
+import multiprocessing
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional
+
+from libhusky.HuskyCensor import CensorMatcher
+
+LOG = logging.getLogger("HuskyBot.RegexSandbox")
+
+defaults = {
+    'workers': 2,  # Number of worker processes evaluating patterns
+    'timeout': 0.25  # Time budget (in seconds) for a single evaluation
+}
+
+
+class RegexTimeoutError(Exception):
+    """
+    Raised when a regex evaluation did not finish within its time budget.
+    """
+    pass
+
+
+# Worker-side functions. These run in the sandbox's processes, which keep their own compiled pattern caches.
+
+@functools.lru_cache(maxsize=64)
+def _get_matcher(patterns: tuple) -> CensorMatcher:
+    return CensorMatcher(patterns)
+
+
+@functools.lru_cache(maxsize=256)
+def _compile(pattern: str, flags: int):
+    return re.compile(pattern, flags)
+
+
+def _worker_ready() -> bool:
+    return True
+
+
+def _worker_search(patterns: tuple, text: str, folded: str = None) -> Optional[str]:
+    return _get_matcher(patterns).search(text, folded)
+
+
+def _worker_find_all(patterns: tuple, text: str, folded: str = None) -> list:
+    return _get_matcher(patterns).find_all(text, folded)
+
+
+def _worker_match_every(patterns: tuple, flags: int, texts: list) -> list:
+    compiled = [_compile(pattern, flags) for pattern in patterns]
+
+    return [i for (i, text) in enumerate(texts) if all(c.search(text) is not None for c in compiled)]
+
+
+class RegexSandbox:
+    """
+    Evaluates staff-supplied regular expressions away from the event loop.
+
+    Python's regex engine can't be interrupted, so a single catastrophically backtracking pattern run on the event
+    loop freezes the whole bot - gateway heartbeats included. The sandbox runs patterns in a small pool of worker
+    processes instead, and gives every evaluation a time budget. No more evaluations are handed to the pool than it has
+    workers, so the budget only ever covers an evaluation's own run, never time spent queued behind others. When an
+    evaluation runs over, the pool is killed and restarted, the evaluation's patterns are re-run one by one to find the
+    culprit, and the culprit is quarantined: it is skipped from then on, and reported through `on_quarantine`.
+    Evaluations of the same patterns wait for the search to finish, then run without the culprit.
+
+    Plain-word terms never need the sandbox; CensorMatchers resolve their literal terms in-process, and only their real
+    patterns are sent to the workers. Workers keep their compiled patterns cached between evaluations.
+    """
+
+    def __init__(self, workers: int = defaults['workers'], timeout: float = defaults['timeout'], on_quarantine=None):
+        """
+        :param workers: The number of worker processes to run patterns in.
+        :param timeout: The time budget (in seconds) for a single evaluation.
+        :param on_quarantine: A coroutine function called as `on_quarantine(pattern, source)` when a pattern is
+                              quarantined.
+        """
+        self.timeout = timeout
+        self.on_quarantine = on_quarantine
+        self.quarantined = {}  # pattern -> source
+
+        self._workers = max(int(workers), 1)
+        self._slots = asyncio.Semaphore(self._workers)
+        self._pool = None
+        self._pool_ready = None
+        self._isolating = {}  # patterns -> asyncio.Task searching them for the culprit
+
+        self.evaluations = 0
+        self.timeouts = 0
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+            self._pool = None
+            self._pool_ready = None
+
+    def release(self, pattern: str) -> bool:
+        """
+        Take a pattern out of quarantine.
+
+        :return: Returns False if the pattern wasn't quarantined.
+        """
+        return self.quarantined.pop(pattern, None) is not None
+
+    async def search(self, matcher: CensorMatcher, text: str, source: str = None,
+                     folded: str = None) -> Optional[str]:
+        """
+        Sandboxed equivalent of CensorMatcher.search().
+
+        :param matcher: The terms to check.
+        :param text: The string to check.
+        :param source: What the terms are for (e.g. "Censor"), for quarantine reports.
+        :param folded: The string's folded form, to also check (see CensorMatcher.search()).
+        :return: Returns the first matching term, or None if nothing matched (or the evaluation ran over).
+        """
+        if folded == text:
+            folded = None
+
+        term = matcher.literals.search(text)
+
+        if term is None and folded is not None:
+            term = matcher.literals.search(folded)
+
+        if term is not None:
+            return term
+
+        patterns = self._active_patterns(matcher)
+
+        if not patterns:
+            return None
+
+        return await self._evaluate(_worker_search, patterns, text, folded, source=source)
+
+    async def find_all(self, matcher: CensorMatcher, text: str, source: str = None, folded: str = None) -> list:
+        """
+        Sandboxed equivalent of CensorMatcher.find_all().
+
+        :param matcher: The terms to check.
+        :param text: The string to check.
+        :param source: What the terms are for (e.g. "AutoFlag"), for quarantine reports.
+        :param folded: The string's folded form, to also check (see CensorMatcher.find_all()).
+        :return: Returns every matching term, in the order they were given.
+        """
+        if folded == text:
+            folded = None
+
+        matched = matcher.literals.find_all(text)
+
+        if folded is not None:
+            matched |= matcher.literals.find_all(folded)
+
+        patterns = self._active_patterns(matcher)
+
+        if patterns:
+            matched.update(await self._evaluate(_worker_find_all, patterns, text, folded, source=source) or ())
+
+        return [term for term in matcher.terms if term in matched]
+
+    async def match_every(self, patterns, texts: list, flags: int = 0, timeout: float = None) -> list:
+        """
+        Find the strings that match every one of the given patterns. Nothing is quarantined; one-off patterns that run
+        over their time budget raise instead.
+
+        :param patterns: The patterns that must all match.
+        :param texts: The strings to check.
+        :param flags: The regex flags to compile the patterns with.
+        :param timeout: The time budget for the whole batch. Defaults to the sandbox's budget per string.
+        :return: Returns the indices of the matching strings.
+        """
+        if timeout is None:
+            timeout = self.timeout * max(len(texts), 1)
+
+        return await self._run(_worker_match_every, tuple(patterns), flags, list(texts), timeout=timeout)
+
+    def _active_patterns(self, matcher: CensorMatcher) -> tuple:
+        if not self.quarantined:
+            return matcher.patterns
+
+        return tuple(p for p in matcher.patterns if p not in self.quarantined)
+
+    async def _get_pool(self) -> ProcessPoolExecutor:
+        while True:
+            if self._pool is None:
+                # Spawn fresh interpreters, rather than forking a process with a running event loop and open sockets.
+                self._pool = ProcessPoolExecutor(max_workers=self._workers,
+                                                 mp_context=multiprocessing.get_context('spawn'))
+                self._pool_ready = asyncio.ensure_future(self._warm_up(self._pool))
+
+            pool = self._pool
+
+            # Starting the workers takes far longer than any time budget, so it must not count against one.
+            await asyncio.shield(self._pool_ready)
+
+            # The pool may have been killed while we were waiting for it.
+            if self._pool is pool:
+                return pool
+
+    async def _warm_up(self, pool: ProcessPoolExecutor):
+        loop = asyncio.get_event_loop()
+
+        try:
+            await asyncio.gather(*(loop.run_in_executor(pool, _worker_ready) for _ in range(self._workers)))
+        except BrokenProcessPool:
+            LOG.warning("Regex sandbox pool was killed before it finished starting.")
+
+    def _kill_pool(self):
+        pool, self._pool = self._pool, None
+
+        if pool is None:
+            return
+
+        # A pattern stuck in the regex engine can't be cancelled, only killed along with its process. Everything else
+        # running in the pool fails with BrokenProcessPool, and is retried on the next pool.
+        terminate_workers = getattr(pool, 'terminate_workers', None)
+
+        if terminate_workers is not None:
+            terminate_workers()
+        else:
+            for process in list((getattr(pool, '_processes', None) or {}).values()):
+                process.terminate()
+
+        pool.shutdown(wait=False)
+
+    async def _run(self, func, *args, timeout: float):
+        loop = asyncio.get_event_loop()
+
+        for attempt in range(3):
+            pool = await self._get_pool()
+
+            # Holding one of the pool's slots means a worker is free, so the evaluation starts as soon as it's submitted
+            # and the clock below only measures its own run.
+            async with self._slots:
+                if self._pool is not pool:
+                    # Killed while we waited for a slot.
+                    continue
+
+                future = loop.run_in_executor(pool, func, *args)
+                self.evaluations += 1
+
+                try:
+                    return await asyncio.wait_for(future, timeout)
+                except asyncio.TimeoutError:
+                    self.timeouts += 1
+
+                    if self._pool is pool:
+                        self._kill_pool()
+
+                    raise RegexTimeoutError(f"Regex evaluation did not finish within {timeout} seconds.")
+                except BrokenProcessPool:
+                    # Killed because of some other evaluation. Ours is innocent, so try again on a fresh pool.
+                    if self._pool is pool:
+                        self._pool = None
+                        pool.shutdown(wait=False)
+
+        raise BrokenProcessPool("The regex sandbox pool failed repeatedly.")
+
+    async def _evaluate(self, func, patterns: tuple, text: str, folded: str = None, source: str = None):
+        timed_out = False
+
+        while True:
+            isolation = self._isolating.get(patterns)
+
+            if isolation is not None:
+                # We're hunting down the bad pattern in this set. Rather than let messages through unchecked meanwhile,
+                # wait for the search, then check against what's left.
+                await asyncio.shield(isolation)
+                patterns = tuple(p for p in patterns if p not in self.quarantined)
+
+                if not patterns:
+                    return None
+
+            try:
+                return await self._run(func, patterns, text, folded, timeout=self.timeout)
+            except RegexTimeoutError:
+                if timed_out:
+                    LOG.warning("Regex evaluation for %s ran over its time budget again, skipping it.", source)
+                    return None
+
+                LOG.warning("Regex evaluation for %s ran over its time budget, searching for the culprit.", source)
+                timed_out = True
+
+                if patterns not in self._isolating:
+                    self._isolating[patterns] = asyncio.ensure_future(self._isolate(patterns, text, folded, source))
+            except BrokenProcessPool:
+                LOG.exception("Regex sandbox pool failed, skipping evaluation.")
+                return None
+
+    async def _isolate(self, patterns: tuple, text: str, folded: str = None, source: str = None):
+        start = time.monotonic()
+        culprits = []
+
+        try:
+            for pattern in patterns:
+                try:
+                    await self._run(_worker_search, (pattern,), text, folded, timeout=self.timeout)
+                except RegexTimeoutError:
+                    culprits.append(pattern)
+                except BrokenProcessPool:
+                    continue
+        finally:
+            self._isolating.pop(patterns, None)
+
+        if not culprits:
+            LOG.warning("Could not find a single slow pattern among %d for %s (searched for %.2f seconds).",
+                        len(patterns), source, time.monotonic() - start)
+            return
+
+        for pattern in culprits:
+            self.quarantined[pattern] = source
+            LOG.error("Quarantined regex %r from %s: it ran for over %s seconds.", pattern, source, self.timeout)
+
+            if self.on_quarantine is not None:
+                try:
+                    await self.on_quarantine(pattern, source)
+                except Exception:
+                    LOG.exception("Failed to report quarantined regex %r.", pattern)
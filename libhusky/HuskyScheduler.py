@@ -0,0 +1,159 @@
+import asyncio
+import datetime
+import heapq
+import itertools
+import logging
+from typing import Optional
+
+LOG = logging.getLogger("HuskyBot.Scheduler")
+
+# Longest the scheduler sleeps in one go, so that it keeps up if the system clock is changed under it.
+MAX_SLEEP = 300
+
+# Cancelled items are left in the heap until they come up, unless they make up most of it.
+_COMPACT_MIN = 64
+
+
+def now() -> float:
+    """
+    The clock the scheduler runs on. It's the one mute expiries and giveaway end times are recorded with
+    (`datetime.datetime.utcnow().timestamp()`), so that they come due exactly when is_expired()/is_over() says.
+    """
+    return datetime.datetime.utcnow().timestamp()
+
+
+class ScheduledItem:
+    __slots__ = ['when', 'seq', 'key', 'callback', 'cancelled']
+
+    def __init__(self, when: float, seq: int, key, callback):
+        self.when = when
+        self.seq = seq
+        self.key = key
+        self.callback = callback
+        self.cancelled = False
+
+    def __lt__(self, other):
+        return (self.when, self.seq) < (other.when, other.seq)
+
+
+class Scheduler:
+    """
+    Runs coroutines at given times (timestamps, as returned by now()), for anything that needs to happen later: mute
+    expiries, giveaway ends, and so on.
+
+    Items are kept in a min-heap. A single task sleeps until the earliest item is due (and is woken early if something
+    earlier is scheduled), so there's no polling, however many items are waiting. Every item has a key, unique across
+    the scheduler: scheduling an existing key replaces (reschedules) it, and items can be cancelled by key. Both cost
+    O(log n); cancelled items are dropped from the heap lazily.
+
+    Callbacks run in tasks of their own, so a slow callback doesn't hold up the ones after it. Exceptions are logged.
+    """
+
+    def __init__(self):
+        self._heap = []
+        self._items = {}  # key -> ScheduledItem
+        self._seq = itertools.count()
+        self._cancelled = 0
+
+        self._wakeup = asyncio.Event()
+        self._task = None
+
+        self.fired = 0
+        self.wakeups = 0
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def when(self, key) -> Optional[float]:
+        """
+        :return: Returns when the item with this key is due, or None if there's no such item.
+        """
+        item = self._items.get(key)
+
+        return item.when if item is not None else None
+
+    def schedule(self, key, when: float, callback):
+        """
+        Schedule a coroutine, replacing any item with the same key.
+
+        :param key: A hashable key for the item, e.g. `("mute", guild_id, user_id, channel_id)`.
+        :param when: The timestamp (see now()) to run the callback at. Times in the past run as soon as possible.
+        :param callback: A coroutine function, taking no arguments.
+        """
+        self.cancel(key)
+
+        item = ScheduledItem(when, next(self._seq), key, callback)
+        self._items[key] = item
+        heapq.heappush(self._heap, item)
+
+        if self._heap[0] is item:
+            self._wakeup.set()
+
+        if self._task is None:
+            self._task = asyncio.ensure_future(self._run())
+
+    def cancel(self, key) -> bool:
+        """
+        Cancel the item with this key, if there's one.
+
+        :return: Returns True if an item was cancelled.
+        """
+        item = self._items.pop(key, None)
+
+        if item is None:
+            return False
+
+        item.cancelled = True
+        self._cancelled += 1
+
+        if self._cancelled > _COMPACT_MIN and self._cancelled > len(self._heap) // 2:
+            self._heap = [i for i in self._heap if not i.cancelled]
+            heapq.heapify(self._heap)
+            self._cancelled = 0
+
+        return True
+
+    def close(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _run(self):
+        while True:
+            while self._heap and self._heap[0].cancelled:
+                heapq.heappop(self._heap)
+                self._cancelled -= 1
+
+            self._wakeup.clear()
+
+            if not self._heap:
+                await self._wakeup.wait()
+                continue
+
+            delay = self._heap[0].when - now()
+
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), min(delay, MAX_SLEEP))
+                except asyncio.TimeoutError:
+                    pass
+
+                self.wakeups += 1
+                continue
+
+            item = heapq.heappop(self._heap)
+            del self._items[item.key]
+            self.fired += 1
+
+            asyncio.ensure_future(self._fire(item))
+
+    @staticmethod
+    async def _fire(item: ScheduledItem):
+        # noinspection PyBroadException
+        try:
+            await item.callback()
+        except Exception:
+            LOG.exception("Scheduled item %s failed.", item.key)
@@ -117,7 +117,7 @@ def should_process_message(message: discord.Message):
         return False
 
     # Don't process messages from ignored guilds (developer mode)
-    if message.guild.id in HuskyConfig.get_config().get("ignoredGuilds", []):
+    if message.guild.id in HuskyConfig.get_config().snapshot.get("ignoredGuilds"):
         return False
 
     # Don't process messages from other bots.
@@ -241,11 +241,11 @@ def get_image_size(fname):
 
 
 async def send_to_keyed_channel(bot: discord.Client, channel: HuskyStatics.ChannelKeys, embed: discord.Embed):
-    log_channel = HuskyConfig.get_config().get('specialChannels', {}).get(channel.value, None)
+    log_channel = HuskyConfig.get_config().snapshot.get('specialChannels').get(channel.value, None)
     if log_channel is not None:
         log_channel: discord.TextChannel = bot.get_channel(log_channel)
 
-        await log_channel.send(embed=embed)
+        bot.log_sink.post(log_channel, embed)
 
 
 def get_fragment_from_invite(data: str) -> str:
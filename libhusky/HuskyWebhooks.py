@@ -0,0 +1,179 @@
+import asyncio
+import logging
+import time
+from typing import Optional
+
+import aiohttp
+import discord
+import discord.http
+
+LOG = logging.getLogger("HuskyBot.Webhooks")
+
+defaults = {
+    'channels': [],  # ChannelKeys values (e.g. "messageLogs", "userLogs") to deliver through webhooks
+    'name': "HuskyBot Logs",  # Name of the webhooks created (and reused) in those channels
+    'apiBase': None,  # Where to execute webhooks (None for Discord's API; see misc/benchmarks/webhook_standin.py)
+    'retrySeconds': 600  # Time (in seconds) to wait before trying to set up a webhook again after failing to
+}
+
+# Executing a webhook fails with this when the webhook was deleted, and we need a new one.
+_UNKNOWN_WEBHOOK = 404
+
+
+class WebhookStats:
+    def __init__(self):
+        self.executes = 0
+        self.embeds = 0
+        self.provisioned = 0
+        self.rate_limited = 0
+        self.fallbacks = 0
+
+
+class WebhookDelivery:
+    """
+    Delivers log embeds through webhooks rather than the bot's own messages.
+
+    Messages sent by the bot share its rate limits (per channel and global) with everything else it does, bans
+    included. Webhooks have buckets of their own, so busy log channels (message and user logs, mostly) can be moved to
+    them and never hold up moderation. A webhook also takes up to 10 embeds per message, on any version of the API.
+
+    The webhook for a channel is found (by name) or created the first time it's needed, then cached. If it's deleted,
+    a new one is set up on the next delivery. If one can't be set up (say, the bot lacks Manage Webhooks), deliver()
+    returns False and the caller should send the embeds itself; the channel is retried after `retry_seconds`.
+    """
+
+    def __init__(self, channels, name: str = defaults['name'], api_base: str = None,
+                 retry_seconds: float = defaults['retrySeconds']):
+        """
+        :param channels: A function returning the IDs of the channels to deliver through webhooks.
+        :param name: The name of the webhooks to use.
+        :param api_base: The API to execute webhooks against. Defaults to Discord's.
+        :param retry_seconds: The time (in seconds) to wait after failing to set up a webhook, before trying again.
+        """
+        self._channels = channels
+        self.name = name
+        self.api_base = (api_base or discord.http.Route.BASE).rstrip('/')
+        self.retry_seconds = retry_seconds
+
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._webhooks = {}  # channel ID -> (webhook ID, token)
+        self._provisioning = {}  # channel ID -> asyncio.Task
+        self._failed = {}  # channel ID -> time of the failed setup
+        self._reset_at = {}  # webhook ID -> time its exhausted bucket resets
+
+        self.stats = WebhookStats()
+
+    def handles(self, channel: discord.TextChannel) -> bool:
+        return channel.id in self._channels()
+
+    async def deliver(self, channel: discord.TextChannel, embeds: list) -> bool:
+        """
+        Send up to 10 embeds to a channel, through its webhook.
+
+        :param channel: The channel to send to.
+        :param embeds: The embeds to send, as dicts.
+        :return: Returns True if the embeds were sent, or False if the caller should send them instead.
+        """
+        if not self.handles(channel):
+            return False
+
+        # A deleted webhook is replaced (once) before giving up.
+        for _ in range(2):
+            webhook = await self._get_webhook(channel)
+
+            if webhook is None:
+                break
+
+            try:
+                status = await self._execute(webhook, embeds)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                LOG.warning("Could not execute the log webhook for #%s (%s).", channel, e)
+                break
+
+            if status == _UNKNOWN_WEBHOOK:
+                LOG.info("The log webhook for #%s is gone, setting up a new one.", channel)
+                self._webhooks.pop(channel.id, None)
+                continue
+
+            if status >= 400:
+                LOG.warning("Discord refused the log webhook for #%s (HTTP %d).", channel, status)
+                break
+
+            self.stats.executes += 1
+            self.stats.embeds += len(embeds)
+            return True
+
+        self.stats.fallbacks += 1
+        return False
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _get_webhook(self, channel: discord.TextChannel) -> Optional[tuple]:
+        webhook = self._webhooks.get(channel.id)
+
+        if webhook is not None:
+            return webhook
+
+        failed_at = self._failed.get(channel.id)
+
+        if failed_at is not None and time.monotonic() - failed_at < self.retry_seconds:
+            return None
+
+        task = self._provisioning.get(channel.id)
+
+        if task is None:
+            task = asyncio.ensure_future(self._provision(channel))
+            self._provisioning[channel.id] = task
+            task.add_done_callback(lambda _: self._provisioning.pop(channel.id, None))
+
+        return await asyncio.shield(task)
+
+    async def _provision(self, channel: discord.TextChannel) -> Optional[tuple]:
+        try:
+            webhook = discord.utils.find(lambda w: w.name == self.name and w.token, await channel.webhooks())
+
+            if webhook is None:
+                webhook = await channel.create_webhook(name=self.name, reason="Log delivery")
+                self.stats.provisioned += 1
+                LOG.info("Created a log webhook for #%s.", channel)
+        except discord.HTTPException as e:
+            LOG.warning("Could not set up a log webhook for #%s (%s). Sending its logs as the bot instead.", channel, e)
+            self._failed[channel.id] = time.monotonic()
+            return None
+
+        self._failed.pop(channel.id, None)
+        self._webhooks[channel.id] = (webhook.id, webhook.token)
+
+        return self._webhooks[channel.id]
+
+    async def _execute(self, webhook: tuple, embeds: list) -> int:
+        (webhook_id, token) = webhook
+
+        if self._session is None:
+            self._session = aiohttp.ClientSession()
+
+        while True:
+            wait = self._reset_at.get(webhook_id, 0) - time.monotonic()
+
+            if wait > 0:
+                await asyncio.sleep(wait)
+
+            async with self._session.post(f"{self.api_base}/webhooks/{webhook_id}/{token}",
+                                          json={'embeds': embeds}) as response:
+                reset_after = float(response.headers.get('X-RateLimit-Reset-After', 0))
+
+                if response.headers.get('X-RateLimit-Remaining') == '0':
+                    self._reset_at[webhook_id] = time.monotonic() + reset_after
+
+                if response.status != 429:
+                    return response.status
+
+                # Ran into the limit anyway (the bucket is shared with whoever else uses the webhook). Wait it out.
+                if not reset_after:
+                    reset_after = (await response.json()).get('retry_after', 1000) / 1000
+
+                self.stats.rate_limited += 1
+                self._reset_at[webhook_id] = time.monotonic() + reset_after
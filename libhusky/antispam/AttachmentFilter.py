@@ -1,7 +1,6 @@
 #   This Source Code Form is "Incompatible With Secondary Licenses", as
 #   defined by the Mozilla Public License, v. 2.0.
 
-import datetime
 import logging
 
 import discord
@@ -9,6 +8,7 @@ from discord.ext import commands
 
 from libhusky.HuskyStatics import *
 from libhusky.antispam import AntiSpamModule
+from libhusky.antispam.RateCounter import CooldownTracker
 
 LOG = logging.getLogger("HuskyBot.Plugin.AntiSpam." + __name__.split('.')[-1])
 
@@ -48,7 +48,7 @@ class AttachmentFilter(AntiSpamModule):
         self.bot = plugin.bot
         self._config = self.bot.config
 
-        self._events = {}
+        self._events = CooldownTracker(plugin.expiry_wheel, "AttachmentFilter")
 
         self.add_command(self.set_attach_cooldown)
         self.add_command(self.clear_cooldown)
@@ -60,50 +60,44 @@ class AttachmentFilter(AntiSpamModule):
 
     def cleanup(self):
         # Purge expired events/cooldowns.
-        for user_id in self._events.keys():
-            if self._events[user_id]['expiry'] < datetime.datetime.utcnow():
-                LOG.info("Cleaning up expired cooldown for user %s", user_id)
-                del self._events[user_id]
+        purged = self._events.purge_expired()
+
+        if purged:
+            LOG.info("Cleaned up %d expired cooldown(s).", purged)
 
     def clear_for_user(self, user: discord.Member):
-        if user.id not in self._events.keys():
+        if user.id not in self._events:
             raise KeyError("The user requested does not have a record for this filter.")
 
-        del self._events[user.id]
+        self._events.pop(user.id)
 
     def clear_all(self):
-        self._events = {}
+        self._events.clear()
 
     async def process_message(self, message: discord.Message, context, meta: dict = None):
-        as_config = self._config.get('antiSpam', {})
-        filter_config = as_config.get('AttachmentFilter', {}).get('config', defaults)
+        features = meta['features']
+        config = features.config
+        filter_config = config.get('antiSpam').module_config('AttachmentFilter', defaults)
 
         # Prepare the logger
-        log_channel = self._config.get('specialChannels', {}).get(ChannelKeys.STAFF_LOG.value, None)
+        log_channel = config.get('specialChannels').get(ChannelKeys.STAFF_LOG.value, None)
         if log_channel is not None:
             log_channel = message.guild.get_channel(log_channel)
 
-        # Clear expired cooldown record for this user, if it exists.
-        if message.author.id in self._events and self._events[message.author.id]['expiry'] < datetime.datetime.utcnow():
-            del self._events[message.author.id]
-            LOG.info(f"Cleaned up stale attachment cooldowns for user {message.author}")
-
         # Users with MANAGE_MESSAGES are allowed to bypass attachment rate limits.
-        if message.author.permissions_in(message.channel).manage_messages:
+        if features.can_manage_messages:
             return
 
         if len(message.attachments) > 0:
-            # User posted an attachment, and is not in the cache. Let's add them, on strike 0.
-            cooldown_record = self._events.setdefault(message.author.id, {
-                'expiry': datetime.datetime.utcnow() + datetime.timedelta(seconds=filter_config['seconds']),
-                'offenseCount': 0
-            })
-
-            # And we increment the offense counter here.
-            cooldown_record['offenseCount'] += 1
+            # User posted an attachment. Get (or create) their record, and count this message against it.
+            cooldown_record = self._events.get(message.author.id, filter_config['seconds'])
+            attachment_count = cooldown_record.events.add()
 
             # Give them a fair warning on attachment #3
-            if filter_config['warnLimit'] != 0 and cooldown_record['offenseCount'] == filter_config['warnLimit']:
+            if filter_config['warnLimit'] != 0 and attachment_count >= filter_config['warnLimit'] \
+                    and not cooldown_record.warned:
+                cooldown_record.warned = True
+
                 await message.channel.send(embed=discord.Embed(
                     title=Emojis.STOP + " Whoa there, pardner!",
                     description=f"Hey there {message.author.mention}! You're sending files awfully fast. Please help "
@@ -113,8 +107,8 @@ class AttachmentFilter(AntiSpamModule):
                 ), delete_after=90.0)
 
                 if log_channel is not None:
-                    await log_channel.send(embed=discord.Embed(
-                        description=f"User {message.author} has sent {cooldown_record['offenseCount']} attachments in "
+                    self.bot.log_sink.post(log_channel, discord.Embed(
+                        description=f"User {message.author} has sent {attachment_count} attachments in "
                                     f"a {filter_config['seconds']}-second period in channel "
                                     f"{message.channel.mention}.",
                         color=Colors.WARNING
@@ -122,17 +116,17 @@ class AttachmentFilter(AntiSpamModule):
                     return
 
                 LOG.info(f"User {message.author} has been warned for posting too many attachments in a short while.")
-            elif cooldown_record['offenseCount'] >= filter_config['banLimit']:
-                await message.author.ban(reason=f"[AUTOMATIC BAN - AntiSpam Module] User sent "
-                                                f"{cooldown_record['offenseCount']} attachments in a "
-                                                f"{filter_config['seconds']} second period.",
-                                         delete_message_days=1)
-                del self._events[message.author.id]
+            elif attachment_count >= filter_config['banLimit']:
+                await features.ban(reason=f"[AUTOMATIC BAN - AntiSpam Module] User sent "
+                                          f"{attachment_count} attachments in a "
+                                          f"{filter_config['seconds']} second period.",
+                                   delete_message_days=1)
+                self._events.pop(message.author.id, None)
                 LOG.info(f"User {message.author} has been banned for posting over {filter_config['banLimit']} "
                          f"attachments in a {filter_config['seconds']} period.")
             else:
                 LOG.info(f"User {message.author} posted a message with {len(message.attachments)} attachments, "
-                         f"incident logged. User on warning {cooldown_record['offenseCount']} of "
+                         f"incident logged. User on warning {attachment_count} of "
                          f"{filter_config['banLimit']}.")
 
         else:
@@ -140,7 +134,7 @@ class AttachmentFilter(AntiSpamModule):
             if message.author.id in self._events:
                 LOG.info(f"User {message.author} previously on file cooldown warning list has sent a file-less "
                          f"message. Deleting cooldown entry.")
-                del self._events[message.author.id]
+                self._events.pop(message.author.id)
 
     @commands.command(name="configure", brief="Configure thresholds for AttachmentFilter")
     async def set_attach_cooldown(self, ctx: commands.Context, cooldown_seconds: int, warn_limit: int, ban_limit: int):
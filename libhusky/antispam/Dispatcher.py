@@ -0,0 +1,249 @@
+#   This Source Code Form is "Incompatible With Secondary Licenses", as
+#   defined by the Mozilla Public License, v. 2.0.
+
+import asyncio
+import collections
+import functools
+import logging
+import math
+import time
+
+from libhusky.antispam.UserMailbox import UserMailbox
+
+LOG = logging.getLogger("HuskyBot.Plugin.AntiSpam." + __name__.split('.')[-1])
+
+defaults = {
+    'workers': 4,  # Number of messages processed concurrently
+    'queueSize': 500,  # Messages waiting for a worker before new messages are dropped
+    'verdictWait': 0.1,  # Time (in seconds) the message pipeline waits on the modules before moving on without them
+    'shedThreshold': 0.5,  # Queue fill ratio at which low-priority modules start being skipped
+    'shedModules': ['NonAsciiFilter', 'NonUniqueFilter', 'AttachmentFilter']  # Low-priority modules, first shed first
+}
+
+
+class DispatchJob:
+    __slots__ = ['features', 'modules', 'enqueued', 'done']
+
+    def __init__(self, features, modules: list, done: asyncio.Future):
+        self.features = features
+        self.modules = modules
+        self.enqueued = time.monotonic()
+        self.done = done
+
+
+class DispatcherStats:
+    """
+    Counters for the AntiSpam dispatcher. Latency and throughput are calculated over the most recent messages only.
+    """
+
+    def __init__(self, window: int = 1000):
+        self.started = time.monotonic()
+        self.submitted = 0
+        self.processed = 0
+        self.detached = 0
+        self.dropped = 0
+        self.errors = 0
+        self.max_depth = 0
+        self.shed = collections.Counter()
+
+        # (completion time, queue latency) for the last `window` messages
+        self._recent = collections.deque(maxlen=window)
+
+    def record(self, latency: float):
+        self.processed += 1
+        self._recent.append((time.monotonic(), latency))
+
+    def throughput(self, period: float = 60.0) -> float:
+        """
+        :return: Messages processed per second over the last `period` seconds.
+        """
+        cutoff = time.monotonic() - period
+        count = sum(1 for (t, _) in self._recent if t >= cutoff)
+
+        return count / min(period, max(time.monotonic() - self.started, 1))
+
+    def latency_percentile(self, percentile: float) -> float:
+        """
+        :return: The queue latency (in seconds) at the given percentile (0-100) over recent messages.
+        """
+        if not self._recent:
+            return 0.0
+
+        latencies = sorted(latency for (_, latency) in self._recent)
+        index = min(len(latencies) - 1, int(math.ceil(percentile / 100 * len(latencies))) - 1)
+
+        return latencies[max(index, 0)]
+
+
+class Dispatcher:
+    """
+    Runs AntiSpam modules against messages on a fixed pool of workers, fed by a bounded queue.
+
+    Every message is queued once and processed by all (enabled) modules at once. When the queue starts filling up,
+    the modules listed in `shedModules` are skipped for new messages, first entry first - the fuller the queue, the
+    more of the list is shed. Once the queue is completely full, new messages are dropped outright rather than piling
+    up tasks without limit.
+
+    Messages from the same user are always processed one at a time, in order (see UserMailbox). A worker that picks
+    up a message from a user who is already being processed hands it to that user's mailbox and moves on, so a single
+    flooding user can't tie up the whole pool. Mailboxed messages still count against the queue size.
+
+    The message pipeline only waits `verdictWait` seconds for the modules (long enough to see a delete on a quiet
+    server), so that a backed-up queue never holds up later stages like commands. Past that, the message is still
+    processed in the background.
+
+    Any exception raised by a module is reported through the bot's error handler. Worker count and queue size are read
+    when the dispatcher starts, so changes to them apply on the next plugin load.
+    """
+
+    def __init__(self, plugin):
+        self.bot = plugin.bot
+        self._plugin = plugin
+        self._config = self.bot.config
+
+        settings = self._settings()
+
+        self._queue = asyncio.Queue(maxsize=max(int(settings['queueSize']), 1))
+        self._mailbox = UserMailbox()
+        self._workers = []
+        self._worker_count = max(int(settings['workers']), 1)
+
+        # Jobs that have been accepted but not finished, and how many of those haven't started yet.
+        self._jobs = set()
+        self._waiting = 0
+
+        self.stats = DispatcherStats()
+
+    @property
+    def depth(self) -> int:
+        return self._waiting
+
+    @property
+    def capacity(self) -> int:
+        return self._queue.maxsize
+
+    @property
+    def worker_count(self) -> int:
+        return self._worker_count
+
+    @property
+    def active_users(self) -> int:
+        return self._mailbox.active_users
+
+    def start(self):
+        for i in range(self._worker_count):
+            self._workers.append(self.bot.loop.create_task(self._worker(i)))
+
+    def stop(self):
+        for worker in self._workers:
+            worker.cancel()
+
+        self._workers = []
+
+        # Release anything still waiting on a queued or mailboxed message.
+        for job in self._jobs:
+            if not job.done.done():
+                job.done.set_result(False)
+
+        self._jobs = set()
+
+    async def submit(self, features, timeout: float = None) -> bool:
+        """
+        Queue a message for processing, and wait until every module has finished with it.
+
+        :param features: The MessageFeatures of the message to process.
+        :param timeout: Stop waiting after this many seconds. The message is still processed, in the background.
+        :return: Returns False if the message was dropped due to overload.
+        """
+        self.stats.submitted += 1
+
+        if self._waiting >= self.capacity:
+            self.stats.dropped += 1
+            LOG.warning("AntiSpam queue is full (%d messages), dropped message %s from %s.", self.depth,
+                        features.message.id, features.author)
+            return False
+
+        job = DispatchJob(features, self._select_modules(), self.bot.loop.create_future())
+        self._jobs.add(job)
+        self._waiting += 1
+        self._queue.put_nowait(job)
+        self.stats.max_depth = max(self.stats.max_depth, self.depth)
+
+        if timeout is None:
+            return await job.done
+
+        try:
+            return await asyncio.wait_for(asyncio.shield(job.done), timeout)
+        except asyncio.TimeoutError:
+            self.stats.detached += 1
+            return True
+
+    def verdict_wait(self) -> float:
+        """
+        :return: How long (in seconds) the message pipeline should wait on the modules for a message.
+        """
+        return float(self._settings()['verdictWait'])
+
+    def _settings(self):
+        global_config = self._config.snapshot.get('antiSpam').global_config
+
+        return {**defaults, **global_config.get('dispatcher', {})}
+
+    def _select_modules(self) -> list:
+        modules = list(self._plugin.__modules__.items())
+
+        settings = self._settings()
+        threshold = settings['shedThreshold']
+        shed_list = [m for m in settings['shedModules'] if m in self._plugin.__modules__]
+        fill = self.depth / self.capacity
+
+        if not shed_list or fill < threshold:
+            return modules
+
+        # Scale the number of shed modules with how far past the threshold we are.
+        shed_count = math.ceil(len(shed_list) * (fill - threshold) / max(1 - threshold, 1e-9))
+        shed = set(shed_list[:max(shed_count, 1)])
+
+        for name in shed:
+            self.stats.shed[name] += 1
+
+        return [(name, module) for (name, module) in modules if name not in shed]
+
+    async def _worker(self, worker_id: int):
+        LOG.debug("AntiSpam dispatcher worker %d started.", worker_id)
+
+        while True:
+            job = await self._queue.get()  # type: DispatchJob
+
+            try:
+                await self._mailbox.run(job.features.author.id, functools.partial(self._process, job))
+            finally:
+                self._queue.task_done()
+
+    async def _process(self, job: DispatchJob):
+        self._waiting -= 1
+
+        try:
+            self.stats.record(time.monotonic() - job.enqueued)
+
+            features = job.features
+            meta = dict(features.meta, features=features)
+
+            await asyncio.gather(*(self._run_module(name, module, features, meta) for (name, module) in job.modules))
+        finally:
+            self._jobs.discard(job)
+
+            if not job.done.done():
+                job.done.set_result(True)
+
+    async def _run_module(self, name, module, features, meta):
+        # noinspection PyBroadException
+        try:
+            await module.process_message(features.message, features.context, meta)
+        except Exception:
+            self.stats.errors += 1
+
+            try:
+                await self.bot.on_error(f"AntiSpam.{name}", features.message)
+            except Exception:
+                LOG.exception("AntiSpam module %s failed to process message %s.", name, features.message.id)
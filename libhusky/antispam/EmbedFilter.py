@@ -44,10 +44,11 @@ class EmbedFilter(AntiSpamModule):
         return
 
     async def process_message(self, message, context, meta: dict = None):
-        antispam_config = self._config.get('antiSpam', {})
-        filter_config = {**defaults, **antispam_config.get('EmbedFilter', {}).get('config', {})}
+        features = meta['features']
+        config = features.config
+        filter_config = config.get('antiSpam').module_config('EmbedFilter', defaults)
 
-        alert_channel = self._config.get('specialChannels', {}).get(ChannelKeys.STAFF_ALERTS.value, None)
+        alert_channel = config.get('specialChannels').get(ChannelKeys.STAFF_ALERTS.value, None)
         if alert_channel is not None:
             alert_channel = message.guild.get_channel(alert_channel)
 
@@ -63,7 +64,7 @@ class EmbedFilter(AntiSpamModule):
 
         if len(message.embeds):
             if filter_config['banOnOffense']:
-                await message.author.ban(
+                await features.ban(
                     reason=f"[AUTOMATIC BAN - AntiSpam Plugin] User sent an embed without accompanying message. "
                            f"Self-bot detected/probable.",
                     delete_message_days=7 if filter_config['deleteOnOffense'] else 0)
@@ -73,7 +74,7 @@ class EmbedFilter(AntiSpamModule):
                 if filter_config['deleteOnOffense']:
                     actions.append("Messages Deleted")
             elif filter_config['deleteOnOffense']:
-                await message.delete()
+                await features.delete()
                 actions.append("Message Deleted")
 
             LOG.info(f"User ID {message.author.id} sent embed without accompanying message content. "
@@ -92,7 +93,7 @@ class EmbedFilter(AntiSpamModule):
             log_embed.add_field(name="Action Taken", value=", ".join(actions), inline=False)
 
             if alert_channel:
-                await alert_channel.send(embed=log_embed)
+                self.bot.log_sink.post(alert_channel, log_embed, urgent=True)
 
     @commands.command(name="configure", brief="Set the configuration on the EmbedFilter")
     async def set_config(self, ctx: commands.Context, ban_on_offense: bool, delete_on_offense: bool):
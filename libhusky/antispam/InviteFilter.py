@@ -3,14 +3,13 @@
 
 import datetime
 import logging
-import re
 
 import discord
 from discord.ext import commands
-from discord.http import Route
 
 from libhusky.HuskyStatics import *
 from libhusky.antispam import AntiSpamModule
+from libhusky.antispam.RateCounter import CooldownTracker
 
 LOG = logging.getLogger("HuskyBot.Plugin.AntiSpam." + __name__.split('.')[-1])
 
@@ -29,8 +28,7 @@ class InviteFilter(AntiSpamModule):
         self.bot = plugin.bot
         self._config = self.bot.config
 
-        self._events = {}
-        self._invite_cache = {}
+        self._events = CooldownTracker(plugin.expiry_wheel, "InviteFilter")
 
         self.add_command(self.allow_invite)
         self.add_command(self.block_invite)
@@ -44,24 +42,25 @@ class InviteFilter(AntiSpamModule):
 
     def cleanup(self):
         # Purge expired events/cooldowns.
-        for user_id in self._events.keys():
-            if self._events[user_id]['expiry'] < datetime.datetime.utcnow():
-                LOG.info("Cleaning up expired cooldown for user %s", user_id)
-                del self._events[user_id]
+        purged = self._events.purge_expired()
 
-        # Purge cached fragment after cache expiry
-        for fragment in self._invite_cache.keys():
-            if datetime.datetime.utcnow() > self._invite_cache[fragment]['__cache_expiry']:
-                del self._invite_cache[fragment]
+        if purged:
+            LOG.info("Cleaned up %d expired cooldown(s).", purged)
+
+        # Purge cached invites after cache expiry
+        purged = self.bot.invite_resolver.purge_expired()
+
+        if purged:
+            LOG.debug("Cleaned up %d expired cached invite(s).", purged)
 
     def clear_for_user(self, user: discord.Member):
-        if user.id not in self._events.keys():
+        if user.id not in self._events:
             raise KeyError("The user requested does not have a record for this filter.")
 
-        del self._events[user.id]
+        self._events.pop(user.id)
 
     def clear_all(self):
-        self._events = {}
+        self._events.clear()
 
     async def process_message(self, message: discord.Message, context, meta: dict = None):
         class UserFate:
@@ -69,54 +68,34 @@ class InviteFilter(AntiSpamModule):
             KICK_NEW = 50
             BAN = 100
 
-        filter_settings = self._config.get('antiSpam', {}).get('InviteFilter', {}).get('config', defaults)
+        features = meta['features']
+        config = features.config
+        filter_settings = config.get('antiSpam').module_config('InviteFilter', defaults)
         allowed_guilds = filter_settings.get('allowedInvites', [message.guild.id])
 
         # Prepare the logger
-        log_channel = self._config.get('specialChannels', {}).get(ChannelKeys.STAFF_LOG.value, None)
+        log_channel = config.get('specialChannels').get(ChannelKeys.STAFF_LOG.value, None)
         if log_channel is not None:
             log_channel = message.guild.get_channel(log_channel)
 
-        # Prevent memory abuse by deleting expired cooldown records for this member
-        if message.author.id in self._events and self._events[message.author.id]['expiry'] < datetime.datetime.utcnow():
-            del self._events[message.author.id]
-            LOG.info(f"Cleaned up stale invite cooldowns for user {message.author}")
-
         # Users with MANAGE_MESSAGES are allowed to send unauthorized invites.
-        if message.author.permissions_in(message.channel).manage_messages:
+        if features.can_manage_messages:
             return
 
         # Determine user's fate right now.
         new_user = (message.author.joined_at > datetime.datetime.utcnow() - datetime.timedelta(seconds=60))
 
-        regex_matches = re.finditer(Regex.INVITE_REGEX, message.content, flags=re.IGNORECASE)
-
-        for regex_match in regex_matches:
-            fragment = regex_match.group('fragment')
-
+        for fragment in features.invite_fragments:
             # Attempt to validate the invite, deleting invalid ones
-            invite_data = None
             invite_guild = None
-            try:
-                # We're going to be caching guild invite data to prevent discord from getting too mad at us, especially
-                # during raids.
 
-                cache_item = self._invite_cache.get(fragment, None)
-
-                if (cache_item is not None) and (datetime.datetime.utcnow() <= cache_item['__cache_expiry']):
-                    invite_data = self._invite_cache[fragment]
-                else:
-                    # discord py doesn't let us do this natively, so let's do it ourselves!
-                    invite_data = await self.bot.http.request(
-                        Route('GET', '/invite/{invite_id}?with_counts=true', invite_id=fragment))
-
-                    LOG.debug(f"Fragment {fragment} was not in the invite cache. Downloaded and added.")
-                    invite_data['__cache_expiry'] = datetime.datetime.utcnow() + datetime.timedelta(hours=4)
-                    self._invite_cache[fragment] = invite_data
+            # The resolver caches invite data (valid or not) to prevent discord from getting too mad at us, especially
+            # during raids.
+            invite_data = await self.bot.invite_resolver.resolve(fragment)
 
+            if invite_data is not None:
                 invite_guild = discord.Guild(state=self.bot, data=invite_data['guild'])
-
-            except discord.errors.NotFound:
+            else:
                 LOG.warning(f"Couldn't resolve invite key {fragment}. Either it's invalid or the bot was banned.")
 
             # This guild is allowed to have invites on our guild, so we can ignore them.
@@ -124,20 +103,16 @@ class InviteFilter(AntiSpamModule):
                 continue
 
             # The guild either is invalid or not on the whitelist - delete the message.
-            try:
-                await message.delete()
-            except discord.NotFound:
+            if not await features.delete():
                 # Message not found, let's log this
                 LOG.warning(f"The message I was trying to delete does not exist! ID: {message.id}")
 
             # Grab the existing cooldown record, or make a new one if it doesn't exist.
-            record = self._events.setdefault(message.author.id, {
-                'expiry': datetime.datetime.utcnow() + datetime.timedelta(minutes=filter_settings['minutes']),
-                'offenseCount': 0
-            })
+            record = self._events.get(message.author.id, filter_settings['minutes'] * 60)
 
             # Warn the user on their first offense only.
-            if (not new_user) and (record['offenseCount'] == 0):
+            if (not new_user) and (not record.warned):
+                record.warned = True
                 await message.channel.send(embed=discord.Embed(
                     title=Emojis.STOP + " Discord Invite Blocked",
                     description=f"Hey {message.author.mention}! It looks like you posted a Discord invite.\n\n"
@@ -148,21 +123,20 @@ class InviteFilter(AntiSpamModule):
                     color=Colors.WARNING
                 ), delete_after=90.0)
 
-            # And we increment the offense counter here, and extend their expiry
-            record['offenseCount'] += 1
-            record['expiry'] = datetime.datetime.utcnow() + datetime.timedelta(minutes=filter_settings['minutes'])
+            # And we increment the offense counter here (which also extends their expiry)
+            strike_count = record.strikes.add()
 
             user_fate = UserFate.WARN
 
             # Kick the user if necessary (performance)
             if new_user:
-                await message.author.kick(reason="New user (less than 60 seconds old) posted invite.")
+                await features.kick(reason="New user (less than 60 seconds old) posted invite.")
                 LOG.info(f"User {message.author} kicked for posting invite within 60 seconds of joining.")
                 user_fate = UserFate.KICK_NEW
 
             # Ban the user if necessary (performance)
-            if filter_settings['banLimit'] > 0 and (record['offenseCount'] >= filter_settings['banLimit']):
-                await message.author.ban(
+            if filter_settings['banLimit'] > 0 and (strike_count >= filter_settings['banLimit']):
+                await features.ban(
                     reason=f"[AUTOMATIC BAN - AntiSpam Plugin] User sent {filter_settings['banLimit']} "
                            f"unauthorized invites in a {filter_settings['minutes']} minute period.",
                     delete_message_days=0)
@@ -208,23 +182,21 @@ class InviteFilter(AntiSpamModule):
 
                     log_embed.set_thumbnail(url=invite_guild.icon_url)
 
-                log_embed.set_footer(text=f"Strike {record['offenseCount']} "
+                log_embed.set_footer(text=f"Strike {strike_count} "
                                           f"of {filter_settings['banLimit']}, "
-                                          f"resets {record['expiry'].strftime(DATETIME_FORMAT)}"
+                                          f"resets {record.expiry.strftime(DATETIME_FORMAT)}"
                                           f"{' | User Removed' if user_fate > UserFate.WARN else ''}")
 
-                await log_channel.send(embed=log_embed)
+                self.bot.log_sink.post(log_channel, log_embed)
 
             # If the user got banned, we can go and clean up their mess
             if user_fate == UserFate.BAN:
-                try:
-                    del self._events[message.author.id]
-                except KeyError:
+                if self._events.pop(message.author.id) is None:
                     LOG.warning("Attempted to delete cooldown record for user %s (ban over limit), but failed as the "
                                 "record count not be found. The user was probably already banned.", message.author.id)
             else:
-                LOG.info(f"User {message.author} was issued an invite warning ({record['offenseCount']} / "
-                         f"{filter_settings['banLimit']}, resetting at {record['expiry'].strftime(DATETIME_FORMAT)})")
+                LOG.info(f"User {message.author} was issued an invite warning ({strike_count} / "
+                         f"{filter_settings['banLimit']}, resetting at {record.expiry.strftime(DATETIME_FORMAT)})")
 
             # We don't need to process anything anymore.
             break
@@ -0,0 +1,234 @@
+#   This Source Code Form is "Incompatible With Secondary Licenses", as
+#   defined by the Mozilla Public License, v. 2.0.
+
+import collections
+import time
+
+# Length of the character shingles messages are split into.
+SHINGLE_SIZE = 4
+
+# Number of entries each bucket lookup inspects. Only the most recent entries in a bucket are ever compared against,
+# so a copypasta posted a thousand times costs no more to check than one posted ten times.
+DEFAULT_PROBE_DEPTH = 8
+
+# Hard cap on the number of messages held, whatever the window.
+DEFAULT_MAX_ENTRIES = 20000
+
+_EMPTY = (1 << 64) - 1
+
+
+def minhash_signature(text: str, size: int) -> tuple:
+    """
+    Compute a MinHash signature of a string's character shingles, by one permutation hashing: every shingle is hashed
+    once, and lands in one of `size` bins by its hash; each bin keeps the smallest hash it gets. Bins no shingle fell
+    into borrow from the next bin that has one, so that short strings still get a full signature.
+
+    :param text: The string to sign.
+    :param size: The number of values in the signature.
+    :return: Returns the signature, a tuple of `size` ints.
+    """
+    text = " ".join(text.split())
+    mins = [_EMPTY] * size
+
+    for i in range(max(len(text) - SHINGLE_SIZE + 1, 1)):
+        value = hash(text[i:i + SHINGLE_SIZE]) & _EMPTY
+        slot = value % size
+
+        if value < mins[slot]:
+            mins[slot] = value
+
+    if _EMPTY in mins:
+        filled = [i for (i, value) in enumerate(mins) if value != _EMPTY]
+
+        for i in range(size):
+            if mins[i] == _EMPTY:
+                # Borrow the nearest filled bin to the right, tagged with the distance, so borrowed values only match
+                # values borrowed from the same distance.
+                donor = next((j for j in filled if j > i), filled[0] + size)
+                mins[i] = hash((mins[donor % size], donor - i))
+
+    return tuple(mins)
+
+
+def estimate_similarity(a: tuple, b: tuple) -> float:
+    """
+    :return: Returns the estimated Jaccard similarity of two strings' shingles, from their MinHash signatures.
+    """
+    return sum(1 for (x, y) in zip(a, b) if x == y) / len(a)
+
+
+class LSHEntry:
+    __slots__ = ['key', 'author_id', 'timestamp', 'signature', 'band_keys', 'cluster', 'payload']
+
+    def __init__(self, key, author_id: int, timestamp: float, signature: tuple, band_keys: list, payload=None):
+        self.key = key
+        self.author_id = author_id
+        self.timestamp = timestamp
+        self.signature = signature
+        self.band_keys = band_keys
+        self.cluster = None
+        self.payload = payload
+
+
+class LSHCluster:
+    """
+    A group of near-identical messages. `authors` counts each author's messages in the cluster; `actioned` is free
+    for the index's owner to mark clusters it has already acted on.
+    """
+
+    __slots__ = ['entries', 'authors', 'actioned']
+
+    def __init__(self):
+        self.entries = collections.OrderedDict()  # key -> LSHEntry
+        self.authors = collections.Counter()
+        self.actioned = False
+
+    def __len__(self):
+        return len(self.entries)
+
+    def add(self, entry: LSHEntry):
+        entry.cluster = self
+        self.entries[entry.key] = entry
+        self.authors[entry.author_id] += 1
+
+    def remove(self, entry: LSHEntry):
+        if self.entries.pop(entry.key, None) is None:
+            return
+
+        self.authors[entry.author_id] -= 1
+
+        if self.authors[entry.author_id] <= 0:
+            del self.authors[entry.author_id]
+
+
+class LSHIndex:
+    """
+    A time-windowed locality-sensitive hashing index of recent messages, grouping near-identical messages (from any
+    author) into clusters.
+
+    Each message's MinHash signature is cut into `bands` bands of `rows` values, and the message is filed in one bucket
+    per band. Two messages land in a common bucket with high probability if they are similar, and almost never if they
+    aren't, so a new message is only compared against the few recent messages sharing a bucket with it - never
+    against the whole window. A message joins the cluster of the first sufficiently similar message it's compared
+    with, or starts a new one.
+
+    Messages leave the index (and their buckets and clusters) once they're older than the window. Messages arrive in
+    time order, so the oldest message is always at the front of every queue it sits in, and expiring one is O(bands).
+    The index never holds more than `max_entries` messages.
+    """
+
+    def __init__(self, window: float, threshold: float, bands: int = 16, rows: int = 2,
+                 probe_depth: int = DEFAULT_PROBE_DEPTH, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        :param window: How long (in seconds) messages stay in the index.
+        :param threshold: The (estimated) Jaccard similarity at which two messages are considered near-identical.
+        :param bands: The number of bands each signature is cut into.
+        :param rows: The number of signature values in each band.
+        :param probe_depth: The number of recent entries inspected per bucket.
+        :param max_entries: The maximum number of messages to hold.
+        """
+        self.window = window
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = rows
+        self.probe_depth = probe_depth
+        self.max_entries = max_entries
+
+        self._entries = collections.deque()  # LSHEntry, oldest first
+        self._buckets = {}  # band key -> deque of LSHEntry, oldest first
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def bucket_count(self) -> int:
+        return len(self._buckets)
+
+    def add(self, key, author_id: int, text: str, now: float = None, payload=None) -> LSHCluster:
+        """
+        File a message in the index.
+
+        :param key: A unique key for the message (e.g. its ID).
+        :param author_id: The ID of the message's author.
+        :param text: The message's (normalized) text.
+        :param now: The (UNIX) time the message was sent.
+        :param payload: Anything to keep alongside the message (e.g. the message itself).
+        :return: Returns the cluster the message joined (or started).
+        """
+        now = time.time() if now is None else now
+        self.expire(now)
+
+        signature = minhash_signature(text, self.bands * self.rows)
+        band_keys = [hash((band, signature[band * self.rows:(band + 1) * self.rows])) for band in range(self.bands)]
+        entry = LSHEntry(key, author_id, now, signature, band_keys, payload)
+
+        cluster = None
+        seen = set()
+
+        for band_key in band_keys:
+            bucket = self._buckets.get(band_key)
+
+            if not bucket:
+                continue
+
+            for i in range(len(bucket) - 1, max(len(bucket) - self.probe_depth, 0) - 1, -1):
+                candidate = bucket[i]
+
+                if candidate.key in seen:
+                    continue
+
+                seen.add(candidate.key)
+
+                if estimate_similarity(signature, candidate.signature) >= self.threshold:
+                    cluster = candidate.cluster
+                    break
+
+            if cluster is not None:
+                break
+
+        if cluster is None:
+            cluster = LSHCluster()
+
+        cluster.add(entry)
+        self._entries.append(entry)
+
+        for band_key in band_keys:
+            self._buckets.setdefault(band_key, collections.deque()).append(entry)
+
+        while len(self._entries) > self.max_entries:
+            self._remove_oldest()
+
+        return cluster
+
+    def expire(self, now: float = None) -> int:
+        """
+        Drop every message older than the window.
+
+        :return: Returns the number of messages dropped.
+        """
+        cutoff = (time.time() if now is None else now) - self.window
+        dropped = 0
+
+        while self._entries and self._entries[0].timestamp <= cutoff:
+            self._remove_oldest()
+            dropped += 1
+
+        return dropped
+
+    def clear(self):
+        self._entries.clear()
+        self._buckets.clear()
+
+    def _remove_oldest(self):
+        entry = self._entries.popleft()
+
+        for band_key in entry.band_keys:
+            bucket = self._buckets.get(band_key)
+
+            if bucket and bucket[0] is entry:
+                bucket.popleft()
+
+                if not bucket:
+                    del self._buckets[band_key]
+
+        entry.cluster.remove(entry)
@@ -1,17 +1,19 @@
 #   This Source Code Form is "Incompatible With Secondary Licenses", as
 #   defined by the Mozilla Public License, v. 2.0.
 
-import datetime
+import collections
 import logging
 import math
-import re
+from typing import Optional
 
 import discord
 from discord.ext import commands
 
 from libhusky import HuskyUtils
+from libhusky.HuskyLinks import DomainSet, parse_host, registered_domain
 from libhusky.HuskyStatics import *
 from libhusky.antispam import AntiSpamModule
+from libhusky.antispam.RateCounter import CooldownTracker, WindowCounter
 
 LOG = logging.getLogger("HuskyBot.Plugin.AntiSpam." + __name__.split('.')[-1])
 
@@ -19,7 +21,12 @@ defaults = {
     'banLimit': 5,  # Number of warnings before banning the user
     'linkWarnLimit': 5,  # The number of links in a single message before banning
     'minutes': 30,  # Cooldown timer (reset)
-    'totalBeforeBan': 100  # Total links in cooldown period before ban
+    'totalBeforeBan': 100,  # Total links in cooldown period before ban (0 to disable)
+    'userDomainLimit': 0,  # Links to a single domain per user in cooldown period before blocking them (0 to disable)
+    'guildDomainLimit': 0,  # Links to a single domain guild-wide before blocking further ones (0 to disable)
+    'guildDomainSeconds': 60,  # Time window (in seconds) for the guild-wide domain limit
+    'allowedDomains': [],  # Domains (and their subdomains) whose links are never counted
+    'deniedDomains': []  # Domains (and their subdomains) whose links are always blocked
 }
 
 
@@ -31,9 +38,14 @@ class LinkFilter(AntiSpamModule):
         self.bot = plugin.bot
         self._config = self.bot.config
 
-        self._events = {}
+        self._events = CooldownTracker(plugin.expiry_wheel, "LinkFilter")
+        self._domains = CooldownTracker(plugin.expiry_wheel, "LinkFilter.domains")
 
         self.add_command(self.set_link_cooldown)
+        self.add_command(self.set_domain_limits)
+        self.add_command(self.allow_domain)
+        self.add_command(self.deny_domain)
+        self.add_command(self.unlist_domain)
         self.add_command(self.clear_cooldown)
         self.add_command(self.clear_all_cooldowns)
         self.add_command(self.view_config)
@@ -43,38 +55,52 @@ class LinkFilter(AntiSpamModule):
 
     def cleanup(self):
         # Purge expired events/cooldowns.
-        for user_id in self._events.keys():
-            if self._events[user_id]['expiry'] < datetime.datetime.utcnow():
-                LOG.info("Cleaning up expired cooldown for user %s", user_id)
-                del self._events[user_id]
+        purged = self._events.purge_expired() + self._domains.purge_expired()
+
+        if purged:
+            LOG.info("Cleaned up %d expired cooldown(s).", purged)
 
     def clear_for_user(self, user: discord.Member):
-        if user.id not in self._events.keys():
+        if user.id not in self._events:
             raise KeyError("The user requested does not have a record for this filter.")
 
-        del self._events[user.id]
+        self._events.pop(user.id)
 
     def clear_all(self):
-        self._events = {}
+        self._events.clear()
+        self._domains.clear()
+
+    @staticmethod
+    def _build_domain_sets(as_config) -> tuple:
+        link_config = as_config.module_config('LinkFilter', defaults)
+
+        return DomainSet(link_config['allowedDomains']), DomainSet(link_config['deniedDomains'])
 
     async def process_message(self, message: discord.Message, context, meta: dict = None):
         """
         Prevent link spam by scanning messages for anything that looks link-like.
 
-        If a link is found, we will attempt to kill it if it has more than [linkWarnLimit] links inside of it. After a
-        number of warnings determined by [warningsBeforeBan], the system will ban the account automatically. This
-        cooldown will automatically expire after [cooldownMinutes] from the first message.
+        If a link is found, we will attempt to kill it if it has more than [linkWarnLimit] links inside of it, if it
+        links to a denied domain, or if the user has posted more than [userDomainLimit] links to the same domain. After
+        a number of warnings determined by [banLimit], the system will ban the account automatically. This cooldown will
+        automatically expire after [minutes] from the first message.
 
         Alternatively, if a user posts [totalBeforeBan] links in [minutes] from their initial link message, they will
         also be banned.
 
+        Independently of any single user, once [guildDomainLimit] links to the same domain are posted guild-wide within
+        [guildDomainSeconds], further links to that domain are deleted until the flood dies down.
+
+        Links to allowed domains are ignored entirely.
+
         :param context: A context in which the message is being sent to the filters.
         :param message: The discord Message object to process.
         :return: Does not return.
         """
 
-        antispam_config = self._config.get('antiSpam', {})
-        cooldown_config = antispam_config.get('LinkFilter', {}).get('config', defaults)
+        features = meta['features']
+        config = features.config
+        cooldown_config = config.get('antiSpam').module_config('LinkFilter', defaults)
 
         # gen the embed here
         link_warning = discord.Embed(
@@ -88,122 +114,216 @@ class LinkFilter(AntiSpamModule):
         ).set_thumbnail(url="https://i.imgur.com/Z3l78Dh.gif")
 
         # Prepare the logger
-        log_channel = self._config.get('specialChannels', {}).get(ChannelKeys.STAFF_LOG.value, None)
+        log_channel = config.get('specialChannels').get(ChannelKeys.STAFF_LOG.value, None)
         if log_channel is not None:
             log_channel = message.guild.get_channel(log_channel)
 
-        # We can lazily delete link cooldowns on messages, instead of checking.
-        if message.author.id in self._events and self._events[message.author.id]['expiry'] < datetime.datetime.utcnow():
-            del self._events[message.author.id]
-
         # Users with MANAGE_MESSAGES are allowed to send as many links as they want.
-        if message.author.permissions_in(message.channel).manage_messages:
+        if features.can_manage_messages:
             return
 
-        regex_matches = re.findall(Regex.URL_REGEX, message.content, re.IGNORECASE)
-
         # If a message has no links, abort right now.
-        if regex_matches is None or len(regex_matches) == 0:
+        if len(features.urls) == 0:
+            return
+
+        (allowed_domains, denied_domains) = self._config.derive('antiSpam', self._build_domain_sets)
+
+        # Links to allowed domains don't count towards anything. Links without a host (mailto: and the like) do.
+        hosts = [host for host in features.link_hosts if host is None or host not in allowed_domains]
+
+        if len(hosts) == 0:
             return
 
-        LOG.info(f"Found a message from {message.author} containing {len(regex_matches)} links. Processing.")
+        LOG.info(f"Found a message from {message.author} containing {len(hosts)} links. Processing.")
 
-        # We have at least one link now, make the cooldown record.
-        cooldown_record = self._events.setdefault(message.author.id, {
-            'expiry': datetime.datetime.utcnow() + datetime.timedelta(minutes=cooldown_config['minutes']),
-            'offenseCount': 0,
-            'totalLinks': 0
-        })
+        # We have at least one link now, get (or make) the cooldown record.
+        cooldown_record = self._events.get(message.author.id, cooldown_config['minutes'] * 60)
 
         # We also want to track individual link posting
-        if cooldown_config['linkWarnLimit'] > 0:
+        if cooldown_config['linkWarnLimit'] > 0 and cooldown_config['totalBeforeBan'] > 0:
 
             # Increment the record
-            cooldown_record['totalLinks'] += len(regex_matches)
+            total_links = cooldown_record.events.add(len(hosts))
 
             # if a member is closely approaching their link cap (75% of max), warn them.
             warn_limit = math.floor(cooldown_config['totalBeforeBan'] * 0.75)
-            if cooldown_record['totalLinks'] >= warn_limit and cooldown_record['offenseCount'] == 0:
+            if total_links >= warn_limit and not cooldown_record.warned:
                 await message.channel.send(embed=link_warning, delete_after=90.0)
-                cooldown_record['offenseCount'] += 1
+                cooldown_record.warned = True
+                cooldown_record.strikes.add()
 
                 if log_channel is not None:
                     embed = discord.Embed(
-                        description=f"User {message.author} has sent {cooldown_record['totalLinks']} links recently, "
+                        description=f"User {message.author} has sent {total_links} links recently, "
                         f"and as a result has been warned. If they continue to post links to the currently "
                         f"configured value of {cooldown_config['totalBeforeBan']} links, they will "
                         f"be automatically banned.",
                     )
 
                     embed.set_footer(text=f"Cooldown resets "
-                    f"{cooldown_record['expiry'].strftime(DATETIME_FORMAT)}")
+                    f"{cooldown_record.expiry.strftime(DATETIME_FORMAT)}")
 
                     embed.set_author(name="Link spam from {message.author} detected!",
                                      icon_url=message.author.avatar_url)
 
-                    await log_channel.send(embed=embed)
+                    self.bot.log_sink.post(log_channel, embed)
 
             # And then ban at max
-            if cooldown_record['totalLinks'] >= cooldown_config['totalBeforeBan']:
-                await message.author.ban(reason=f"[AUTOMATIC BAN - AntiSpam Module] User sent "
+            if total_links >= cooldown_config['totalBeforeBan']:
+                await features.ban(reason=f"[AUTOMATIC BAN - AntiSpam Module] User sent "
                 f"{cooldown_config['totalBeforeBan']} or more links in a "
                 f"{cooldown_config['minutes']} minute period.",
-                                         delete_message_days=1)
+                                   delete_message_days=1)
 
                 # And purge their record, it's not needed anymore
-                del self._events[message.author.id]
+                self._events.pop(message.author.id, None)
                 return
 
-        # And now process warning counters
-        if cooldown_config['linkWarnLimit'] > 0 and (len(regex_matches) > cooldown_config['linkWarnLimit']):
+        # Count links per domain, for this user and guild-wide.
+        domains = collections.Counter(registered_domain(host) for host in hosts if host is not None)
+        violation = self.check_domains(cooldown_config, cooldown_record, domains)
+        flooded = self.count_guild_domains(cooldown_config, domains)
 
-            # First and foremost, delete the message
-            try:
-                await message.delete()
-            except discord.NotFound:
-                LOG.warning("Message was deleted before AS could handle it.")
+        denied = next(filter(None, (denied_domains.match(host) for host in hosts if host is not None)), None)
 
-            # Add the user to the warning table if they're not already there
-            if cooldown_record['offenseCount'] == 0:
-                # Inform the user of what happened, on their first time only.
-                await message.channel.send(embed=link_warning, delete_after=90.0)
+        if denied is not None:
+            violation = f"has sent a message linking to a blocked domain (`{denied}`)"
+        elif cooldown_config['linkWarnLimit'] > 0 and (len(hosts) > cooldown_config['linkWarnLimit']):
+            violation = f"has sent a message containing over {cooldown_config['linkWarnLimit']} links to a public " \
+                        f"channel"
 
-            # Get the offender's cooldown record, and increment it.
-            cooldown_record['offenseCount'] += 1
+        if violation is None:
+            if flooded is not None:
+                await self.throttle_domain(message, features, cooldown_config, log_channel, *flooded)
 
-            # Post something to logs
-            if log_channel is not None:
-                embed = discord.Embed(
-                    description=f"User {message.author} has sent a message containing over "
-                    f"{cooldown_config['linkWarnLimit']} links to a public channel.",
-                    color=Colors.WARNING
-                )
+            return
 
-                embed.add_field(name="Message Text", value=HuskyUtils.trim_string(message.content, 1000, False),
-                                inline=False)
+        # First and foremost, delete the message
+        if not await features.delete():
+            LOG.warning("Message was deleted before AS could handle it.")
 
-                embed.add_field(name="Message ID", value=message.id, inline=True)
-                embed.add_field(name="Channel", value=message.channel.mention, inline=True)
+        # Add the user to the warning table if they're not already there
+        if not cooldown_record.warned:
+            # Inform the user of what happened, on their first time only.
+            await message.channel.send(embed=link_warning, delete_after=90.0)
+            cooldown_record.warned = True
 
-                embed.set_footer(text=f"Strike {cooldown_record['offenseCount']} "
-                f"of {cooldown_config['banLimit']}, "
-                f"resets {cooldown_record['expiry'].strftime(DATETIME_FORMAT)}")
+        # Get the offender's cooldown record, and increment it.
+        strike_count = cooldown_record.strikes.add()
 
-                embed.set_author(name=f"Link spam from {message.author} blocked.",
-                                 icon_url=message.author.avatar_url)
+        # Post something to logs
+        if log_channel is not None:
+            embed = discord.Embed(
+                description=f"User {message.author} {violation}.",
+                color=Colors.WARNING
+            )
 
-                await log_channel.send(embed=embed)
+            embed.add_field(name="Message Text", value=HuskyUtils.trim_string(message.content, 1000, False),
+                            inline=False)
 
-            # If the user is over the ban limit, get rid of them.
-            if cooldown_record['offenseCount'] >= cooldown_config['banLimit']:
-                await message.author.ban(reason=f"[AUTOMATIC BAN - AntiSpam Module] User sent "
-                f"{cooldown_config['banLimit']} messages containing "
-                f"{cooldown_config['linkWarnLimit']} or more links in a "
-                f"{cooldown_config['minutes']} minute period.",
-                                         delete_message_days=1)
+            embed.add_field(name="Message ID", value=message.id, inline=True)
+            embed.add_field(name="Channel", value=message.channel.mention, inline=True)
 
-                # And purge their record, it's not needed anymore
-                del self._events[message.author.id]
+            embed.set_footer(text=f"Strike {strike_count} "
+            f"of {cooldown_config['banLimit']}, "
+            f"resets {cooldown_record.expiry.strftime(DATETIME_FORMAT)}")
+
+            embed.set_author(name=f"Link spam from {message.author} blocked.",
+                             icon_url=message.author.avatar_url)
+
+            self.bot.log_sink.post(log_channel, embed)
+
+        # If the user is over the ban limit, get rid of them.
+        if 0 < cooldown_config['banLimit'] <= strike_count:
+            await features.ban(reason=f"[AUTOMATIC BAN - AntiSpam Module] User sent "
+            f"{cooldown_config['banLimit']} messages blocked by the link filter in a "
+            f"{cooldown_config['minutes']} minute period.",
+                               delete_message_days=1)
+
+            # And purge their record, it's not needed anymore
+            self._events.pop(message.author.id, None)
+
+    @staticmethod
+    def check_domains(cooldown_config, cooldown_record, domains: collections.Counter) -> Optional[str]:
+        """
+        Count a message's links against the per-domain limit of its author.
+
+        :param cooldown_config: The filter's configuration.
+        :param cooldown_record: The author's cooldown record. Its `extra` holds a WindowCounter per domain.
+        :param domains: The number of links to each (registered) domain in the message.
+        :return: Returns a description of the violation, or None if the user is within the limit.
+        """
+        if cooldown_record.extra is None:
+            cooldown_record.extra = {}
+
+        violation = None
+
+        for (domain, count) in domains.items():
+            counter = cooldown_record.extra.get(domain)
+
+            if counter is None:
+                counter = cooldown_record.extra[domain] = WindowCounter(cooldown_record.window)
+
+            total = counter.add(count)
+
+            if 0 < cooldown_config['userDomainLimit'] < total and violation is None:
+                violation = f"has sent {total} links to `{domain}` within {cooldown_config['minutes']} minutes " \
+                            f"(the limit is {cooldown_config['userDomainLimit']})"
+
+        return violation
+
+    def count_guild_domains(self, cooldown_config, domains: collections.Counter) -> Optional[tuple]:
+        """
+        Count a message's links against the guild-wide per-domain limit.
+
+        :param cooldown_config: The filter's configuration.
+        :param domains: The number of links to each (registered) domain in the message.
+        :return: Returns a (domain, domain record) tuple for the first domain over the limit, or None.
+        """
+        flooded = None
+
+        for (domain, count) in domains.items():
+            domain_record = self._domains.get(domain, cooldown_config['guildDomainSeconds'])
+            total = domain_record.events.add(count)
+
+            if 0 < cooldown_config['guildDomainLimit'] < total and flooded is None:
+                flooded = (domain, domain_record)
+
+        return flooded
+
+    async def throttle_domain(self, message: discord.Message, features, cooldown_config, log_channel, domain: str,
+                              domain_record):
+        """
+        Delete a message linking to a domain that's being posted too often guild-wide. The author isn't at fault (they
+        may just be sharing a popular link), so no strike is given. Staff are told once per flood.
+        """
+        if not await features.delete():
+            LOG.warning("Message was deleted before AS could handle it.")
+
+        if domain_record.warned:
+            return
+
+        domain_record.warned = True
+        LOG.info(f"Throttling links to {domain}: {domain_record.events.count()} links were posted in the past "
+                 f"{cooldown_config['guildDomainSeconds']} seconds.")
+
+        if log_channel is None:
+            return
+
+        embed = discord.Embed(
+            description=f"{domain_record.events.count()} links to `{domain}` were posted in the past "
+                        f"{cooldown_config['guildDomainSeconds']} seconds, over the limit of "
+                        f"{cooldown_config['guildDomainLimit']}. Further links to `{domain}` will be deleted until "
+                        f"the flood dies down.",
+            color=Colors.WARNING
+        )
+
+        embed.add_field(name="Triggering Message", value=HuskyUtils.trim_string(message.content, 1000, False),
+                        inline=False)
+        embed.add_field(name="Channel", value=message.channel.mention, inline=True)
+        embed.set_author(name=f"Links to {domain} throttled.", icon_url=message.author.avatar_url)
+
+        self.bot.log_sink.post(log_channel, embed)
 
     @commands.command(name="configure", brief="Configure thresholds for LinkFilter")
     async def set_link_cooldown(self, ctx: commands.Context, cooldown_minutes: int, links_before_warn: int,
@@ -220,8 +340,9 @@ class LinkFilter(AntiSpamModule):
         Alternatively, if a user posts `total_link_limit` links in a `minutes` period, they will be automatically
         banned as well. A warning will be issued at 75% of links.
 
-        Setting links_before_warn to 0 disables this feature entirely, and setting `ban_limit` to 0 will disable the
-        autoban feature.
+        Setting links_before_warn to 0 disables this feature entirely, setting `ban_limit` to 0 will disable the
+        autoban feature, and setting `total_link_limit` to 0 disables the total link limit (see
+        /as linkFilter domainLimits for limiting links to a single domain instead).
 
         Cooldowns are not reset by anything other than time.
 
@@ -253,10 +374,183 @@ class LinkFilter(AntiSpamModule):
             color=Colors.SUCCESS
         ))
 
+    @commands.command(name="domainLimits", brief="Configure per-domain link limits for LinkFilter")
+    async def set_domain_limits(self, ctx: commands.Context, user_domain_limit: int, guild_domain_limit: int,
+                                guild_domain_seconds: int):
+        """
+        Rather than (or as well as) limiting the total number of links users post, the link filter can limit the
+        number of links to any single domain. This throttles a domain being spammed without penalizing users who share
+        many different links. Subdomains count towards their domain (`a.example.com` and `b.example.com` are both
+        `example.com`).
+
+        If a user posts more than `user_domain_limit` links to the same domain within the cooldown period (see
+        /as linkFilter configure), their message is deleted and they receive a strike, exactly like posting too many
+        links in a single message.
+
+        If more than `guild_domain_limit` links to the same domain are posted by anybody within `guild_domain_seconds`
+        seconds, any further links to that domain are deleted (without a strike) until the flood dies down, and staff
+        are notified.
+
+        Setting either limit to 0 disables it. Links to allowed domains are never counted.
+
+        Parameters
+        ----------
+            ctx                   :: Discord context <!nodoc>
+            user_domain_limit     :: Links to one domain allowed per user in the cooldown period | Default: 0 (off)
+            guild_domain_limit    :: Links to one domain allowed guild-wide in the time window | Default: 0 (off)
+            guild_domain_seconds  :: The time window (in seconds) for the guild-wide limit | Default: 60 seconds
+
+        Examples
+        --------
+            /as linkFilter domainLimits 10 30 60  :: 10 links per user per domain, 30 per domain guild-wide per minute
+
+        See Also
+        --------
+            /help as linkFilter allowDomain  :: Never count links to a domain
+            /help as linkFilter denyDomain   :: Always block links to a domain
+        """
+        if user_domain_limit < 0 or guild_domain_limit < 0 or guild_domain_seconds < 1:
+            await ctx.send(embed=discord.Embed(
+                title="Configuration Error",
+                description="The limits may not be negative, and `guild_domain_seconds` must be at least 1!",
+                color=Colors.DANGER
+            ))
+            return
+
+        as_config = self._config.get('antiSpam', {})
+        link_config = as_config.setdefault('LinkFilter', {}).setdefault('config', defaults)
+
+        link_config['userDomainLimit'] = user_domain_limit
+        link_config['guildDomainLimit'] = guild_domain_limit
+        link_config['guildDomainSeconds'] = guild_domain_seconds
+
+        self._config.set('antiSpam', as_config)
+
+        await ctx.send(embed=discord.Embed(
+            title="AntiSpam Plugin",
+            description=f"The links module of AntiSpam will now allow {user_domain_limit or 'unlimited'} links to a "
+                        f"single domain per user, and {guild_domain_limit or 'unlimited'} links to a single domain "
+                        f"guild-wide every {guild_domain_seconds} seconds.",
+            color=Colors.SUCCESS
+        ))
+
+    async def _edit_domain_list(self, ctx: commands.Context, domain: str, add_to: Optional[str]):
+        host = parse_host(domain)
+
+        if host is None:
+            await ctx.send(embed=discord.Embed(
+                title="AntiSpam Plugin",
+                description=f"`{domain}` does not look like a domain!",
+                color=Colors.DANGER
+            ))
+            return
+
+        as_config = self._config.get('antiSpam', {})
+        link_config = as_config.setdefault('LinkFilter', {}).setdefault('config', defaults)
+        removed_from = None
+
+        for key in ['allowedDomains', 'deniedDomains']:
+            domains = list(link_config.get(key, []))
+
+            if host in domains:
+                domains.remove(host)
+                removed_from = key
+
+            if key == add_to:
+                domains.append(host)
+
+            link_config[key] = domains
+
+        if add_to is None and removed_from is None:
+            await ctx.send(embed=discord.Embed(
+                title="AntiSpam Plugin",
+                description=f"The domain `{host}` is neither allowed nor denied!",
+                color=Colors.WARNING
+            ))
+            return
+
+        self._config.set('antiSpam', as_config)
+
+        if add_to == 'allowedDomains':
+            description = f"Links to `{host}` (and its subdomains) will no longer be counted."
+        elif add_to == 'deniedDomains':
+            description = f"Links to `{host}` (and its subdomains) will now be blocked."
+        else:
+            description = f"The domain `{host}` has been removed from the domain lists."
+
+        await ctx.send(embed=discord.Embed(
+            title="AntiSpam Plugin",
+            description=description,
+            color=Colors.SUCCESS
+        ))
+
+    @commands.command(name="allowDomain", brief="Never count links to a domain")
+    async def allow_domain(self, ctx: commands.Context, domain: str):
+        """
+        Links to allowed domains (and their subdomains) are ignored by the link filter: they count towards no limit,
+        per-message, per-user or guild-wide. Use this for the sites your community links to all the time.
+
+        A domain may only be on one list; allowing a denied domain removes it from the deny list.
+
+        Parameters
+        ----------
+            ctx     :: Discord context <!nodoc>
+            domain  :: The domain to allow. A full link works too.
+
+        Examples
+        --------
+            /as linkFilter allowDomain github.com  :: Ignore links to github.com and gist.github.com (etc.)
+
+        See Also
+        --------
+            /help as linkFilter unlistDomain  :: Remove a domain from the allow and deny lists
+        """
+        await self._edit_domain_list(ctx, domain, 'allowedDomains')
+
+    @commands.command(name="denyDomain", brief="Always block links to a domain")
+    async def deny_domain(self, ctx: commands.Context, domain: str):
+        """
+        Messages linking to denied domains (or their subdomains) are always deleted, and their authors receive a
+        strike.
+
+        A domain may only be on one list; denying an allowed domain removes it from the allow list.
+
+        Parameters
+        ----------
+            ctx     :: Discord context <!nodoc>
+            domain  :: The domain to deny. A full link works too.
+
+        Examples
+        --------
+            /as linkFilter denyDomain grabify.link  :: Block links to grabify.link
+
+        See Also
+        --------
+            /help as linkFilter unlistDomain  :: Remove a domain from the allow and deny lists
+        """
+        await self._edit_domain_list(ctx, domain, 'deniedDomains')
+
+    @commands.command(name="unlistDomain", brief="Remove a domain from the allow and deny lists")
+    async def unlist_domain(self, ctx: commands.Context, domain: str):
+        """
+        Remove a domain from the allow or deny list, so that links to it are treated like any other link again.
+
+        Parameters
+        ----------
+            ctx     :: Discord context <!nodoc>
+            domain  :: The domain to remove.
+
+        See Also
+        --------
+            /help as linkFilter allowDomain  :: Never count links to a domain
+            /help as linkFilter denyDomain   :: Always block links to a domain
+        """
+        await self._edit_domain_list(ctx, domain, None)
+
     @commands.command(name="viewConfig", brief="See currently set configuration values for this plugin.")
     async def view_config(self, ctx: commands.Context):
         as_config = self._config.get('antiSpam', {})
-        filter_config = as_config.get('LinkFilter', {}).get('config', defaults)
+        filter_config = {**defaults, **as_config.get('LinkFilter', {}).get('config', {})}
 
         embed = discord.Embed(
             title="Link Filter Configuration",
@@ -269,6 +563,17 @@ class LinkFilter(AntiSpamModule):
         embed.add_field(name="Warnings to Ban", value=f"{filter_config['banLimit']} warnings", inline=False)
         embed.add_field(name="Total Ban Limit", value=f"{filter_config['totalBeforeBan']} links in cooldown",
                         inline=False)
+        embed.add_field(name="Per-User Domain Limit",
+                        value=f"{filter_config['userDomainLimit']} links to a domain in cooldown", inline=False)
+        embed.add_field(name="Guild-Wide Domain Limit",
+                        value=f"{filter_config['guildDomainLimit']} links to a domain in "
+                              f"{filter_config['guildDomainSeconds']} seconds", inline=False)
+        embed.add_field(name="Allowed Domains",
+                        value=HuskyUtils.trim_string(", ".join(filter_config['allowedDomains']) or "None", 1000,
+                                                     False), inline=False)
+        embed.add_field(name="Denied Domains",
+                        value=HuskyUtils.trim_string(", ".join(filter_config['deniedDomains']) or "None", 1000,
+                                                     False), inline=False)
 
         await ctx.send(embed=embed)
 
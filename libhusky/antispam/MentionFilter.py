@@ -1,7 +1,6 @@
 #   This Source Code Form is "Incompatible With Secondary Licenses", as
 #   defined by the Mozilla Public License, v. 2.0.
 
-import datetime
 import logging
 
 import discord
@@ -9,6 +8,7 @@ from discord.ext import commands
 
 from libhusky.HuskyStatics import *
 from libhusky.antispam import AntiSpamModule
+from libhusky.antispam.RateCounter import CooldownTracker
 
 LOG = logging.getLogger("HuskyBot.Plugin.AntiSpam." + __name__.split('.')[-1])
 
@@ -26,7 +26,7 @@ class MentionFilter(AntiSpamModule):
 
         self.bot = plugin.bot
         self._config = self.bot.config
-        self._events = {}
+        self._events = CooldownTracker(plugin.expiry_wheel, "MentionFilter")
 
         self.add_command(self.set_ping_limit)
         self.add_command(self.clear_cooldown)
@@ -38,51 +38,42 @@ class MentionFilter(AntiSpamModule):
 
     def cleanup(self):
         # Purge expired events/cooldowns.
-        for user_id in self._events.keys():
-            if self._events[user_id]['expiry'] < datetime.datetime.utcnow():
-                LOG.info("Cleaning up expired cooldown for user %s", user_id)
-                del self._events[user_id]
+        purged = self._events.purge_expired()
+
+        if purged:
+            LOG.info("Cleaned up %d expired cooldown(s).", purged)
 
     def clear_for_user(self, user: discord.Member):
-        if user.id not in self._events.keys():
+        if user.id not in self._events:
             raise KeyError("The user requested does not have a record for this filter.")
 
-        del self._events[user.id]
+        self._events.pop(user.id)
 
     def clear_all(self):
-        self._events = {}
+        self._events.clear()
 
     async def process_message(self, message, context, meta: dict = None):
-        antispam_config = self._config.get('antiSpam', {})
-        ping_config = {**defaults, **antispam_config.get('MentionFilter', {}).get('config', {})}
+        features = meta['features']
+        config = features.config
+        ping_config = config.get('antiSpam').module_config('MentionFilter', defaults)
 
-        alert_channel = self._config.get('specialChannels', {}).get(ChannelKeys.STAFF_ALERTS.value, None)
+        alert_channel = config.get('specialChannels').get(ChannelKeys.STAFF_ALERTS.value, None)
         if alert_channel is not None:
             alert_channel = message.guild.get_channel(alert_channel)
 
-        # Actively (lazily) delete expired cooldowns, if any.
-        if message.author.id in self._events and self._events[message.author.id]['expiry'] < datetime.datetime.utcnow():
-            del self._events[message.author.id]
-
-        if message.author.permissions_in(message.channel).mention_everyone:
+        if features.permissions.mention_everyone:
             return
 
-        if len(message.mentions) == 0:
+        if features.mention_count == 0:
             return
 
-        cooldown_record = None
+        recent_pings = None
         if ping_config['seconds']:
-            cooldown_record = self._events.setdefault(message.author.id, {
-                "expiry": datetime.datetime.utcnow() + datetime.timedelta(seconds=ping_config['seconds']),
-                "offenseCount": 0
-            })
-
-            cooldown_record['offenseCount'] += len(message.mentions)
+            cooldown_record = self._events.get(message.author.id, ping_config['seconds'])
+            recent_pings = cooldown_record.events.add(features.mention_count)
 
-        if ping_config['soft'] is not None and len(message.mentions) >= ping_config['soft']:
-            try:
-                await message.delete()
-            except discord.NotFound:
+        if ping_config['soft'] is not None and features.mention_count >= ping_config['soft']:
+            if not await features.delete():
                 LOG.warning("Message already deleted before AS could handle it (censor?).")
 
             await message.channel.send(embed=discord.Embed(
@@ -93,31 +84,31 @@ class MentionFilter(AntiSpamModule):
             ))
 
             if alert_channel is not None:
-                await alert_channel.send(embed=discord.Embed(
-                    description=f"User {message.author} has pinged {len(message.mentions)} users in a single message "
+                self.bot.log_sink.post(alert_channel, discord.Embed(
+                    description=f"User {message.author} has pinged {features.mention_count} users in a single message "
                                 f"in channel {message.channel.mention}.",
                     color=Colors.WARNING
-                ).set_author(name="Mass Ping Alert", icon_url=message.author.avatar_url))
+                ).set_author(name="Mass Ping Alert", icon_url=message.author.avatar_url), urgent=True)
 
-            LOG.info(f"Got message from {message.author} containing {len(message.mentions)} pings.")
+            LOG.info(f"Got message from {message.author} containing {features.mention_count} pings.")
 
         if ping_config['hard'] is not None:
-            if len(message.mentions) >= ping_config['hard']:
-                await message.author.ban(
+            if features.mention_count >= ping_config['hard']:
+                await features.ban(
                     delete_message_days=0,
                     reason="[AUTOMATIC BAN - AntiSpam Module] Multi-pinged over guild ban limit."
                 )
-                del self._events[message.author.id]
+                self._events.pop(message.author.id, None)
                 return
 
-            if cooldown_record:
-                if cooldown_record['offenseCount'] >= ping_config['hard']:
-                    await message.author.ban(
+            if recent_pings is not None:
+                if recent_pings >= ping_config['hard']:
+                    await features.ban(
                         delete_message_days=0,
                         reason=f"[AUTOMATIC BAN - AntiSpam Module] Pinged over guild ban limit in "
                         f"{ping_config['seconds']} seconds."
                     )
-                    del self._events[message.author.id]
+                    self._events.pop(message.author.id, None)
                     return
 
     @commands.command(name="configure", brief="Set the number of pings required before AntiSpam takes action")
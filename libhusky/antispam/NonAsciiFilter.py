@@ -11,6 +11,7 @@ from discord.ext import commands
 from libhusky import HuskyUtils
 from libhusky.HuskyStatics import *
 from libhusky.antispam import AntiSpamModule
+from libhusky.antispam.RateCounter import CooldownTracker
 
 LOG = logging.getLogger("HuskyBot.Plugin.AntiSpam." + __name__.split('.')[-1])
 
@@ -18,10 +19,84 @@ defaults = {
     'minMessageLength': 40,  # Minimum length of messages to check
     'nonAsciiThreshold': 0.5,  # Threshold (0 to 1) before marking the message as spam
     'nonAsciiDelete': 0.75,  # Threshold (0 to 1) before marking the message as spam *and* deleting it.
+    'zalgoDelete': 0.3,  # Share (0 to 1) of combining marks ("zalgo") before deleting the message. 0 to disable.
+    'emojiDelete': 0,  # Share (0 to 1) of emoji before deleting the message. 0 to disable.
     'banLimit': 3,  # Number of spam messages before banning
     'minutes': 5  # Cooldown timer (minutes)
 }
 
+# Everything but printable ASCII and spaces, as UTF-8 bytes. Non-ASCII characters encode to bytes >= 0x80 only.
+_NON_PRINTABLE_BYTES = bytes(range(0x00, 0x20)) + bytes(range(0x7F, 0x100))
+
+# Nearly all zalgo is stacked from the Combining Diacritical Marks block (U+0300 - U+036F), whose UTF-8 encodings
+# start with 0xCC or 0xCD; counting those bytes is far faster than matching the characters. 0xCD also leads U+0370 -
+# U+037F (Greek letters), which are subtracted again.
+_ZALGO_LEAD_BYTES = (b'\xcc', b'\xcd')
+_GREEK_BYTES = re.compile(rb'\xcd[\xb0-\xbf]')
+
+# The other combining diacritic blocks. Marks belonging to a script (e.g. Devanagari vowel signs) are ordinary text,
+# and aren't counted. U+20E3 (keycap) is part of an emoji.
+_ZALGO_EXTENDED_CLASS = '\u1ab0-\u1aff\u1dc0-\u1dff\u20d0-\u20e2\u20e4-\u20ff\ufe20-\ufe2f'
+_ZALGO_EXTENDED = re.compile(f'[{_ZALGO_EXTENDED_CLASS}]')
+
+# Emoji, and the invisible characters that join or modify them. Box drawing and geometric shapes (U+2500 - U+25FF)
+# are deliberately left out; they're what ASCII art spam is made of.
+_EMOJI_CLASS = ('\U0001f000-\U0001faff\u2300-\u23ff\u2600-\u27bf\u2b00-\u2bff\U000e0020-\U000e007f'
+                '\u200d\u20e3\ufe0e\ufe0f')
+_EMOJI = re.compile(f'[{_EMOJI_CLASS}]')
+
+# Either of the above. Most non-ASCII messages have neither, and one search for both is cheaper than two counts.
+_ZALGO_EXTENDED_OR_EMOJI = re.compile(f'[{_ZALGO_EXTENDED_CLASS}{_EMOJI_CLASS}]')
+
+
+class TextMetrics:
+    """
+    The make-up of a message's text. Every share is relative to the message's length, not counting spaces.
+    """
+
+    __slots__ = ['length', 'non_ascii', 'zalgo', 'emoji']
+
+    def __init__(self, length: int, non_ascii: float, zalgo: float, emoji: float):
+        self.length = length
+        self.non_ascii = non_ascii
+        self.zalgo = zalgo
+        self.emoji = emoji
+
+
+def measure_text(text: str) -> TextMetrics:
+    """
+    Measure the share of non-ASCII characters, combining marks (zalgo) and emoji in a string.
+
+    Plain ASCII messages (most of them) are recognized without copying anything. Otherwise the string is encoded to
+    UTF-8 once, and the non-ASCII and (common) zalgo counts are C-level scans of that. The rarer characters are
+    counted by regex, only from the first one found onwards.
+    """
+    length = len(text) - text.count(' ')
+
+    if length <= 0:
+        return TextMetrics(0, 0.0, 0.0, 0.0)
+
+    if text.isascii() and text.isprintable():
+        return TextMetrics(length, 0.0, 0.0, 0.0)
+
+    encoded = text.encode('utf-8', 'surrogatepass')
+
+    # Non-printable ASCII (newlines, tabs) is counted as non-ASCII, as it always has been.
+    non_ascii = len(text) - len(encoded.translate(None, _NON_PRINTABLE_BYTES))
+    zalgo = sum(encoded.count(lead) for lead in _ZALGO_LEAD_BYTES)
+    emoji = 0
+
+    if zalgo:
+        zalgo -= len(_GREEK_BYTES.findall(encoded))
+
+    first = _ZALGO_EXTENDED_OR_EMOJI.search(text)
+
+    if first is not None:
+        zalgo += len(_ZALGO_EXTENDED.findall(text, first.start()))
+        emoji = len(_EMOJI.findall(text, first.start()))
+
+    return TextMetrics(length, non_ascii / length, zalgo / length, emoji / length)
+
 
 class NonAsciiFilter(AntiSpamModule):
     def __init__(self, plugin):
@@ -31,7 +106,7 @@ class NonAsciiFilter(AntiSpamModule):
         self.bot = plugin.bot
         self._config = self.bot.config
 
-        self._events = {}
+        self._events = CooldownTracker(plugin.expiry_wheel, "NonAsciiFilter")
 
         self.add_command(self.set_ascii_cooldown)
         self.add_command(self.test_strings)
@@ -44,70 +119,86 @@ class NonAsciiFilter(AntiSpamModule):
 
     def cleanup(self):
         # Purge expired events/cooldowns.
-        for user_id in self._events.keys():
-            if self._events[user_id]['expiry'] < datetime.datetime.utcnow():
-                LOG.info("Cleaning up expired cooldown for user %s", user_id)
-                del self._events[user_id]
+        purged = self._events.purge_expired()
+
+        if purged:
+            LOG.info("Cleaned up %d expired cooldown(s).", purged)
 
     def clear_for_user(self, user: discord.Member):
-        if user.id not in self._events.keys():
+        if user.id not in self._events:
             raise KeyError("The user requested does not have a record for this filter.")
 
-        del self._events[user.id]
+        self._events.pop(user.id)
 
     def clear_all(self):
-        self._events = {}
+        self._events.clear()
+
+    @staticmethod
+    def calculate_nonascii_value(text: str) -> float:
+        return measure_text(text).non_ascii
 
     @staticmethod
-    def calculate_nonascii_value(text: str):
-        text = text.replace(' ', '')
-        nonascii_characters = re.sub('[!-~]', '', text)
+    def get_violations(check_config, metrics: TextMetrics) -> tuple:
+        """
+        Check a message's metrics against the configured thresholds.
+
+        :return: Returns a list of descriptions of every threshold crossed, and whether the message should be deleted.
+        """
+        violations = []
+        delete = False
+
+        if metrics.non_ascii >= min(check_config['nonAsciiThreshold'], check_config['nonAsciiDelete']):
+            violations.append(f"{100 * metrics.non_ascii:.1f}% non-ASCII characters")
+            delete = metrics.non_ascii > check_config['nonAsciiDelete']
 
-        return len(nonascii_characters) / float(len(text))
+        if 0 < check_config['zalgoDelete'] <= metrics.zalgo:
+            violations.append(f"{100 * metrics.zalgo:.1f}% combining marks (zalgo)")
+            delete = True
+
+        if 0 < check_config['emojiDelete'] <= metrics.emoji:
+            violations.append(f"{100 * metrics.emoji:.1f}% emoji")
+            delete = True
+
+        return violations, delete
 
     async def process_message(self, message: discord.Message, context, meta: dict = None):
-        antispam_config = self._config.get('antiSpam', {})
-        check_config = {**defaults, **antispam_config.get('NonAsciiFilter', {}).get('config', {})}
+        features = meta['features']
+        config = features.config
+        check_config = config.get('antiSpam').module_config('NonAsciiFilter', defaults)
 
         # Prepare the logger
-        log_channel = self._config.get('specialChannels', {}).get(ChannelKeys.STAFF_LOG.value, None)
+        log_channel = config.get('specialChannels').get(ChannelKeys.STAFF_LOG.value, None)
         if log_channel is not None:
             log_channel = message.guild.get_channel(log_channel)
 
-        # We can lazily delete cooldowns on messages, instead of checking.
-        if message.author.id in self._events and self._events[message.author.id]['expiry'] < datetime.datetime.utcnow():
-            del self._events[message.author.id]
-
         # Disable if min length is 0 or less
         if check_config['minMessageLength'] <= 0:
             return
 
         # Users with MANAGE_MESSAGES are allowed to send as many nonascii things as they want.
-        if message.author.permissions_in(message.channel).manage_messages:
+        if features.can_manage_messages:
             return
 
         # Message is too short, just ignore it.
         if len(message.content) < check_config['minMessageLength']:
             return
 
-        nonascii_percentage = self.calculate_nonascii_value(message.content)
+        metrics = measure_text(message.content)
+        violations, delete = self.get_violations(check_config, metrics)
 
-        # Message doesn't have enough non-ascii characters, we can ignore it.
-        if nonascii_percentage < min(check_config['nonAsciiThreshold'], check_config['nonAsciiDelete']):
+        # Message doesn't have enough non-ascii characters (or zalgo, or emoji), we can ignore it.
+        if not violations:
             return
 
-        if nonascii_percentage > check_config['nonAsciiDelete']:
-            LOG.info(f"Deleted message containing non-ascii percentage over threshold of "
-                     f"{check_config['nonAsciiDelete']}: {nonascii_percentage}")
-            await message.delete()
+        if delete:
+            LOG.info(f"Deleted message over non-ascii thresholds: {', '.join(violations)}")
+            await features.delete()
 
         # Message is now over threshold, get/create their cooldown record.
-        cooldown_record = self._events.setdefault(message.author.id, {
-            'expiry': datetime.datetime.utcnow() + datetime.timedelta(minutes=check_config['minutes']),
-            'offenseCount': 0
-        })
+        cooldown_record = self._events.get(message.author.id, check_config['minutes'] * 60)
 
-        if cooldown_record['offenseCount'] == 0:
+        if not cooldown_record.warned:
+            cooldown_record.warned = True
             await message.channel.send(embed=discord.Embed(
                 title=Emojis.SHIELD + " Oops! Non-ASCII Message!",
                 description=f"Hey {message.author.mention}!\n\nIt looks like you posted a message containing a lot of "
@@ -117,14 +208,14 @@ class NonAsciiFilter(AntiSpamModule):
             ), delete_after=90.0)
             LOG.info(f"Warned user {message.author} for non-ascii spam publicly. A cooldown record has been created.")
 
-        cooldown_record['offenseCount'] += 1
+        strike_count = cooldown_record.strikes.add()
         LOG.info(f"Offense record for {message.author} incremented. User has "
-                 f"{cooldown_record['offenseCount']} / {check_config['banLimit']} warnings.")
+                 f"{strike_count} / {check_config['banLimit']} warnings.")
 
         if log_channel is not None:
             embed = discord.Embed(
-                description=f"User {message.author} has sent a message with {100 * nonascii_percentage:.1f}% non-ASCII "
-                            f"characters (out of {len(message.content)} total).",
+                description=f"User {message.author} has sent a message with {' and '.join(violations)} (out of "
+                            f"{len(message.content)} total characters).",
                 color=Colors.WARNING
             )
 
@@ -134,26 +225,27 @@ class NonAsciiFilter(AntiSpamModule):
             embed.add_field(name="Message ID", value=message.id, inline=True)
             embed.add_field(name="Channel", value=message.channel.mention, inline=True)
 
-            embed.set_footer(text=f"Strike {cooldown_record['offenseCount']} of {check_config['banLimit']}, "
-                                  f"resets {cooldown_record['expiry'].strftime(DATETIME_FORMAT)}")
+            embed.set_footer(text=f"Strike {strike_count} of {check_config['banLimit']}, "
+                                  f"resets {cooldown_record.expiry.strftime(DATETIME_FORMAT)}")
 
             embed.set_author(name=f"Non-ASCII spam from {message.author} detected!",
                              icon_url=message.author.avatar_url)
 
-            await log_channel.send(embed=embed)
+            self.bot.log_sink.post(log_channel, embed)
 
-        if cooldown_record['offenseCount'] >= check_config['banLimit']:
-            await message.author.ban(reason=f"[AUTOMATIC BAN - AntiSpam Module] User sent {check_config['banLimit']} "
-                                            f"messages over the non-ASCII threshold in a {check_config['minutes']} "
-                                            f"minute period.",
-                                     delete_message_days=1)
+        if strike_count >= check_config['banLimit']:
+            await features.ban(reason=f"[AUTOMATIC BAN - AntiSpam Module] User sent {check_config['banLimit']} "
+                                      f"messages over the non-ASCII threshold in a {check_config['minutes']} "
+                                      f"minute period.",
+                               delete_message_days=1)
 
             # And purge their record, it's not needed anymore
-            del self._events[message.author.id]
+            self._events.pop(message.author.id, None)
 
     @commands.command(name="configure", brief="Configure thresholds for NonAsciiFilter")
     async def set_ascii_cooldown(self, ctx: commands.Context, cooldown_minutes: int, ban_limit: int, min_length: int,
-                                 warn_threshold: float, delete_threshold: float):
+                                 warn_threshold: float, delete_threshold: float, zalgo_threshold: float = None,
+                                 emoji_threshold: float = None):
         """
         AntiSpam will attempt to detect and ban uses who excessively post non-ASCII characters. These are defined as
         symbols that can not be typed on a normal keyboard such as emoji and box art. Effectively, this command will
@@ -175,6 +267,11 @@ class NonAsciiFilter(AntiSpamModule):
                                  non-ASCII before a warning is fired. (default: 0.5)
             delete_threshold  :: A value (between 0 and 1) that represents the percentage of characters that need to be
                                  non-ASCII before the message is deleted as well as warned (default: 0.75)
+            zalgo_threshold   :: A value (between 0 and 1) that represents the percentage of characters that need to be
+                                 stacked combining marks ("zalgo") before the message is deleted and warned. 0 disables
+                                 this check. (default: 0.3)
+            emoji_threshold   :: A value (between 0 and 1) that represents the percentage of characters that need to be
+                                 emoji before the message is deleted and warned. 0 disables this check. (default: 0)
         """
 
         as_config = self._config.get('antiSpam', {})
@@ -196,12 +293,27 @@ class NonAsciiFilter(AntiSpamModule):
             ))
             return
 
+        for (name, value) in (("zalgo_threshold", zalgo_threshold), ("emoji_threshold", emoji_threshold)):
+            if value is not None and not 0 <= value <= 1:
+                await ctx.send(embed=discord.Embed(
+                    title="Configuration Error",
+                    description=f"The `{name}` value must be between 0 and 1!",
+                    color=Colors.DANGER
+                ))
+                return
+
         nonascii_config['minutes'] = cooldown_minutes
         nonascii_config['banLimit'] = ban_limit
         nonascii_config['minMessageLength'] = min_length
         nonascii_config['nonAsciiThreshold'] = warn_threshold
         nonascii_config['nonAsciiDelete'] = delete_threshold
 
+        if zalgo_threshold is not None:
+            nonascii_config['zalgoDelete'] = zalgo_threshold
+
+        if emoji_threshold is not None:
+            nonascii_config['emojiDelete'] = emoji_threshold
+
         self._config.set('antiSpam', as_config)
 
         await ctx.send(embed=discord.Embed(
@@ -228,6 +340,10 @@ class NonAsciiFilter(AntiSpamModule):
                         inline=False)
         embed.add_field(name="Non-Ascii Warn %", value=f"{filter_config['nonAsciiThreshold']}% nac", inline=False)
         embed.add_field(name="Non-Ascii Delete %", value=f"{filter_config['nonAsciiDelete']}% nac", inline=False)
+        embed.add_field(name="Zalgo Delete %", value=f"{filter_config.get('zalgoDelete', defaults['zalgoDelete'])}%",
+                        inline=False)
+        embed.add_field(name="Emoji Delete %", value=f"{filter_config.get('emojiDelete', defaults['emojiDelete'])}%",
+                        inline=False)
         embed.add_field(name="Deletes to Ban", value=f"{filter_config['banLimit']} deletes", inline=False)
 
         await ctx.send(embed=embed)
@@ -254,17 +370,18 @@ class NonAsciiFilter(AntiSpamModule):
         nonascii_config = {**defaults, **as_config.get('NonAsciiFilter', {}).get('config', {})}
 
         calc_start = datetime.datetime.utcnow()
-        percentage = self.calculate_nonascii_value(text)
+        metrics = measure_text(text)
         calc_end = datetime.datetime.utcnow()
 
         calc_time = calc_end - calc_start
 
-        is_spam = (percentage >= nonascii_config['nonAsciiThreshold'])
-        is_deleted = (percentage >= nonascii_config['nonAsciiDelete'])
+        violations, is_deleted = self.get_violations(nonascii_config, metrics)
+        is_spam = bool(violations)
 
         await ctx.send(embed=discord.Embed(
             title="Non-Ascii Tester",
-            description=f"The passed message is **`{100 * percentage:.1f}%` non-ascii**.\n\n"
+            description=f"The passed message is **`{100 * metrics.non_ascii:.1f}%` non-ascii**, "
+                        f"**`{100 * metrics.zalgo:.1f}%` zalgo** and **`{100 * metrics.emoji:.1f}%` emoji**.\n\n"
                         f"Message result: `{'DELETED' if is_deleted else 'FLAGGED' if is_spam else 'IGNORED'}`\n\n"
                         f"Calculation Time: `{round(calc_time.total_seconds() * 1000, 3)} ms`.",
             color=Colors.DANGER if is_deleted else (Colors.WARNING if is_spam else Colors.INFO)
@@ -3,7 +3,6 @@
 
 import datetime
 import logging
-from difflib import SequenceMatcher
 
 import discord
 from discord.ext import commands
@@ -11,17 +10,23 @@ from discord.ext import commands
 from libhusky import HuskyUtils
 from libhusky.HuskyStatics import *
 from libhusky.antispam.__init__ import AntiSpamModule
+from libhusky.antispam import Similarity
+from libhusky.antispam.RateCounter import CooldownTracker
 
 LOG = logging.getLogger("HuskyBot.Plugin.AntiSpam." + __name__.split('.')[-1])
 
 defaults = {
     "threshold": 0.75,  # Diff threshold before considering a message "similar"
     "cacheSize": 3,  # The number of "mostly unique" messages to keep in cache.
+    "engine": "minhash",  # The similarity engine to compare messages with (see Similarity.ENGINES)
     "minutes": 5,  # Cooldown time (in minutes)
     "warnLimit": 5,  # number of matching non-uniques before issuing a warning
     "banLimit": 15  # number of matching non-uniques before issuing a ban
 }
 
+# Upper bound for `cacheSize`. Comparisons against cached signatures are cheap, but every one still costs something.
+MAX_CACHE_SIZE = 100
+
 
 class NonUniqueFilter(AntiSpamModule):
     def __init__(self, plugin):
@@ -32,7 +37,7 @@ class NonUniqueFilter(AntiSpamModule):
         self.bot = self.plugin.bot
         self._config = self.bot.config
 
-        self._events = {}
+        self._events = CooldownTracker(plugin.expiry_wheel, "NonUniqueFilter")
 
         self.add_command(self.nonuniqe_cooldown)
         self.add_command(self.test_strings)
@@ -45,81 +50,92 @@ class NonUniqueFilter(AntiSpamModule):
 
     def cleanup(self):
         # Purge expired events/cooldowns.
-        for user_id in self._events.keys():
-            if self._events[user_id]['expiry'] < datetime.datetime.utcnow():
-                LOG.info("Cleaning up expired cooldown for user %s", user_id)
-                del self._events[user_id]
+        purged = self._events.purge_expired()
+
+        if purged:
+            LOG.info("Cleaned up %d expired cooldown(s).", purged)
 
     def clear_for_user(self, user: discord.Member):
-        if user.id not in self._events.keys():
+        if user.id not in self._events:
             raise KeyError("The user requested does not have a record for this filter.")
 
-        del self._events[user.id]
+        self._events.pop(user.id)
 
     def clear_all(self):
-        self._events = {}
+        self._events.clear()
 
-    async def process_message(self, message: discord.message, context, meta=None):
-        meta = meta or {}
+    @staticmethod
+    def get_engine(nonunique_config) -> Similarity.SimilarityEngine:
+        try:
+            return Similarity.get_engine(nonunique_config['engine'])
+        except KeyError:
+            LOG.warning("Unknown similarity engine %s, falling back to %s.", nonunique_config['engine'],
+                        defaults['engine'])
+            return Similarity.get_engine(defaults['engine'])
 
-        as_config = self._config.get('antiSpam', {})
-        nonunique_config = as_config.get('NonUniqueFilter', {}).get('config', defaults)
+    async def process_message(self, message: discord.message, context, meta=None):
+        features = meta['features']
+        config = features.config
+        nonunique_config = config.get('antiSpam').module_config('NonUniqueFilter', defaults)
 
         # Prepare the logger
-        log_channel = self._config.get('specialChannels', {}).get(ChannelKeys.STAFF_LOG.value, None)
+        log_channel = config.get('specialChannels').get(ChannelKeys.STAFF_LOG.value, None)
         if log_channel is not None:
             log_channel = message.guild.get_channel(log_channel)
 
-        # Actively/lazily find and delete expired cooldowns instead of waiting for event
-        if message.author.id in self._events and self._events[message.author.id]['expiry'] < datetime.datetime.utcnow():
-            del self._events[message.author.id]
-
         # Users with MANAGE_MESSAGES are allowed to send as much spam as they want
-        if message.author.permissions_in(message.channel).manage_messages:
+        if features.can_manage_messages:
             return
 
         # Setting threshold to 0 disables this check.
         if nonunique_config['threshold'] == 0:
             return
 
-        # get cooldown object for this user
-        cooldown_record: dict = self._events.setdefault(message.author.id, {
-            'expiry': datetime.datetime.utcnow() + datetime.timedelta(minutes=nonunique_config['minutes']),
-            "messageCache": {}
-        })
-        message_cache = cooldown_record['messageCache']  # type: dict
+        engine = self.get_engine(nonunique_config)
+
+        # get cooldown object for this user. Records expire a fixed time after they're created, taking the cache along.
+        cooldown_record = self._events.get(message.author.id, nonunique_config['minutes'] * 60)
+
+        # Signatures from one engine can't be compared with another's, so a change of engine starts the cache over.
+        if cooldown_record.extra is None or cooldown_record.extra['engine'] is not engine:
+            cooldown_record.extra = {'engine': engine, 'messages': {}}
+
+        message_cache = cooldown_record.extra['messages']  # type: dict  # content -> [signature, strikes]
+        content = features.content_lower
 
         # Edits are a bit of a special case and need to be treated differently
         original_message: discord.Message = meta.get('before')
         if context == "edited_message" and original_message:
-            e_diff = SequenceMatcher(None, original_message.content.lower(), message.content.lower()).ratio()
+            original_content = original_message.content.lower()
+            e_diff = engine.compare(original_content, content)
             if e_diff >= nonunique_config['threshold']:
                 LOG.debug("User edited a message above threshold. Updating the cooldown record and ignoring strike")
 
-                old_cooldown_data = message_cache.get(original_message.content.lower())
+                old_cooldown_data = message_cache.pop(original_content, None)
                 if old_cooldown_data is not None:
-                    message_cache[message.content.lower()] = old_cooldown_data
-                    del message_cache[original_message.content.lower()]
+                    message_cache[content] = [engine.signature(content), old_cooldown_data[1]]
                 return
 
-        for s_message in message_cache.keys():
-            diff = SequenceMatcher(None, s_message.lower(), message.content.lower()).ratio()
+        signature = engine.signature(content)
+
+        for s_message in message_cache.values():
+            diff = engine.similarity(s_message[0], signature)
 
             if diff >= nonunique_config['threshold']:
                 LOG.info(f"Message from {message.author} is too similar to past message, strike added. "
                          f"Similarity = {diff:.3f}")
-                message_cache[s_message] += 1
+                s_message[1] += 1
                 break
         else:
-            while len(message_cache) >= nonunique_config['cacheSize']:
-                # Delete the first item in the cache, until the cache is under min size.
-                del message_cache[list(message_cache.keys())[0]]
+            while len(message_cache) >= min(nonunique_config['cacheSize'], MAX_CACHE_SIZE):
+                # Delete the oldest item in the cache, until the cache is under min size.
+                del message_cache[next(iter(message_cache))]
 
-            message_cache[message.content.lower()] = 0
+            message_cache[content] = [signature, 0]
 
-        total_infractions = sum(message_cache.values())
+        total_infractions = sum(strikes for (_, strikes) in message_cache.values())
 
-        if total_infractions == nonunique_config['warnLimit'] and cooldown_record.get('wasntWarned', True):
+        if total_infractions == nonunique_config['warnLimit'] and not cooldown_record.warned:
             await message.channel.send(embed=discord.Embed(
                 title=Emojis.STOP + " Calm your jets!",
                 description=f"Hey there {message.author.mention}!\n\nIt looks like you're sending a bunch of "
@@ -141,24 +157,24 @@ class NonUniqueFilter(AntiSpamModule):
             log_embed.set_author(name="Possible non-unique spam!", icon_url=message.author.avatar_url)
 
             log_embed.set_footer(text=f"Strike {total_infractions} of {nonunique_config['banLimit']}, "
-                                      f"resets {cooldown_record['expiry'].strftime(DATETIME_FORMAT)}")
+                                      f"resets {cooldown_record.expiry.strftime(DATETIME_FORMAT)}")
 
             if log_channel:
-                await log_channel.send(embed=log_embed)
+                self.bot.log_sink.post(log_channel, log_embed)
 
-            cooldown_record['wasntWarned'] = False
+            cooldown_record.warned = True
 
         elif total_infractions == nonunique_config['banLimit']:
-            await message.author.ban(reason=f"[AUTOMATIC BAN - AntiSpam Module] User sent "
-                                            f"{nonunique_config['banLimit']} nonunique messages in a "
-                                            f"{nonunique_config['minutes']} minute period.",
-                                     delete_message_days=1)
+            await features.ban(reason=f"[AUTOMATIC BAN - AntiSpam Module] User sent "
+                                      f"{nonunique_config['banLimit']} nonunique messages in a "
+                                      f"{nonunique_config['minutes']} minute period.",
+                               delete_message_days=1)
 
-            del self._events[message.author.id]
+            self._events.pop(message.author.id, None)
 
     @commands.command(name="configure", brief="Configure thresholds for NonUniqueFilter")
     async def nonuniqe_cooldown(self, ctx: commands.Context, threshold: float, cache_size: int, cooldown_minutes: int,
-                                warn_limit: int, ban_limit: int):
+                                warn_limit: int, ban_limit: int, engine: str = None):
         """
         When a message is received by the bot, the system checks it for uniqueness against a cache of previous
         messages from that user. If a message is found to already be in that cache, a "strike" is added. Once a user
@@ -172,7 +188,7 @@ class NonUniqueFilter(AntiSpamModule):
                                  before being considered a duplicate. Set to 0 to disable this check.
                                  Default: 0.75
             cache_size        :: The number of back messages to keep in cache for any given user. This value must be
-                                 above one to prevent issues. The cache can not exceed 20 messages.
+                                 above one to prevent issues. The cache can not exceed 100 messages.
                                  Default: 3
             cooldown_minutes  :: The number of minutes to keep a cooldown period active. Like most other antispam
                                  commands, this counts from the first message sent. Default: 5
@@ -180,6 +196,9 @@ class NonUniqueFilter(AntiSpamModule):
                                  Default: 5
             ban_limit         :: The number of non-unique messages to tolerate before banning a user.
                                  Default: 15
+            engine            :: The engine to compare messages with: "minhash" (fast, approximate) or "sequence"
+                                 (exact, slow on long messages). Thresholds mean the same with either.
+                                 Default: minhash
         """
 
         as_config = self._config.get('antiSpam', {})
@@ -193,10 +212,18 @@ class NonUniqueFilter(AntiSpamModule):
             ))
             return
 
-        if not 1 <= cache_size <= 20:
+        if not 1 <= cache_size <= MAX_CACHE_SIZE:
+            await ctx.send(embed=discord.Embed(
+                title="Configuration Error",
+                description=f"The `cache_size` value must be between 1 and {MAX_CACHE_SIZE}!",
+                color=Colors.DANGER
+            ))
+            return
+
+        if engine is not None and engine not in Similarity.ENGINES:
             await ctx.send(embed=discord.Embed(
                 title="Configuration Error",
-                description="The `cache_size` value must be between 1 and 20!",
+                description=f"The `engine` value must be one of: {', '.join(Similarity.ENGINES.keys())}!",
                 color=Colors.DANGER
             ))
             return
@@ -207,6 +234,9 @@ class NonUniqueFilter(AntiSpamModule):
         nonunique_config['warnLimit'] = warn_limit
         nonunique_config['banLimit'] = ban_limit
 
+        if engine is not None:
+            nonunique_config['engine'] = engine
+
         self._config.set('antiSpam', as_config)
 
         await ctx.send(embed=discord.Embed(
@@ -231,6 +261,7 @@ class NonUniqueFilter(AntiSpamModule):
         embed.add_field(name="Uniqueness Threshold", value=f"{filter_config['threshold']}% similar", inline=False)
         embed.add_field(name="Warn Limit", value=f"{filter_config['warnLimit']} matching messages", inline=False)
         embed.add_field(name="Ban Limit", value=f"{filter_config['banLimit']} matching messages", inline=False)
+        embed.add_field(name="Similarity Engine", value=filter_config.get('engine', defaults['engine']), inline=False)
 
         await ctx.send(embed=embed)
 
@@ -252,11 +283,11 @@ class NonUniqueFilter(AntiSpamModule):
         -------
             /as nuf test hello henlo  :: Compare strings "hello" and "henlo"
         """
-        as_config = self._config.get('antiSpam', {})
-        nonunique_config = as_config.get('NonUniqueFilter', {}).get('config', defaults)
+        nonunique_config = self._config.snapshot.get('antiSpam').module_config('NonUniqueFilter', defaults)
+        engine = self.get_engine(nonunique_config)
 
         calc_start = datetime.datetime.utcnow()
-        diff = SequenceMatcher(None, text_a.lower(), text_b.lower()).ratio()
+        diff = engine.compare(text_a.lower(), text_b.lower())
         calc_end = datetime.datetime.utcnow()
 
         calc_time = calc_end - calc_start
@@ -267,6 +298,7 @@ class NonUniqueFilter(AntiSpamModule):
             title="Non-Unique Tester",
             description=f"The difference between the two provided strings is **`{diff:.3f}`**.\n\n"
                         f"This message **WOULD {'' if is_spam else 'NOT'}** trigger a warning.\n\n"
+                        f"Engine: `{engine.name}`\n"
                         f"Calculation Time: `{calc_time.total_seconds() * 1000} ms`.",
             color=Colors.WARNING if is_spam else Colors.INFO
         ))
@@ -0,0 +1,247 @@
+#   This Source Code Form is "Incompatible With Secondary Licenses", as
+#   defined by the Mozilla Public License, v. 2.0.
+
+import asyncio
+import logging
+
+import discord
+from discord.ext import commands
+
+from libhusky.HuskyStatics import *
+from libhusky.antispam import AntiSpamModule
+from libhusky.antispam.LSHIndex import LSHCluster, LSHIndex
+
+LOG = logging.getLogger("HuskyBot.Plugin.AntiSpam." + __name__.split('.')[-1])
+
+defaults = {
+    "seconds": 15,  # How long (in seconds) to remember messages for
+    "minAuthors": 5,  # Number of distinct users posting the same message before it's considered a raid
+    "threshold": 0.6,  # Similarity (0-1) at which two messages are considered the same
+    "minLength": 24,  # Messages shorter than this are ignored, so that "lol" and "gm" never look like a raid
+    "banOnOffense": True,  # Whether to ban raiders
+    "deleteOnOffense": True  # Whether to delete raid messages
+}
+
+
+class RaidFilter(AntiSpamModule):
+    def __init__(self, plugin):
+        super().__init__(self.base, name="raidFilter", brief="Control the raid filter's settings",
+                         checks=[super().has_permissions(manage_guild=True)], aliases=["rf"])
+
+        self.bot = plugin.bot
+        self._config = self.bot.config
+        self._index = LSHIndex(defaults['seconds'], defaults['threshold'])
+
+        self.add_command(self.set_config)
+        self.add_command(self.view_config)
+        self.register_commands(plugin)
+
+        LOG.info("Filter initialized.")
+
+    def cleanup(self):
+        # Drop messages that have left the window, in case the guild has gone quiet.
+        self._index.expire()
+
+    def clear_for_user(self, user: discord.Member):
+        # Records aren't kept per user. They expire within seconds anyways.
+        return
+
+    def clear_all(self):
+        self._index.clear()
+
+    async def process_message(self, message: discord.Message, context, meta: dict = None):
+        features = meta['features']
+        config = features.config
+        raid_config = config.get('antiSpam').module_config('RaidFilter', defaults)
+
+        # Edits don't add new copies of a message.
+        if context != "new_message":
+            return
+
+        if message.author.bot or message.webhook_id:
+            return
+
+        if features.can_manage_messages:
+            return
+
+        # Folding strips the zero-width characters and look-alike letters raid scripts use to vary their messages.
+        content = features.folded_content
+
+        if len(content) < raid_config['minLength']:
+            return
+
+        self._index.window = raid_config['seconds']
+        self._index.threshold = raid_config['threshold']
+
+        cluster = self._index.add(message.id, message.author.id, content, payload=message)
+
+        if cluster.actioned:
+            # A latecomer to a raid we've already acted on.
+            LOG.info(f"User {message.author} joined an ongoing raid in #{message.channel}, taking action.")
+            await self.take_action(raid_config, [message], features)
+            return
+
+        if len(cluster.authors) < raid_config['minAuthors']:
+            return
+
+        # Mark the cluster before the first await, so no other worker acts on it too.
+        cluster.actioned = True
+        messages = [entry.payload for entry in cluster.entries.values()]
+
+        LOG.info(f"Detected a raid: {len(cluster.authors)} users posted {len(messages)} near-identical messages "
+                 f"within {raid_config['seconds']} seconds.")
+
+        actions = await self.take_action(raid_config, messages, features)
+        self.send_alert(config, message, cluster, messages, actions)
+
+    async def take_action(self, raid_config, messages: list, features) -> list:
+        """
+        Act on every author (and message) of a raid.
+
+        :param raid_config: The filter's configuration.
+        :param messages: The raid messages to act on.
+        :param features: The features of the message being processed, which is deleted through the pipeline.
+        :return: Returns a list of the actions taken, for display.
+        """
+        actions = []
+        authors = {}
+        action_queue = self.bot.action_queue
+
+        for message in messages:
+            authors.setdefault(message.author.id, message.author)
+
+        bans = []
+        deletes = []
+
+        if raid_config['banOnOffense']:
+            reason = f"[AUTOMATIC BAN - AntiSpam Module] User took part in a raid ({len(authors)} users posting the " \
+                     f"same message within {raid_config['seconds']} seconds)."
+            delete_days = 1 if raid_config['deleteOnOffense'] else 0
+
+            bans = [action_queue.ban(features.guild, author, reason=reason, delete_message_days=delete_days)
+                    for author in authors.values()]
+            actions.append(f"{len(authors)} User(s) Banned")
+
+        if raid_config['deleteOnOffense']:
+            deletes = [features.delete() if message.id == features.message.id else action_queue.delete(message)
+                       for message in messages]
+            actions.append(f"{len(messages)} Message(s) Deleted")
+
+        # Everything is requested at once, so that the action queue can merge the deletes into bulk deletes (and skip
+        # those the bans purge anyways).
+        results = await asyncio.gather(*bans, *deletes, return_exceptions=True)
+        targets = (list(authors.values()) if bans else []) + (messages if deletes else [])
+
+        for (target, result) in zip(targets, results):
+            if isinstance(result, discord.HTTPException):
+                LOG.warning(f"Could not act on raider or raid message {target}: {result}")
+            elif isinstance(result, Exception):
+                raise result
+
+        return actions
+
+    def send_alert(self, config, message: discord.Message, cluster: LSHCluster, messages: list, actions: list):
+        alert_channel = config.get('specialChannels').get(ChannelKeys.STAFF_ALERTS.value, None)
+        if alert_channel is not None:
+            alert_channel = message.guild.get_channel(alert_channel)
+
+        if alert_channel is None:
+            return
+
+        users = ", ".join(m.author.mention for m in {m.author.id: m for m in messages}.values())
+        channels = ", ".join({m.channel.id: m.channel.mention for m in messages}.values())
+
+        log_embed = discord.Embed(
+            description=f"{len(cluster.authors)} users posted near-identical messages in a short timespan. This is "
+                        f"most likely a raid. The message was:\n\n```{message.content[:1000]}```",
+            color=Colors.DANGER
+        )
+
+        log_embed.set_author(name="Raid detected!", icon_url=message.author.avatar_url)
+        log_embed.add_field(name="Users", value=users[:1024], inline=False)
+        log_embed.add_field(name="Channels", value=channels[:1024], inline=False)
+        log_embed.add_field(name="Action Taken", value=", ".join(actions) or "None", inline=False)
+
+        self.bot.log_sink.post(alert_channel, log_embed, urgent=True)
+
+    @commands.command(name="configure", brief="Configure thresholds for the RaidFilter")
+    async def set_config(self, ctx: commands.Context, seconds: int, min_authors: int, threshold: float,
+                         min_length: int, ban_on_offense: bool, delete_on_offense: bool):
+        """
+        The raid filter watches for many different users posting the same message (copypasta, scam links, ...) within
+        a few seconds of each other, as happens in a raid. Once enough users post a message, every one of them is
+        acted on at once, as is anybody else posting the message while the raid goes on.
+
+        Messages don't have to be exactly the same; small changes (random characters, look-alike letters, hidden
+        characters) are still caught. Users with MANAGE_MESSAGES are never counted.
+
+        Parameters
+        ----------
+            ctx                :: Discord context <!nodoc>
+            seconds            :: The time window (in seconds) in which messages are compared. Default: 15
+            min_authors        :: The number of different users that must post a message to consider it a raid.
+                                  Default: 5
+            threshold          :: A number between zero and one for how similar two messages must be to be considered
+                                  the same. Default: 0.6
+            min_length         :: Messages shorter than this number of characters are ignored. Default: 24
+            ban_on_offense     :: Whether to ban every user taking part in a raid.
+            delete_on_offense  :: Whether to delete every raid message.
+
+        Examples
+        --------
+            /as raidFilter configure 15 5 0.6 24 True True  :: Ban raiders and delete raid messages (default)
+            /as raidFilter configure 15 5 0.6 24 False True :: Only delete raid messages
+        """
+        if not 0 < threshold <= 1:
+            await ctx.send(embed=discord.Embed(
+                title="Configuration Error",
+                description="The `threshold` value must be above 0, and no more than 1!",
+                color=Colors.DANGER
+            ))
+            return
+
+        if seconds < 1 or min_authors < 2:
+            await ctx.send(embed=discord.Embed(
+                title="Configuration Error",
+                description="The `seconds` value must be at least 1, and `min_authors` at least 2!",
+                color=Colors.DANGER
+            ))
+            return
+
+        as_config = self._config.get('antiSpam', {})
+        filter_config = as_config.setdefault('RaidFilter', {}).setdefault('config', defaults)
+
+        filter_config['seconds'] = seconds
+        filter_config['minAuthors'] = min_authors
+        filter_config['threshold'] = threshold
+        filter_config['minLength'] = min_length
+        filter_config['banOnOffense'] = ban_on_offense
+        filter_config['deleteOnOffense'] = delete_on_offense
+        self._config.set('antiSpam', as_config)
+
+        await ctx.send(embed=discord.Embed(
+            title="AntiSpam Raid Configuration Updated!",
+            description="The configuration has been successfully saved. Changes have been applied.",
+            color=Colors.SUCCESS
+        ))
+
+    @commands.command(name="viewConfig", brief="See currently set configuration values for this plugin.")
+    async def view_config(self, ctx: commands.Context):
+        as_config = self._config.get('antiSpam', {})
+        filter_config = {**defaults, **as_config.get('RaidFilter', {}).get('config', {})}
+
+        embed = discord.Embed(
+            title="Raid Filter Configuration",
+            description="The below settings are the current values for the raid filter configuration.",
+            color=Colors.INFO
+        )
+
+        embed.add_field(name="Time Window", value=f"{filter_config['seconds']} seconds", inline=False)
+        embed.add_field(name="Minimum Users", value=f"{filter_config['minAuthors']} users", inline=False)
+        embed.add_field(name="Similarity Threshold", value=filter_config['threshold'], inline=False)
+        embed.add_field(name="Minimum Length", value=f"{filter_config['minLength']} characters", inline=False)
+        embed.add_field(name="Ban on Offense", value=filter_config['banOnOffense'], inline=False)
+        embed.add_field(name="Delete on Offense", value=filter_config['deleteOnOffense'], inline=False)
+        embed.add_field(name="Messages Tracked", value=f"{len(self._index)} messages", inline=False)
+
+        await ctx.send(embed=embed)
@@ -0,0 +1,231 @@
+#   This Source Code Form is "Incompatible With Secondary Licenses", as
+#   defined by the Mozilla Public License, v. 2.0.
+
+import collections
+import datetime
+import time
+
+from libhusky.antispam.TimingWheel import ExpiryWheel
+
+# Number of buckets a counter's window is split into. More buckets means a smoother window, at a bit more memory.
+DEFAULT_BUCKETS = 8
+
+# Maximum number of users a single filter tracks at once. Past this, the least recently active user is forgotten.
+DEFAULT_MAX_RECORDS = 100000
+
+
+class WindowCounter:
+    """
+    Counts events over a sliding window of time.
+
+    The window is split into a ring of fixed-width buckets. Adding an event or reading the count first rotates out any
+    buckets that have fallen out of the window, so both are O(1) (amortized over elapsed buckets) and the memory used
+    is fixed no matter how many events are counted. Events age out with a granularity of `window / buckets`.
+    """
+
+    __slots__ = ['window', '_width', '_counts', '_head', '_head_start', '_total', 'last_event']
+
+    def __init__(self, window: float, buckets: int = DEFAULT_BUCKETS):
+        self.window = max(float(window), 0.001)
+        self._width = self.window / buckets
+        self._counts = [0] * buckets
+        self._head = 0
+        self._head_start = None
+        self._total = 0
+        self.last_event = None
+
+    def add(self, amount: int = 1, now: float = None) -> int:
+        """
+        Record `amount` events.
+
+        :return: Returns the number of events in the window, including these.
+        """
+        now = time.time() if now is None else now
+        self._advance(now)
+
+        self._counts[self._head] += amount
+        self._total += amount
+        self.last_event = now
+
+        return self._total
+
+    def count(self, now: float = None) -> int:
+        self._advance(time.time() if now is None else now)
+
+        return self._total
+
+    def reset(self):
+        self._counts = [0] * len(self._counts)
+        self._total = 0
+        self._head_start = None
+
+    def expires_at(self) -> float:
+        """
+        :return: The (UNIX) time at which every event currently counted will have left the window.
+        """
+        if self.last_event is None:
+            return 0.0
+
+        return self.last_event + self.window
+
+    def _advance(self, now: float):
+        if self._head_start is None:
+            self._head_start = now
+            return
+
+        steps = int((now - self._head_start) // self._width)
+        if steps <= 0:
+            return
+
+        bucket_count = len(self._counts)
+
+        if steps >= bucket_count:
+            self._counts = [0] * bucket_count
+            self._total = 0
+        else:
+            for _ in range(steps):
+                self._head = (self._head + 1) % bucket_count
+                self._total -= self._counts[self._head]
+                self._counts[self._head] = 0
+
+        self._head_start += steps * self._width
+
+
+class CooldownRecord:
+    """
+    A single user's state in an AntiSpam filter.
+
+    `events` counts whatever the filter watches (links, pings, attachments, ...), and `strikes` counts offenses. Both
+    slide over the same window. `warned` records whether the user has been warned since their record was created, and
+    `extra` is free for filter-specific state.
+    """
+
+    __slots__ = ['created', 'events', 'strikes', 'warned', 'extra']
+
+    def __init__(self, window: float):
+        self.created = time.time()
+        self.events = WindowCounter(window)
+        self.strikes = WindowCounter(window)
+        self.warned = False
+        self.extra = None
+
+    @property
+    def window(self) -> float:
+        return self.events.window
+
+    def expires_at(self) -> float:
+        return max(self.created + self.window, self.events.expires_at(), self.strikes.expires_at())
+
+    @property
+    def expiry(self) -> datetime.datetime:
+        """
+        The (naive, UTC) time this record resets, for display.
+        """
+        return datetime.datetime.utcfromtimestamp(self.expires_at())
+
+    def is_expired(self, now: float = None) -> bool:
+        return self.expires_at() <= (time.time() if now is None else now)
+
+
+class CooldownTracker:
+    """
+    A bounded map of user ID -> CooldownRecord.
+
+    Expired records are dropped as they're looked up, as they come due on the ExpiryWheel (if one is given), and by
+    purge_expired(). The tracker never holds more than `max_records` users; past that, the least recently active
+    user's record is evicted.
+    """
+
+    def __init__(self, expiry: ExpiryWheel = None, name: str = None, max_records: int = DEFAULT_MAX_RECORDS):
+        """
+        :param expiry: The ExpiryWheel to file this tracker's records in.
+        :param name: The name to report this tracker's live records under.
+        :param max_records: The maximum number of records to hold at once.
+        """
+        self._records = collections.OrderedDict()
+        self._max_records = max_records
+        self._expiry = expiry
+
+        if expiry is not None:
+            expiry.register(name or str(id(self)), self)
+
+    def __len__(self):
+        return len(self._records)
+
+    def __contains__(self, user_id):
+        return self.peek(user_id) is not None
+
+    def get(self, user_id: int, window: float) -> CooldownRecord:
+        """
+        Get a user's record, creating a fresh one if they have none (or theirs has expired).
+
+        :param user_id: The user to get a record for.
+        :param window: The filter's current window (in seconds). If the window was reconfigured, the user's existing
+                       record is replaced.
+        """
+        record = self.peek(user_id)
+
+        if record is None or record.window != max(float(window), 0.001):
+            record = CooldownRecord(window)
+            self._records[user_id] = record
+
+            if self._expiry is not None:
+                self._expiry.schedule(self, user_id, record)
+
+            while len(self._records) > self._max_records:
+                self._records.popitem(last=False)
+
+        self._records.move_to_end(user_id)
+
+        return record
+
+    def peek(self, user_id: int):
+        """
+        Get a user's record without creating one.
+
+        :return: Returns the user's live record, or None.
+        """
+        record = self._records.get(user_id)
+
+        if record is not None and record.is_expired():
+            del self._records[user_id]
+            return None
+
+        return record
+
+    def expire(self, user_id: int, record: CooldownRecord, now: float = None) -> bool:
+        """
+        Called by the ExpiryWheel when a record filed by this tracker comes due.
+
+        :return: Returns True if the record was released, or False if it was already gone (or has been extended, in
+                 which case it is re-filed).
+        """
+        if self._records.get(user_id) is not record:
+            return False
+
+        if not record.is_expired(now):
+            self._expiry.schedule(self, user_id, record)
+            return False
+
+        del self._records[user_id]
+        return True
+
+    def pop(self, user_id: int, default=None):
+        return self._records.pop(user_id, default)
+
+    def clear(self):
+        self._records.clear()
+
+    def purge_expired(self) -> int:
+        """
+        Drop every expired record.
+
+        :return: Returns the number of records dropped.
+        """
+        now = time.time()
+        expired = [user_id for (user_id, record) in self._records.items() if record.is_expired(now)]
+
+        for user_id in expired:
+            del self._records[user_id]
+
+        return len(expired)
@@ -0,0 +1,131 @@
+#   This Source Code Form is "Incompatible With Secondary Licenses", as
+#   defined by the Mozilla Public License, v. 2.0.
+
+import bisect
+import collections
+import heapq
+from difflib import SequenceMatcher
+
+# Number of hashes kept in a MinHash sketch. Messages with fewer distinct shingles than this are compared exactly.
+DEFAULT_SKETCH_SIZE = 256
+
+# Maps the bigram Dice coefficient of two strings to the SequenceMatcher ratio they'd typically get, so that existing
+# `threshold` values keep their meaning. A single-character edit breaks two bigrams but only one character, so near
+# duplicates score lower on bigrams than on the ratio; unrelated strings score about the same on both. Fitted against
+# SequenceMatcher on the corpus in misc/benchmarks/similarity_benchmark.py.
+_CALIBRATION_X = (0.0, 0.3, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0)
+_CALIBRATION_Y = (0.0, 0.3, 0.7, 0.795, 0.835, 0.89, 0.935, 1.0)
+
+
+def calibrate(dice: float) -> float:
+    """
+    Convert a bigram Dice coefficient to the equivalent (approximate) SequenceMatcher ratio.
+    """
+    i = min(max(bisect.bisect_right(_CALIBRATION_X, dice) - 1, 0), len(_CALIBRATION_X) - 2)
+    x0, x1 = _CALIBRATION_X[i], _CALIBRATION_X[i + 1]
+    y0, y1 = _CALIBRATION_Y[i], _CALIBRATION_Y[i + 1]
+
+    return y0 + (dice - x0) * (y1 - y0) / (x1 - x0)
+
+
+class SimilarityEngine:
+    """
+    Scores how similar two strings are, from 0 (nothing in common) to 1 (identical).
+
+    Engines split the work in two: signature() does the per-string work once, and similarity() compares two
+    signatures. Filters keep signatures of past messages around, so that a new message is only processed once no
+    matter how many messages it's compared against.
+    """
+
+    name = None
+
+    def signature(self, text: str):
+        raise NotImplementedError
+
+    def similarity(self, a, b) -> float:
+        raise NotImplementedError
+
+    def compare(self, text_a: str, text_b: str) -> float:
+        return self.similarity(self.signature(text_a), self.signature(text_b))
+
+
+class SequenceEngine(SimilarityEngine):
+    """
+    The original engine: difflib's SequenceMatcher ratio. Exact, but every comparison is O(n*m) in the lengths of
+    the strings.
+    """
+
+    name = "sequence"
+
+    def signature(self, text: str):
+        return text
+
+    def similarity(self, a, b) -> float:
+        return SequenceMatcher(None, a, b).ratio()
+
+
+class MinHashSignature:
+    __slots__ = ['sketch', 'members', 'exact']
+
+    def __init__(self, sketch: tuple, exact: bool):
+        self.sketch = sketch
+        self.members = frozenset(sketch)
+        self.exact = exact
+
+
+class MinHashEngine(SimilarityEngine):
+    """
+    Compares strings by their character bigrams, using bottom-k MinHash sketches.
+
+    A string's signature is the `sketch_size` smallest hashes of its bigrams (counted as a multiset, so repeated text
+    still counts). The Jaccard similarity of two strings is estimated from their sketches alone, so a comparison costs
+    the same however long the strings are; for strings short enough that the sketch holds every bigram (most chat
+    messages), the estimate is exact. The result is calibrated to approximate the SequenceMatcher ratio.
+    """
+
+    name = "minhash"
+
+    def __init__(self, sketch_size: int = DEFAULT_SKETCH_SIZE):
+        self.sketch_size = sketch_size
+
+    def signature(self, text: str) -> MinHashSignature:
+        if len(text) < 2:
+            hashes = {hash((text, 0))}
+        else:
+            counts = collections.Counter(text[i:i + 2] for i in range(len(text) - 1))
+            hashes = {hash((gram, n)) for (gram, count) in counts.items() for n in range(count)}
+
+        if len(hashes) <= self.sketch_size:
+            return MinHashSignature(tuple(sorted(hashes)), True)
+
+        return MinHashSignature(tuple(heapq.nsmallest(self.sketch_size, hashes)), False)
+
+    def similarity(self, a: MinHashSignature, b: MinHashSignature) -> float:
+        shared = len(a.members & b.members)
+
+        if a.exact and b.exact:
+            union = len(a.members) + len(b.members) - shared
+        else:
+            # Both sketches hold every hash of their string up to the smaller of their largest hashes, so together they
+            # hold every hash of the union up to there: a uniform sample of the union. Hashes both strings share are
+            # always below that cutoff.
+            cutoff = min(a.sketch[-1], b.sketch[-1])
+            union = bisect.bisect_right(a.sketch, cutoff) + bisect.bisect_right(b.sketch, cutoff) - shared
+
+        jaccard = shared / union
+        return calibrate(2 * jaccard / (1 + jaccard))
+
+
+ENGINES = {
+    SequenceEngine.name: SequenceEngine(),
+    MinHashEngine.name: MinHashEngine()
+}
+
+
+def get_engine(name: str) -> SimilarityEngine:
+    """
+    Get a similarity engine by name.
+
+    :raises KeyError: If no engine has the given name.
+    """
+    return ENGINES[name]
@@ -0,0 +1,160 @@
+#   This Source Code Form is "Incompatible With Secondary Licenses", as
+#   defined by the Mozilla Public License, v. 2.0.
+
+import math
+import time
+
+
+class TimingWheel:
+    """
+    A hierarchical timing wheel.
+
+    Level 0 has one slot per tick; each level above it has slots `slots` times as wide as the level below. An item is
+    filed in the lowest level whose span covers its deadline, so scheduling is O(1). As time advances, a slot in a
+    higher level is "cascaded" down into the lower levels once the wheel reaches it, so each item is touched at most
+    once per level before it falls due - advancing the wheel is amortized O(1) per item, no matter how many are held.
+
+    Deadlines past the wheel's horizon (`tick * slots ** levels`) are clamped to it. Items may therefore come due
+    early (never late), so owners should check whether an item is really due and re-schedule it if not.
+
+    Items are never cancelled. Owners that no longer care about an item simply ignore it when it comes due.
+    """
+
+    def __init__(self, tick: float = 1.0, slots: int = 64, levels: int = 4, now: float = None):
+        """
+        :param tick: The width (in seconds) of a single level 0 slot. This is the wheel's resolution.
+        :param slots: The number of slots in each level.
+        :param levels: The number of levels.
+        :param now: The (UNIX) time to start the wheel at.
+        """
+        self.tick = tick
+        self._slots = slots
+        self._spans = [slots ** level for level in range(levels)]
+        self._wheels = [[[] for _ in range(slots)] for _ in range(levels)]
+        self._current = int((time.time() if now is None else now) // tick)
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def horizon(self) -> float:
+        """
+        The furthest (in seconds) into the future an item can be scheduled without being clamped.
+        """
+        return self.tick * (self._spans[-1] * self._slots - 1)
+
+    def schedule(self, item, deadline: float):
+        """
+        File an item to come due at (or, at worst, one tick after) a given time.
+
+        :param item: The item to schedule.
+        :param deadline: The (UNIX) time the item is due.
+        """
+        tick = max(int(math.ceil(deadline / self.tick)), self._current + 1)
+        tick = min(tick, self._current + self._spans[-1] * self._slots - 1)
+
+        self._place(tick, item)
+        self._size += 1
+
+    def advance(self, now: float = None) -> list:
+        """
+        Move the wheel forward to the given time.
+
+        :param now: The (UNIX) time to advance to.
+        :return: Returns every item that came due, in deadline order.
+        """
+        target = int((time.time() if now is None else now) // self.tick)
+        due = []
+
+        while self._current < target and self._size > len(due):
+            self._current += 1
+
+            # Cascade from the highest level down, so an item dropped out of a high level can cascade again below.
+            for level in range(len(self._spans) - 1, 0, -1):
+                span = self._spans[level]
+
+                if self._current % span != 0:
+                    continue
+
+                slot_index = (self._current // span) % self._slots
+                slot = self._wheels[level][slot_index]
+                self._wheels[level][slot_index] = []
+
+                for (tick, item) in slot:
+                    self._place(tick, item)
+
+            slot_index = self._current % self._slots
+            due.extend(item for (_, item) in self._wheels[0][slot_index])
+            self._wheels[0][slot_index] = []
+
+        # If we stopped early, the wheel is empty and there's no need to step through the remaining ticks one by one.
+        self._current = max(self._current, target)
+
+        self._size -= len(due)
+
+        return due
+
+    def _place(self, tick: int, item):
+        delta = tick - self._current
+
+        for (level, span) in enumerate(self._spans):
+            if delta < span * self._slots:
+                self._wheels[level][(tick // span) % self._slots].append((tick, item))
+                return
+
+
+class ExpiryWheel:
+    """
+    Owns the expiry of every AntiSpam filter's cooldown records.
+
+    Each CooldownTracker registers itself here, and files every record it creates in a shared timing wheel. The
+    AntiSpam plugin advances the wheel once a tick, and records are released as soon as they expire rather than being
+    held until the next full sweep. Records that were extended (by more events) since they were filed are re-filed at
+    their new expiry.
+    """
+
+    def __init__(self, tick: float = 1.0):
+        self._wheel = TimingWheel(tick=tick)
+        self._trackers = {}
+        self.expired = 0
+
+    @property
+    def tick(self) -> float:
+        return self._wheel.tick
+
+    @property
+    def scheduled(self) -> int:
+        return len(self._wheel)
+
+    def register(self, name: str, tracker):
+        self._trackers[name] = tracker
+
+    def unregister(self, name: str):
+        self._trackers.pop(name, None)
+
+    def schedule(self, tracker, user_id: int, record):
+        self._wheel.schedule((tracker, user_id, record), record.expires_at())
+
+    def advance(self, now: float = None) -> int:
+        """
+        Release every record that has expired.
+
+        :return: Returns the number of records released.
+        """
+        now = time.time() if now is None else now
+        released = 0
+
+        for (tracker, user_id, record) in self._wheel.advance(now):
+            if tracker.expire(user_id, record, now):
+                released += 1
+
+        self.expired += released
+
+        return released
+
+    def live_records(self) -> dict:
+        """
+        :return: Returns a dict of tracker name -> number of records held.
+        """
+        return {name: len(tracker) for (name, tracker) in self._trackers.items()}
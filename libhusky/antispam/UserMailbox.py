@@ -0,0 +1,68 @@
+#   This Source Code Form is "Incompatible With Secondary Licenses", as
+#   defined by the Mozilla Public License, v. 2.0.
+
+import collections
+import logging
+
+LOG = logging.getLogger("HuskyBot.Plugin.AntiSpam." + __name__.split('.')[-1])
+
+
+class UserMailbox:
+    """
+    Serializes work per user, without tying up a worker per waiting message.
+
+    The first piece of work for a user runs immediately, and its runner becomes the owner of that user's mailbox.
+    Anything posted for the same user in the meantime is queued in the mailbox, and the owner runs it (in order) once
+    it's done with the current item. Work for different users runs in parallel as usual.
+
+    This guarantees that the AntiSpam modules never see two messages from the same user at once, so cooldown records
+    are never updated concurrently and a user can't be banned twice over by two racing messages.
+    """
+
+    def __init__(self):
+        self._mailboxes = {}  # user_id -> deque of pending work
+
+    def __len__(self):
+        return sum(len(mailbox) for mailbox in self._mailboxes.values())
+
+    @property
+    def active_users(self) -> int:
+        return len(self._mailboxes)
+
+    async def run(self, user_id: int, work) -> bool:
+        """
+        Run (or schedule) a piece of work for a user.
+
+        :param user_id: The user the work is for.
+        :param work: A coroutine function taking no arguments. It should handle its own errors.
+        :return: Returns True if the work (and anything posted while it ran) has been run by this call, or False if
+                 it was posted to the user's mailbox to be run by the current owner.
+        """
+        mailbox = self._mailboxes.get(user_id)
+
+        if mailbox is not None:
+            mailbox.append(work)
+            return False
+
+        mailbox = self._mailboxes[user_id] = collections.deque()
+
+        try:
+            await self._run_safely(user_id, work)
+
+            while mailbox:
+                await self._run_safely(user_id, mailbox.popleft())
+        finally:
+            del self._mailboxes[user_id]
+
+        return True
+
+    def pending_for(self, user_id: int) -> int:
+        return len(self._mailboxes.get(user_id, ()))
+
+    @staticmethod
+    async def _run_safely(user_id, work):
+        # noinspection PyBroadException
+        try:
+            await work()
+        except Exception:
+            LOG.exception("Unhandled exception while processing mailbox work for user %s.", user_id)
@@ -30,6 +30,15 @@ class AntiSpamModule(commands.Group, metaclass=CogMeta):
 
     @abstractmethod
     async def process_message(self, message: discord.Message, context: str, meta: dict = None):
+        """
+        Run this module's checks against a message.
+
+        :param message: The message to check.
+        :param context: Either "new_message" or "edited_message".
+        :param meta: Extra context. Always carries `features` (the message's shared MessageFeatures); edits also carry
+                     `before` and `after`. Delete messages through `features.delete()` so the pipeline stops, and
+                     punish their authors through `features.ban()`/`features.kick()` so duplicate actions are merged.
+        """
         raise NotImplementedError
 
     @abstractmethod
@@ -1,4 +1,3 @@
-import asyncio
 import datetime
 import logging
 import random
@@ -7,7 +6,7 @@ import discord
 from discord.ext import commands
 
 from HuskyBot import HuskyBot
-from libhusky import HuskyConfig, HuskyData, HuskyUtils
+from libhusky import HuskyConfig, HuskyData
 from libhusky.HuskyStatics import *
 
 GIVEAWAY_CONFIG_KEY = 'giveaways'
@@ -18,8 +17,8 @@ class GiveawayManager:
     """
     The Giveaway Manager is a centralized management location for Giveaways (see the Giveaway plugin).
 
-    Because Giveaways need to be persistent between sessions/bot executions, this class exists. Similarly, the
-    scheduler needs some registered class.
+    Because Giveaways need to be persistent between sessions/bot executions, this class exists. Giveaway ends are run
+    by the bot's scheduler.
     """
 
     def __init__(self, bot: HuskyBot):
@@ -35,14 +34,11 @@ class GiveawayManager:
         # Random number generator
         self._rng = random.SystemRandom()
 
-        # We store all giveaways in a time-ordered cache list. Reading and working with the file directly is
-        # *generally* a bad idea.
+        # We store all giveaways in a cache list. Reading and working with the file directly is *generally* a bad idea.
         self.__cache__ = []
 
         self.load_giveaways_from_file()
 
-        self.__task__ = self.bot.loop.create_task(self.process_giveaways())
-
         LOG.info("Manager load complete.")
 
     def load_giveaways_from_file(self) -> None:
@@ -56,31 +52,28 @@ class GiveawayManager:
             giveaway = HuskyData.GiveawayObject(data=giveaway_raw)
 
             self.__cache__.append(giveaway)
+            self.schedule_giveaway(giveaway)
+
+    @staticmethod
+    def get_schedule_key(giveaway: HuskyData.GiveawayObject) -> tuple:
+        return "giveaway", giveaway.register_channel_id, giveaway.register_message_id
 
-    async def process_giveaways(self) -> None:
+    def schedule_giveaway(self, giveaway: HuskyData.GiveawayObject) -> None:
         """
-        Process all pending giveaways.
+        Schedule a giveaway to be finished once its end time comes. Null-ending giveaways (usually impossible) are
+        never finished automatically.
 
-        Iterate through the cache looking for any expired giveaway. This method will run about once every 0.5 seconds
-        as part of the bot's event loop. As a result, care must be taken to make sure this code exits quickly if nothing
-        needs to be done.
+        :param giveaway: The giveaway to schedule.
         :return: Doesn't return.
         """
+        if giveaway.end_time is None:
+            return
 
-        while not self.bot.is_closed():
-            # This is what peak performance looks like, kids.
-            for giveaway in self.__cache__:
-                if giveaway.is_over():
-                    LOG.info(f"Found a scheduled giveaway for {giveaway.name} ending. Triggering...")
-                    await self.finish_giveaway(giveaway)
-
-                # Because giveaways are sorted by finish date, if we encounter a giveaway that *isn't* over, we can
-                # assume there's nothing more to do, so we can exit the for loop entirely.
-                else:
-                    break
+        async def finish():
+            LOG.info(f"Found a scheduled giveaway for {giveaway.name} ending. Triggering...")
+            await self.finish_giveaway(giveaway)
 
-            # Check again every half second
-            await asyncio.sleep(0.5)
+        self.bot.scheduler.schedule(self.get_schedule_key(giveaway), giveaway.end_time, finish)
 
     async def finish_giveaway(self, giveaway: HuskyData.GiveawayObject) -> None:
         """
@@ -95,6 +88,9 @@ class GiveawayManager:
 
         wcl = "\n\nWinners will be contacted shortly."
 
+        # Finishing a giveaway early means it's not to be finished again later.
+        self.bot.scheduler.cancel(self.get_schedule_key(giveaway))
+
         try:
             channel: discord.TextChannel = self.bot.get_channel(giveaway.register_channel_id)
             message: discord.Message = await channel.fetch_message(giveaway.register_message_id)
@@ -193,12 +189,8 @@ class GiveawayManager:
         giveaway.register_channel_id = channel.id
         giveaway.register_message_id = message.id
 
-        pos = HuskyUtils.get_sort_index(self.__cache__, giveaway, 'end_time')
-
-        # note, we insert the giveaway, and sort. this is a rare operation, so a sort is "acceptable"
-        # Null-ending giveaways (usually impossible) will be placed at the very end.
-        self.__cache__.insert(pos, giveaway)
-        self.__cache__.sort(key=lambda g: g.end_time if g.end_time else 10 * 100)
+        self.__cache__.append(giveaway)
+        self.schedule_giveaway(giveaway)
         self._giveaway_config.set(GIVEAWAY_CONFIG_KEY, self.__cache__)
 
         return giveaway
@@ -229,9 +221,10 @@ class GiveawayManager:
         :param giveaway: The GiveawayObject to terminate.
         """
 
+        self.bot.scheduler.cancel(self.get_schedule_key(giveaway))
         self.__cache__.remove(giveaway)
         self._giveaway_config.set(GIVEAWAY_CONFIG_KEY, self.__cache__)
 
     def cleanup(self):
-        if self.__task__ is not None:
-            self.__task__.cancel()
+        for giveaway in self.__cache__:
+            self.bot.scheduler.cancel(self.get_schedule_key(giveaway))
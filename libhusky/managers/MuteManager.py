@@ -1,4 +1,3 @@
-import asyncio
 import datetime
 import logging
 
@@ -6,49 +5,58 @@ import discord
 from discord.ext import commands
 
 from HuskyBot import HuskyBot
-from libhusky import HuskyConfig, HuskyData, HuskyUtils
+from libhusky import HuskyConfig, HuskyData, HuskyMutes, HuskyScheduler, HuskyUtils
 from libhusky.HuskyStatics import *
 
 LOG = logging.getLogger("HuskyBot.Managers.MuteManager")
 
+# The scheduler holds a single item for the mute store: its earliest expiry.
+SCHEDULE_KEY = ("mutes",)
+
+# Time (in seconds) before lifting an expired mute is tried again, if it failed.
+UNMUTE_RETRY_SECONDS = 60
+
 
 class MuteManager:
     def __init__(self, bot: HuskyBot):
         self._bot = bot
         self._bot_config = HuskyConfig.get_config()
-        self._mute_config = HuskyConfig.get_config('mutes', create_if_nonexistent=True)
-        self.__cache__ = []
+        self._store = HuskyMutes.MuteStore(HuskyConfig.get_config('mutes', create_if_nonexistent=True))
 
         self.read_mutes_from_file()
 
-        self.__task__ = self._bot.loop.create_task(self.check_mutes())
-
         LOG.info("Manager load complete.")
 
     def read_mutes_from_file(self):
-        disk_mutes = self._mute_config.get("mutes", [])
+        self._store.load()
+        self.schedule_expiries()
 
-        for raw_mute in disk_mutes:
-            mute = HuskyData.Mute(raw_mute)
+    def schedule_expiries(self):
+        """
+        Schedule the next pass over expired mutes for the earliest expiry in the store (if any mute expires at all).
+        """
+        when = self._store.next_expiry()
 
-            self.__cache__.append(mute)
+        if when is None:
+            self._bot.scheduler.cancel(SCHEDULE_KEY)
+        elif self._bot.scheduler.when(SCHEDULE_KEY) != when:
+            self._bot.scheduler.schedule(SCHEDULE_KEY, when, self.process_expiries)
 
-        self._mute_config.set("mutes", self.__cache__)
+    async def process_expiries(self):
+        for mute in self._store.pop_due():
+            LOG.info(f"Found a scheduled unmute - [user_id={mute.user_id}, channel_id={mute.channel}]. Triggering...")
 
-    async def check_mutes(self):
-        while not self._bot.is_closed():
-            for mute in self.__cache__:
-                if mute.is_expired():
-                    LOG.info(f"Found a scheduled unmute - [user_id={mute.user_id}, channel_id={mute.channel}]. "
-                             f"Triggering...")
-                    await self.unmute_user(mute, "System - Scheduled")
+            # noinspection PyBroadException
+            try:
+                await self.unmute_user(mute, "System - Scheduled")
+            except Exception:
+                LOG.exception(f"Could not lift the expired mute of user ID {mute.user_id}. Retrying in "
+                              f"{UNMUTE_RETRY_SECONDS} seconds.")
 
-                # Because mutes are sorted by expiry, we can just exit the loop if we encounter a mute that's not yet
-                # over.
-                else:
-                    break
+                if mute in self._store:
+                    self._store.retry_at(mute, HuskyScheduler.now() + UNMUTE_RETRY_SECONDS)
 
-            await asyncio.sleep(0.5)
+        self.schedule_expiries()
 
     async def mute_user_by_object(self, mute: HuskyData.Mute, staff_member: str = "System"):
         guild = self._bot.get_guild(mute.guild)
@@ -77,11 +85,9 @@ class MuteManager:
                                           send_messages=False,
                                           add_reactions=False)
 
-        if mute not in self.__cache__:
-            pos = HuskyUtils.get_sort_index(self.__cache__, mute, 'expiry')
-            self.__cache__.insert(pos, mute)
-            self.__cache__.sort(key=lambda m: m.expiry if m.expiry else 10 * 100)
-            self._mute_config.set("mutes", self.__cache__)
+        if mute not in self._store:
+            self._store.add(mute)
+            self.schedule_expiries()
 
             # Inform the guild logs
             alert_channel = self._bot_config.get('specialChannels', {}).get(ChannelKeys.STAFF_LOG.value, None)
@@ -103,7 +109,7 @@ class MuteManager:
                                 .strftime(DATETIME_FORMAT) if mute.expiry is not None else "Never", inline=True)
                 embed.add_field(name="Reason", value=mute.reason, inline=False)
 
-                await alert_channel.send(embed=embed)
+                self._bot.log_sink.post(alert_channel, embed)
 
     async def mute_user(self, ctx: commands.Context, member: discord.Member, channel,
                         reason: str, expiry: int, staff_member: discord.Member):
@@ -138,8 +144,7 @@ class MuteManager:
         # is up.
         if member is None:
             LOG.info(f"Left user ID {mute.user_id} has had their mute expire. Removing it.")
-            self.__cache__.remove(mute)
-            self._mute_config.set("mutes", self.__cache__)
+            self._store.remove(mute)
 
             return
 
@@ -161,8 +166,7 @@ class MuteManager:
                                       reason=f"User's guild mute has been lifted by {unmute_reason}")
 
         # Remove from the disk
-        self.__cache__.remove(mute)
-        self._mute_config.set("mutes", self.__cache__)
+        self._store.remove(mute)
 
         # Inform the guild logs
         alert_channel = self._bot_config.get('specialChannels', {}).get(ChannelKeys.STAFF_LOG.value, None)
@@ -180,37 +184,26 @@ class MuteManager:
                 icon_url=member.avatar_url),
             embed.add_field(name="Responsible User", value=staff_member, inline=True)
 
-            await alert_channel.send(embed=embed)
+            self._bot.log_sink.post(alert_channel, embed)
 
     async def restore_user_mute(self, member: discord.Member):
-        for mute in self.__cache__:
-            if (mute.user_id == member.id) and not mute.is_expired():
+        for mute in self._store.for_user(member.guild.id, member.id):
+            if not mute.is_expired():
                 LOG.info(f"Restoring mute state for left user {member} in channel")
                 await self.mute_user_by_object(mute, "System - ReJoin")
 
     async def find_user_mute_record(self, member: discord.Member, channel):
-        result = None
-
         channel_id = None
         if channel is not None:
             channel_id = channel.id
 
-        for mute in self.__cache__:
-            if member.id == mute.user_id and channel_id == mute.channel:
-                result = mute
-
-        if result is None:
-            return None
-
-        return result
+        return self._store.get(member.guild.id, member.id, channel_id)
 
     async def update_mute_record(self, mute: HuskyData.Mute, reason: str = None, expiry: int = None):
 
-        if mute not in self.__cache__:
+        if mute not in self._store:
             raise KeyError("This record doesn't exist in the cache!")
 
-        self.__cache__.remove(mute)
-
         old_reason = mute.reason
         old_expiry = mute.expiry
 
@@ -221,10 +214,8 @@ class MuteManager:
             mute.expiry = expiry
 
         # Update cache and disk
-        pos = HuskyUtils.get_sort_index(self.__cache__, mute, 'expiry')
-        self.__cache__.insert(pos, mute)
-        self.__cache__.sort(key=lambda m: m.expiry if m.expiry else 10 * 100)
-        self._mute_config.set("mutes", self.__cache__)
+        self._store.update(mute)
+        self.schedule_expiries()
 
         alert_channel = self._bot_config.get('specialChannels', {}).get(ChannelKeys.STAFF_LOG.value, None)
         if alert_channel is not None:
@@ -252,8 +243,7 @@ class MuteManager:
 
             embed.add_field(name="Timestamp", value=HuskyUtils.get_timestamp(), inline=True)
 
-            await alert_channel.send(embed=embed)
+            self._bot.log_sink.post(alert_channel, embed)
 
     def cleanup(self):
-        if self.__task__ is not None:
-            self.__task__.cancel()
+        self._bot.scheduler.cancel(SCHEDULE_KEY)
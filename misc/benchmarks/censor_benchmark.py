@@ -0,0 +1,85 @@
+"""
+Measures the per-message cost of checking a message against a large censor list.
+
+Compares the old approach (re.search() for every term, leaning on the re module's internal cache) with a compiled
+CensorMatcher. Run from the repository root:
+
+    python misc/benchmarks/censor_benchmark.py [censor count]
+"""
+import os
+import random
+import re
+import string
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+
+from libhusky.HuskyCensor import CensorMatcher  # noqa: E402
+
+
+def random_word(rng: random.Random, length: int) -> str:
+    return "".join(rng.choice(string.ascii_lowercase) for _ in range(length))
+
+
+def build_censors(rng: random.Random, count: int) -> list:
+    censors = []
+
+    for i in range(count):
+        word = random_word(rng, rng.randint(5, 10))
+
+        # Roughly a quarter of real censors are actual regexes rather than plain words.
+        if i % 4 == 0:
+            censors.append(rf"\b{word[:3]}[\W_]*{word[3:]}\b")
+        else:
+            censors.append(word)
+
+    return censors
+
+
+def build_messages(rng: random.Random, censors: list, count: int) -> list:
+    messages = []
+
+    for i in range(count):
+        words = [random_word(rng, rng.randint(2, 9)) for _ in range(rng.randint(3, 40))]
+
+        # One in twenty messages actually contains a censored word.
+        if i % 20 == 0:
+            words.insert(rng.randrange(len(words)), rng.choice([c for c in censors if c.isalpha()]))
+
+        messages.append(" ".join(words))
+
+    return messages
+
+
+def main(censor_count: int = 1000, message_count: int = 200):
+    rng = random.Random(1337)
+    censors = build_censors(rng, censor_count)
+    messages = build_messages(rng, censors, message_count)
+
+    def naive():
+        for m in messages:
+            any(re.search(term, m, re.IGNORECASE) is not None for term in censors)
+
+    matcher = CensorMatcher(censors)
+
+    def compiled():
+        for m in messages:
+            matcher.search(m)
+
+    # Both approaches must agree on every message.
+    for m in messages:
+        expected = any(re.search(term, m, re.IGNORECASE) is not None for term in censors)
+        assert (matcher.search(m) is not None) == expected, m
+
+    build_time = timeit.timeit(lambda: CensorMatcher(censors), number=3) / 3
+    print(f"{censor_count} censors, {message_count} messages")
+    print(f"  matcher build:      {build_time * 1000:9.2f} ms (once per censor list change)")
+
+    for (name, func) in (("re.search per term", naive), ("CensorMatcher", compiled)):
+        per_message = min(timeit.repeat(func, number=1, repeat=3)) / message_count
+        print(f"  {name + ':':19} {per_message * 1e6:9.1f} us/message")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
@@ -0,0 +1,179 @@
+"""
+Measures the config reads every message costs: once the way they used to be made (nested get() chains on the store,
+each taking its lock, with list membership tests and module configs merged on every call), and once through the
+store's snapshot (lock-free, with frozensets and pre-resolved views). The reads are those of the bot's message
+handler, AntiSpam and its modules, Censor, AutoFlag and the message logger. Also checks that both give the same
+answers, and measures what keeping the snapshot current adds to a write. Run from the repository root:
+
+    python misc/benchmarks/config_benchmark.py [messages]
+"""
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+
+from libhusky import HuskyConfig  # noqa: E402
+from libhusky.HuskyStatics import ChannelKeys  # noqa: E402
+from libhusky.antispam import AttachmentFilter, EmbedFilter, InviteFilter, LinkFilter  # noqa: E402
+from libhusky.antispam import MentionFilter, NonAsciiFilter, NonUniqueFilter  # noqa: E402
+
+MODULES = [
+    ('AttachmentFilter', AttachmentFilter.defaults),
+    ('EmbedFilter', EmbedFilter.defaults),
+    ('InviteFilter', InviteFilter.defaults),
+    ('LinkFilter', LinkFilter.defaults),
+    ('MentionFilter', MentionFilter.defaults),
+    ('NonAsciiFilter', NonAsciiFilter.defaults),
+    ('NonUniqueFilter', NonUniqueFilter.defaults),
+]
+
+GUILD = 1
+CHANNELS = list(range(100, 150))
+ROLES = list(range(200, 230))
+
+
+class Message:
+    __slots__ = ['author', 'guild', 'channel', 'roles', 'command']
+
+    def __init__(self, rng: random.Random, users: int):
+        self.author = rng.randrange(users)
+        self.guild = GUILD
+        self.channel = rng.choice(CHANNELS)
+        self.roles = rng.sample(ROLES, rng.randrange(4))
+        self.command = rng.choice(["help", "ping", "mute", "warn", "info"]) if rng.random() < 0.05 else None
+
+
+def build_config(rng: random.Random, users: int) -> dict:
+    antispam = {name: {'enabled': True, 'config': {key: value for (key, value) in defaults.items()
+                                                   if rng.random() < 0.5}}
+                for (name, defaults) in MODULES}
+    antispam['__global__'] = {'exemptedRoles': rng.sample(ROLES, 3)}
+
+    censors = {str(channel): [f"word{rng.randrange(1000)}" for _ in range(rng.randrange(10))]
+               for channel in rng.sample(CHANNELS, 10)}
+    censors['global'] = [f"word{i}" for i in range(200)]
+
+    return {
+        'userBlacklist': rng.sample(range(users), 500),
+        'ignoredGuilds': [2, 3, 4],
+        'ignoredCommands': ["ping"],
+        'disabledChannels': rng.sample(CHANNELS, 5),
+        'flaggedUsers': rng.sample(range(users), 200),
+        'flaggedRegexes': [f"flag{i}" for i in range(50)],
+        'specialChannels': {key.value: 1000 + i for (i, key) in enumerate(ChannelKeys)},
+        'antiSpam': antispam,
+        'censors': censors,
+        'loggers': {'messageDelete': {}, 'messageEdit': {}, 'userJoin': {}, '__global__': {'ignoredChannels': []}},
+    }
+
+
+def old_message(config: HuskyConfig.WolfConfig, message: Message) -> tuple:
+    # HuskyBot.on_message / should_process_message
+    blacklisted = message.author in config.get('userBlacklist', [])
+    ignored = message.guild in config.get('ignoredGuilds', [])
+    command_ignored = message.command is not None and message.command in config.get('ignoredCommands', [])
+    disabled = message.channel in config.get('disabledChannels', [])
+
+    # AntiSpam and its modules
+    as_config = config.get('antiSpam', {})
+    exempt = not set(as_config.get('__global__', {}).get('exemptedRoles', [])).isdisjoint(message.roles)
+    module_configs = []
+
+    for (name, defaults) in MODULES:
+        module_configs.append({**defaults, **config.get('antiSpam', {}).get(name, {}).get('config', {})})
+        config.get('specialChannels', {}).get(ChannelKeys.STAFF_LOG.value, None)
+
+    # Censor
+    censor_config = config.get('censors', {})
+    censors = (len(censor_config.get('global', [])) + len(censor_config.get(str(message.channel), []))
+               + len(censor_config.get(f"user-{message.author}", [])))
+
+    # AutoFlag
+    flag_regexes = len(config.get('flaggedRegexes', []))
+    flagged = message.author in config.get('flaggedUsers', [])
+    alerts = config.get('specialChannels', {}).get(ChannelKeys.STAFF_ALERTS.value, None)
+
+    # ServerLog
+    logged = "messageDelete" in config.get('loggers', {}).keys()
+
+    return (blacklisted, ignored, command_ignored, disabled, exempt, module_configs, censors, flag_regexes, flagged,
+            alerts, logged)
+
+
+def new_message(config: HuskyConfig.WolfConfig, message: Message) -> tuple:
+    snapshot = config.snapshot
+
+    blacklisted = message.author in snapshot.get('userBlacklist')
+    ignored = message.guild in snapshot.get('ignoredGuilds')
+    command_ignored = message.command is not None and message.command in snapshot.get('ignoredCommands')
+    disabled = message.channel in snapshot.get('disabledChannels')
+
+    antispam = snapshot.get('antiSpam')
+    exempt = not antispam.exempted_roles.isdisjoint(message.roles)
+    module_configs = []
+
+    for (name, defaults) in MODULES:
+        module_configs.append(antispam.module_config(name, defaults))
+        snapshot.get('specialChannels').get(ChannelKeys.STAFF_LOG.value, None)
+
+    censor_config = snapshot.get('censors')
+    censors = (len(censor_config.get('global', ())) + len(censor_config.get(str(message.channel), ()))
+               + len(censor_config.get(f"user-{message.author}", ())))
+
+    flag_regexes = len(snapshot.get('flaggedRegexes'))
+    flagged = message.author in snapshot.get('flaggedUsers')
+    alerts = snapshot.get('specialChannels').get(ChannelKeys.STAFF_ALERTS.value, None)
+
+    logged = "messageDelete" in snapshot.get('loggers').enabled
+
+    return (blacklisted, ignored, command_ignored, disabled, exempt, module_configs, censors, flag_regexes, flagged,
+            alerts, logged)
+
+
+def main(count: int = 20000):
+    rng = random.Random(1337)
+    users = 100000
+    data = build_config(rng, users)
+    messages = [Message(rng, users) for _ in range(count)]
+
+    config = HuskyConfig.WolfConfig()
+
+    for (key, value) in data.items():
+        config.set(key, value)
+
+    # Same answers both ways (module configs compared as plain dicts).
+    mismatches = 0
+
+    for message in messages[:2000]:
+        old = old_message(config, message)
+        new = new_message(config, message)
+
+        if old[:5] + old[6:] != new[:5] + new[6:] or old[5] != [HuskyConfig.thaw(c) for c in new[5]]:
+            mismatches += 1
+
+    old_time = min(timeit.repeat(lambda: [old_message(config, m) for m in messages], number=1, repeat=3))
+    new_time = min(timeit.repeat(lambda: [new_message(config, m) for m in messages], number=1, repeat=3))
+
+    # Writes: a store whose snapshot has never been read skips keeping it current.
+    plain = HuskyConfig.WolfConfig()
+
+    for (key, value) in data.items():
+        plain.set(key, value)
+
+    writes = 1000
+    plain_write = timeit.timeit(lambda: plain.set('flaggedUsers', data['flaggedUsers']), number=writes) / writes
+    snapshot_write = timeit.timeit(lambda: config.set('flaggedUsers', data['flaggedUsers']), number=writes) / writes
+    antispam_write = timeit.timeit(lambda: config.set('antiSpam', data['antiSpam']), number=writes) / writes
+
+    print(f"{count} messages, {len(MODULES)} AntiSpam modules, {len(data['userBlacklist'])} blacklisted users")
+    print(f"  per message: get() chains {old_time / count * 1e6:7.2f} us   "
+          f"snapshot {new_time / count * 1e6:7.2f} us   ({old_time / new_time:.1f}x)")
+    print(f"  per write:   no snapshot  {plain_write * 1e6:7.2f} us   "
+          f"snapshot {snapshot_write * 1e6:7.2f} us (flaggedUsers), {antispam_write * 1e6:.2f} us (antiSpam)")
+    print(f"  mismatches: {mismatches}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
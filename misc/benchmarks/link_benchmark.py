@@ -0,0 +1,70 @@
+"""
+Measures link extraction on 10,000 generated chat messages (mostly without links, as in a real guild), against running
+the URL regex on every message. Also checks the two find the same links, and times host parsing and domain lookups for
+the messages that do have links. Run from the repository root:
+
+    python misc/benchmarks/link_benchmark.py
+"""
+import os
+import random
+import string
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+
+from libhusky.HuskyLinks import URL_PATTERN, DomainSet, find_urls, parse_host, registered_domain  # noqa: E402
+
+LINKS = ["https://www.youtube.com/watch?v=dQw4w9WgXcQ", "https://github.com/user/repo/issues/12", "www.example.org",
+         "http://cdn.spam.example.co.uk/free-nitro", "https://tenor.com/view/cat-12345", "example.com/page"]
+CHATTER = ["lol", "gm", "see you at 5:30", "ok.", "what? no way!", ":)", "re: yesterday's thing", "1.5x faster"]
+
+
+def english(rng: random.Random) -> str:
+    words = ["".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(1, 9)))
+             for _ in range(rng.randint(2, 40))]
+
+    return " ".join(words) + rng.choice(["", ".", "!", "?", " " + rng.choice(CHATTER)])
+
+
+def build_messages(rng: random.Random, count: int) -> list:
+    messages = []
+
+    for _ in range(count):
+        text = english(rng)
+
+        if rng.random() < 0.1:
+            text = text + " " + " ".join(rng.choice(LINKS) for _ in range(rng.randint(1, 3)))
+
+        messages.append(text)
+
+    return messages
+
+
+def old_find_urls(text: str) -> tuple:
+    return tuple(m.group(0) for m in URL_PATTERN.finditer(text))
+
+
+def main(count: int = 10000):
+    messages = build_messages(random.Random(1337), count)
+    with_links = [m for m in messages if old_find_urls(m)]
+    urls = [url for m in with_links for url in find_urls(m)]
+    domains = DomainSet(["github.com", "tenor.com", "youtube.com"])
+
+    mismatches = sum(1 for m in messages if old_find_urls(m) != find_urls(m))
+
+    old = min(timeit.repeat(lambda: [old_find_urls(m) for m in messages], number=1, repeat=5))
+    new = min(timeit.repeat(lambda: [find_urls(m) for m in messages], number=1, repeat=5))
+    hosts = min(timeit.repeat(lambda: [registered_domain(parse_host(u)) for u in urls], number=1, repeat=5))
+    lookups = min(timeit.repeat(lambda: [parse_host(u) in domains for u in urls], number=1, repeat=5))
+
+    print(f"{count} messages, {len(with_links)} with links ({len(urls)} links)")
+    print(f"  old (URL regex on every message):   {old / count * 1e6:.2f} us/message")
+    print(f"  new (substring prefilter + regex):  {new / count * 1e6:.2f} us/message")
+    print(f"  link mismatches: {mismatches}")
+    print(f"  host parsing:      {hosts / len(urls) * 1e6:.2f} us/link")
+    print(f"  allow list lookup: {lookups / len(urls) * 1e6:.2f} us/link (including parsing)")
+
+
+if __name__ == "__main__":
+    main()
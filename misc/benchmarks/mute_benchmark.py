@@ -0,0 +1,162 @@
+"""
+Measures MuteStore against the list MuteManager used to keep, with 50,000 stored mutes: mute lookups, restoring mutes
+when users rejoin, lifting expired mutes and rescheduling, plus the cost of persisting one change (the whole list
+through the `json` backend, against one record through the `journal` backend). Also checks that both give the same
+answers. Run from the repository root:
+
+    python misc/benchmarks/mute_benchmark.py
+"""
+import os
+import random
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+
+from libhusky import HuskyConfig, HuskyData, HuskyScheduler, HuskyUtils  # noqa: E402
+from libhusky.HuskyMutes import MuteStore  # noqa: E402
+
+GUILD = 1
+CHANNELS = [None] + list(range(100, 120))
+
+
+def build_mutes(rng: random.Random, count: int, now: float) -> list:
+    mutes = {}
+
+    while len(mutes) < count:
+        mute = HuskyData.Mute()
+        mute.guild = GUILD
+        mute.user_id = rng.randrange(10 ** 6)
+        mute.channel = rng.choice(CHANNELS)
+        mute.reason = "Benchmark"
+        mute.expiry = None if rng.random() < 0.1 else int(now + rng.uniform(-3600, 30 * 86400))
+        mutes[(mute.user_id, mute.channel)] = mute
+
+    return list(mutes.values())
+
+
+def sort_key(mute):
+    # The old key put permanent mutes (as 10 * 100) *first*, which stopped the expiry loop dead. Sort them last here,
+    # as intended, so that the old expiry path is measured doing its job.
+    return mute.expiry if mute.expiry is not None else float('inf')
+
+
+def old_find(cache: list, user_id: int, channel):
+    result = None
+
+    for mute in cache:
+        if user_id == mute.user_id and channel == mute.channel:
+            result = mute
+
+    return result
+
+
+def old_restore(cache: list, user_id: int) -> list:
+    return [mute for mute in cache if mute.user_id == user_id and not mute.is_expired()]
+
+
+def old_expire(cache: list, now: float) -> list:
+    expired = []
+
+    for mute in list(cache):
+        if mute.expiry is not None and mute.expiry <= now:
+            expired.append(mute)
+            cache.remove(mute)
+        else:
+            break
+
+    return expired
+
+
+def old_reschedule(cache: list, mute, expiry: int):
+    cache.remove(mute)
+    mute.expiry = expiry
+    cache.insert(HuskyUtils.get_sort_index(cache, mute, 'expiry'), mute)
+    cache.sort(key=sort_key)
+
+
+def copy_mutes(mutes: list) -> list:
+    return [HuskyData.Mute(m.to_data()) for m in mutes]
+
+
+def main(count: int = 50000, ops: int = 5000):
+    rng = random.Random(1337)
+    now = HuskyScheduler.now()
+    mutes = build_mutes(rng, count, now)
+    queries = [(m.user_id, m.channel) for m in rng.sample(mutes, 200)] + [(rng.randrange(10 ** 6), None)] * 50
+    joins = [rng.choice(mutes).user_id for _ in range(ops)]
+
+    cache = sorted(copy_mutes(mutes), key=sort_key)
+    store = MuteStore(HuskyConfig.WolfConfig())
+
+    for mute in copy_mutes(mutes):
+        store.add(mute)
+
+    # Lookups and join restores
+    mismatches = sum(1 for (user_id, channel) in queries
+                     if (old_find(cache, user_id, channel) or HuskyData.Mute()).to_data()
+                     != (store.get(GUILD, user_id, channel) or HuskyData.Mute()).to_data())
+    mismatches += sum(1 for user_id in joins[:200]
+                      if sorted(m.channel or 0 for m in old_restore(cache, user_id))
+                      != sorted(m.channel or 0 for m in store.for_user(GUILD, user_id) if not m.is_expired()))
+
+    old_lookup = min(timeit.repeat(lambda: [old_find(cache, u, c) for (u, c) in queries], number=1, repeat=3))
+    new_lookup = min(timeit.repeat(lambda: [store.get(GUILD, u, c) for (u, c) in queries], number=1, repeat=3))
+    old_join = min(timeit.repeat(lambda: [old_restore(cache, u) for u in joins[:200]], number=1, repeat=3))
+    new_join = min(timeit.repeat(lambda: [[m for m in store.for_user(GUILD, u) if not m.is_expired()]
+                                          for u in joins], number=1, repeat=3))
+
+    # Expiries: everything due within the next day, lifted and removed.
+    horizon = now + 86400
+    old_expired = timeit.timeit(lambda: old_expire(cache, horizon), number=1)
+    new_expired = timeit.timeit(lambda: [store.remove(m) for m in store.pop_due(horizon)], number=1)
+    expired_count = count - len(cache)
+    mismatches += abs(len(store) - len(cache))
+
+    # Reschedules
+    picks = rng.sample(range(len(cache)), 200)
+    targets = [cache[i] for i in picks]
+    expiries = [int(now + rng.uniform(86400, 30 * 86400)) for _ in picks]
+    old_update = timeit.timeit(lambda: [old_reschedule(cache, m, e) for (m, e) in zip(targets, expiries)], number=1)
+
+    stored = [store.get(GUILD, m.user_id, m.channel) for m in targets]
+
+    def new_reschedule():
+        for (mute, expiry) in zip(stored, expiries):
+            mute.expiry = expiry
+            store.update(mute)
+
+    new_update = timeit.timeit(new_reschedule, number=1)
+
+    # Persisting one change, synchronously (no write-behind).
+    with tempfile.TemporaryDirectory() as directory:
+        old_path = os.path.join(directory, "old_mutes.json")
+        old_config = HuskyConfig.WolfConfig(old_path, create_if_nonexistent=True,
+                                            backend=HuskyConfig.JsonFileBackend(old_path))
+        old_config.set("mutes", cache)
+        old_persist = timeit.timeit(lambda: old_config.set("mutes", cache), number=10) / 10
+
+        new_path = os.path.join(directory, "new_mutes.json")
+        new_config = HuskyConfig.WolfConfig(new_path, create_if_nonexistent=True,
+                                            backend=HuskyConfig.JournaledFileBackend(new_path))
+        persisted = MuteStore(new_config)
+
+        for mute in stored:
+            persisted.add(mute)
+
+        new_persist = timeit.timeit(lambda: [persisted.update(m) for m in stored[:10]], number=1) / 10
+
+    print(f"{count} mutes ({expired_count} expiring within a day)")
+    print(f"  lookup:      old {old_lookup / len(queries) * 1e6:9.2f} us   "
+          f"new {new_lookup / len(queries) * 1e6:7.2f} us")
+    print(f"  join:        old {old_join / 200 * 1e6:9.2f} us   new {new_join / len(joins) * 1e6:7.2f} us")
+    print(f"  expiry:      old {old_expired / expired_count * 1e6:9.2f} us   "
+          f"new {new_expired / expired_count * 1e6:7.2f} us (per mute lifted, before persisting)")
+    print(f"  reschedule:  old {old_update / 200 * 1e6:9.2f} us   new {new_update / 200 * 1e6:7.2f} us")
+    print(f"  persistence: old {old_persist * 1e3:9.2f} ms   new {new_persist * 1e3:7.2f} ms (per change)")
+    print(f"  mismatches: {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Measures NonAsciiFilter's text scoring on 10,000 generated chat messages (plain English, accented and CJK text, emoji,
+box-drawing art and zalgo), against the old two-pass implementation. Also checks the two agree on the non-ASCII share.
+Run from the repository root:
+
+    python misc/benchmarks/nonascii_benchmark.py
+"""
+import os
+import random
+import re
+import string
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+
+from libhusky.antispam.NonAsciiFilter import measure_text  # noqa: E402
+
+EMOJI = ["\U0001F600", "\U0001F602", "\U0001F44D\U0001F3FD", "❤️", "\U0001F468‍\U0001F4BB", "⭐"]
+BOX_ART = "╔═╗║╚╝█░▒▓"
+ACCENTED = "éèàüöäßçñ"
+CJK = "你好世界こんにちは한국어"
+ZALGO_MARKS = [chr(cp) for cp in range(0x0300, 0x036F)]
+
+
+def old_nonascii_value(text: str) -> float:
+    text = text.replace(' ', '')
+    nonascii_characters = re.sub('[!-~]', '', text)
+
+    return len(nonascii_characters) / float(len(text))
+
+
+def english(rng: random.Random) -> str:
+    words = ["".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(1, 9)))
+             for _ in range(rng.randint(2, 40))]
+
+    return " ".join(words) + rng.choice(["", ".", "!", "?", " :)", "\nand another line"])
+
+
+def build_messages(rng: random.Random, count: int) -> list:
+    messages = []
+
+    for _ in range(count):
+        roll = rng.random()
+        text = english(rng)
+
+        if roll < 0.6:
+            pass
+        elif roll < 0.75:
+            text = text + " " + "".join(rng.choice(EMOJI) for _ in range(rng.randint(1, 6)))
+        elif roll < 0.85:
+            text = "".join(rng.choice(ACCENTED) if c in "aeou" and rng.random() < 0.3 else c for c in text)
+        elif roll < 0.92:
+            text = "".join(rng.choice(CJK) for _ in range(rng.randint(5, 80)))
+        elif roll < 0.96:
+            text = "\n".join("".join(rng.choice(BOX_ART) for _ in range(30)) for _ in range(rng.randint(3, 10)))
+        else:
+            text = "".join(c + "".join(rng.choice(ZALGO_MARKS) for _ in range(rng.randint(1, 8))) for c in text)
+
+        messages.append(text)
+
+    return messages
+
+
+def main(count: int = 10000):
+    messages = build_messages(random.Random(1337), count)
+    total_length = sum(len(m) for m in messages)
+
+    mismatches = sum(1 for m in messages if abs(old_nonascii_value(m) - measure_text(m).non_ascii) > 1e-9)
+
+    old = min(timeit.repeat(lambda: [old_nonascii_value(m) for m in messages], number=1, repeat=5))
+    new = min(timeit.repeat(lambda: [measure_text(m) for m in messages], number=1, repeat=5))
+
+    print(f"{count} messages, {total_length / count:.0f} characters on average")
+    print(f"  old (replace + re.sub, non-ASCII only):      {old / count * 1e6:.2f} us/message")
+    print(f"  new (encode, non-ASCII + zalgo + emoji):     {new / count * 1e6:.2f} us/message")
+    print(f"  non-ASCII share mismatches: {mismatches}")
+    print(f"  whitespace-only message: {measure_text('   ').non_ascii} (the old implementation raised "
+          f"ZeroDivisionError)")
+
+
+if __name__ == "__main__":
+    main()
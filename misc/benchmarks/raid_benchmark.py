@@ -0,0 +1,75 @@
+"""
+Measures the RaidFilter's LSH index under sustained guild traffic: per-message cost, memory held, how quickly a raid is
+caught, and whether ordinary chat ever forms a raid-sized cluster. Run from the repository root:
+
+    python misc/benchmarks/raid_benchmark.py [messages per minute]
+"""
+import os
+import random
+import string
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+
+from libhusky.antispam.LSHIndex import LSHIndex  # noqa: E402
+from libhusky.antispam.RaidFilter import defaults  # noqa: E402
+
+RAID_MESSAGE = "free nitro for everyone!!! claim yours at discord-gift.example before it runs out, today only"
+
+
+def random_word(rng: random.Random) -> str:
+    return "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(2, 8)))
+
+
+def main(rate: int = 4000, message_count: int = 50000):
+    rng = random.Random(1337)
+    vocabulary = [random_word(rng) for _ in range(2000)]
+    index = LSHIndex(defaults['seconds'], defaults['threshold'])
+
+    raid_start = message_count // 2
+    raid_detected = None
+    benign_worst = 0
+    peak_entries = 0
+    peak_buckets = 0
+    now = 0.0
+
+    start = time.perf_counter()
+
+    for i in range(message_count):
+        now += 60 / rate
+
+        if raid_start <= i < raid_start + 2000 and i % 40 == 0:
+            # Every raider varies the message a little.
+            text = RAID_MESSAGE + " " + random_word(rng)
+            author = 10 ** 6 + i
+        else:
+            text = " ".join(rng.choice(vocabulary) for _ in range(rng.randint(3, 30)))
+            author = rng.randrange(5000)
+
+            if len(text) < defaults['minLength']:
+                continue
+
+        cluster = index.add(i, author, text, now=now)
+
+        if author >= 10 ** 6:
+            if raid_detected is None and len(cluster.authors) >= defaults['minAuthors']:
+                raid_detected = (i - raid_start) // 40 + 1
+        else:
+            benign_worst = max(benign_worst, len(cluster.authors))
+
+        peak_entries = max(peak_entries, len(index))
+        peak_buckets = max(peak_buckets, index.bucket_count)
+
+    elapsed = time.perf_counter() - start
+
+    print(f"{message_count} messages at {rate} messages/minute, {defaults['seconds']} second window")
+    print(f"  per message:        {elapsed / message_count * 1e6:.1f} us")
+    print(f"  peak messages held: {peak_entries}")
+    print(f"  peak buckets held:  {peak_buckets}")
+    print(f"  raid caught after:  {raid_detected} raiders (minAuthors = {defaults['minAuthors']})")
+    print(f"  largest benign cluster: {benign_worst} author(s)")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
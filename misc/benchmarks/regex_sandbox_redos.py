@@ -0,0 +1,87 @@
+"""
+Runs known catastrophic-backtracking (ReDoS) patterns through the RegexSandbox, and checks that the event loop keeps
+ticking while they run, that each one is quarantined, and that well-behaved patterns keep working afterwards. Run
+from the repository root:
+
+    python misc/benchmarks/regex_sandbox_redos.py
+"""
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+
+from libhusky.HuskyCensor import CensorMatcher  # noqa: E402
+from libhusky.HuskyRegex import RegexSandbox  # noqa: E402
+
+# (pattern, input that makes it backtrack catastrophically)
+REDOS_CASES = [
+    (r"(a+)+$", "a" * 40 + "!"),
+    (r"(a|aa)+$", "a" * 60 + "!"),
+    (r"(a|a?)+$", "a" * 40 + "!"),
+    (r"^(\w+\s?)*$", "word " * 12 + "!"),
+    (r"(.*a){25}", "a" * 40),
+    (r"^(([a-z])+.)+[A-Z]([a-z])+$", "a" * 40 + "!"),
+]
+
+# Well-behaved patterns and plain words that share the matcher with the bad pattern.
+GOOD_TERMS = ["badword", r"fr[e3]{2}\s*n[i1]tro", r"\bspam+\b"]
+
+TICK = 0.01
+MAX_LAG = 0.1
+
+
+async def heartbeat(lags: list, stop: asyncio.Event):
+    while not stop.is_set():
+        start = time.monotonic()
+        await asyncio.sleep(TICK)
+        lags.append(time.monotonic() - start - TICK)
+
+
+async def main() -> bool:
+    quarantined = []
+
+    async def on_quarantine(pattern, source):
+        quarantined.append(pattern)
+
+    sandbox = RegexSandbox(workers=2, timeout=0.25, on_quarantine=on_quarantine)
+
+    # Start the workers before measuring anything; spawning them isn't part of any evaluation's budget.
+    await sandbox.search(CensorMatcher([r"warm\s*up"]), "warm up")
+
+    lags = []
+    stop = asyncio.Event()
+    beat = asyncio.ensure_future(heartbeat(lags, stop))
+    ok = True
+
+    for (pattern, text) in REDOS_CASES:
+        matcher = CensorMatcher(GOOD_TERMS + [pattern])
+        start = time.monotonic()
+        result = await sandbox.search(matcher, text, source="ReDoS check")
+        elapsed = time.monotonic() - start
+
+        caught = pattern in sandbox.quarantined
+        ok &= caught and result is None
+        print(f"  {pattern:32} {'quarantined' if caught else 'NOT QUARANTINED':16} in {elapsed:5.2f} s")
+
+        # The good patterns must still work with the bad one in the same list.
+        for (term, sample) in zip(GOOD_TERMS, ["a badword", "free nitro", "spammm"]):
+            hit = await sandbox.search(matcher, sample, source="ReDoS check")
+            ok &= hit == term
+
+    stop.set()
+    await beat
+    sandbox.shutdown()
+
+    max_lag = max(lags)
+    ok &= max_lag < MAX_LAG and len(quarantined) == len(REDOS_CASES)
+
+    print(f"  max event loop lag: {max_lag * 1000:.1f} ms over {len(lags)} ticks (limit {MAX_LAG * 1000:.0f} ms)")
+    print("PASS" if ok else "FAIL")
+
+    return ok
+
+
+if __name__ == "__main__":
+    sys.exit(0 if asyncio.run(main()) else 1)
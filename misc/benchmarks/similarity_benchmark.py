@@ -0,0 +1,138 @@
+"""
+Compares NonUniqueFilter's similarity engines, for speed and for accuracy.
+
+Speed is the cost of checking one new message against a user's whole message cache, for a few cache sizes and message
+lengths. Accuracy is measured on a generated corpus of message pairs, each labelled spam (two variants of the same
+message) or not spam (two unrelated messages): how often each engine's verdict agrees with SequenceMatcher's at the
+same threshold, and how well each separates spam from not spam. Run from the repository root:
+
+    python misc/benchmarks/similarity_benchmark.py
+"""
+import os
+import random
+import string
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+
+from libhusky.antispam.Similarity import ENGINES  # noqa: E402
+
+THRESHOLDS = [0.5, 0.6, 0.7, 0.75, 0.8, 0.9]
+
+
+def build_vocabulary(rng: random.Random, size: int = 400) -> list:
+    return ["".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(2, 8))) for _ in range(size)]
+
+
+def sentence(rng: random.Random, vocabulary: list, words: int) -> str:
+    return " ".join(rng.choice(vocabulary) for _ in range(words))
+
+
+def mutate(rng: random.Random, text: str, rate: float) -> str:
+    # Randomly drop, replace and insert characters, the way spam is varied to slip past exact-match filters.
+    out = []
+
+    for char in text:
+        roll = rng.random()
+
+        if roll < rate / 3:
+            continue
+        elif roll < 2 * rate / 3:
+            out.append(rng.choice(string.ascii_lowercase))
+        elif roll < rate:
+            out.append(char + rng.choice(string.ascii_lowercase))
+        else:
+            out.append(char)
+
+    return "".join(out)
+
+
+def build_corpus(rng: random.Random, count: int) -> list:
+    """
+    :return: Returns a list of (label, text_a, text_b) pairs, where label is True for spam.
+    """
+    vocabulary = build_vocabulary(rng)
+    corpus = []
+
+    for _ in range(count):
+        base = sentence(rng, vocabulary, rng.randint(1, 25))
+        roll = rng.random()
+
+        if roll < 0.25:
+            corpus.append((True, base, mutate(rng, base, rng.uniform(0, 0.3))))
+        elif roll < 0.35:
+            corpus.append((True, base, base + " " + sentence(rng, vocabulary, rng.randint(1, 3))))
+        elif roll < 0.45:
+            corpus.append((True, base, base * rng.randint(2, 4)))
+        elif roll < 0.5:
+            words = base.split()
+            rng.shuffle(words)
+            corpus.append((True, base, " ".join(words)))
+        else:
+            corpus.append((False, base, sentence(rng, vocabulary, rng.randint(1, 25))))
+
+    return corpus
+
+
+def accuracy(corpus: list):
+    reference = ENGINES["sequence"]
+    scores = {name: [engine.compare(a, b) for (_, a, b) in corpus] for (name, engine) in ENGINES.items()}
+
+    print(f"Accuracy on {len(corpus)} message pairs ({sum(label for (label, _, _) in corpus)} spam):\n")
+    print(f"{'threshold':>9}  {'engine':>8}  {'agrees w/ seq':>13}  {'precision':>9}  {'recall':>6}")
+
+    for threshold in THRESHOLDS:
+        expected = [score >= threshold for score in scores[reference.name]]
+
+        for (name, engine_scores) in scores.items():
+            verdicts = [score >= threshold for score in engine_scores]
+            agreement = sum(v == e for (v, e) in zip(verdicts, expected)) / len(corpus)
+
+            hits = sum(v and label for (v, (label, _, _)) in zip(verdicts, corpus))
+            precision = hits / max(sum(verdicts), 1)
+            recall = hits / sum(label for (label, _, _) in corpus)
+
+            print(f"{threshold:>9}  {name:>8}  {agreement:>13.1%}  {precision:>9.1%}  {recall:>6.1%}")
+
+    print()
+
+
+def speed(rng: random.Random):
+    vocabulary = build_vocabulary(rng)
+
+    print("Cost of checking one message against a full cache:\n")
+    print(f"{'cache':>5}  {'length':>6}  " + "  ".join(f"{name:>10}" for name in ENGINES))
+
+    for cache_size in (3, 20, 100):
+        for words in (8, 40, 200):
+            history = [sentence(rng, vocabulary, words) for _ in range(cache_size)]
+            message = sentence(rng, vocabulary, words)
+            results = []
+
+            for engine in ENGINES.values():
+                signatures = [engine.signature(text) for text in history]
+
+                def check():
+                    signature = engine.signature(message)
+
+                    for cached in signatures:
+                        engine.similarity(cached, signature)
+
+                runs, total = timeit.Timer(check).autorange()
+                results.append(f"{total / runs * 1000:>7.3f} ms")
+
+            print(f"{cache_size:>5}  {len(message):>6}  " + "  ".join(results))
+
+    print()
+
+
+def main():
+    rng = random.Random(1337)
+
+    accuracy(build_corpus(rng, 4000))
+    speed(rng)
+
+
+if __name__ == "__main__":
+    main()
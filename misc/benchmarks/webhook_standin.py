@@ -0,0 +1,201 @@
+"""
+A local stand-in for Discord's webhook API, for testing log delivery through webhooks without a real guild.
+
+The stand-in executes webhooks (`POST /api/webhooks/{id}/{token}`) like Discord does: with a per-webhook rate limit
+(and the same rate limit headers), 429s past it, 404s for deleted webhooks and 400s for more than 10 embeds. By default,
+this script runs WebhookDelivery against it with stand-in channels and checks that batches arrive, that the rate limit
+is respected, and that deleted webhooks and missing permissions are handled. Run from the repository root:
+
+    python misc/benchmarks/webhook_standin.py
+
+To run the stand-in on its own (and point `logWebhooks.apiBase` at `http://127.0.0.1:8089/api`):
+
+    python misc/benchmarks/webhook_standin.py serve 8089
+"""
+import asyncio
+import itertools
+import os
+import sys
+import time
+import types
+
+from aiohttp import web
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+
+import discord  # noqa: E402
+
+from libhusky.HuskyWebhooks import WebhookDelivery  # noqa: E402
+
+# Discord allows 5 executes per webhook every 2 seconds. The check uses a shorter window, to finish quickly.
+LIMIT = 5
+WINDOW = 2.0
+
+
+class StandInDiscord:
+    def __init__(self, limit: int = LIMIT, window: float = WINDOW):
+        self.limit = limit
+        self.window = window
+
+        self.webhooks = {}  # webhook ID -> (channel ID, name, token)
+        self.messages = []  # (webhook ID, embeds)
+        self.requests = 0
+        self.rate_limited = 0
+
+        self._ids = itertools.count(1000)
+        self._buckets = {}  # webhook ID -> (window start, executes in the window)
+
+    def create_webhook(self, channel_id: int, name: str) -> int:
+        webhook_id = next(self._ids)
+        self.webhooks[webhook_id] = (channel_id, name, f"token-{webhook_id}")
+
+        return webhook_id
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_post('/api/webhooks/{webhook_id}/{token}', self.execute)
+
+        return app
+
+    async def execute(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        webhook_id = int(request.match_info['webhook_id'])
+        webhook = self.webhooks.get(webhook_id)
+
+        if webhook is None or webhook[2] != request.match_info['token']:
+            return web.json_response({'message': "Unknown Webhook", 'code': 10015}, status=404)
+
+        now = time.monotonic()
+        (start, used) = self._buckets.get(webhook_id, (now, 0))
+
+        if now - start >= self.window:
+            (start, used) = (now, 0)
+
+        reset_after = start + self.window - now
+
+        if used >= self.limit:
+            self.rate_limited += 1
+            return web.json_response({'message': "You are being rate limited.", 'retry_after': int(reset_after * 1000),
+                                      'global': False}, status=429, headers=self._headers(0, reset_after))
+
+        self._buckets[webhook_id] = (start, used + 1)
+        embeds = (await request.json()).get('embeds', [])
+
+        if not 1 <= len(embeds) <= 10:
+            return web.json_response({'message': "Invalid Form Body", 'code': 50035}, status=400,
+                                     headers=self._headers(self.limit - used - 1, reset_after))
+
+        self.messages.append((webhook_id, embeds))
+
+        return web.Response(status=204, headers=self._headers(self.limit - used - 1, reset_after))
+
+    def _headers(self, remaining: int, reset_after: float) -> dict:
+        return {'X-RateLimit-Limit': str(self.limit), 'X-RateLimit-Remaining': str(remaining),
+                'X-RateLimit-Reset-After': f"{reset_after:.3f}"}
+
+
+class StandInChannel:
+    """
+    Just enough of a discord.TextChannel for WebhookDelivery.
+    """
+
+    def __init__(self, server: StandInDiscord, channel_id: int, manage_webhooks: bool = True):
+        self.server = server
+        self.id = channel_id
+        self.manage_webhooks = manage_webhooks
+
+    def __str__(self):
+        return f"channel-{self.id}"
+
+    async def webhooks(self) -> list:
+        self._check_permissions()
+
+        return [types.SimpleNamespace(id=webhook_id, name=name, token=token)
+                for (webhook_id, (channel_id, name, token)) in self.server.webhooks.items() if channel_id == self.id]
+
+    async def create_webhook(self, name: str, reason: str = None):
+        self._check_permissions()
+        webhook_id = self.server.create_webhook(self.id, name)
+
+        return types.SimpleNamespace(id=webhook_id, name=name, token=self.server.webhooks[webhook_id][2])
+
+    def _check_permissions(self):
+        if not self.manage_webhooks:
+            raise discord.Forbidden(types.SimpleNamespace(status=403, reason="Forbidden"), "Missing Permissions")
+
+
+async def serve(port: int):
+    runner = web.AppRunner(StandInDiscord().app())
+    await runner.setup()
+    await web.TCPSite(runner, '127.0.0.1', port).start()
+
+    print(f"Stand-in webhook API listening on http://127.0.0.1:{port}/api")
+
+    while True:
+        await asyncio.sleep(3600)
+
+
+async def check():
+    server = StandInDiscord(limit=LIMIT, window=0.5)
+    runner = web.AppRunner(server.app())
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = runner.addresses[0][1]
+
+    logs = StandInChannel(server, 1)
+    forbidden = StandInChannel(server, 2, manage_webhooks=False)
+    delivery = WebhookDelivery(lambda: {logs.id, forbidden.id}, api_base=f"http://127.0.0.1:{port}/api")
+
+    def batch(n: int, size: int = 10) -> list:
+        return [{'title': f"Log entry {n}.{i}"} for i in range(size)]
+
+    # A burst of full batches: more than one bucket's worth, so the client has to pace itself.
+    start = time.monotonic()
+    sent = [await delivery.deliver(logs, batch(n)) for n in range(12)]
+    burst = time.monotonic() - start
+
+    assert all(sent), sent
+    assert len(server.messages) == 12 and all(len(embeds) == 10 for (_, embeds) in server.messages)
+    assert server.rate_limited == 0, "the client should wait for the bucket to reset, not run into it"
+    assert burst >= 2 * server.window * 0.9, burst
+
+    # Somebody else exhausts the bucket: the client gets a 429, waits, and retries.
+    (webhook_id, _) = delivery._webhooks[logs.id]
+    server._buckets[webhook_id] = (time.monotonic(), server.limit)
+    delivery._reset_at.clear()
+    assert await delivery.deliver(logs, batch(12))
+    assert delivery.stats.rate_limited == 1
+
+    # The webhook is deleted: a new one is set up, and the embeds still arrive.
+    del server.webhooks[webhook_id]
+    assert await delivery.deliver(logs, batch(13))
+    assert delivery.stats.provisioned == 2 and delivery._webhooks[logs.id][0] != webhook_id
+
+    # No permission to manage webhooks: the caller has to send the embeds itself.
+    assert not await delivery.deliver(forbidden, batch(14))
+    assert not await delivery.deliver(StandInChannel(server, 3), batch(15)), "channel not set up for webhooks"
+
+    # Too many embeds for one execute: refused, so the caller sends them itself.
+    assert not await delivery.deliver(logs, batch(16, size=11))
+
+    await delivery.close()
+    await runner.cleanup()
+
+    print(f"{len(server.messages)} webhook messages ({sum(len(e) for (_, e) in server.messages)} embeds) delivered "
+          f"in {server.requests} requests")
+    print(f"  burst of 12 batches: {burst:.2f} s at {server.limit} executes per {server.window} s, "
+          f"{server.rate_limited} rate limited response(s)")
+    print(f"  webhooks set up: {delivery.stats.provisioned}, fallbacks to the bot: {delivery.stats.fallbacks}")
+    print("  all checks passed")
+
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "serve":
+        asyncio.get_event_loop().run_until_complete(serve(int(sys.argv[2]) if len(sys.argv) > 2 else 8089))
+    else:
+        asyncio.get_event_loop().run_until_complete(check())
+
+
+if __name__ == "__main__":
+    main()
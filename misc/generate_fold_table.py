@@ -0,0 +1,186 @@
+"""
+Generates libhusky/HuskyFoldTable.py, the str.translate() table behind HuskyCensor.fold(). Run from the repository
+root whenever the rules below change (or to pick up a newer Unicode database):
+
+    python misc/generate_fold_table.py --write
+
+Without `--write` (or `--output PATH`, to write the table elsewhere), nothing is written: the script only checks whether
+the table is up to date, and exits with status 1 if it isn't.
+
+The table depends on the Unicode database of the Python running this script. If that isn't the version the current
+table was generated from, writing it is refused unless `--allow-unicode-change` is given, so that matching doesn't
+change just because the script was run on a different Python.
+
+The table maps every character to what it should look like for matching purposes:
+
+- Zero-width and other invisible format characters, filler characters and combining diacritics are dropped.
+- Anything with a compatibility decomposition (fullwidth letters, mathematical alphanumerics, ligatures, circled and
+  superscript characters, ...) is decomposed, with its diacritics dropped.
+- Common homoglyphs (Cyrillic and Greek letters that look Latin) are replaced with the Latin letter they imitate.
+- Everything is case-folded.
+
+Only characters that fold to plain ASCII, or that sit in the Latin, Greek and Cyrillic blocks, are included - other
+scripts are left alone, so that e.g. Hangul syllables are never broken into their parts.
+"""
+import argparse
+import os
+import re
+import sys
+import unicodedata
+
+OUTPUT = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "libhusky",
+                                      "HuskyFoldTable.py"))
+
+HEADER = "# Generated by misc/generate_fold_table.py from Unicode {version}. Do not edit by hand.\n"
+HEADER_VERSION = re.compile(r"^# Generated by misc/generate_fold_table\.py from Unicode (\S+)\. ")
+
+# Combining diacritic blocks. Marks elsewhere belong to the scripts that use them, and are kept.
+MARK_RANGES = [(0x0300, 0x036F), (0x1AB0, 0x1AFF), (0x1DC0, 0x1DFF), (0x20D0, 0x20FF), (0xFE20, 0xFE2F)]
+
+# Characters that render as blank space without being whitespace, often used to pad out or hide text.
+FILLERS = [0x115F, 0x1160, 0x2800, 0x3164, 0xFFA0]
+
+# Look-alikes of Latin letters, applied before case folding.
+HOMOGLYPHS = {
+    # Cyrillic
+    'А': 'a', 'В': 'b', 'Е': 'e', 'К': 'k', 'М': 'm', 'Н': 'h', 'О': 'o', 'Р': 'p', 'С': 'c', 'Т': 't', 'У': 'y',
+    'Х': 'x', 'Ѕ': 's', 'І': 'i', 'Ј': 'j', 'Ԁ': 'd', 'Ԛ': 'q', 'Ԝ': 'w',
+    'а': 'a', 'е': 'e', 'о': 'o', 'р': 'p', 'с': 'c', 'у': 'y', 'х': 'x', 'ѕ': 's', 'і': 'i', 'ј': 'j', 'һ': 'h',
+    'ԁ': 'd', 'ԛ': 'q', 'ԝ': 'w', 'ѡ': 'w', 'ү': 'y',
+    # Greek
+    'Α': 'a', 'Β': 'b', 'Ε': 'e', 'Ζ': 'z', 'Η': 'h', 'Ι': 'i', 'Κ': 'k', 'Μ': 'm', 'Ν': 'n', 'Ο': 'o', 'Ρ': 'p',
+    'Τ': 't', 'Υ': 'y', 'Χ': 'x',
+    'α': 'a', 'ι': 'i', 'κ': 'k', 'ν': 'v', 'ο': 'o', 'ρ': 'p', 'τ': 't', 'υ': 'u', 'χ': 'x',
+    # Latin
+    'ı': 'i', 'ȷ': 'j', 'ɑ': 'a', 'ɡ': 'g', 'ɩ': 'i', 'ʀ': 'r', 'ꜱ': 's',
+}
+
+LATIN_GREEK_CYRILLIC_END = 0x0530
+ENTRIES_PER_LINE = 6
+
+
+def is_dropped(char: str) -> bool:
+    cp = ord(char)
+    category = unicodedata.category(char)
+
+    if category == 'Cf' or cp in FILLERS:
+        return True
+
+    return category in ('Mn', 'Me') and any(start <= cp <= end for (start, end) in MARK_RANGES)
+
+
+def fold_char(char: str) -> str:
+    if is_dropped(char):
+        return ''
+
+    if char in HOMOGLYPHS:
+        return HOMOGLYPHS[char]
+
+    folded = unicodedata.normalize('NFKD', char).casefold()
+
+    # Case folding can itself produce decomposable characters (e.g. U+0130), so normalize until nothing changes.
+    while True:
+        parts = unicodedata.normalize('NFKD', folded).casefold()
+        parts = ''.join(HOMOGLYPHS.get(c, c) for c in parts if not is_dropped(c))
+
+        if parts == folded:
+            return folded
+
+        folded = parts
+
+
+def build_table() -> dict:
+    table = {}
+
+    for cp in range(sys.maxunicode + 1):
+        char = chr(cp)
+
+        if unicodedata.category(char) in ('Cs', 'Co', 'Cn'):
+            continue
+
+        folded = fold_char(char)
+
+        if folded == char:
+            continue
+
+        if is_dropped(char) or folded.isascii() or char in HOMOGLYPHS or cp < LATIN_GREEK_CYRILLIC_END:
+            table[cp] = folded
+
+    # A single translate() pass must be enough: nothing a character folds to may fold any further.
+    for folded in table.values():
+        assert all(ord(c) not in table for c in folded), folded
+
+    return table
+
+
+def render_table(table: dict) -> str:
+    entries = [f"0x{cp:04X}: {folded!r}" for (cp, folded) in sorted(table.items())]
+    lines = [HEADER.format(version=unicodedata.unidata_version), "FOLD_TABLE = {"]
+
+    for i in range(0, len(entries), ENTRIES_PER_LINE):
+        lines.append("    " + ", ".join(entries[i:i + ENTRIES_PER_LINE]) + ",")
+
+    lines.append("}")
+
+    return "\n".join(lines) + "\n"
+
+
+def read_table(path: str) -> (str, str):
+    """
+    :return: Returns the contents of an existing table, and the Unicode version it was generated from (either may be
+             None).
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            contents = f.read()
+    except FileNotFoundError:
+        return None, None
+
+    match = HEADER_VERSION.match(contents)
+
+    return contents, match.group(1) if match else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate the character folding table behind HuskyCensor.fold().")
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument('--write', action='store_true', help=f"Write the table to {os.path.relpath(OUTPUT)}")
+    target.add_argument('--output', metavar='PATH', help="Write the table to PATH instead")
+    parser.add_argument('--allow-unicode-change', action='store_true',
+                        help="Write the table even if it was generated from a different Unicode version")
+    args = parser.parse_args()
+
+    (current, current_version) = read_table(OUTPUT)
+    version = unicodedata.unidata_version
+    version_changed = current_version is not None and current_version != version
+
+    if version_changed:
+        print(f"Warning: {os.path.relpath(OUTPUT)} was generated from Unicode {current_version}, but this Python has "
+              f"Unicode {version}.", file=sys.stderr)
+
+    if args.write and version_changed and not args.allow_unicode_change:
+        print("Refusing to change the Unicode version of the table, as that changes what censors match. Run with the "
+              "Python it was generated with, or pass --allow-unicode-change.", file=sys.stderr)
+        sys.exit(2)
+
+    table = build_table()
+    contents = render_table(table)
+
+    if not args.write and args.output is None:
+        if contents == current:
+            print(f"{os.path.relpath(OUTPUT)} is up to date ({len(table)} entries).")
+            return
+
+        print(f"{os.path.relpath(OUTPUT)} is out of date. Run with --write to regenerate it.")
+        sys.exit(1)
+
+    path = OUTPUT if args.write else args.output
+
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(contents)
+
+    print(f"Wrote {len(table)} entries to {os.path.normpath(path)}")
+
+
+if __name__ == "__main__":
+    main()
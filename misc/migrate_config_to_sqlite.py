@@ -0,0 +1,42 @@
+"""
+Migrates every JSON config store (`config/*.json`) into the SQLite backend in one go, ahead of switching a deployment
+over with HUSKYBOT_CONFIG_BACKEND=sqlite. The JSON files are left untouched, as a backup. Stop the bot first, then
+run from the repository root (or the bot's working directory):
+
+    python misc/migrate_config_to_sqlite.py [--directory config] [--overwrite]
+
+Stores that already have a database are skipped, unless `--overwrite` is given - which replaces the database with the
+contents of the JSON file, discarding any changes made since the migration.
+"""
+import argparse
+import logging
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from libhusky import HuskyConfig  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Migrate JSON config stores into the SQLite config backend.")
+    parser.add_argument('--directory', default='config', help="The directory holding the stores (default: config)")
+    parser.add_argument('--overwrite', action='store_true',
+                        help="Re-import stores that already have a database, replacing it")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    if not os.path.isdir(args.directory):
+        parser.error(f"{args.directory} is not a directory.")
+
+    migrated = HuskyConfig.migrate_to_sqlite(args.directory, overwrite=args.overwrite)
+
+    for db_path in migrated:
+        print(f"Migrated {db_path}")
+
+    print(f"{len(migrated)} store(s) migrated. Set HUSKYBOT_CONFIG_BACKEND=sqlite to run the bot on them.")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,9 +9,11 @@ import discord
 from discord.ext import commands
 
 from HuskyBot import HuskyBot
-from libhusky import HuskyUtils
 from libhusky import antispam
+from libhusky.HuskyPipeline import MessageFeatures, Priority
 from libhusky.HuskyStatics import *
+from libhusky.antispam.Dispatcher import Dispatcher
+from libhusky.antispam.TimingWheel import ExpiryWheel
 
 LOG = logging.getLogger("HuskyBot.Plugin." + __name__)
 
@@ -32,9 +34,12 @@ class AntiSpam(commands.Cog):
 
         # AS Modules
         self.__modules__ = {}
+        self._dispatcher = Dispatcher(self)
+        self.expiry_wheel = ExpiryWheel()
 
         # Tasks
         self.__cleanup_task__ = self.bot.loop.create_task(self.run_scheduled_cleanups())
+        self.__expiry_task__ = self.bot.loop.create_task(self.run_cooldown_expiry())
 
         # Initialize the modules
         for (module_name, module_config) in self._config.get('antiSpam', {}).items():
@@ -45,10 +50,16 @@ class AntiSpam(commands.Cog):
             if module_config.get('enabled', True):
                 self.load_module(module_name)
 
+        self._dispatcher.start()
+        bot.pipeline.register("AntiSpam", self.process_message, Priority.ANTISPAM, on_edit=True)
+
         LOG.info("Loaded plugin!")
 
     def cog_unload(self):
+        self.bot.pipeline.unregister("AntiSpam")
+        self._dispatcher.stop()
         self.__cleanup_task__.cancel()
+        self.__expiry_task__.cancel()
 
         for mod_name in list(self.__modules__.keys()):
             self.unload_module(mod_name)
@@ -57,7 +68,10 @@ class AntiSpam(commands.Cog):
         importlib.invalidate_caches()
 
         module = importlib.import_module(f".{module_name}", package=f"libhusky.antispam")
-        clazz = getattr(module, module_name)
+        clazz = getattr(module, module_name, None)
+
+        if not (isinstance(clazz, type) and issubclass(clazz, antispam.AntiSpamModule)):
+            raise ModuleNotFoundError(f"{module_name} is not an AntiSpam module.")
 
         impl = clazz(self)
         self.__modules__[module_name] = impl
@@ -65,6 +79,7 @@ class AntiSpam(commands.Cog):
 
     def unload_module(self, module_name):
         self.asp.remove_command(self.__modules__[module_name])
+        self.expiry_wheel.unregister(module_name)
         del self.__modules__[module_name]
 
     async def run_scheduled_cleanups(self):
@@ -77,32 +92,22 @@ class AntiSpam(commands.Cog):
 
             await asyncio.sleep(self._cleanup_time)  # sleep for four hours
 
-    @commands.Cog.listener()
-    async def on_message(self, message: discord.Message):
-        await self.process_message(message, context='new_message')
-
-    @commands.Cog.listener()
-    async def on_message_edit(self, before: discord.Message, after: discord.Message):
-        await self.process_message(after, context='edited_message', meta={"before": before, "after": after})
-
-    async def process_message(self, message: discord.Message, context: str, meta: dict = None):
-        # config loading
-        as_config: dict = self._config.get("antiSpam", {})
-        global_config: dict = as_config.get("__global__", {})
-        exemption_config: list = global_config.get("exemptedRoles", [])
-
-        # Replace meta None with a dict if unset.
-        if not meta:
-            meta = {}
+    async def run_cooldown_expiry(self):
+        """
+        Advance the cooldown expiry wheel once a tick, releasing module cooldown records as soon as they expire.
+        """
+        while not self.bot.is_closed():
+            self.expiry_wheel.advance()
 
-        if not HuskyUtils.should_process_message(message):
-            return
+            await asyncio.sleep(self.expiry_wheel.tick)
 
-        if exemption_config and HuskyUtils.member_has_any_role(message.author, exemption_config):
+    async def process_message(self, features: MessageFeatures):
+        if features.is_antispam_exempt:
             return
 
-        for module in self.__modules__.values():
-            asyncio.ensure_future(module.process_message(message, context, meta))
+        # Give the modules a moment to decide, so the pipeline knows if any of them deleted the message. Past that, they
+        # carry on in the background: a backed-up queue (or a slow ban) must not hold up commands and responders.
+        await self._dispatcher.submit(features, timeout=self._dispatcher.verdict_wait())
 
     @commands.group(name="antispam", aliases=['as'], brief="Manage the Antispam configuration for the bot")
     @commands.has_permissions(manage_messages=True)
@@ -129,10 +134,11 @@ class AntiSpam(commands.Cog):
         ------------------
             AttachmentFilter  :: Restrict the number of attachments/files a user can post in a certain time
             InviteFilter      :: Block unauthorized Discord invites to other guilds
-            LinkFilter        :: Block messages that contain excessive links, or link-spamming users.
+            LinkFilter        :: Block messages that contain excessive links, link-spamming users, or spammed domains.
             MentionFilter     :: Block users from "mention-spamming" over set thresholds.
             NonAsciiFilter    :: Block messages composed of non-ASCII characters, like Zalgo
             NonUniqueFilter   :: Monitor and take action against users who post the same messages over and over again.
+            RaidFilter        :: Take action against many users posting the same message at once (raids).
 
         Parameters
         ----------
@@ -278,6 +284,82 @@ class AntiSpam(commands.Cog):
             color=Colors.SUCCESS
         ))
 
+    @asp.command(name="stats", brief="Show AntiSpam throughput and queue statistics")
+    async def dispatcher_stats(self, ctx: commands.Context):
+        """
+        AntiSpam processes messages on a fixed number of workers, fed by a bounded queue. This command shows how well
+        it's keeping up.
+
+        If the queue starts filling up (e.g. during a raid), low-priority modules are skipped ("shed") for new messages,
+        and once it is completely full new messages are dropped without being checked at all. Seeing either of these
+        regularly means AntiSpam needs more workers or a bigger queue.
+
+        Deletes, kicks and bans go through a separate moderation queue, which merges duplicate requests and batches
+        deletes. Its latency is the time from a filter asking for an action to Discord confirming it.
+        """
+        dispatcher = self._dispatcher
+        stats = dispatcher.stats
+
+        embed = discord.Embed(
+            title=Emojis.SHIELD + " AntiSpam | Dispatcher Statistics",
+            description=f"Running {len(self.__modules__)} module(s) on {dispatcher.worker_count} worker(s).",
+            color=Colors.WARNING if stats.dropped else Colors.INFO
+        )
+
+        embed.add_field(name="Queue Depth", value=f"{dispatcher.depth} / {dispatcher.capacity} "
+                                                  f"(peak {stats.max_depth})", inline=True)
+        embed.add_field(name="Throughput", value=f"{stats.throughput():.2f} msg/s", inline=True)
+        embed.add_field(name="Queue Latency", value=f"p50 {stats.latency_percentile(50) * 1000:.1f} ms, "
+                                                    f"p95 {stats.latency_percentile(95) * 1000:.1f} ms", inline=True)
+        embed.add_field(name="Messages", value=f"{stats.processed} processed, {stats.dropped} dropped "
+                                               f"(of {stats.submitted})", inline=True)
+        embed.add_field(name="Module Errors", value=str(stats.errors), inline=True)
+        embed.add_field(name="Finished In Background", value=str(stats.detached), inline=True)
+        embed.add_field(name="Users In Progress", value=str(dispatcher.active_users), inline=True)
+        embed.add_field(name="Shed Modules",
+                        value=", ".join(f"{name} ({count})" for (name, count) in stats.shed.most_common()) or "None",
+                        inline=False)
+
+        live_records = self.expiry_wheel.live_records()
+        embed.add_field(name="Live Cooldown Records",
+                        value=", ".join(f"{name} ({count})" for (name, count) in sorted(live_records.items()))
+                        or "None",
+                        inline=False)
+        embed.add_field(name="Expired Cooldown Records", value=str(self.expiry_wheel.expired), inline=True)
+
+        action_queue = self.bot.action_queue
+        action_stats = action_queue.stats
+
+        embed.add_field(name="Moderation Queue", value=f"{action_queue.depth} pending "
+                                                       f"(peak {action_stats.max_depth})", inline=True)
+        embed.add_field(name="Action Latency", value=f"p50 {action_stats.latency_percentile(50) * 1000:.1f} ms, "
+                                                     f"p95 {action_stats.latency_percentile(95) * 1000:.1f} ms",
+                        inline=True)
+        embed.add_field(name="Action Errors", value=str(action_stats.errors), inline=True)
+        embed.add_field(name="Actions Taken",
+                        value=", ".join(f"{kind.title()} ({count})" for (kind, count)
+                                        in action_stats.executed.most_common()) or "None",
+                        inline=False)
+        embed.add_field(name="Actions Saved",
+                        value=f"{action_stats.deduplicated} duplicate(s), {action_stats.escalated} escalation(s), "
+                              f"{action_stats.absorbed} delete(s) covered by bans, {action_stats.bulk_deleted} "
+                              f"message(s) in {action_stats.bulk_deletes} bulk delete(s)",
+                        inline=False)
+
+        log_sink = self.bot.log_sink
+        sink_stats = log_sink.stats
+
+        embed.add_field(name="Log Embeds",
+                        value=f"{sink_stats.embeds} sent in {sink_stats.messages} message(s) "
+                              f"({sink_stats.embeds_per_message:.1f} per message), {log_sink.depth} pending",
+                        inline=False)
+        embed.add_field(name="Log Embeds Saved",
+                        value=f"{sink_stats.merged} repeat(s) merged, {sink_stats.dropped} dropped, "
+                              f"{sink_stats.errors} error(s)",
+                        inline=False)
+
+        await ctx.send(embed=embed)
+
     @asp.group(name="exemptions", brief="Manage exemptions to the AntiSpam plugin")
     @commands.has_permissions(manage_guild=True)
     async def exemptions(self, ctx: commands.Context):
@@ -330,7 +412,7 @@ class AntiSpam(commands.Cog):
             return
 
         exemption_config.remove(role.id)
-        self._config.set("antispam", as_config)
+        self._config.set("antiSpam", as_config)
 
         await ctx.send(embed=discord.Embed(
             title="Role Unexempted!",
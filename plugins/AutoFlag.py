@@ -1,6 +1,4 @@
-import asyncio
 import logging
-import re
 
 import discord
 from discord.ext import commands
@@ -8,6 +6,8 @@ from discord.ext import commands
 from HuskyBot import HuskyBot
 from libhusky import HuskyChecks
 from libhusky import HuskyUtils
+from libhusky.HuskyCensor import CensorMatcher
+from libhusky.HuskyPipeline import MessageFeatures, Priority
 from libhusky.HuskyStatics import *
 
 LOG = logging.getLogger("HuskyBot.Plugin." + __name__)
@@ -26,64 +26,77 @@ class AutoFlag(commands.Cog):
         self._config = bot.config
 
         self._delete_time = 30 * 60  # 30 minutes (30 x 60 seconds)
+
+        # Flags only ever report on a message, so there's no need to hold up the rest of the pipeline for them.
+        bot.pipeline.register("AutoFlag.Regex", self.regex_message_filter, Priority.AUTOFLAG, on_edit=True,
+                              background=True)
+        bot.pipeline.register("AutoFlag.User", self.user_filter, Priority.AUTOFLAG, background=True)
+
         LOG.info("Loaded plugin!")
 
-    async def regex_message_filter(self, message: discord.Message, context: str = "new_message"):
-        flag_regexes = self._config.get("flaggedRegexes", [])
+    def cog_unload(self):
+        self.bot.pipeline.unregister("AutoFlag.Regex")
+        self.bot.pipeline.unregister("AutoFlag.User")
+
+    @staticmethod
+    def _build_flag_matcher(flag_regexes):
+        return CensorMatcher(flag_regexes or ())
 
-        alert_channel = self._config.get('specialChannels', {}).get(ChannelKeys.STAFF_ALERTS.value, None)
+    async def regex_message_filter(self, features: MessageFeatures):
+        message = features.message
+        context = features.context
+
+        config = features.config
+        flag_matcher = self._config.derive("flaggedRegexes", self._build_flag_matcher)
+
+        alert_channel = config.get('specialChannels').get(ChannelKeys.STAFF_ALERTS.value, None)
         if alert_channel is not None:
             alert_channel: discord.TextChannel = self.bot.get_channel(alert_channel)
 
-        log_channel = self._config.get('specialChannels', {}).get(ChannelKeys.STAFF_LOG.value, None)
+        log_channel = config.get('specialChannels').get(ChannelKeys.STAFF_LOG.value, None)
         if log_channel is not None:
             log_channel: discord.TextChannel = self.bot.get_channel(alert_channel)
 
-        if not isinstance(message.channel, discord.TextChannel):
+        if features.can_manage_messages:
             return
 
-        if not HuskyUtils.should_process_message(message):
-            return
+        flag_terms = await self.bot.regex_sandbox.find_all(flag_matcher, message.content, source="AutoFlag",
+                                                           folded=features.folded_for("AutoFlag"))
 
-        if message.author.permissions_in(message.channel).manage_messages:
-            return
+        for flag_term in flag_terms:
+            embed = discord.Embed(
+                title=Emojis.RED_FLAG + " Message autoflag raised!",
+                description=f"A message matching term `{flag_term}` was detected and has been raised to staff. "
+                            f"Please investigate.",
+                color=Colors.WARNING
+            )
 
-        for flag_term in flag_regexes:
-            if re.search(flag_term, message.content, re.IGNORECASE) is not None:
-                embed = discord.Embed(
-                    title=Emojis.RED_FLAG + " Message autoflag raised!",
-                    description=f"A message matching term `{flag_term}` was detected and has been raised to staff. "
-                                f"Please investigate.",
-                    color=Colors.WARNING
-                )
-
-                embed.add_field(name="Message Content", value=HuskyUtils.trim_string(message.content, 1000),
-                                inline=False)
-                embed.add_field(name="Message ID", value=message.id, inline=True)
-                embed.add_field(name="Channel", value=message.channel.mention, inline=True)
-                embed.add_field(name="User", value=message.author.mention, inline=True)
-                embed.add_field(name="Message Timestamp", value=message.created_at.strftime(DATETIME_FORMAT),
-                                inline=True)
-
-                if alert_channel is not None:
-                    await alert_channel.send(embed=embed, delete_after=self._delete_time)
-
-                if log_channel is not None:
-                    await log_channel.send(embed=embed)
-
-                LOG.info("Got flagged message (context %s, key %s, from %s in %s): %s", context,
-                         message.author, flag_term, message.channel, message.content)
-
-    async def user_filter(self, message: discord.Message):
-        flag_users = self._config.get("flaggedUsers", [])
+            embed.add_field(name="Message Content", value=HuskyUtils.trim_string(message.content, 1000), inline=False)
+            embed.add_field(name="Message ID", value=message.id, inline=True)
+            embed.add_field(name="Channel", value=message.channel.mention, inline=True)
+            embed.add_field(name="User", value=message.author.mention, inline=True)
+            embed.add_field(name="Message Timestamp", value=message.created_at.strftime(DATETIME_FORMAT),
+                            inline=True)
+
+            if alert_channel is not None:
+                self.bot.log_sink.post(alert_channel, embed, delete_after=self._delete_time)
+
+            if log_channel is not None:
+                self.bot.log_sink.post(log_channel, embed)
 
-        alert_channel = self._config.get('specialChannels', {}).get(ChannelKeys.STAFF_ALERTS.value, None)
+            LOG.info("Got flagged message (context %s, key %s, from %s in %s): %s", context,
+                     message.author, flag_term, message.channel, message.content)
+
+    async def user_filter(self, features: MessageFeatures):
+        message = features.message
+
+        config = features.config
+        flag_users = config.get("flaggedUsers")
+
+        alert_channel = config.get('specialChannels').get(ChannelKeys.STAFF_ALERTS.value, None)
         if alert_channel is not None:
             alert_channel: discord.TextChannel = self.bot.get_channel(alert_channel)
 
-        if not HuskyUtils.should_process_message(message):
-            return
-
         if message.author.id in flag_users:
             embed = discord.Embed(
                 title=Emojis.RED_FLAG + " Message autoflag raised!",
@@ -100,20 +113,10 @@ class AutoFlag(commands.Cog):
                             inline=True)
 
             if alert_channel is not None:
-                await alert_channel.send(embed=embed, delete_after=self._delete_time)
+                self.bot.log_sink.post(alert_channel, embed, delete_after=self._delete_time)
 
             LOG.info("Got user flagged message (from %s in %s): %s", message.author, message.channel, message.content)
 
-    @commands.Cog.listener()
-    async def on_message(self, message):
-        asyncio.ensure_future(self.regex_message_filter(message))
-        asyncio.ensure_future(self.user_filter(message))
-
-    # noinspection PyUnusedLocal
-    @commands.Cog.listener()
-    async def on_message_edit(self, before, after):
-        await self.regex_message_filter(after, "edit")
-
     @commands.group(name="autoflag", brief="Manage the autoflag plugin")
     @HuskyChecks.has_guild_permissions(manage_messages=True)
     async def autoflag(self, ctx: commands.Context):
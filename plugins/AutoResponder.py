@@ -5,12 +5,85 @@ import discord
 from discord.ext import commands
 
 from HuskyBot import HuskyBot
-from libhusky import HuskyUtils
+from libhusky import HuskyConfig
+from libhusky.HuskyPipeline import MessageFeatures, Priority
 from libhusky.HuskyStatics import Colors
 
 LOG = logging.getLogger("HuskyBot.Plugin." + __name__)
 
 
+class CompiledResponse:
+    """
+    A single response, pre-processed for fast matching: channel and role lists become sets, and embeds are built once.
+    """
+
+    __slots__ = ['trigger', 'order', 'allowed_channels', 'required_roles', 'content', 'embed']
+
+    def __init__(self, trigger: str, order: int, data):
+        self.trigger = trigger
+        self.order = order
+
+        allowed_channels = data.get('allowedChannels')
+        self.allowed_channels = frozenset(allowed_channels) if allowed_channels is not None else None
+
+        required_roles = data.get('requiredRoles')
+        self.required_roles = frozenset(required_roles) if required_roles is not None else None
+
+        if data.get('isEmbed', False):
+            self.content = None
+            self.embed = discord.Embed.from_dict(HuskyConfig.thaw(data['response']))
+        else:
+            self.content = data['response']
+            self.embed = None
+
+
+class ResponseIndex:
+    """
+    A trie of response triggers (lowercased), so that finding every response whose trigger starts a message only
+    walks as many characters of the message as the longest matching trigger, however many responses there are.
+    """
+
+    def __init__(self, responses):
+        self._root = {}
+        self.size = 0
+
+        for (order, (trigger, data)) in enumerate(responses.items()):
+            try:
+                response = CompiledResponse(trigger, order, data)
+            except Exception:
+                LOG.exception("Could not load response %s, skipping it.", trigger)
+                continue
+
+            node = self._root
+
+            for char in trigger.lower():
+                node = node.setdefault(char, {})
+
+            # None can't be a (single character) key, so it marks the responses ending at this node.
+            node.setdefault(None, []).append(response)
+            self.size += 1
+
+    def match(self, content_lower: str) -> list:
+        """
+        :return: Returns every response whose trigger is a prefix of the (lowercased) content, in config order.
+        """
+        matches = list(self._root.get(None, ()))
+        node = self._root
+
+        for char in content_lower:
+            node = node.get(char)
+
+            if node is None:
+                break
+
+            matches.extend(node.get(None, ()))
+
+        if len(matches) > 1:
+            matches.sort(key=lambda r: r.order)
+
+        return matches
+
+
 # noinspection PyMethodMayBeStatic
 class AutoResponder(commands.Cog):
     """
@@ -29,8 +102,18 @@ class AutoResponder(commands.Cog):
         self.bot = bot
         self._config = bot.config
         self._session_store = bot.session_store
+
+        bot.pipeline.register("AutoResponder", self.respond, Priority.AUTORESPONDER)
+
         LOG.info("Loaded plugin!")
 
+    def cog_unload(self):
+        self.bot.pipeline.unregister("AutoResponder")
+
+    @staticmethod
+    def _build_index(responses):
+        return ResponseIndex(responses or {})
+
     #   responses: {
     #       "someString": {
     #           "requiredRoles": [],             // Any on the list, *or* MANAGE_MESSAGES
@@ -40,39 +123,27 @@ class AutoResponder(commands.Cog):
     #       }
     #   }
 
-    @commands.Cog.listener()
-    async def on_message(self, message: discord.Message):
-        if not HuskyUtils.should_process_message(message):
-            return
+    async def respond(self, features: MessageFeatures):
+        message = features.message
+        config = features.config
 
-        if message.author.id in self._config.get('userBlacklist', []):
+        if message.author.id in config.get('userBlacklist'):
             return
 
-        if message.channel.id in self._config.get('disabledChannels', []) \
-                and isinstance(message.author, discord.Member) \
-                and not message.author.permissions_in(message.channel).manage_messages:
+        if message.channel.id in config.get('disabledChannels') \
+                and features.is_member \
+                and not features.can_manage_messages:
             return
 
         if self._session_store.get('lockdown', False):
             return
 
-        responses = self._config.get("responses", {})
-
-        for response in responses.keys():
-            if not (message.content.lower().startswith(response.lower())):
-                continue
-
-            if not ((responses[response].get('allowedChannels') is None)
-                    or (message.channel.id in responses[response].get('allowedChannels'))):
+        for response in self._config.derive("responses", self._build_index).match(features.content_lower):
+            if not ((response.allowed_channels is None) or (message.channel.id in response.allowed_channels)):
                 continue
 
-            if HuskyUtils.member_has_any_role(message.author, responses[response].get('requiredRoles')) \
-                    or bool(message.author.permissions_in(message.channel).manage_messages):
-                if responses[response].get('isEmbed', False):
-                    await message.channel.send(content=None,
-                                               embed=discord.Embed.from_dict(responses[response]['response']))
-                else:
-                    await message.channel.send(content=responses[response]['response'])
+            if features.has_any_role(response.required_roles) or features.can_manage_messages:
+                await message.channel.send(content=response.content, embed=response.embed)
 
     @commands.group(name="responses", aliases=["response"], brief="Manage the AutoResponder plugin")
     @commands.has_permissions(manage_messages=True)
@@ -1,12 +1,12 @@
 import logging
-import re
 
 import discord
 from discord.ext import commands
 
 from HuskyBot import HuskyBot
 from libhusky import HuskyChecks
-from libhusky import HuskyUtils
+from libhusky.HuskyCensor import CensorCache
+from libhusky.HuskyPipeline import MessageFeatures, Priority
 from libhusky.HuskyStatics import Colors
 
 LOG = logging.getLogger("HuskyBot.Plugin." + __name__)
@@ -31,53 +31,61 @@ class Censor(commands.Cog):
 
     Censors can take either plain text (that is, a single word) or regular expressions. All censors are evaluated as
     regular expressions.
+
+    If "Censor" is listed in the `foldedMatching` config key, censors are also matched against a folded copy of each
+    message, with look-alike characters (fullwidth letters, homoglyphs, ...) replaced and zero-width characters
+    removed. Censors should be written in plain lowercase letters to take advantage of this.
     """
 
     def __init__(self, bot: HuskyBot):
         self.bot = bot
         self._config = bot.config
+        self._matchers = CensorCache()
+
+        bot.pipeline.register("Censor", self.filter_message, Priority.CENSOR, on_edit=True)
 
         LOG.info("Loaded plugin!")
 
-    async def filter_message(self, message: discord.Message, context: str = "new_message"):
-        if not HuskyUtils.should_process_message(message):
-            return
+    def cog_unload(self):
+        self.bot.pipeline.unregister("Censor")
 
-        censor_config = self._config.get("censors", {})
+    async def filter_message(self, features: MessageFeatures):
+        message = features.message
+        context = features.context
 
-        global_censors = censor_config.get("global", [])
-        channel_censors = censor_config.get(str(message.channel.id), [])
-        user_censors = censor_config.get(f"user-{message.author.id}", [])
+        censor_config = features.config.get("censors")
 
-        censor_list = global_censors + channel_censors + user_censors
+        scopes = ["global", str(message.channel.id), f"user-{message.author.id}"]
 
-        if not isinstance(message.author, discord.Member):
+        if not features.is_member:
             LOG.warning("Attempted to censor a message (ID %s) from user %s (ID %s), but they do not exist.",
                         message.id, str(message.author), message.author.id)
-        elif message.author.permissions_in(message.channel).manage_messages:
-            if len(user_censors) > 0:
-                censor_list = user_censors
+        elif features.can_manage_messages:
+            # Staff bypass everything but their own user censors.
+            scopes = scopes[2:]
+
+        matched_term = None
+
+        for scope in scopes:
+            terms = censor_config.get(scope)
+
+            if not terms:
+                continue
+
+            matched_term = await self.bot.regex_sandbox.search(self._matchers.get(scope, terms), message.content,
+                                                               source="Censor", folded=features.folded_for("Censor"))
+
+            if matched_term is not None:
+                break
+
+        if matched_term is not None:
+            if await features.delete():
+                LOG.info("Deleted censored message (context %s, from %s in %s, matched %r): %s", context,
+                         message.author, message.channel, matched_term, message.content)
             else:
-                return
-
-        if any((re.search(censor_term, message.content, re.IGNORECASE) is not None) for censor_term in censor_list):
-            try:
-                await message.delete()
-                LOG.info("Deleted censored message (context %s, from %s in %s): %s", context, message.author,
-                         message.channel, message.content)
-            except discord.NotFound:
                 LOG.warning("I tried to delete a censored message (ID %s, ctx %s, from %s in %s), but I couldn't find "
                             "it. Was it already deleted?", message.id, context, message.author, message.channel)
 
-    @commands.Cog.listener()
-    async def on_message(self, message):
-        await self.filter_message(message)
-
-    # noinspection PyUnusedLocal
-    @commands.Cog.listener()
-    async def on_message_edit(self, before, after):
-        await self.filter_message(after, "edit")
-
     @commands.group(name="censor", brief="Manage the Censor list for the guild")
     @commands.has_permissions(manage_messages=True)
     async def censor(self, ctx: commands.Context):
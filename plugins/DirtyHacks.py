@@ -2,7 +2,6 @@ import json
 import logging
 import os
 import random
-import re
 import tempfile
 
 import aiohttp
@@ -12,6 +11,7 @@ from discord.ext import commands
 
 from HuskyBot import HuskyBot
 from libhusky import HuskyUtils
+from libhusky.HuskyPipeline import MessageFeatures, Priority
 from libhusky.HuskyStatics import *
 
 LOG = logging.getLogger("HuskyBot.Plugin." + __name__)
@@ -31,13 +31,17 @@ class DirtyHacks(commands.Cog):
 
         self._http_session = aiohttp.ClientSession(loop=bot.loop)
 
+        bot.pipeline.register("DirtyHacks.AbusiveGifs", self.kill_abusive_gifs, Priority.DIRTY_HACKS, background=True)
+
         LOG.info("Loaded plugin!")
 
     def cog_unload(self):
+        self.bot.pipeline.unregister("DirtyHacks.AbusiveGifs")
         self.bot.loop.create_task(self._http_session.close())
 
-    @commands.Cog.listener(name="on_message")
-    async def kill_abusive_gifs(self, message: discord.Message):
+    async def kill_abusive_gifs(self, features: MessageFeatures):
+        message = features.message
+
         def undersized_gif_check(file) -> bool:
             # Try to see if this gif is too big for its size (over 5000px^2, but less than 1mb)
             (width, height) = HuskyUtils.get_image_size(file.name)
@@ -63,25 +67,20 @@ class DirtyHacks(commands.Cog):
 
             return False
 
-        if not HuskyUtils.should_process_message(message):
-            return
-
-        matches = re.findall(Regex.URL_REGEX, message.content, re.IGNORECASE)
+        matches = list(features.urls)
 
         for attach in message.attachments:  # type: discord.Attachment
             matches.append(attach.proxy_url)
             matches.append(attach.url)
 
         # If a message has no links, abort right now.
-        if matches is None or len(matches) == 0:
+        if len(matches) == 0:
             return
 
         # deduplicate the list
         matches = list(set(matches))
 
         for match in matches:  # type: str
-            match = ''.join(match)
-
             if not match.endswith('.gif'):
                 return
 
@@ -101,7 +100,7 @@ class DirtyHacks(commands.Cog):
                 f.flush()
 
                 if undersized_gif_check(f) or too_large_frame_check(f):
-                    await message.delete()
+                    await features.delete()
                     break
 
     # @commands.Cog.listener(name="on_message")
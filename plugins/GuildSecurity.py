@@ -37,7 +37,8 @@ class GuildSecurity(commands.Cog):
         permitted_bots = self._guildsecurity_store.get('permittedBotList', [])
 
         if member.id not in permitted_bots:
-            await member.kick(reason="[AUTOMATIC KICK - Guild Security] User is not an authorized bot.")
+            await self.bot.action_queue.kick(member, reason="[AUTOMATIC KICK - Guild Security] User is not an "
+                                                            "authorized bot.")
 
     @commands.Cog.listener(name="on_member_update")
     async def protect_roles(self, before: discord.Member, after: discord.Member):
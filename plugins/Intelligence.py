@@ -3,7 +3,6 @@ import logging
 
 import discord
 from discord.ext import commands
-from discord.http import Route
 
 from HuskyBot import HuskyBot
 from libhusky import HuskyConverters
@@ -421,8 +420,8 @@ class Intelligence(commands.Cog):
         publicly-gleanable information about the invite such as user count, verification level, join channel names,
         the invite's creator, and other such information.
 
-        This command calls the API directly, and will validate an invite's existence. If either the bot's account
-        or the bot's IP are banned, the system will act as though the invite does not exist.
+        This command calls the API (through the bot's invite cache), and will validate an invite's existence. If either
+        the bot's account or the bot's IP are banned, the system will act as though the invite does not exist.
 
         Parameters
         ----------
@@ -434,16 +433,9 @@ class Intelligence(commands.Cog):
             /invitespy aabbcc                              :: Get invite data for invite aabbcc
             /invitespy https://disco\u200brd.gg/someguild  :: Get invite data for invite someguild
         """
-        try:
-            invite_data: dict = await self.bot.http.request(
-                Route('GET', '/invite/{invite_id}?with_counts=true', invite_id=fragment))
-            invite_guild = discord.Guild(state=self.bot, data=invite_data['guild'])
+        invite_data = await self.bot.invite_resolver.resolve(fragment)
 
-            if invite_data.get("inviter") is not None:
-                invite_user = discord.User(state=self.bot, data=invite_data["inviter"])
-            else:
-                invite_user = None
-        except discord.NotFound:
+        if invite_data is None:
             await ctx.send(embed=discord.Embed(
                 title="Could Not Retrieve Invite Data",
                 description="This invite does not appear to exist, or the bot has been banned from the guild.",
@@ -451,6 +443,13 @@ class Intelligence(commands.Cog):
             ))
             return
 
+        invite_guild = discord.Guild(state=self.bot, data=invite_data['guild'])
+
+        if invite_data.get("inviter") is not None:
+            invite_user = discord.User(state=self.bot, data=invite_data["inviter"])
+        else:
+            invite_user = None
+
         embed = discord.Embed(
             description=f"Information about invite slug `{fragment}`",
             color=Colors.INFO
@@ -7,6 +7,7 @@ from discord.ext import commands
 
 from HuskyBot import HuskyBot
 from libhusky import HuskyConverters
+from libhusky import HuskyRegex
 from libhusky import HuskyUtils
 from libhusky.HuskyStatics import *
 from libhusky.managers.MuteManager import MuteManager
@@ -470,7 +471,7 @@ class ModTools(commands.Cog):
         """
 
         # BE VERY CAREFUL TOUCHING THIS METHOD!
-        def generate_cleanup_filter():
+        async def generate_cleanup_filter():
             if filter_def is None:
                 return None
 
@@ -495,19 +496,37 @@ class ModTools(commands.Cog):
                 else:
                     raise KeyError(f"Filter {filter_candidate[0]} is not valid!")
 
+            regex_matches = None
+
+            if len(regex_list) > 0:
+                # The regexes run in the sandbox, and purge() can't wait on a check, so match the lookback window first.
+                candidates = await ctx.channel.history(limit=lookback + 1).flatten()
+                matches = await self.bot.regex_sandbox.match_every(regex_list, [m.content for m in candidates])
+                regex_matches = {candidates[i].id for i in matches}
+
             def dynamic_check(message: discord.Message):
                 if len(user_list) > 0 and message.author.id not in user_list:
                     return False
 
-                for regex in regex_list:
-                    if len(regex_list) > 0 and re.search(regex, message.content) is None:
-                        return False
+                if regex_matches is not None and message.id not in regex_matches:
+                    return False
 
                 return True
 
             return dynamic_check
 
-        await ctx.channel.purge(limit=lookback + 1, check=generate_cleanup_filter(), bulk=True)
+        try:
+            cleanup_filter = await generate_cleanup_filter()
+        except HuskyRegex.RegexTimeoutError:
+            await ctx.send(embed=discord.Embed(
+                title="Moderator Toolkit",
+                description="The regex filter took too long to evaluate, so no messages were deleted. Please try a "
+                            "simpler regex.",
+                color=Colors.DANGER
+            ))
+            return
+
+        await ctx.channel.purge(limit=lookback + 1, check=cleanup_filter, bulk=True)
 
     @commands.command(name="editban", brief="Edit a banned user's reason")
     @commands.has_permissions(ban_members=True)
@@ -579,7 +598,7 @@ class ModTools(commands.Cog):
         alert_channel = self._config.get('specialChannels', {}).get(ChannelKeys.STAFF_LOG.value, None)
         if alert_channel is not None:
             alert_channel: discord.TextChannel = self.bot.get_channel(alert_channel)
-            await alert_channel.send(embed=embed)
+            self.bot.log_sink.post(alert_channel, embed)
 
         logger_ignores: dict = self._session_store.get('loggerIgnores', {})
         ignored_bans = logger_ignores.setdefault('ban', [])
@@ -1,11 +1,10 @@
 import logging
 import random
 
-import discord
 from discord.ext import commands
 
 from HuskyBot import HuskyBot
-from libhusky import HuskyUtils
+from libhusky.HuskyPipeline import MessageFeatures, Priority
 
 LOG = logging.getLogger("HuskyBot.Plugin." + __name__)
 
@@ -20,14 +19,17 @@ class PingMe(commands.Cog):
         self._bot = bot
         self._config = bot.config
 
+        bot.pipeline.register("PingMe", self.on_ping, Priority.PING_ME)
+
         LOG.info("Loaded plugin!")
 
-    @commands.Cog.listener(name="on_message")
-    async def on_ping(self, message: discord.Message):
-        if not HuskyUtils.should_process_message(message):
-            return
+    def cog_unload(self):
+        self._bot.pipeline.unregister("PingMe")
+
+    async def on_ping(self, features: MessageFeatures):
+        message = features.message
 
-        if message.content.startswith(self._bot.command_prefix):
+        if features.is_command:
             return
 
         # hacky way to determine if a message is only a bot mention
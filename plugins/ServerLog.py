@@ -33,7 +33,7 @@ class ServerLog(commands.Cog):
 
     @commands.Cog.listener(name="on_member_join")
     async def user_milestone_logger(self, member: discord.Member):
-        if "userJoin.milestones" not in self._config.get("loggers", {}).keys():
+        if "userJoin.milestones" not in self._config.snapshot.get("loggers").enabled:
             return
 
         milestone_channel = self._config.get('specialChannels', {}).get(ChannelKeys.STAFF_ALERTS.value, None)
@@ -55,7 +55,7 @@ class ServerLog(commands.Cog):
     # Send all joins to the logging channel
     @commands.Cog.listener(name="on_member_join")
     async def user_join_logger(self, member: discord.Member):
-        if "userJoin" not in self._config.get("loggers", {}).keys():
+        if "userJoin" not in self._config.snapshot.get("loggers").enabled:
             return
 
         channel = self._config.get('specialChannels', {}).get(ChannelKeys.USER_LOG.value, None)
@@ -80,11 +80,11 @@ class ServerLog(commands.Cog):
         embed.set_footer(text=f"Member #{member_num} on the guild")
 
         LOG.info(f"User {member} ({member.id}) has joined {member.guild.name}.")
-        await channel.send(embed=embed)
+        self.bot.log_sink.post(channel, embed)
 
     @commands.Cog.listener(name="on_member_remove")
     async def user_leave_logger(self, member: discord.Member):
-        if "userLeave" not in self._config.get("loggers", {}).keys():
+        if "userLeave" not in self._config.snapshot.get("loggers").enabled:
             return
 
         alert_channel = self._config.get('specialChannels', {}).get(ChannelKeys.USER_LOG.value, None)
@@ -116,11 +116,11 @@ class ServerLog(commands.Cog):
             embed.add_field(name="Roles on Leave", value=", ".join(roles_on_leave), inline=False)
 
         LOG.info(f"User {member} has left {member.guild.name}.")
-        await alert_channel.send(embed=embed)
+        self.bot.log_sink.post(alert_channel, embed)
 
     @commands.Cog.listener(name="on_member_ban")
     async def user_ban_logger(self, guild: discord.Guild, user: discord.User):
-        if "userBan" not in self._config.get("loggers", {}).keys():
+        if "userBan" not in self._config.snapshot.get("loggers").enabled:
             return
 
         logger_ignores: dict = self._session_store.get('loggerIgnores', {})
@@ -161,12 +161,12 @@ class ServerLog(commands.Cog):
         embed.add_field(name="Ban Reason", value=ban_reason, inline=False)
 
         LOG.info(f"User {user} was banned from {guild.name} for '{ban_reason}'.")
-        await alert_channel.send(embed=embed)
+        self.bot.log_sink.post(alert_channel, embed)
 
     # noinspection PyUnusedLocal
     @commands.Cog.listener(name="on_member_unban")
     async def user_unban_logger(self, guild: discord.Guild, user: discord.User):
-        if "userBan" not in self._config.get("loggers", {}).keys():
+        if "userBan" not in self._config.snapshot.get("loggers").enabled:
             return
 
         logger_ignores: dict = self._session_store.get('loggerIgnores', {})
@@ -193,11 +193,11 @@ class ServerLog(commands.Cog):
         embed.add_field(name="Unban Timestamp", value=HuskyUtils.get_timestamp())
 
         LOG.info(f"User {user} was unbanned from {guild.name}.")
-        await alert_channel.send(embed=embed)
+        self.bot.log_sink.post(alert_channel, embed)
 
     @commands.Cog.listener(name="on_member_update")
     async def user_rename_logger(self, before: discord.Member, after: discord.Member):
-        if "userRename" not in self._config.get("loggers", {}).keys():
+        if "userRename" not in self._config.snapshot.get("loggers").enabled:
             return
 
         logger_ignores: dict = self._session_store.get('loggerIgnores', {})
@@ -239,23 +239,24 @@ class ServerLog(commands.Cog):
         embed.add_field(name="User ID", value=after.id, inline=True)
         embed.set_author(name=f"{after}'s {update_type} has changed!", icon_url=after.avatar_url)
 
-        await alert_channel.send(embed=embed)
+        self.bot.log_sink.post(alert_channel, embed)
 
     @commands.Cog.listener(name="on_message_delete")
     async def message_delete_logger(self, message: discord.Message):
-        logger_config = self._config.get("loggers", {})
+        config = self._config.snapshot
+        logger_config = config.get("loggers")
 
         if message.guild is None:
             return
 
-        if "messageDelete" not in logger_config.keys():
+        if "messageDelete" not in logger_config.enabled:
             return
 
-        if message.channel.id in logger_config.get('__global__', {}).get("ignoredChannels", []):
+        if message.channel.id in logger_config.ignored_channels:
             return
 
-        server_log_channel = self._config.get('specialChannels', {}).get(ChannelKeys.STAFF_LOG.value, -1)
-        alert_channel = self._config.get('specialChannels', {}).get(ChannelKeys.MESSAGE_LOG.value, None)
+        server_log_channel = config.get('specialChannels').get(ChannelKeys.STAFF_LOG.value, -1)
+        alert_channel = config.get('specialChannels').get(ChannelKeys.MESSAGE_LOG.value, None)
 
         if alert_channel is None:
             return
@@ -296,22 +297,23 @@ class ServerLog(commands.Cog):
             embed.add_field(name="Attachment URL", value=message.attachments[0].url, inline=False)
             embed.set_image(url=message.attachments[0].proxy_url)
 
-        await alert_channel.send(embed=embed)
+        self.bot.log_sink.post(alert_channel, embed)
 
     @commands.Cog.listener(name="on_message_edit")
     async def message_edit_logger(self, before: discord.Message, after: discord.Message):
-        logger_config = self._config.get('loggers', {})
+        config = self._config.snapshot
+        logger_config = config.get('loggers')
 
         if after.guild is None:
             return
 
-        if "messageEdit" not in logger_config.keys():
+        if "messageEdit" not in logger_config.enabled:
             return
 
-        if after.channel.id in logger_config.get('__global__', {}).get("ignoredChannels", []):
+        if after.channel.id in logger_config.ignored_channels:
             return
 
-        alert_channel = self._config.get('specialChannels', {}).get(ChannelKeys.MESSAGE_LOG.value, None)
+        alert_channel = config.get('specialChannels').get(ChannelKeys.MESSAGE_LOG.value, None)
 
         if alert_channel is None:
             return
@@ -353,7 +355,7 @@ class ServerLog(commands.Cog):
         else:
             embed.add_field(name="Message After", value="`<No Content>`", inline=False)
 
-        await alert_channel.send(embed=embed)
+        self.bot.log_sink.post(alert_channel, embed)
 
     @commands.group(name="logger", aliases=["logging"], brief="Parent command to manage the ServerLog module")
     @commands.has_permissions(administrator=True)
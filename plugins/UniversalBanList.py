@@ -1,11 +1,13 @@
 import logging
-import re
 
 import discord
 from discord.ext import commands
 
 from HuskyBot import HuskyBot
-from libhusky import HuskyUtils, HuskyStatics
+from libhusky import HuskyStatics
+from libhusky import HuskyCensor
+from libhusky.HuskyCensor import CensorMatcher
+from libhusky.HuskyPipeline import MessageFeatures, Priority
 
 LOG = logging.getLogger("HuskyBot.Plugin." + __name__)
 
@@ -46,52 +48,66 @@ class UniversalBanList(commands.Cog):
     def __init__(self, bot: HuskyBot):
         self.bot = bot
 
+        bot.pipeline.register("UniversalBanList", self.filter_message, Priority.UBL, on_edit=True)
+
         LOG.info("Loaded plugin!")
 
-    def get_banned_usernames(self):
-        ubl_config = self.bot.config.get('ubl', {})
+    def cog_unload(self):
+        self.bot.pipeline.unregister("UniversalBanList")
+
+    def get_banned_usernames(self) -> CensorMatcher:
+        return self.bot.config.derive('ubl', self._build_banned_usernames)
+
+    def get_banned_phrases(self) -> CensorMatcher:
+        return self.bot.config.derive('ubl', self._build_banned_phrases)
 
-        banned_list = ubl_config.get('bannedUsernames', []) + ubl_config.get('bannedPhrases', [])
+    @staticmethod
+    def _build_banned_usernames(ubl_config):
+        ubl_config = ubl_config or {}
+
+        banned_list = ubl_config.get('bannedUsernames', ()) + ubl_config.get('bannedPhrases', ())
 
         if ubl_config.get('kickInviteUsernames', False):
-            banned_list.append(HuskyStatics.Regex.INVITE_REGEX)
+            banned_list += (HuskyStatics.Regex.INVITE_REGEX,)
 
-        return banned_list
+        return CensorMatcher(banned_list)
 
-    async def filter_message(self, message: discord.Message, context: str = "new_message"):
-        if not HuskyUtils.should_process_message(message):
-            return
+    @staticmethod
+    def _build_banned_phrases(ubl_config):
+        return CensorMatcher((ubl_config or {}).get('bannedPhrases', ()))
 
-        if message.author.permissions_in(message.channel).manage_messages:
-            return
+    def _fold_name(self, name: str):
+        if "UBL" not in self.bot.config.snapshot.get('foldedMatching'):
+            return None
 
-        for ubl_term in self.bot.config.get('ubl', {}).get('bannedPhrases', []):
-            if re.search(ubl_term, message.content, re.IGNORECASE) is not None:
-                await message.author.ban(reason=f"User used UBL keyword `{ubl_term}`. Purging user...",
-                                         delete_message_days=5)
-                await message.guild.unban(message.author, reason="UBL ban reversal")
-                LOG.info("Kicked UBL triggering user (context %s, keyword %s, from %s in %s): %s", context,
-                         message.author, ubl_term, message.channel, message.content)
+        return HuskyCensor.fold(name)
 
-    @commands.Cog.listener()
-    async def on_message(self, message):
-        await self.filter_message(message)
+    async def filter_message(self, features: MessageFeatures):
+        message = features.message
 
-    # noinspection PyUnusedLocal
-    @commands.Cog.listener()
-    async def on_message_edit(self, before, after):
-        await self.filter_message(after, "edit")
+        if features.can_manage_messages:
+            return
+
+        ubl_term = await self.bot.regex_sandbox.search(self.get_banned_phrases(), message.content, source="UBL",
+                                                       folded=features.folded_for("UBL"))
+
+        if ubl_term is not None:
+            await features.softban(reason=f"User used UBL keyword `{ubl_term}`. Purging user...", delete_message_days=5)
+            LOG.info("Kicked UBL triggering user (context %s, keyword %s, from %s in %s): %s", features.context,
+                     message.author, ubl_term, message.channel, message.content)
 
     @commands.Cog.listener()
     async def on_member_join(self, member: discord.Member):
         if member.guild_permissions.manage_guild:
             return
 
-        for ubl_term in self.get_banned_usernames():
-            if re.search(ubl_term, member.display_name, re.IGNORECASE) is not None:
-                await member.kick(reason=f"[AUTOMATIC KICK - UBL Module] New user's name contains UBL keyword "
-                                         f"`{ubl_term}`")
-                LOG.info("Kicked UBL triggering new join of user %s (matching UBL %s)", member, ubl_term)
+        ubl_term = await self.bot.regex_sandbox.search(self.get_banned_usernames(), member.display_name, source="UBL",
+                                                       folded=self._fold_name(member.display_name))
+
+        if ubl_term is not None:
+            await self.bot.action_queue.kick(member, reason=f"[AUTOMATIC KICK - UBL Module] New user's name contains "
+                                                            f"UBL keyword `{ubl_term}`")
+            LOG.info("Kicked UBL triggering new join of user %s (matching UBL %s)", member, ubl_term)
 
     @commands.Cog.listener()
     async def on_member_update(self, before: discord.Member, after: discord.Member):
@@ -101,17 +117,25 @@ class UniversalBanList(commands.Cog):
         if before.nick == after.nick and before.name == after.name:
             return
 
-        for ubl_term in self.get_banned_usernames():
-            if after.nick is not None and re.search(ubl_term, after.nick, re.IGNORECASE) is not None:
-                u_type = 'nickname'
-            elif after.name is not None and re.search(ubl_term, after.name, re.IGNORECASE):
-                u_type = 'username'
-            else:
-                continue
-
-            await after.kick(reason=f"[AUTOMATIC BAN - UBL Module] User {after} changed {u_type} to include UBL "
-                                    f"keyword {ubl_term}")
-            LOG.info("Kicked UBL triggering %s change of user %s (matching UBL %s)", u_type, after, ubl_term)
+        banned_usernames = self.get_banned_usernames()
+        ubl_term = None
+
+        if after.nick is not None:
+            ubl_term = await self.bot.regex_sandbox.search(banned_usernames, after.nick, source="UBL",
+                                                           folded=self._fold_name(after.nick))
+            u_type = 'nickname'
+
+        if ubl_term is None and after.name is not None:
+            ubl_term = await self.bot.regex_sandbox.search(banned_usernames, after.name, source="UBL",
+                                                           folded=self._fold_name(after.name))
+            u_type = 'username'
+
+        if ubl_term is None:
+            return
+
+        await self.bot.action_queue.kick(after, reason=f"[AUTOMATIC BAN - UBL Module] User {after} changed {u_type} "
+                                                       f"to include UBL keyword {ubl_term}")
+        LOG.info("Kicked UBL triggering %s change of user %s (matching UBL %s)", u_type, after, ubl_term)
 
 
 def setup(bot: HuskyBot):